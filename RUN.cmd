@@ -2,10 +2,34 @@ REM Running the main function to display output
 python main.py
 
 REM Running the test cases for the functionalities in read_files.py, 
-REM job_match_recommendation.py, and recommedation.py files.
+REM job_match_recommendation.py, recommedation.py and the skill_matching files.
 python -m unittest tests.test_read_files
+python -m unittest tests.test_file_cache
+python -m unittest tests.test_row_hash_set
+python -m unittest tests.test_ingest_options
 python -m unittest tests.test_job_match_recommendation
 python -m unittest tests.test_recommendation
+python -m unittest tests.test_skill_vocabulary
+python -m unittest tests.test_matching_backend
+python -m unittest tests.test_inverted_index
+python -m unittest tests.test_bitset_matching
+python -m unittest tests.test_skill_token_cache
+python -m unittest tests.test_profile_deduplication
+python -m unittest tests.test_result_sinks
+python -m unittest tests.test_recommendation_result
+python -m unittest tests.test_incremental_recommendations
+python -m unittest tests.test_recommendation_index
+python -m unittest tests.test_query_service
+python -m unittest tests.test_benchmark
+python -m unittest tests.test_execution_planner
+python -m unittest tests.test_run_statistics
+python -m unittest tests.test_shards
+python -m unittest tests.test_external_sort
+python -m unittest tests.test_worker_pool
+python -m unittest tests.test_scoring_kernels
+python -m unittest tests.test_prefix_filter
+python -m unittest tests.test_minhash_lsh
+python -m unittest tests.test_checkpoint_log
 
 REM Pausing until the user presses any key
 pause
\ No newline at end of file
@@ -13,8 +13,8 @@ def main():
     # Creating an object of JobMatchRecommendationEngine
     obj_job_match = JobMatchRecommendationEngine(path_file_jobs,path_file_jobseeker)
     
-    # Setting the threshold for parallel processing as 7 MB
-    obj_job_match.set_threshold_parallel_processing(7.0)
+    # Printing the execution plan chosen for the input files
+    print(obj_job_match.explain_plan())
     
     # Getting the generated job recommendations
     recommendations = obj_job_match.generate_recommendations()
@@ -0,0 +1,476 @@
+# typing module for type hints
+from typing import List, Dict, Iterable
+# argparse module for the command line interface
+import argparse
+# copy module for the exact reference engine of approximate cases
+import copy
+# datetime module for timestamping the results
+import datetime
+# queue module for the exception of a poll without result
+import queue
+# json module for saving the results
+import json
+# multiprocessing module for running every case in a fresh process
+import multiprocessing as mp
+# os module for operating system functionalities
+import os
+# platform module for describing the environment
+import platform
+# tempfile module for the generated files and the output files
+import tempfile
+# threading module for sampling the memory while a case runs
+import threading
+# time module for measuring the wall time
+import time
+# pandas library for reading the recommended pairs back
+import pandas as pd
+# psutil library for measuring the memory of the process and its workers
+import psutil
+# custom JobMatchRecommendationEngine class for running the matching modes
+from ..jobseeker_recommendation_engine.job_match_recommendation import JobMatchRecommendationEngine
+# custom File class for counting the cleansed rows
+from ..file_reader.read_files import File
+# custom CsvResultSink class for writing and measuring the output
+from ..result_sink.result_sinks import CsvResultSink
+# custom SyntheticDataGenerator class for generating the input files
+from .data_generator import SyntheticDataGenerator
+
+
+class PeakMemorySampler:
+    """
+    A class for sampling the peak resident memory of the current process and all of its child processes.
+
+    The memory is sampled by a background thread, so that the memory of the worker processes of parallel
+    processing is included, on every platform supported by psutil.
+
+    Attributes:
+    - interval(float): Time in seconds between two samples.
+    - peak_rss(int): Largest total resident memory in bytes seen so far.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        """
+        Constructor for class PeakMemorySampler.
+
+        Parameters:
+        - interval(float): Time in seconds between two samples. Set to 5 ms by default.
+        """
+        self.interval = interval
+        self.peak_rss = 0
+        self.process = psutil.Process()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.sample, daemon=True)
+
+
+
+    def __enter__(self) -> "PeakMemorySampler":
+        """
+        Function for starting to sample when entering the context.
+
+        Returns:
+        - PeakMemorySampler: The sampler itself.
+        """
+        self.sample_once()
+        self.thread.start()
+        return self
+
+
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Function for stopping to sample when leaving the context.
+        """
+        self.stopped.set()
+        self.thread.join()
+        self.sample_once()
+
+
+
+    def sample_once(self) -> None:
+        """
+        Function for adding up the resident memory of the process and its children once.
+        """
+        total_rss = self.process.memory_info().rss
+        for child in self.process.children(recursive=True):
+            try:
+                total_rss += child.memory_info().rss
+            except psutil.Error:
+                # Skipping worker processes which exited meanwhile
+                pass
+        self.peak_rss = max(self.peak_rss, total_rss)
+
+
+
+    def sample(self) -> None:
+        """
+        Function for sampling until stopped.
+        """
+        while not self.stopped.wait(self.interval):
+            self.sample_once()
+
+
+
+def recommended_pairs(path_file: str) -> pd.MultiIndex:
+    """
+    Function for reading the job seeker and job pairs of a recommendations CSV file.
+
+    Parameters:
+    - path_file(str): Path of the CSV file written by CsvResultSink.
+
+    Returns:
+    - pd.MultiIndex: Distinct pairs of jobseeker id and job id.
+    """
+    recommendations_df = pd.read_csv(path_file, usecols=['jobseeker_id', 'job_id'], dtype=str)
+    return pd.MultiIndex.from_frame(recommendations_df).unique()
+
+
+
+def measure_recall(engine: JobMatchRecommendationEngine, path_file_output: str) -> float:
+    """
+    Function for measuring the share of the exact recommendations which an approximate run found.
+
+    The exact recommendations are calculated by a copy of the engine with the 'auto' matching backend and
+    otherwise the same settings.
+
+    Parameters:
+    - engine(JobMatchRecommendationEngine): Engine of the approximate run.
+    - path_file_output(str): Path of the CSV file with the recommendations of the approximate run.
+
+    Returns:
+    - float: Number of exact recommendations also in the output divided by the number of exact recommendations,
+             or None if there are no exact recommendations.
+    """
+    exact_engine = copy.copy(engine)
+    exact_engine.set_matching_backend('auto')
+    exact_engine.set_pool_size(1)
+    path_file_exact = os.path.join(os.path.dirname(path_file_output), 'exact_recommendations.csv')
+    try:
+        with CsvResultSink(path_file_exact) as sink:
+            sink.write(exact_engine.columnar_processing().to_records())
+        exact_pairs = recommended_pairs(path_file_exact)
+        if len(exact_pairs) == 0:
+            return None
+        return len(exact_pairs.intersection(recommended_pairs(path_file_output))) / len(exact_pairs)
+
+    finally:
+        if os.path.exists(path_file_exact):
+            os.remove(path_file_exact)
+
+
+
+def run_benchmark_case(case: Dict) -> Dict:
+    """
+    Function for running a single benchmark case and measuring it.
+
+    The output is written to a temporary CSV file after the timed section, except for the streaming mode where
+    writing the output is part of the mode. With an approximate matching backend, the recall of the output
+    against the exact recommendations is measured after the timed section too.
+
+    Parameters:
+    - case(Dict): Case with the keys path_file_jobs, path_file_jobseeker, mode, workers, matching_backend and top_k,
+                  and lsh_bands and lsh_rows_per_band for the 'minhash_lsh' backend.
+
+    Returns:
+    - Dict: The case without the paths, with the wall time, pairs per second, peak RSS, output size and recall added.
+    """
+    engine = JobMatchRecommendationEngine(case['path_file_jobs'], case['path_file_jobseeker'])
+    engine.set_matching_backend(case['matching_backend'])
+    engine.set_top_k(case['top_k'])
+    engine.set_pool_size(case['workers'])
+    approximate = case['matching_backend'] in engine.approximate_matching_backends
+    if approximate:
+        engine.set_lsh_parameters(case['lsh_bands'], case['lsh_rows_per_band'])
+    output_directory = tempfile.mkdtemp()
+    path_file_output = os.path.join(output_directory, 'recommendations.csv')
+
+    try:
+        # Running the mode while sampling the memory of the process and its workers
+        with PeakMemorySampler() as memory_sampler:
+            started = time.perf_counter()
+            if case['mode'] == 'sequential':
+                recommendations = engine.sequential_processing()
+            elif case['mode'] == 'vectorized':
+                recommendations = engine.vectorized_processing()
+            elif case['mode'] == 'parallel':
+                recommendations = engine.parallel_processing()
+            elif case['mode'] == 'columnar':
+                recommendations = engine.columnar_processing()
+            else:
+                number_recommendations = engine.write_recommendations(CsvResultSink(path_file_output), parallel=case['workers'] > 1)
+            wall_time = time.perf_counter() - started
+
+        # Writing the output outside of the timed section to measure its size
+        if case['mode'] != 'streaming':
+            records = recommendations.to_records() if case['mode'] == 'columnar' else recommendations
+            number_recommendations = len(records)
+            with CsvResultSink(path_file_output) as sink:
+                sink.write(records)
+
+        # Counting the evaluated pairs of the cleansed inputs
+        number_pairs = len(File(case['path_file_jobs']).read_file()) * len(File(case['path_file_jobseeker']).read_file())
+        recall = measure_recall(engine, path_file_output) if approximate else None
+        return {
+            'mode': case['mode'], 'workers': case['workers'], 'matching_backend': case['matching_backend'], 'top_k': case['top_k'],
+            'wall_time_seconds': round(wall_time, 4),
+            'pairs': number_pairs,
+            'pairs_per_second': round(number_pairs / wall_time, 1) if wall_time > 0 else None,
+            'peak_rss_mb': round(memory_sampler.peak_rss / (1024 * 1024), 2),
+            'recommendations': number_recommendations,
+            'output_bytes': os.path.getsize(path_file_output),
+            'recall': round(recall, 4) if recall is not None else None
+        }
+
+    finally:
+        if os.path.exists(path_file_output):
+            os.remove(path_file_output)
+        os.rmdir(output_directory)
+
+
+
+def run_benchmark_case_in_process(case: Dict, result_queue: mp.Queue) -> None:
+    """
+    Function for running a benchmark case in a child process and sending back its result or error.
+
+    Parameters:
+    - case(Dict): Case to run.
+    - result_queue(mp.Queue): Queue the result is put into.
+    """
+    try:
+        result_queue.put(run_benchmark_case(case))
+    except Exception as ex:
+        result_queue.put(failed_case_result(case, str(ex)))
+
+
+
+def failed_case_result(case: Dict, error: str) -> Dict:
+    """
+    Function for describing a benchmark case which did not give a result.
+
+    Parameters:
+    - case(Dict): Case which failed.
+    - error(str): Description of the error.
+
+    Returns:
+    - Dict: The settings of the case with the error added.
+    """
+    return {'mode': case['mode'], 'workers': case['workers'], 'matching_backend': case['matching_backend'], 'top_k': case['top_k'], 'error': error}
+
+
+
+class BenchmarkRunner:
+    """
+    A class for benchmarking the matching modes over the same input files.
+
+    Every case, i.e. a mode with a number of workers, runs in a fresh process so that the peak memory of one case
+    does not carry over into the next. The results are saved as JSON together with a description of the
+    environment and the inputs, so that runs of different versions can be compared.
+
+    Attributes:
+    - path_file_jobs(str): Path to the file containing jobs data.
+    - path_file_jobseeker(str): Path to the file containing jobseekers data.
+    - modes(List[str]): Modes to run, of 'sequential', 'vectorized', 'parallel', 'columnar' and 'streaming'.
+    - worker_counts(List[int]): Numbers of worker processes the parallel and streaming modes are run with.
+    - matching_backend(str): Matching backend of the engine. The recall of an approximate backend is measured against
+                             the exact recommendations.
+    - top_k(int): Maximum number of recommendations kept per job seeker, or None for all of them.
+    - repeats(int): Number of times every case is run.
+    - lsh_bands(int): Number of bands of the 'minhash_lsh' backend.
+    - lsh_rows_per_band(int): Number of signature values per band of the 'minhash_lsh' backend.
+    """
+    modes = ('sequential', 'vectorized', 'parallel', 'columnar', 'streaming')
+    result_poll_interval = 1.0
+
+
+    def __init__(self, path_file_jobs: str, path_file_jobseeker: str, modes: Iterable[str] = None, worker_counts: Iterable[int] = (1,),
+                 matching_backend: str = 'auto', top_k: int = None, repeats: int = 1, lsh_bands: int = 16, lsh_rows_per_band: int = 2):
+        """
+        Constructor for class BenchmarkRunner.
+
+        Parameters:
+        - path_file_jobs(str): Path to the file containing jobs data.
+        - path_file_jobseeker(str): Path to the file containing jobseekers data.
+        - modes(Iterable[str]): Modes to run, or None for all of them. Set to None by default.
+        - worker_counts(Iterable[int]): Numbers of worker processes of the parallel and streaming modes. Set to (1,) by default.
+        - matching_backend(str): Matching backend of the engine. Set to 'auto' by default.
+        - top_k(int): Maximum number of recommendations kept per job seeker, or None for all of them. Set to None by default.
+        - repeats(int): Number of times every case is run. Set to 1 by default.
+        - lsh_bands(int): Number of bands of the 'minhash_lsh' backend. Set to 16 by default.
+        - lsh_rows_per_band(int): Number of signature values per band of the 'minhash_lsh' backend. Set to 2 by default.
+        """
+        modes = list(self.modes if modes is None else modes)
+        unknown_modes = [mode for mode in modes if mode not in self.modes]
+        if unknown_modes:
+            raise ValueError(f"Modes should be some of: {', '.join(self.modes)}.")
+        if not worker_counts or any(workers < 1 for workers in worker_counts):
+            raise ValueError("Worker counts should be positive integers.")
+        if repeats < 1:
+            raise ValueError("Repeats should be at least 1.")
+        self.path_file_jobs = path_file_jobs
+        self.path_file_jobseeker = path_file_jobseeker
+        self.modes = modes
+        self.worker_counts = list(worker_counts)
+        self.matching_backend = matching_backend
+        self.top_k = top_k
+        self.repeats = repeats
+        self.lsh_bands = lsh_bands
+        self.lsh_rows_per_band = lsh_rows_per_band
+
+
+
+    def cases(self) -> List[Dict]:
+        """
+        Function for listing the cases to run.
+
+        Returns:
+        - List[Dict]: Every mode, with every worker count for the parallel and streaming modes, repeats times.
+        """
+        return [{'path_file_jobs': self.path_file_jobs, 'path_file_jobseeker': self.path_file_jobseeker, 'mode': mode, 'workers': workers,
+                 'matching_backend': self.matching_backend, 'top_k': self.top_k, 'lsh_bands': self.lsh_bands, 'lsh_rows_per_band': self.lsh_rows_per_band}
+                for _ in range(self.repeats)
+                for mode in self.modes
+                for workers in (self.worker_counts if mode in ('parallel', 'streaming') else [1])]
+
+
+
+    def start_case_process(self, context: mp.context.BaseContext, case: Dict, result_queue: mp.Queue) -> mp.Process:
+        """
+        Function for starting the process running a benchmark case.
+
+        Parameters:
+        - context(mp.context.BaseContext): Multiprocessing context of the runner.
+        - case(Dict): Case to run.
+        - result_queue(mp.Queue): Queue the result is put into.
+
+        Returns:
+        - mp.Process: Started process.
+        """
+        process = context.Process(target=run_benchmark_case_in_process, args=(case, result_queue))
+        process.start()
+        return process
+
+
+
+    def wait_for_result(self, case: Dict, process: mp.Process, result_queue: mp.Queue) -> Dict:
+        """
+        Function for waiting for the result of a benchmark case while checking that its process is still alive.
+
+        A process which exits without a result, e.g. when it is killed for running out of memory, gives a failed
+        case with its exit code instead of blocking the runner forever.
+
+        Parameters:
+        - case(Dict): Case being run.
+        - process(mp.Process): Process running the case.
+        - result_queue(mp.Queue): Queue the result is put into.
+
+        Returns:
+        - Dict: Result of the case, or its error.
+        """
+        while True:
+            try:
+                return result_queue.get(timeout=self.result_poll_interval)
+            except queue.Empty:
+                if process.is_alive():
+                    continue
+            # Reading a result put just before the process exited
+            try:
+                return result_queue.get(timeout=self.result_poll_interval)
+            except queue.Empty:
+                process.join()
+                return dict(failed_case_result(case, f"The benchmark process exited with code {process.exitcode} without a result."),
+                            exit_code=process.exitcode)
+
+
+
+    def run(self) -> List[Dict]:
+        """
+        Function for running all cases, each in a fresh process.
+
+        Returns:
+        - List[Dict]: Result of every case, or its error together with the exit code of a process which died.
+        """
+        results = []
+        context = mp.get_context('spawn')
+        for case in self.cases():
+            result_queue = context.Queue()
+            process = self.start_case_process(context, case, result_queue)
+            # Reading the result before joining, so that a large result cannot block the child
+            results.append(self.wait_for_result(case, process, result_queue))
+            process.join()
+        return results
+
+
+
+    def environment(self) -> Dict:
+        """
+        Function for describing the environment and the inputs of the benchmark.
+
+        Returns:
+        - Dict: Timestamp, Python version, platform, CPU count and the sizes of the input files.
+        """
+        return {
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': mp.cpu_count(),
+            'path_file_jobs': self.path_file_jobs,
+            'path_file_jobseeker': self.path_file_jobseeker,
+            'jobs_file_bytes': os.path.getsize(self.path_file_jobs),
+            'jobseekers_file_bytes': os.path.getsize(self.path_file_jobseeker)
+        }
+
+
+
+    def save(self, results: List[Dict], path_file: str, input_settings: Dict = None) -> None:
+        """
+        Function for saving the results as JSON.
+
+        Parameters:
+        - results(List[Dict]): Results of run.
+        - path_file(str): Path of the JSON file to write.
+        - input_settings(Dict): Settings the input files were generated with, if any. Set to None by default.
+        """
+        with open(path_file, 'w') as file:
+            json.dump({'environment': self.environment(), 'input_settings': input_settings, 'results': results}, file, indent=2)
+
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the matching modes on generated or given input files.")
+    parser.add_argument('--jobs-file', default=None, help="Path to an existing jobs CSV file instead of generating one.")
+    parser.add_argument('--jobseekers-file', default=None, help="Path to an existing job seekers CSV file instead of generating one.")
+    parser.add_argument('--jobs', type=int, default=2000, help="Number of generated jobs.")
+    parser.add_argument('--jobseekers', type=int, default=2000, help="Number of generated job seekers.")
+    parser.add_argument('--vocabulary-size', type=int, default=1000, help="Number of distinct generated skills.")
+    parser.add_argument('--zipf-exponent', type=float, default=1.1, help="Exponent of the Zipf distributed skill popularity.")
+    parser.add_argument('--skills-per-row', type=int, nargs=2, default=(1, 8), metavar=('MIN', 'MAX'), help="Range of skills drawn per row.")
+    parser.add_argument('--null-rate', type=float, default=0.0, help="Fraction of generated rows with null skills.")
+    parser.add_argument('--duplicate-rate', type=float, default=0.0, help="Fraction of generated rows followed by an exact duplicate.")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the random generator.")
+    parser.add_argument('--modes', nargs='+', default=list(BenchmarkRunner.modes), help="Modes to run.")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1], help="Numbers of worker processes of the parallel and streaming modes.")
+    parser.add_argument('--matching-backend', default='auto', help="Matching backend of the engine, e.g. the approximate minhash_lsh.")
+    parser.add_argument('--lsh-bands', type=int, default=16, help="Number of bands of the minhash_lsh backend.")
+    parser.add_argument('--lsh-rows-per-band', type=int, default=2, help="Number of signature values per band of the minhash_lsh backend.")
+    parser.add_argument('--top-k', type=int, default=None, help="Maximum number of recommendations kept per job seeker.")
+    parser.add_argument('--repeats', type=int, default=1, help="Number of times every case is run.")
+    parser.add_argument('--output', default='benchmark_results.json', help="Path of the JSON results file.")
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_directory:
+        # Generating the input files unless both are given
+        path_file_jobs, path_file_jobseeker = arguments.jobs_file, arguments.jobseekers_file
+        input_settings = None
+        if path_file_jobs is None or path_file_jobseeker is None:
+            input_settings = {setting: getattr(arguments, setting) for setting in ('jobs', 'jobseekers', 'vocabulary_size', 'zipf_exponent', 'skills_per_row',
+                                                                                  'null_rate', 'duplicate_rate', 'seed')}
+            path_file_jobs, path_file_jobseeker = os.path.join(data_directory, 'jobs.csv'), os.path.join(data_directory, 'jobseekers.csv')
+            SyntheticDataGenerator(arguments.vocabulary_size, arguments.zipf_exponent, tuple(arguments.skills_per_row), arguments.null_rate,
+                                   arguments.duplicate_rate, arguments.seed).write_files(path_file_jobs, path_file_jobseeker, arguments.jobs, arguments.jobseekers)
+
+        benchmark_runner = BenchmarkRunner(path_file_jobs, path_file_jobseeker, arguments.modes, arguments.workers, arguments.matching_backend,
+                                           arguments.top_k, arguments.repeats, arguments.lsh_bands, arguments.lsh_rows_per_band)
+        benchmark_results = benchmark_runner.run()
+        benchmark_runner.save(benchmark_results, arguments.output, input_settings)
+
+    for benchmark_result in benchmark_results:
+        print(json.dumps(benchmark_result))
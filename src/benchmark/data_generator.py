@@ -0,0 +1,170 @@
+# typing module for type hints
+from typing import Tuple
+# argparse module for the command line interface
+import argparse
+# numpy library for random sampling
+import numpy as np
+# pandas library for data manipulation and analysis
+import pandas as pd
+
+
+class SyntheticDataGenerator:
+    """
+    A class for generating synthetic jobs and job seekers CSV files of any size.
+
+    The skills are drawn from a vocabulary whose popularity follows a Zipf distribution, so a few skills are
+    very common and most are rare, like in real catalogs. Null values and exact duplicate rows can be injected
+    to exercise the cleansing. The rows are generated and written in chunks, so the memory stays bounded for
+    millions of rows, and the same seed always gives the same files.
+
+    Attributes:
+    - vocabulary_size(int): Number of distinct skills.
+    - zipf_exponent(float): Exponent s of the skill popularity, where the i-th most popular skill has weight 1 / i^s.
+    - skills_per_row(Tuple[int, int]): Smallest and largest number of skills drawn per row.
+    - null_rate(float): Fraction of rows whose skills are replaced by a null value.
+    - duplicate_rate(float): Fraction of rows followed by an exact duplicate of themselves.
+    - seed(int): Seed of the random generator.
+    """
+    chunk_size = 100000
+
+
+    def __init__(self, vocabulary_size: int = 1000, zipf_exponent: float = 1.1, skills_per_row: Tuple[int, int] = (1, 8),
+                 null_rate: float = 0.0, duplicate_rate: float = 0.0, seed: int = 0):
+        """
+        Constructor for class SyntheticDataGenerator.
+
+        Parameters:
+        - vocabulary_size(int): Number of distinct skills. Set to 1000 by default.
+        - zipf_exponent(float): Exponent of the skill popularity. Set to 1.1 by default.
+        - skills_per_row(Tuple[int, int]): Smallest and largest number of skills drawn per row. Set to (1, 8) by default.
+        - null_rate(float): Fraction of rows with null skills. Set to 0 by default.
+        - duplicate_rate(float): Fraction of rows followed by an exact duplicate. Set to 0 by default.
+        - seed(int): Seed of the random generator. Set to 0 by default.
+        """
+        if vocabulary_size < 1:
+            raise ValueError("Vocabulary size should be at least 1.")
+        if not 1 <= skills_per_row[0] <= skills_per_row[1]:
+            raise ValueError("Skills per row should be a range of positive numbers.")
+        if not (0 <= null_rate <= 1 and 0 <= duplicate_rate <= 1):
+            raise ValueError("Null and duplicate rates should be between 0 and 1.")
+        self.vocabulary_size = vocabulary_size
+        self.zipf_exponent = zipf_exponent
+        self.skills_per_row = skills_per_row
+        self.null_rate = null_rate
+        self.duplicate_rate = duplicate_rate
+        self.seed = seed
+
+        # Naming the skills and calculating their popularity once
+        self.skill_names = np.array([f"Skill {skill_id}" for skill_id in range(vocabulary_size)], dtype=object)
+        weights = 1 / np.arange(1, vocabulary_size + 1, dtype=np.float64) ** zipf_exponent
+        self.skill_probabilities = weights / weights.sum()
+
+
+
+    def generate_skills(self, random_generator: np.random.Generator, number_rows: int) -> list:
+        """
+        Function for drawing the skills strings of a number of rows.
+
+        Each row draws its number of skills uniformly from skills_per_row and the skills by popularity. A skill
+        drawn twice for the same row is kept once, so popular skills lower the number of skills a little.
+
+        Parameters:
+        - random_generator(np.random.Generator): Random generator to draw from.
+        - number_rows(int): Number of rows.
+
+        Returns:
+        - list: Comma separated skills of each row.
+        """
+        skill_counts = random_generator.integers(self.skills_per_row[0], self.skills_per_row[1] + 1, size=number_rows)
+        skill_ids = random_generator.choice(self.vocabulary_size, size=int(skill_counts.sum()), p=self.skill_probabilities)
+        row_ends = np.cumsum(skill_counts).tolist()
+        skill_names = self.skill_names[skill_ids].tolist()
+        # Dropping repeated skills of a row while keeping the order in which they were drawn
+        return [", ".join(dict.fromkeys(skill_names[end - count:end])) for end, count in zip(row_ends, skill_counts.tolist())]
+
+
+
+    def generate_rows(self, random_generator: np.random.Generator, first_id: int, number_rows: int, label_column: str,
+                      label_prefix: str, skills_column: str) -> pd.DataFrame:
+        """
+        Function for generating a chunk of rows with unique ids, injecting nulls and duplicates.
+
+        Parameters:
+        - random_generator(np.random.Generator): Random generator to draw from.
+        - first_id(int): ID of the first row.
+        - number_rows(int): Number of rows before injecting duplicates.
+        - label_column(str): Name of the title or name column.
+        - label_prefix(str): Prefix of the titles or names.
+        - skills_column(str): Name of the skills column.
+
+        Returns:
+        - pd.DataFrame: Generated rows.
+        """
+        ids = np.arange(first_id, first_id + number_rows)
+        skills = pd.Series(self.generate_skills(random_generator, number_rows), dtype=object)
+        skills[random_generator.random(number_rows) < self.null_rate] = None
+        rows = pd.DataFrame({'id': ids, label_column: [f"{label_prefix} {row_id % 1000}" for row_id in ids.tolist()], skills_column: skills})
+
+        # Following some rows by an exact duplicate of themselves
+        repeats = np.where(random_generator.random(number_rows) < self.duplicate_rate, 2, 1)
+        return rows.loc[rows.index.repeat(repeats)]
+
+
+
+    def write_file(self, path_file: str, number_rows: int, label_column: str, label_prefix: str, skills_column: str, seed_offset: int) -> None:
+        """
+        Function for writing a generated CSV file chunk by chunk.
+
+        Parameters:
+        - path_file(str): Path of the CSV file to write.
+        - number_rows(int): Number of rows before injecting duplicates.
+        - label_column(str): Name of the title or name column.
+        - label_prefix(str): Prefix of the titles or names.
+        - skills_column(str): Name of the skills column.
+        - seed_offset(int): Offset added to the seed, so that the jobs and job seekers draw different skills.
+        """
+        random_generator = np.random.default_rng(self.seed + seed_offset)
+        with open(path_file, 'w', newline='') as file:
+            # Writing the header even if there are no rows
+            file.write(f"id,{label_column},{skills_column}\n")
+            for start in range(0, number_rows, self.chunk_size):
+                rows = self.generate_rows(random_generator, start + 1, min(self.chunk_size, number_rows - start), label_column, label_prefix, skills_column)
+                rows.to_csv(file, header=False, index=False)
+
+
+
+    def write_files(self, path_file_jobs: str, path_file_jobseeker: str, number_jobs: int, number_jobseekers: int) -> None:
+        """
+        Function for writing a generated jobs file and job seekers file.
+
+        Parameters:
+        - path_file_jobs(str): Path of the jobs CSV file to write.
+        - path_file_jobseeker(str): Path of the job seekers CSV file to write.
+        - number_jobs(int): Number of jobs before injecting duplicates.
+        - number_jobseekers(int): Number of job seekers before injecting duplicates.
+        """
+        try:
+            self.write_file(path_file_jobs, number_jobs, 'title', 'Job', 'required_skills', 0)
+            self.write_file(path_file_jobseeker, number_jobseekers, 'name', 'Jobseeker', 'skills', 1)
+
+        except OSError as ex:
+            # Handling errors while writing the files
+            raise ValueError(f"An error occurred while writing the generated files: {ex}")
+
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Generate synthetic jobs and job seekers CSV files.")
+    parser.add_argument('--jobs-file', default='jobs_generated.csv', help="Path of the jobs CSV file to write.")
+    parser.add_argument('--jobseekers-file', default='jobseekers_generated.csv', help="Path of the job seekers CSV file to write.")
+    parser.add_argument('--jobs', type=int, default=10000, help="Number of jobs.")
+    parser.add_argument('--jobseekers', type=int, default=10000, help="Number of job seekers.")
+    parser.add_argument('--vocabulary-size', type=int, default=1000, help="Number of distinct skills.")
+    parser.add_argument('--zipf-exponent', type=float, default=1.1, help="Exponent of the Zipf distributed skill popularity.")
+    parser.add_argument('--skills-per-row', type=int, nargs=2, default=(1, 8), metavar=('MIN', 'MAX'), help="Range of skills drawn per row.")
+    parser.add_argument('--null-rate', type=float, default=0.0, help="Fraction of rows with null skills.")
+    parser.add_argument('--duplicate-rate', type=float, default=0.0, help="Fraction of rows followed by an exact duplicate.")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the random generator.")
+    arguments = parser.parse_args()
+    SyntheticDataGenerator(arguments.vocabulary_size, arguments.zipf_exponent, tuple(arguments.skills_per_row), arguments.null_rate,
+                           arguments.duplicate_rate, arguments.seed).write_files(arguments.jobs_file, arguments.jobseekers_file, arguments.jobs, arguments.jobseekers)
@@ -0,0 +1,217 @@
+# typing module for type hints
+from typing import Dict, Iterator, Optional, Set
+# copy module for storing the chunk results without their jobs table
+import copy
+# json module for the manifest of the work log
+import json
+# os module for the paths and durable writes of the work log
+import os
+# pickle module for storing the chunk results with their exact values
+import pickle
+# re module for recognizing the chunk files
+import re
+# pandas library for data manipulation and analysis
+import pandas as pd
+# custom RecommendationResult class for the recommendations of the chunks
+from ..recommendation_result.recommendation_result import RecommendationResult
+
+
+class CheckpointLog:
+    """
+    A class for committing the recommendations of every finished job seeker chunk to a durable work log on disk.
+
+    The work log is a directory holding a manifest, i.e. the fingerprints of the input files and the settings of the
+    engine, and one file per finished chunk, named after the position of the chunk in the job seeker file. Every file
+    is written to a temporary file, flushed to disk and then renamed, so a run killed at any point leaves only
+    complete chunks behind. A run with the same manifest skips the chunks already in the log and loads their
+    recommendations instead, so its output is identical to the one of an uninterrupted run. A work log with another
+    manifest, e.g. after the inputs or the settings changed, is discarded.
+
+    Attributes:
+    - checkpoint_directory(str): Directory of the work log.
+    - manifest(Dict): Fingerprints of the input files and settings of the engine the chunks belong to.
+    - finished_chunks(Set[int]): Positions of the chunks committed by earlier runs, which are skipped.
+    - chunks_committed(int): Number of chunks committed by the current run.
+    - chunks_resumed(int): Number of chunks loaded from the work log by the current run.
+    """
+    checkpoint_format_version = 1
+    manifest_file_name = 'manifest.json'
+    chunk_file_pattern = re.compile(r'chunk_(\d+)\.pickle')
+
+
+    def __init__(self, checkpoint_directory: str, manifest: Dict):
+        """
+        Constructor for class CheckpointLog.
+
+        Parameters:
+        - checkpoint_directory(str): Directory of the work log. It is created if it does not exist.
+        - manifest(Dict): Fingerprints of the input files and settings of the engine, which must be JSON serializable.
+        """
+        self.checkpoint_directory = checkpoint_directory
+        self.manifest = dict(manifest, version=self.checkpoint_format_version)
+        self.chunks_committed = 0
+        self.chunks_resumed = 0
+        os.makedirs(checkpoint_directory, exist_ok=True)
+
+        # Resuming the work log of the same inputs and settings, or starting a new one
+        if self.read_manifest() == self.manifest:
+            self.finished_chunks: Set[int] = self.committed_chunks()
+        else:
+            self.clear()
+            self.write_durably(os.path.join(checkpoint_directory, self.manifest_file_name), json.dumps(self.manifest, indent=2).encode('utf-8'))
+            self.finished_chunks = set()
+
+
+
+    def read_manifest(self) -> Optional[Dict]:
+        """
+        Function for reading the manifest of the work log.
+
+        Returns:
+        - Optional[Dict]: Manifest of the work log, or None if it is missing or unreadable.
+        """
+        try:
+            with open(os.path.join(self.checkpoint_directory, self.manifest_file_name)) as file:
+                return json.load(file)
+
+        except (OSError, ValueError):
+            # Treating a missing or partial manifest as no work log
+            return None
+
+
+
+    def chunk_path(self, chunk_index: int) -> str:
+        """
+        Function for getting the path of the file of a chunk.
+
+        Parameters:
+        - chunk_index(int): Position of the chunk in the job seeker file.
+
+        Returns:
+        - str: Path of the chunk file.
+        """
+        return os.path.join(self.checkpoint_directory, f'chunk_{chunk_index:08d}.pickle')
+
+
+
+    def committed_chunks(self) -> Set[int]:
+        """
+        Function for listing the chunks in the work log.
+
+        Returns:
+        - Set[int]: Positions of the committed chunks.
+        """
+        matches = (self.chunk_file_pattern.fullmatch(file_name) for file_name in os.listdir(self.checkpoint_directory))
+        return {int(match.group(1)) for match in matches if match is not None}
+
+
+
+    def clear(self) -> None:
+        """
+        Function for removing the manifest, the chunk files and any partially written file of the work log.
+        """
+        for file_name in os.listdir(self.checkpoint_directory):
+            if file_name == self.manifest_file_name or file_name.endswith('.tmp') or self.chunk_file_pattern.fullmatch(file_name):
+                os.remove(os.path.join(self.checkpoint_directory, file_name))
+        self.finished_chunks = set()
+
+
+
+    @staticmethod
+    def write_durably(path_file: str, data: bytes) -> None:
+        """
+        Static method for writing a file so that it is either complete on disk or missing, also after a crash.
+
+        Parameters:
+        - path_file(str): Path of the file.
+        - data(bytes): Contents of the file.
+        """
+        temporary_path = path_file + f'.{os.getpid()}.tmp'
+        with open(temporary_path, 'wb') as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path_file)
+
+
+
+    def commit(self, chunk_index: int, chunk_result: RecommendationResult) -> None:
+        """
+        Function for committing the recommendations of a finished chunk to the work log.
+
+        Parameters:
+        - chunk_index(int): Position of the chunk in the job seeker file.
+        - chunk_result(RecommendationResult): Recommendations of the chunk. The jobs table is not stored.
+        """
+        stored_result = copy.copy(chunk_result)
+        stored_result.jobs_df = None
+        self.write_durably(self.chunk_path(chunk_index), pickle.dumps(stored_result, protocol=pickle.HIGHEST_PROTOCOL))
+        self.chunks_committed += 1
+
+
+
+    def load(self, chunk_index: int, jobs_df: pd.DataFrame) -> RecommendationResult:
+        """
+        Function for loading the recommendations of a chunk committed by an earlier run.
+
+        Parameters:
+        - chunk_index(int): Position of the chunk in the job seeker file.
+        - jobs_df(pd.DataFrame): Jobs the job positions of the recommendations refer to.
+
+        Returns:
+        - RecommendationResult: Recommendations of the chunk.
+        """
+        try:
+            with open(self.chunk_path(chunk_index), 'rb') as file:
+                chunk_result = pickle.load(file)
+
+        except (OSError, pickle.UnpicklingError, EOFError) as ex:
+            # Handling chunk files removed or damaged since the work log was opened
+            raise ValueError(f"An error occurred while loading chunk {chunk_index} of the work log: {ex}")
+        chunk_result.jobs_df = jobs_df
+        self.chunks_resumed += 1
+        return chunk_result
+
+
+
+    def unfinished(self, jobseeker_chunks: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Function for skipping the job seeker chunks which are already in the work log.
+
+        Parameters:
+        - jobseeker_chunks(Iterator[pd.DataFrame]): All chunks of job seeker data, in order.
+
+        Returns:
+        - Iterator[pd.DataFrame]: Chunks which still have to be matched, in order.
+        """
+        for chunk_index, jobseekers_chunk in enumerate(jobseeker_chunks):
+            if chunk_index not in self.finished_chunks:
+                yield jobseekers_chunk
+
+
+
+    def resume(self, chunk_results: Iterator[RecommendationResult], jobs_df: pd.DataFrame) -> Iterator[RecommendationResult]:
+        """
+        Function for merging the chunks of the work log with the newly matched chunks and committing the latter.
+
+        Parameters:
+        - chunk_results(Iterator[RecommendationResult]): Recommendations of the chunks returned by unfinished, in order.
+        - jobs_df(pd.DataFrame): Jobs the job positions of the recommendations refer to.
+
+        Returns:
+        - Iterator[RecommendationResult]: Recommendations of all chunks in the order of the job seeker file.
+        """
+        chunk_index = 0
+        for chunk_result in chunk_results:
+            # Loading the finished chunks before the newly matched one
+            while chunk_index in self.finished_chunks:
+                yield self.load(chunk_index, jobs_df)
+                chunk_index += 1
+            self.commit(chunk_index, chunk_result)
+            yield chunk_result
+            chunk_index += 1
+
+        # Loading the finished chunks after the last newly matched one
+        while chunk_index in self.finished_chunks:
+            yield self.load(chunk_index, jobs_df)
+            chunk_index += 1
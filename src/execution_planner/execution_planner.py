@@ -0,0 +1,362 @@
+# typing module for type hints
+from typing import Dict, Tuple
+# io module for parsing the sampled lines
+import io
+# itertools module for reading the first lines of a file
+import itertools
+# math module for rounding up the number of bitmask words
+import math
+# multiprocessing module for counting the CPU cores
+import multiprocessing as mp
+# os module for operating system functionalities
+import os
+# pandas library for parsing the sampled rows
+import pandas as pd
+# psutil library for measuring the available memory
+import psutil
+# custom File class for cleansing the sampled rows
+from ..file_reader.read_files import File
+# custom skill vocabulary and incidence matrix classes for encoding the sampled skills
+from ..skill_matching.skill_vocabulary import SkillVocabulary, SkillMatrix
+# custom SparseMatchingBackend class for matching the sampled rows
+from ..skill_matching.matching_backend import SparseMatchingBackend
+
+
+class ExecutionPlan:
+    """
+    A class representing the strategy, matching backend, worker count and chunk size chosen for a run.
+
+    Attributes:
+    - strategy(str): Processing strategy, either 'vectorized' or 'parallel'.
+    - matching_backend(str): Name of the matching backend, one of the keys of JobMatchRecommendationEngine.matching_backends.
+    - workers(int): Number of worker processes, 1 for vectorized processing.
+    - jobseeker_chunk_size(int): Number of job seekers matched at once.
+    - statistics(Dict): Sampled statistics of the input files the plan is based on.
+    - resources(Dict): CPU cores and available memory the plan is based on.
+    - costs(Dict): Estimated seconds of every strategy and matching backend.
+    - reasons(Dict): Short explanation of every choice.
+    """
+
+    def __init__(self, strategy: str, matching_backend: str, workers: int, jobseeker_chunk_size: int, statistics: Dict, resources: Dict,
+                 costs: Dict, reasons: Dict):
+        """
+        Constructor for class ExecutionPlan.
+
+        Parameters:
+        - strategy(str): Processing strategy, either 'vectorized' or 'parallel'.
+        - matching_backend(str): Name of the matching backend.
+        - workers(int): Number of worker processes.
+        - jobseeker_chunk_size(int): Number of job seekers matched at once.
+        - statistics(Dict): Sampled statistics of the input files.
+        - resources(Dict): CPU cores and available memory.
+        - costs(Dict): Estimated seconds of every strategy and matching backend.
+        - reasons(Dict): Short explanation of every choice.
+        """
+        self.strategy = strategy
+        self.matching_backend = matching_backend
+        self.workers = workers
+        self.jobseeker_chunk_size = jobseeker_chunk_size
+        self.statistics = statistics
+        self.resources = resources
+        self.costs = costs
+        self.reasons = reasons
+
+
+
+    def explain(self) -> str:
+        """
+        Function for describing the plan and the estimates it is based on, like an EXPLAIN of a database.
+
+        Returns:
+        - str: Human readable description of the plan.
+        """
+        statistics = self.statistics
+        lines = [f"Execution plan: {self.strategy} processing ({self.reasons['strategy']})",
+                 f"  matching backend: {self.matching_backend} ({self.reasons['matching_backend']})",
+                 f"  workers: {self.workers} ({self.reasons['workers']})",
+                 f"  job seeker chunk size: {self.jobseeker_chunk_size} ({self.reasons['jobseeker_chunk_size']})",
+                 "Estimates:"]
+        for table in ('jobs', 'jobseekers'):
+            table_statistics = statistics[table]
+            lines.append(f"  {table}: {table_statistics['rows']} rows{'' if table_statistics['exact'] else ' (estimated)'}, "
+                         f"{table_statistics['skills_per_row']:.2f} skills per row, {table_statistics['sampled_rows']} rows sampled")
+        lines.extend([f"  skill vocabulary: {statistics['vocabulary_size']} skills seen in the sampled jobs",
+                      f"  overlap rate: {statistics['overlap_rate']:.2%} of the pairs share a skill, "
+                      f"{statistics['skills_per_match']:.2f} matching skills per matching pair",
+                      f"  matching pairs: {statistics['matching_pairs']:.0f} of {statistics['pairs']} pairs, {statistics['recommendations']:.0f} recommendations",
+                      f"  resources: {self.resources['cpu_count']} CPU cores, {self.resources['available_memory'] / 1024 ** 3:.2f} GB available memory",
+                      "Costs (estimated seconds):"])
+        lines.extend(f"  {name}: {cost:.3f}" for name, cost in self.costs.items())
+        return "\n".join(lines)
+
+
+
+    def to_dict(self) -> Dict:
+        """
+        Function for converting the plan into a dictionary, e.g. for logging it as JSON.
+
+        Returns:
+        - Dict: Choices, statistics, resources, costs and reasons of the plan.
+        """
+        return {'strategy': self.strategy, 'matching_backend': self.matching_backend, 'workers': self.workers,
+                'jobseeker_chunk_size': self.jobseeker_chunk_size, 'statistics': self.statistics, 'resources': self.resources,
+                'costs': self.costs, 'reasons': self.reasons}
+
+
+
+class ExecutionPlanner:
+    """
+    A class for choosing how to process a pair of input files from a cost model, instead of the file size.
+
+    It reads only sample_rows rows of each file, in sample_blocks blocks spread evenly over the file so that files
+    sorted by id, date or skill are not judged by their beginning, to estimate the row counts, the average number of
+    skills per row and the overlap rate, i.e. the fraction of job seeker and job pairs sharing at least one skill,
+    by matching the sampled job seekers against the sampled jobs. The row counts are extrapolated from the bytes per
+    sampled line and the file sizes. From these, the cost of every matching backend and of vectorized and parallel
+    processing is estimated in seconds, using per unit costs measured with the benchmark runner, and the cheapest
+    plan fitting the available CPU cores and memory is chosen.
+
+    Parallel processing only spreads the matching over the workers, while the job seeker file is read and the
+    recommendations are built in the main process, so it is only chosen when the matching dominates, e.g. with top_k set.
+
+    Attributes:
+    - path_file_jobs(str): Path to the file containing jobs data.
+    - path_file_jobseeker(str): Path to the file containing jobseekers data.
+    - sample_rows(int): Number of rows read from each file for the estimates.
+    - cpu_count(int): Number of CPU cores, or None to detect it.
+    - available_memory(int): Available memory in bytes, or None to detect it.
+    """
+    seconds_per_row_parsed = 8e-6
+    seconds_per_matching_skill = 4e-8
+    seconds_per_pair_word = 2e-8
+    seconds_per_matching_pair = 1e-7
+    seconds_per_recommendation = 1.5e-6
+    seconds_per_transferred_match = 5e-8
+    seconds_per_worker_start = 0.2
+    seconds_per_worker_job = 2e-6
+    bytes_per_match = 40
+    bytes_per_job = 300
+    memory_fraction = 0.5
+    min_chunk_size = 100
+    max_chunk_size = 100000
+    chunks_per_worker = 4
+    sample_blocks = 8
+
+
+    def __init__(self, path_file_jobs: str, path_file_jobseeker: str, sample_rows: int = 2000, cpu_count: int = None, available_memory: int = None):
+        """
+        Constructor for class ExecutionPlanner.
+
+        Parameters:
+        - path_file_jobs(str): Path to the file containing jobs data.
+        - path_file_jobseeker(str): Path to the file containing jobseekers data.
+        - sample_rows(int): Number of rows read from each file for the estimates. Set to 2000 rows by default.
+        - cpu_count(int): Number of CPU cores. Set to None by default, i.e. detected with multiprocessing.
+        - available_memory(int): Available memory in bytes. Set to None by default, i.e. detected with psutil.
+        """
+        if sample_rows < 1:
+            raise ValueError("Sample rows should be at least 1.")
+        self.path_file_jobs = path_file_jobs
+        self.path_file_jobseeker = path_file_jobseeker
+        self.sample_rows = sample_rows
+        self.cpu_count = cpu_count
+        self.available_memory = available_memory
+
+
+
+    def sample_file(self, path_file: str) -> Tuple[pd.DataFrame, int, bool]:
+        """
+        Function for reading and cleansing a sample of the rows of a file and estimating its number of cleansed rows.
+
+        When the file has more than sample_rows rows, the sample is made of sample_blocks blocks of consecutive lines
+        starting at evenly spaced byte offsets, each after the first line break following its offset. The lines of
+        the file are assumed not to contain line breaks inside quoted values.
+
+        Parameters:
+        - path_file(str): Path of the CSV file.
+
+        Returns:
+        - Tuple[pd.DataFrame, int, bool]: Cleansed sampled rows, estimated number of cleansed rows of the file and
+                                          whether the estimate is exact, i.e. the sample is the whole file.
+        """
+        # Reading the header and the lines as bytes, so that the bytes per line are known
+        with open(path_file, 'rb') as file:
+            header = file.readline()
+            lines = list(itertools.islice(file, self.sample_rows))
+            exact = file.read(1) == b''
+            if not exact:
+                # Reading blocks of lines spread evenly over the file instead of the first lines
+                file_size, rows_per_block, lines = os.path.getsize(path_file), max(self.sample_rows // self.sample_blocks, 1), []
+                for block in range(self.sample_blocks):
+                    file.seek(len(header) + (file_size - len(header)) * block // self.sample_blocks)
+                    if block:
+                        file.readline()
+                    lines.extend(itertools.islice(file, rows_per_block))
+        sample_df = pd.read_csv(io.BytesIO(header + b''.join(lines)))
+        sampled_df = File.cleanse_dataset(sample_df)
+        if exact or len(sample_df) == 0:
+            return sampled_df, len(sampled_df), True
+
+        # Extrapolating the number of rows from the file size and scaling it by the share of rows kept by the cleansing
+        row_bytes = sum(len(line) for line in lines) / len(sample_df)
+        rows = (os.path.getsize(path_file) - len(header)) / row_bytes
+        return sampled_df, int(round(rows * len(sampled_df) / len(sample_df))), False
+
+
+
+    def collect_statistics(self) -> Dict:
+        """
+        Function for estimating the row counts, skills per row and overlap rate of the input files from samples.
+
+        Returns:
+        - Dict: Statistics of the jobs and the job seekers, the vocabulary size, the number of pairs and the
+                estimated overlap rate and number of matching pairs.
+        """
+        jobs_df, job_rows, jobs_exact = self.sample_file(self.path_file_jobs)
+        jobseekers_df, jobseeker_rows, jobseekers_exact = self.sample_file(self.path_file_jobseeker)
+
+        # Matching the sampled job seekers against the sampled jobs
+        vocabulary = SkillVocabulary()
+        job_matrix = SkillMatrix.from_skills(jobs_df['required_skills'], vocabulary)
+        seeker_matrix = SkillMatrix.from_skills(jobseekers_df['skills'], vocabulary, grow_vocabulary=False)
+        matching_skill_counts = SparseMatchingBackend(job_matrix).match_block(seeker_matrix)[2]
+        sampled_pairs = len(job_matrix) * len(seeker_matrix)
+        overlap_rate = len(matching_skill_counts) / sampled_pairs if sampled_pairs else 0.0
+        skills_per_match = float(matching_skill_counts.mean()) if len(matching_skill_counts) else 0.0
+
+        return {'jobs': {'rows': job_rows, 'exact': jobs_exact, 'sampled_rows': len(jobs_df),
+                         'skills_per_row': float(job_matrix.skill_counts.mean()) if len(job_matrix) else 0.0},
+                'jobseekers': {'rows': jobseeker_rows, 'exact': jobseekers_exact, 'sampled_rows': len(jobseekers_df),
+                               'skills_per_row': float(seeker_matrix.skill_counts.mean()) if len(seeker_matrix) else 0.0},
+                'vocabulary_size': len(vocabulary), 'pairs': job_rows * jobseeker_rows, 'overlap_rate': overlap_rate,
+                'skills_per_match': skills_per_match, 'matching_pairs': overlap_rate * job_rows * jobseeker_rows}
+
+
+
+    def detect_resources(self) -> Dict:
+        """
+        Function for detecting the CPU cores and the available memory, unless they were given.
+
+        Returns:
+        - Dict: Number of CPU cores and available memory in bytes.
+        """
+        cpu_count = self.cpu_count if self.cpu_count is not None else mp.cpu_count()
+        available_memory = self.available_memory if self.available_memory is not None else psutil.virtual_memory().available
+        return {'cpu_count': max(cpu_count, 1), 'available_memory': available_memory}
+
+
+
+    def estimate_matching_costs(self, statistics: Dict, bitset_vocabulary_limit: int) -> Dict:
+        """
+        Function for estimating the seconds spent by every eligible matching backend on all pairs.
+
+        The sparse product does work for every matching skill of every matching pair, while the bitset backend
+        does work for every pair and 64-bit word of the bitmasks, so it is only considered for small vocabularies.
+
+        Parameters:
+        - statistics(Dict): Statistics returned by collect_statistics.
+        - bitset_vocabulary_limit(int): Largest vocabulary size for which the bitset backend is considered.
+
+        Returns:
+        - Dict: Estimated seconds of each eligible backend.
+        """
+        matching_pairs = statistics['matching_pairs']
+        # Selecting the best matches and calculating the percentages for every matching pair
+        pair_cost = self.seconds_per_matching_pair * matching_pairs
+        costs = {'sparse': self.seconds_per_matching_skill * matching_pairs * statistics['skills_per_match'] + pair_cost}
+        if statistics['vocabulary_size'] <= bitset_vocabulary_limit:
+            number_words = max(1, math.ceil(statistics['vocabulary_size'] / 64))
+            costs['bitset'] = self.seconds_per_pair_word * statistics['pairs'] * number_words + pair_cost
+        return costs
+
+
+
+    def choose_chunk_size(self, statistics: Dict, workers: int, available_memory: int) -> Tuple[int, str]:
+        """
+        Function for choosing the number of job seekers matched at once.
+
+        The chunks are as large as possible while the intermediate matches of all chunks in flight fit the share
+        of available memory, and small enough that every worker gets a few chunks to balance the load.
+
+        Parameters:
+        - statistics(Dict): Statistics returned by collect_statistics.
+        - workers(int): Number of worker processes, 1 for vectorized processing.
+        - available_memory(int): Available memory in bytes.
+
+        Returns:
+        - Tuple[int, str]: Chunk size and the reason for it.
+        """
+        jobseeker_rows = max(statistics['jobseekers']['rows'], 1)
+        matches_per_jobseeker = max(statistics['overlap_rate'] * statistics['jobs']['rows'], 1)
+        memory_chunk_size = int(available_memory * self.memory_fraction / (workers + 1) / (self.bytes_per_match * matches_per_jobseeker))
+        chunk_size, reason = memory_chunk_size, f"about {matches_per_jobseeker:.0f} matches per job seeker within the memory budget"
+        if workers > 1 and jobseeker_rows // (workers * self.chunks_per_worker) < chunk_size:
+            chunk_size, reason = jobseeker_rows // (workers * self.chunks_per_worker), f"{self.chunks_per_worker} chunks per worker"
+        if chunk_size < self.min_chunk_size:
+            chunk_size, reason = self.min_chunk_size, "smallest chunk size"
+        if chunk_size > min(self.max_chunk_size, jobseeker_rows):
+            chunk_size, reason = min(self.max_chunk_size, jobseeker_rows), "all job seekers fit" if jobseeker_rows <= self.max_chunk_size else "largest chunk size"
+        return chunk_size, reason
+
+
+
+    def plan(self, matching_backend: str = "auto", pool_size: int = None, top_k: int = None, bitset_vocabulary_limit: int = 64) -> ExecutionPlan:
+        """
+        Function for choosing the cheapest execution plan for the input files.
+
+        Parameters:
+        - matching_backend(str): Configured matching backend, or 'auto' to choose it. Set to 'auto' by default.
+        - pool_size(int): Configured number of worker processes, or None to choose it. Set to None by default.
+        - top_k(int): Maximum number of recommendations kept per job seeker, or None for all of them. Set to None by default.
+        - bitset_vocabulary_limit(int): Largest vocabulary size for which the bitset backend is considered. Set to 64 by default.
+
+        Returns:
+        - ExecutionPlan: Chosen plan with the estimates it is based on.
+        """
+        try:
+            statistics = self.collect_statistics()
+            resources = self.detect_resources()
+            job_rows, jobseeker_rows = statistics['jobs']['rows'], statistics['jobseekers']['rows']
+            recommendations = statistics['matching_pairs'] if top_k is None else min(statistics['matching_pairs'], top_k * jobseeker_rows)
+            statistics['recommendations'] = recommendations
+            reasons = {}
+
+            # Choosing the cheapest matching backend unless one is configured
+            costs = self.estimate_matching_costs(statistics, bitset_vocabulary_limit)
+            if matching_backend == "auto":
+                matching_backend = min(costs, key=costs.get)
+                reasons['matching_backend'] = "cheapest estimated matching"
+            else:
+                reasons['matching_backend'] = "configured"
+            matching_cost = costs.get(matching_backend, costs['sparse'])
+            costs = {f"matching with {name}": cost for name, cost in costs.items()}
+
+            # Choosing the number of workers from the CPU cores and the memory each worker needs for the jobs
+            if pool_size is not None:
+                workers, reasons['workers'] = pool_size, "configured"
+            else:
+                cpu_workers = max(resources['cpu_count'] - 1, 1)
+                memory_workers = max(int(resources['available_memory'] * self.memory_fraction / max(job_rows * self.bytes_per_job, 1)), 1)
+                workers = min(cpu_workers, memory_workers)
+                reasons['workers'] = "one CPU core left for the main process" if workers == cpu_workers else "jobs copies fitting the memory budget"
+
+            # Estimating both strategies, which share the reading of the files and the building of the recommendations
+            shared_cost = self.seconds_per_row_parsed * (job_rows + jobseeker_rows) + self.seconds_per_recommendation * recommendations
+            costs['vectorized processing'] = shared_cost + matching_cost
+            costs['parallel processing'] = (shared_cost + matching_cost / workers + self.seconds_per_transferred_match * recommendations
+                                            + workers * (self.seconds_per_worker_start + self.seconds_per_worker_job * job_rows))
+            if workers > 1 and costs['parallel processing'] < costs['vectorized processing']:
+                strategy, reasons['strategy'] = "parallel", "cheaper than vectorized processing"
+            else:
+                strategy = "vectorized"
+                reasons['strategy'] = "cheaper than parallel processing" if workers > 1 else "a single worker"
+                if workers > 1:
+                    reasons['workers'] = "vectorized processing runs in the main process"
+                workers = 1
+
+            jobseeker_chunk_size, reasons['jobseeker_chunk_size'] = self.choose_chunk_size(statistics, workers, resources['available_memory'])
+            return ExecutionPlan(strategy, matching_backend, workers, jobseeker_chunk_size, statistics, resources, costs, reasons)
+
+        except Exception as ex:
+            # Handling unexpected errors
+            raise ValueError(f"An unexpected error occurred while planning the execution: {ex}")
@@ -0,0 +1,228 @@
+# typing module for type hints
+from typing import Dict, Iterator, List, Tuple, Union
+# heapq module for the k-way merge of the sorted runs
+import heapq
+# os module for the paths of the run files
+import os
+# pickle module for writing the rows of the runs with their Python types
+import pickle
+# shutil and tempfile modules for the temporary directory of the runs
+import shutil
+import tempfile
+# numpy library for numerical arrays
+import numpy as np
+# custom RecommendationResult class for sorting columnar recommendations
+from ..recommendation_result.recommendation_result import RecommendationResult
+
+
+class ExternalRecommendationSorter:
+    """
+    A class for sorting more recommendations than fit into memory.
+
+    The recommendations are buffered until the buffer reaches the memory budget. The buffer is then sorted and
+    spilled to a temporary file as a sorted run, in blocks of pickled rows. At the end, the runs and the remaining
+    buffer are merged with a heap, so only one block per run is held in memory. The order is the one of
+    sort_recommendations: jobseeker ID ascending, matching skill percentage descending and job ID ascending, with
+    rows equal in all three kept in the order they were added.
+
+    The memory of the buffer is estimated per recommendation, which is far smaller for columnar results than for
+    dictionaries.
+
+    Attributes:
+    - memory_budget(int): Largest estimated number of bytes of buffered recommendations.
+    - run_paths(List[str]): Paths of the sorted runs spilled so far.
+    - rows_added(int): Number of recommendations added so far.
+    """
+    columns = RecommendationResult.columns
+    default_memory_budget = 256 * 2**20
+    bytes_per_row = 400
+    bytes_per_result_row = 64
+    rows_per_block = 10000
+
+
+    def __init__(self, memory_budget: int, temporary_directory: str = None):
+        """
+        Constructor for class ExternalRecommendationSorter.
+
+        Parameters:
+        - memory_budget(int): Largest estimated number of bytes of buffered recommendations.
+        - temporary_directory(str): Directory in which the directory of the runs is created, or None for the
+                                    default temporary directory. Set to None by default.
+        """
+        if not isinstance(memory_budget, int) or isinstance(memory_budget, bool):
+            raise TypeError("Memory budget must be an integer")
+
+        if memory_budget < 1:
+            raise ValueError("Memory budget should be at least 1.")
+        self.memory_budget = memory_budget
+        self.run_directory = tempfile.mkdtemp(prefix='recommendation_runs_', dir=temporary_directory)
+        self.run_paths: List[str] = []
+        self.rows_added = 0
+        self.buffered_rows: List[Tuple] = []
+        self.buffered_results: List[RecommendationResult] = []
+        self.buffered_bytes = 0
+
+
+
+    def __enter__(self) -> "ExternalRecommendationSorter":
+        """
+        Function for entering the context of the sorter.
+
+        Returns:
+        - ExternalRecommendationSorter: The sorter itself.
+        """
+        return self
+
+
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Function for removing the runs when leaving the context of the sorter.
+        """
+        self.close()
+
+
+
+    @staticmethod
+    def sort_key(row: Tuple) -> Tuple:
+        """
+        Static method for getting the sort key of a row.
+
+        Parameters:
+        - row(Tuple): Values of the recommendation in the order of columns.
+
+        Returns:
+        - Tuple: Jobseeker id, negated matching skill percentage and job id.
+        """
+        return row[0], -row[5], row[2]
+
+
+
+    @classmethod
+    def result_rows(cls, result: RecommendationResult) -> Iterator[Tuple]:
+        """
+        Class method for converting columnar recommendations into rows, one block at a time.
+
+        Parameters:
+        - result(RecommendationResult): Recommendations.
+
+        Returns:
+        - Iterator[Tuple]: Values of every recommendation in the order of columns.
+        """
+        for start in range(0, len(result), cls.rows_per_block):
+            values = result.take(np.arange(start, min(start + cls.rows_per_block, len(result)))).column_values()
+            yield from zip(*(values[column] for column in cls.columns))
+
+
+
+    def add(self, recommendations: Union[List[Dict], RecommendationResult]) -> None:
+        """
+        Function for adding recommendations, spilling a sorted run whenever the buffer reaches the memory budget.
+
+        Parameters:
+        - recommendations(Union[List[Dict], RecommendationResult]): Recommendations as dictionaries or as columns.
+        """
+        if isinstance(recommendations, RecommendationResult):
+            if len(recommendations):
+                self.buffered_results.append(recommendations)
+                self.buffered_bytes += len(recommendations) * self.bytes_per_result_row
+        else:
+            self.buffered_rows.extend(tuple(recommendation[column] for column in self.columns) for recommendation in recommendations)
+            self.buffered_bytes += len(recommendations) * self.bytes_per_row
+        self.rows_added += len(recommendations)
+
+        if self.buffered_bytes >= self.memory_budget:
+            self.spill()
+
+
+
+    def sorted_buffer(self) -> Iterator[Tuple]:
+        """
+        Function for sorting the buffered recommendations and emptying the buffer.
+
+        Returns:
+        - Iterator[Tuple]: Buffered rows in sorted order.
+        """
+        buffered_rows, buffered_results = self.buffered_rows, self.buffered_results
+        self.buffered_rows, self.buffered_results, self.buffered_bytes = [], [], 0
+
+        # Sorting the columnar results with NumPy and the dictionaries with Python, both stable
+        buffered_rows.sort(key=self.sort_key)
+        if not buffered_results:
+            return iter(buffered_rows)
+        sorted_rows = self.result_rows(RecommendationResult.concatenate(buffered_results).sort())
+        return heapq.merge(sorted_rows, buffered_rows, key=self.sort_key) if buffered_rows else sorted_rows
+
+
+
+    def spill(self) -> None:
+        """
+        Function for writing the sorted buffer to a new run file.
+        """
+        run_path = os.path.join(self.run_directory, f'run_{len(self.run_paths)}.pickle')
+        with open(run_path, 'wb') as file:
+            block = []
+            for row in self.sorted_buffer():
+                block.append(row)
+                if len(block) == self.rows_per_block:
+                    pickle.dump(block, file, protocol=pickle.HIGHEST_PROTOCOL)
+                    block = []
+            if block:
+                pickle.dump(block, file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.run_paths.append(run_path)
+
+
+
+    @staticmethod
+    def read_run(run_path: str) -> Iterator[Tuple]:
+        """
+        Static method for reading the rows of a run one block at a time.
+
+        Parameters:
+        - run_path(str): Path of the run file.
+
+        Returns:
+        - Iterator[Tuple]: Rows of the run in sorted order.
+        """
+        with open(run_path, 'rb') as file:
+            while True:
+                try:
+                    block = pickle.load(file)
+                except EOFError:
+                    return
+                yield from block
+
+
+
+    def sorted_rows(self) -> Iterator[Tuple]:
+        """
+        Function for merging the runs and the remaining buffer into one sorted stream.
+
+        The runs are merged in the order they were spilled, followed by the buffer, so that equal rows keep the
+        order in which they were added.
+
+        Returns:
+        - Iterator[Tuple]: All rows in sorted order.
+        """
+        return heapq.merge(*(self.read_run(run_path) for run_path in self.run_paths), self.sorted_buffer(), key=self.sort_key)
+
+
+
+    def sorted_records(self) -> Iterator[Dict]:
+        """
+        Function for merging the runs and the remaining buffer into one sorted stream of dictionaries.
+
+        Returns:
+        - Iterator[Dict]: All recommendations in sorted order, with the same keys as sort_recommendations.
+        """
+        for row in self.sorted_rows():
+            yield dict(zip(self.columns, row))
+
+
+
+    def close(self) -> None:
+        """
+        Function for removing the run files.
+        """
+        shutil.rmtree(self.run_directory, ignore_errors=True)
+        self.run_paths = []
@@ -0,0 +1,210 @@
+# typing module for type hints
+from typing import Dict, Optional, Tuple
+# os module for operating system functionalities
+import os
+# hashlib module for hashing the file contents and paths
+import hashlib
+# json module for storing the fingerprint and column layout
+import json
+# numpy library for numerical arrays
+import numpy as np
+# pandas library for data manipulation and analysis
+import pandas as pd
+
+
+class ParsedFileCache:
+    """
+    A class for caching cleansed and tokenized CSV files on disk in a binary columnar format.
+
+    Every column of the cleansed dataset is stored as a NumPy array in an uncompressed .npz file, with text
+    columns packed into one UTF-8 buffer plus offsets. The skills columns are additionally stored tokenized,
+    as a list of distinct skill tokens and CSR arrays of token ids per row. A cache entry is keyed by the path
+    of the source file and the ingest options it was parsed with, and is only used if the size, modification time
+    and content hash of the file are unchanged, so it is invalidated automatically when the source changes and
+    entries of fast ingest mode and normal mode are kept apart.
+
+    Attributes:
+    - cache_directory(str): Directory holding the cache files.
+    """
+    cache_format_version = 1
+    skills_columns = ('skills', 'required_skills')
+    hash_block_size = 1 << 20
+
+
+    def __init__(self, cache_directory: str):
+        """
+        Constructor for class ParsedFileCache.
+
+        Parameters:
+        - cache_directory(str): Directory holding the cache files. It is created if it does not exist.
+        """
+        self.cache_directory = cache_directory
+        os.makedirs(cache_directory, exist_ok=True)
+
+
+
+    @classmethod
+    def fingerprint(cls, path_file: str, ingest_options: Optional[Dict] = None) -> Dict:
+        """
+        Class method for calculating the fingerprint of a source file.
+
+        Parameters:
+        - path_file(str): Path of the source file.
+        - ingest_options(Optional[Dict]): Description of the ingest options the file is parsed with, as returned by
+                                          IngestOptions.describe. Set to None by default, i.e. normal mode.
+
+        Returns:
+        - Dict: Absolute path, size in bytes, modification time in nanoseconds, BLAKE2 hash of the contents and ingest options.
+        """
+        file_stat = os.stat(path_file)
+        # Hashing the contents block by block to keep the memory bounded
+        content_hash = hashlib.blake2b(digest_size=16)
+        with open(path_file, 'rb') as file:
+            for block in iter(lambda: file.read(cls.hash_block_size), b''):
+                content_hash.update(block)
+
+        return {'path': os.path.abspath(path_file), 'size': file_stat.st_size, 'mtime_ns': file_stat.st_mtime_ns,
+                'content_hash': content_hash.hexdigest(), 'version': cls.cache_format_version, 'ingest_options': ingest_options}
+
+
+
+    def cache_path(self, fingerprint: Dict) -> str:
+        """
+        Function for getting the path of the cache file of a source file, one per path and ingest options.
+
+        Parameters:
+        - fingerprint(Dict): Fingerprint of the source file.
+
+        Returns:
+        - str: Path of the cache file.
+        """
+        cache_key = json.dumps([fingerprint['path'], fingerprint.get('ingest_options')], sort_keys=True)
+        return os.path.join(self.cache_directory, hashlib.sha256(cache_key.encode()).hexdigest() + '.npz')
+
+
+
+    def load(self, fingerprint: Dict) -> Optional[Tuple[pd.DataFrame, Dict]]:
+        """
+        Function for loading a cached dataset.
+
+        Parameters:
+        - fingerprint(Dict): Fingerprint of the source file.
+
+        Returns:
+        - Optional[Tuple[pd.DataFrame, Dict]]: Cleansed dataset and tokenized skills columns (mapping each column to
+                                               its skill tokens, indptr and indices), or None if there is no valid entry.
+        """
+        cache_path = self.cache_path(fingerprint)
+        if not os.path.exists(cache_path):
+            return None
+
+        try:
+            with np.load(cache_path, allow_pickle=False) as cached:
+                # Checking that the entry belongs to the current contents of the source file
+                layout = json.loads(str(cached['layout']))
+                if layout['fingerprint'] != fingerprint:
+                    return None
+
+                # Rebuilding the columns of the dataset
+                columns = {}
+                for position, (column, kind) in enumerate(layout['columns']):
+                    if kind == 'text':
+                        columns[column] = self.decode_text(cached[f'column_{position}'], cached[f'offsets_{position}'])
+                    else:
+                        columns[column] = cached[f'column_{position}']
+                data_set = pd.DataFrame(columns, index=cached['index'], columns=[column for column, _ in layout['columns']])
+
+                # Rebuilding the tokenized skills columns
+                tokenized_skills = {}
+                for position, column in enumerate(layout['tokenized']):
+                    tokenized_skills[column] = (cached[f'tokens_{position}'].tolist(), cached[f'indptr_{position}'], cached[f'indices_{position}'])
+
+                return data_set, tokenized_skills
+
+        except Exception:
+            # Treating unreadable entries as missing so they are rebuilt
+            return None
+
+
+
+    def store(self, fingerprint: Dict, data_set: pd.DataFrame, tokenized_skills: Dict) -> bool:
+        """
+        Function for storing a cleansed dataset and its tokenized skills columns.
+
+        Datasets with object columns holding anything but strings are not cached.
+
+        Parameters:
+        - fingerprint(Dict): Fingerprint of the source file.
+        - data_set(pd.DataFrame): Cleansed dataset.
+        - tokenized_skills(Dict): Mapping from each skills column to its skill tokens, indptr and indices.
+
+        Returns:
+        - bool: Whether the dataset was cached.
+        """
+        arrays = {'index': data_set.index.to_numpy()}
+        layout = {'fingerprint': fingerprint, 'columns': [], 'tokenized': list(tokenized_skills)}
+
+        # Storing numeric columns as they are and text columns as one UTF-8 buffer with offsets
+        for position, column in enumerate(data_set.columns):
+            values = data_set[column]
+            if pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values):
+                values = values.tolist()
+                if not all(isinstance(value, str) for value in values):
+                    return False
+                arrays[f'column_{position}'], arrays[f'offsets_{position}'] = self.encode_text(values)
+                layout['columns'].append((column, 'text'))
+            elif values.to_numpy().dtype != object:
+                arrays[f'column_{position}'] = values.to_numpy()
+                layout['columns'].append((column, 'numeric'))
+            else:
+                return False
+        if arrays['index'].dtype == object:
+            return False
+
+        # Storing the skill tokens and the CSR arrays of each tokenized column
+        for position, (skill_tokens, indptr, indices) in enumerate(tokenized_skills.values()):
+            arrays[f'tokens_{position}'], arrays[f'indptr_{position}'], arrays[f'indices_{position}'] = np.array(skill_tokens, dtype=str), indptr, indices
+        arrays['layout'] = np.array(json.dumps(layout))
+
+        # Writing to a temporary file first so that readers never see a partial entry
+        cache_path = self.cache_path(fingerprint)
+        temporary_path = cache_path + f'.{os.getpid()}.tmp'
+        with open(temporary_path, 'wb') as file:
+            np.savez(file, **arrays)
+        os.replace(temporary_path, cache_path)
+        return True
+
+
+
+    @staticmethod
+    def encode_text(values: list) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Static method for packing strings into one UTF-8 buffer.
+
+        Parameters:
+        - values(list): Strings to pack.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: UTF-8 bytes of the concatenated strings and the character offset of each string.
+        """
+        offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(value) for value in values])
+        return np.frombuffer("".join(values).encode('utf-8'), dtype=np.uint8), offsets
+
+
+
+    @staticmethod
+    def decode_text(buffer: np.ndarray, offsets: np.ndarray) -> list:
+        """
+        Static method for unpacking strings packed with encode_text.
+
+        Parameters:
+        - buffer(np.ndarray): UTF-8 bytes of the concatenated strings.
+        - offsets(np.ndarray): Character offset of each string.
+
+        Returns:
+        - list: Unpacked strings.
+        """
+        text = buffer.tobytes().decode('utf-8')
+        offsets = offsets.tolist()
+        return [text[start:stop] for start, stop in zip(offsets[:-1], offsets[1:])]
@@ -0,0 +1,149 @@
+# typing module for type hints
+from typing import Dict, List
+# pandas library for the column data types
+import pandas as pd
+# pyarrow library for the multithreaded CSV parser and Arrow string storage, which is optional
+try:
+    import pyarrow
+    import pyarrow.csv
+except ImportError:
+    pyarrow = None
+
+
+class IngestOptions:
+    """
+    A class describing how a CSV file is parsed in fast ingest mode.
+
+    Only the listed columns are kept, with declared data types instead of inferring them from the values. The other
+    columns are parsed as plain strings and only take part in removing nulls and duplicates. The id
+    columns are converted into nullable integers when all of their values are integers and are otherwise kept as the
+    parsed strings, like the inferred data types of normal mode. The text columns are stored as Arrow strings or as
+    categoricals, both of which take a fraction of the memory of Python string objects. With the 'pyarrow' parser, the file is parsed by
+    the multithreaded parser of pyarrow. When pyarrow is not installed, the C parser of pandas and categorical text
+    columns are used instead.
+
+    Attributes:
+    - columns(Dict[str, str]): Kind of every parsed column, 'id' or 'text', in the order of the output.
+    - parser(str): Requested parser, 'auto', 'pyarrow' or 'c'.
+    - string_storage(str): Requested storage of the text columns, 'auto', 'pyarrow' or 'category'.
+    """
+    job_columns = {'id': 'id', 'title': 'text', 'required_skills': 'text'}
+    jobseeker_columns = {'id': 'id', 'name': 'text', 'skills': 'text'}
+    parsers = ("auto", "pyarrow", "c")
+    string_storages = ("auto", "pyarrow", "category")
+    id_dtype = "Int64"
+
+
+    def __init__(self, columns: Dict[str, str], parser: str = "auto", string_storage: str = "auto"):
+        """
+        Constructor for class IngestOptions.
+
+        Parameters:
+        - columns(Dict[str, str]): Kind of every parsed column, 'id' or 'text'.
+        - parser(str): Parser of the file, 'auto' for pyarrow when installed, 'pyarrow' or 'c'. Set to 'auto' by default.
+        - string_storage(str): Storage of the text columns, 'auto' for Arrow strings when pyarrow is installed,
+                               'pyarrow' or 'category'. Set to 'auto' by default.
+        """
+        if parser not in self.parsers:
+            raise ValueError(f"Parser should be one of: {', '.join(self.parsers)}.")
+        if string_storage not in self.string_storages:
+            raise ValueError(f"String storage should be one of: {', '.join(self.string_storages)}.")
+        if any(kind not in ('id', 'text') for kind in columns.values()):
+            raise ValueError("Column kinds should be 'id' or 'text'.")
+        self.columns = dict(columns)
+        self.parser = parser
+        self.string_storage = string_storage
+
+
+
+    @staticmethod
+    def pyarrow_available() -> bool:
+        """
+        Static method for checking whether the optional pyarrow library is installed.
+
+        Returns:
+        - bool: Whether pyarrow can be imported.
+        """
+        return pyarrow is not None
+
+
+
+    def resolve_parser(self) -> str:
+        """
+        Function for getting the parser actually used, falling back to the C parser without pyarrow.
+
+        Returns:
+        - str: 'pyarrow' or 'c'.
+        """
+        return "pyarrow" if self.parser != "c" and self.pyarrow_available() else "c"
+
+
+
+    def resolve_string_storage(self) -> str:
+        """
+        Function for getting the storage of the text columns actually used, falling back to categoricals without pyarrow.
+
+        Returns:
+        - str: 'pyarrow' or 'category'.
+        """
+        return "pyarrow" if self.string_storage != "category" and self.pyarrow_available() else "category"
+
+
+
+    @property
+    def usecols(self) -> List[str]:
+        """
+        Function for getting the names of the parsed columns.
+
+        Returns:
+        - List[str]: Parsed columns.
+        """
+        return list(self.columns)
+
+
+
+    def describe(self) -> Dict:
+        """
+        Function for describing the ingest options actually used, for keying cached files.
+
+        Returns:
+        - Dict: Parsed columns with their kinds, parser and string storage.
+        """
+        return {'columns': self.columns, 'parser': self.resolve_parser(), 'string_storage': self.resolve_string_storage()}
+
+
+
+    def dtypes(self) -> Dict:
+        """
+        Function for getting the declared data type of every parsed column.
+
+        Returns:
+        - Dict: Mapping from each column to its pandas data type.
+        """
+        text_dtype = pd.StringDtype("pyarrow") if self.resolve_string_storage() == "pyarrow" else "category"
+        return {column: self.id_dtype if kind == 'id' else text_dtype for column, kind in self.columns.items()}
+
+
+
+    def convert(self, data_set: pd.DataFrame) -> pd.DataFrame:
+        """
+        Function for converting the parsed columns of a dataset into their declared data types.
+
+        The id columns are parsed as strings, since ids need not be integers. Every id column is converted into
+        nullable integers if all of its values are integers and is kept as it is otherwise.
+
+        Parameters:
+        - data_set(pd.DataFrame): Dataset with the parsed columns.
+
+        Returns:
+        - pd.DataFrame: Dataset with the declared data types.
+        """
+        data_set = data_set.astype({column: dtype for column, dtype in self.dtypes().items() if self.columns[column] == 'text'})
+        for column, kind in self.columns.items():
+            if kind == 'id':
+                try:
+                    data_set[column] = data_set[column].astype(self.id_dtype)
+                except (ValueError, TypeError):
+                    # Keeping ids which are not integers, such as 'J1', as strings
+                    pass
+        return data_set
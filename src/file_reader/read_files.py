@@ -1,4 +1,16 @@
+# typing module for type hints
+from typing import Dict, Iterator, List, Tuple
+# os module for checking the size of the file
+import os
 import pandas as pd
+# custom ParsedFileCache class for caching parsed files on disk
+from .file_cache import ParsedFileCache
+# custom RowHashSet class for removing duplicates across chunks
+from .row_hash_set import RowHashSet
+# custom IngestOptions class and the optional pyarrow library for fast ingest mode
+from .ingest_options import IngestOptions, pyarrow
+# custom skill vocabulary and incidence matrix classes for tokenizing the skills columns
+from ..skill_matching.skill_vocabulary import SkillVocabulary, SkillMatrix
 
 class File:
 
@@ -7,16 +19,29 @@ class File:
     
     Attributes:
     - path_file(str): Path of the CSV file.
+    - cache_directory(str): Directory of the opt-in parsed file cache, or None to always parse the CSV file.
+    - memory_limit(int): Largest number of bytes of the row hashes kept for removing duplicates across chunks,
+                         or None for no limit.
+    - ingest_options(IngestOptions): Columns, data types and parser of fast ingest mode, or None to parse all
+                                     columns with inferred data types.
+    - chunk_size(int): Number of CSV rows parsed at once.
     """
+    chunk_size = 100000
 
-    def __init__(self,path_file:str):
+    def __init__(self,path_file:str, cache_directory:str = None, memory_limit:int = None, ingest_options:IngestOptions = None):
         """
         Constructor for class File.
         
         Parameters:
         - path_file(str):  Path to the CSV file.
+        - cache_directory(str): Directory of the parsed file cache. Set to None by default, i.e. no caching.
+        - memory_limit(int): Largest number of bytes of the row hashes of read_chunks. Set to None by default, i.e. no limit.
+        - ingest_options(IngestOptions): Options of fast ingest mode. Set to None by default, i.e. all columns are parsed.
         """
         self.path_file = path_file
+        self.cache_directory = cache_directory
+        self.memory_limit = memory_limit
+        self.ingest_options = ingest_options
         
  
     @staticmethod
@@ -41,14 +66,144 @@ class File:
         """
         Function for reading and cleansing CSV files.
         
-        It loads the CSV file and performs data cleansing if no errors occur.
+        It loads the CSV file and performs data cleansing if no errors occur. With a cache directory set,
+        the cleansed dataset is loaded from the parsed file cache when the file is unchanged.
         
         Returns:
         - pd.DataFrame: Cleansed dataset of type DataFrame.
         """
+        if self.cache_directory is not None:
+            return self.read_cached_file()[0]
+        return self.parse_file()
+
+
+
+    def parse_file(self) -> pd.DataFrame:
+        """
+        Function for parsing and cleansing the CSV file without using the cache.
+
+        The file is parsed with read_chunks, so the whole file and the chunked readers cleanse it the same way.
+        
+        Returns:
+        - pd.DataFrame: Cleansed dataset of type DataFrame.
+        """
+        # Concatenating the cleansed chunks, which always include at least one chunk with the columns
+        data_set = pd.concat(list(self.read_chunks()))
+        if self.ingest_options is not None:
+            # Restoring the categorical columns, whose categories differ from chunk to chunk, and the integer ids
+            data_set = self.ingest_options.convert(data_set)
+        return data_set
+
+
+
+    def extra_columns(self) -> List[str]:
+        """
+        Function for listing the columns of the CSV file which are not columns of the ingest options.
+
+        Returns:
+        - List[str]: Names of the other columns, in the order of the file.
+        """
+        return [column for column in pd.read_csv(self.path_file, nrows=0).columns if column not in self.ingest_options.columns]
+
+
+
+    def parse_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Function for parsing the CSV file one chunk at a time without cleansing it.
+
+        Without ingest options, all columns are parsed with inferred data types. Otherwise the columns of the
+        options are parsed with their declared data types, by the C parser of pandas or by the pyarrow parser, and
+        the other columns as plain strings, which read_chunks only uses for removing nulls and duplicates. The ids
+        are parsed as strings and converted into integers chunk by chunk when they all are integers.
+
+        Parameters:
+        - chunk_size(int): Number of CSV rows parsed at once.
+
+        Returns:
+        - Iterator[pd.DataFrame]: Parsed chunks, in the order of the file.
+        """
+        if self.ingest_options is None:
+            return pd.read_csv(self.path_file, chunksize=chunk_size)
+        if self.ingest_options.resolve_parser() == "pyarrow":
+            return self.parse_arrow_chunks(chunk_size)
+        dtypes = dict(self.ingest_options.dtypes(), **{column: str for column, kind in self.ingest_options.columns.items() if kind == 'id'})
+        dtypes.update({column: str for column in self.extra_columns()})
+        return map(self.ingest_options.convert, pd.read_csv(self.path_file, chunksize=chunk_size, dtype=dtypes))
+
+
+
+    def parse_arrow_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Function for parsing the CSV file one chunk at a time with the streaming CSV reader of pyarrow.
+
+        The reader parses blocks of the file on several threads. Its record batches are sliced without copying into
+        chunks of exactly chunk_size rows, whose index continues from chunk to chunk like that of the pandas parser.
+
+        Parameters:
+        - chunk_size(int): Number of CSV rows per chunk.
+
+        Returns:
+        - Iterator[pd.DataFrame]: Parsed chunks, in the order of the file.
+        """
+        # Reporting an empty file the same way as the pandas parser
+        if os.path.exists(self.path_file) and os.path.getsize(self.path_file) == 0:
+            raise pd.errors.EmptyDataError("No columns to parse from file")
+
+        # Parsing all columns as strings and converting them into the declared pandas data types
+        column_types = {column: pyarrow.string() for column in list(self.ingest_options.columns) + self.extra_columns()}
+        types_mapper = {pyarrow.string(): pd.StringDtype("pyarrow")}.get
+        convert_options = pyarrow.csv.ConvertOptions(column_types=column_types, strings_can_be_null=True)
+
+        try:
+            reader = pyarrow.csv.open_csv(self.path_file, convert_options=convert_options)
+            pending, start = reader.schema.empty_table(), 0
+            for batch in reader:
+                pending = pyarrow.concat_tables([pending, pyarrow.Table.from_batches([batch])])
+                # Cutting the parsed rows into chunks of exactly chunk_size rows
+                while pending.num_rows >= chunk_size:
+                    chunk = self.ingest_options.convert(pending.slice(0, chunk_size).to_pandas(types_mapper=types_mapper))
+                    chunk.index = pd.RangeIndex(start, start + chunk_size)
+                    pending, start = pending.slice(chunk_size), start + chunk_size
+                    yield chunk
+
+        except pyarrow.ArrowInvalid as ex:
+            # Reporting malformed files the same way as the pandas parser
+            raise pd.errors.ParserError(str(ex))
+
+        # Yielding the remaining rows, or the columns only if the file has no rows
+        if pending.num_rows or start == 0:
+            chunk = self.ingest_options.convert(pending.to_pandas(types_mapper=types_mapper))
+            chunk.index = pd.RangeIndex(start, start + pending.num_rows)
+            yield chunk
+
+
+
+    def read_chunks(self, chunk_size: int = None) -> Iterator[pd.DataFrame]:
+        """
+        Function for reading and cleansing the CSV file one chunk at a time.
+
+        Every chunk is cleansed the same way as cleanse_dataset does on the whole file: rows with null values are
+        removed, and so is every row equal to an earlier row, also when the earlier row is in an earlier chunk. The
+        rows seen so far are remembered as 64-bit hashes in a RowHashSet, so the memory used is bounded by a chunk
+        and 8 bytes per distinct row, and the memory limit of the file caps the latter. Chunks left empty by the 
+        cleansing are yielded as well, so the first chunk always carries the columns. In fast ingest mode, the
+        columns which are not columns of the ingest options take part in the cleansing and are dropped afterwards,
+        so the same rows are kept in both modes.
+
+        Parameters:
+        - chunk_size(int): Number of CSV rows parsed at once, or None for the chunk_size of the class. Set to None by default.
+
+        Returns:
+        - Iterator[pd.DataFrame]: Cleansed chunks, in the order of the file.
+        """
+        seen_rows = RowHashSet(self.memory_limit)
         try:
             # Attempting to read the CSV file
-            file = pd.read_csv(self.path_file)
+            for chunk in self.parse_chunks(chunk_size or self.chunk_size):
+                # Removing null values and the rows seen before in this or an earlier chunk
+                chunk = chunk.dropna()
+                chunk = chunk[seen_rows.add_new(chunk)]
+                yield chunk if self.ingest_options is None else chunk[self.ingest_options.usecols]
 
         except FileNotFoundError as er:
             # Handling FileNotFoundError
@@ -62,17 +217,89 @@ class File:
             # Handling ParserError
             raise ValueError("Error: Failed to parse CSV file. Please check the file format.")
         
+        except ValueError:
+            # Passing on the errors of the memory limit
+            raise
+
         except Exception as ex:
             # Handling other unexpected errors
             raise ValueError(F"An unexpected error occurred: {str(ex)}")
-            
-        # Cleansing the dataset
-        file = self.cleanse_dataset(file)
 
-        # Returning the cleansed dataset
-        return file
 
-   
 
+    @staticmethod
+    def tokenize_skills(data_set: pd.DataFrame) -> Dict:
+        """
+        Static method for tokenizing the skills columns of a dataset.
+
+        Parameters:
+        - data_set(pd.DataFrame): Cleansed dataset.
+
+        Returns:
+        - Dict: Mapping from each skills column to its distinct skill tokens and the CSR indptr and indices of the rows.
+        """
+        tokenized_skills = {}
+        for skills_column in ParsedFileCache.skills_columns:
+            if skills_column in data_set.columns:
+                # Tokenizing over a local vocabulary whose ids follow the order of the distinct tokens
+                vocabulary = SkillVocabulary()
+                skill_matrix = SkillMatrix.from_skills(data_set[skills_column], vocabulary)
+                skill_tokens = sorted(vocabulary.skill_ids, key=vocabulary.skill_ids.get)
+                tokenized_skills[skills_column] = (skill_tokens, skill_matrix.matrix.indptr, skill_matrix.matrix.indices)
+        return tokenized_skills
+
+
+
+    def read_cached_file(self) -> Tuple[pd.DataFrame, Dict]:
+        """
+        Function for reading the cleansed and tokenized dataset through the parsed file cache.
+
+        The cache entry is used if the path, size, modification time and content hash of the CSV file and the ingest
+        options are unchanged, which skips CSV parsing, cleansing and tokenizing entirely. Otherwise the file is parsed
+        and the cache entry rebuilt. In fast ingest mode, the cached columns are converted back into their declared data types.
+
+        Returns:
+        - Tuple[pd.DataFrame, Dict]: Cleansed dataset and its tokenized skills columns.
+        """
+        try:
+            cache = ParsedFileCache(self.cache_directory)
+            fingerprint = cache.fingerprint(self.path_file, None if self.ingest_options is None else self.ingest_options.describe())
+
+        except FileNotFoundError as er:
+            # Handling FileNotFoundError
+            raise ValueError(F"Error: {er.strerror}. Please ensure the CSV file exists.")
+
+        # Loading the cached dataset if the file is unchanged
+        cached = cache.load(fingerprint)
+        if cached is not None:
+            data_set, tokenized_skills = cached
+            return (data_set if self.ingest_options is None else self.ingest_options.convert(data_set)), tokenized_skills
 
+        # Parsing the file and rebuilding the cache entry otherwise
+        data_set = self.parse_file()
+        tokenized_skills = self.tokenize_skills(data_set)
+        cache.store(fingerprint, data_set, tokenized_skills)
+        return data_set, tokenized_skills
+
+
+
+    def read_skill_matrix(self, skills_column: str, vocabulary: SkillVocabulary, grow_vocabulary: bool = True) -> Tuple[pd.DataFrame, SkillMatrix]:
+        """
+        Function for reading the cleansed dataset together with the skill incidence matrix of one of its columns.
+
+        With a cache directory set, the matrix is built from the cached tokens instead of splitting the skills strings.
+
+        Parameters:
+        - skills_column(str): Column containing the skills.
+        - vocabulary(SkillVocabulary): Vocabulary for mapping skills to ids.
+        - grow_vocabulary(bool): Whether unseen skills are added to the vocabulary. Set to True by default.
+
+        Returns:
+        - Tuple[pd.DataFrame, SkillMatrix]: Cleansed dataset and the incidence matrix of its skills column.
+        """
+        if self.cache_directory is None:
+            data_set = self.read_file()
+            return data_set, SkillMatrix.from_skills(data_set[skills_column], vocabulary, grow_vocabulary)
 
+        data_set, tokenized_skills = self.read_cached_file()
+        return data_set, SkillMatrix.from_tokenized(*tokenized_skills[skills_column], vocabulary, grow_vocabulary)
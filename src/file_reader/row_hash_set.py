@@ -0,0 +1,146 @@
+# typing module for type hints
+from typing import List
+# numpy library for the sorted hash arrays
+import numpy as np
+# pandas library for hashing the rows
+import pandas as pd
+
+
+class RowHashSet:
+    """
+    A class for remembering the rows seen so far as 64-bit hashes, for removing duplicates across chunks.
+
+    The hashes are kept in a few sorted NumPy arrays instead of a Python set, so every distinct row takes 8 bytes.
+    New hashes form a new sorted run and runs of similar size are merged, so that membership is checked with a
+    binary search in a logarithmic number of runs. Two distinct rows with the same 64-bit hash would be taken for
+    duplicates, which is negligible below billions of rows.
+
+    Attributes:
+    - memory_limit(int): Largest number of bytes the hashes may take, or None for no limit.
+    - runs(List[np.ndarray]): Sorted runs of hashes, from the largest to the smallest.
+    """
+
+    def __init__(self, memory_limit: int = None):
+        """
+        Constructor for class RowHashSet.
+
+        Parameters:
+        - memory_limit(int): Largest number of bytes the hashes may take. Set to None by default, i.e. no limit.
+        """
+        self.memory_limit = memory_limit
+        self.runs: List[np.ndarray] = []
+
+
+
+    def __len__(self) -> int:
+        """
+        Function for getting the number of distinct rows seen so far.
+
+        Returns:
+        - int: Number of hashes in the set.
+        """
+        return sum(len(run) for run in self.runs)
+
+
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Function for getting the memory taken by the hashes.
+
+        Returns:
+        - int: Number of bytes of all runs.
+        """
+        return sum(run.nbytes for run in self.runs)
+
+
+
+    @staticmethod
+    def hash_column(values: pd.Series) -> np.ndarray:
+        """
+        Static method for hashing every value of a column in a canonical form.
+
+        The data type of a column is inferred per chunk, so the same value may be an integer in one chunk and a float
+        in another one, e.g. when a later chunk has a null id. Integer columns are therefore hashed as int64 and the
+        whole float values of float columns as the equal int64, so that 1 and 1.0 get the same hash.
+
+        Parameters:
+        - values(pd.Series): Column to hash.
+
+        Returns:
+        - np.ndarray: 64-bit hash of every value.
+        """
+        if pd.api.types.is_integer_dtype(values) and not values.hasnans:
+            return pd.util.hash_array(values.to_numpy(dtype=np.int64))
+        if pd.api.types.is_float_dtype(values):
+            floats = values.to_numpy(dtype=np.float64, na_value=np.nan)
+            whole = (floats == np.floor(floats)) & (np.abs(floats) < 2.0**63)
+            integers = np.where(whole, floats, 0).astype(np.int64)
+            return np.where(whole, pd.util.hash_array(integers), pd.util.hash_array(floats))
+        return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+
+    @staticmethod
+    def hash_rows(data_set: pd.DataFrame) -> np.ndarray:
+        """
+        Static method for hashing the values of every row of a dataset, regardless of its index.
+
+        Parameters:
+        - data_set(pd.DataFrame): Dataset to hash.
+
+        Returns:
+        - np.ndarray: 64-bit hash of every row.
+        """
+        column_hashes = pd.DataFrame({position: RowHashSet.hash_column(values) for position, (_, values) in enumerate(data_set.items())}, index=data_set.index)
+        return pd.util.hash_pandas_object(column_hashes, index=False).to_numpy()
+
+
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Function for checking which hashes are in the set.
+
+        Parameters:
+        - hashes(np.ndarray): 64-bit row hashes.
+
+        Returns:
+        - np.ndarray: Boolean mask of the hashes already in the set.
+        """
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in self.runs:
+            positions = np.searchsorted(run, hashes)
+            found |= run[np.minimum(positions, len(run) - 1)] == hashes
+        return found
+
+
+
+    def add_new(self, data_set: pd.DataFrame) -> np.ndarray:
+        """
+        Function for adding the rows of a dataset to the set and finding the rows which were not seen before.
+
+        Parameters:
+        - data_set(pd.DataFrame): Chunk of rows.
+
+        Returns:
+        - np.ndarray: Boolean mask of the rows seen for the first time, i.e. the first occurrence of every row which
+                      is neither in an earlier chunk nor earlier in this chunk.
+        """
+        hashes = self.hash_rows(data_set)
+        unique_hashes, first_positions = np.unique(hashes, return_index=True)
+        is_new = ~self.contains(unique_hashes)
+        unique_hashes, first_positions = unique_hashes[is_new], first_positions[is_new]
+
+        if self.memory_limit is not None and self.nbytes + unique_hashes.nbytes > self.memory_limit:
+            raise ValueError(f"Removing duplicates across chunks needs more than the memory limit of {self.memory_limit} bytes.")
+
+        # Adding the new hashes as a run and merging the runs of similar size
+        if len(unique_hashes):
+            self.runs.append(unique_hashes)
+        while len(self.runs) > 1 and len(self.runs[-2]) <= 2 * len(self.runs[-1]):
+            last_run = self.runs.pop()
+            self.runs[-1] = np.union1d(self.runs[-1], last_run)
+
+        new_rows = np.zeros(len(hashes), dtype=bool)
+        new_rows[first_positions] = True
+        return new_rows
@@ -0,0 +1,637 @@
+# typing module for type hints
+from typing import List, Dict, Iterable, Tuple
+# io module for parsing appended rows from memory
+import io
+# os module for operating system functionalities
+import os
+# json module for storing the settings and tracked files of a saved state
+import json
+# numpy library for numerical arrays
+import numpy as np
+# pandas library for data manipulation and analysis
+import pandas as pd
+# sparse module from scipy for stacking the skill matrices
+from scipy import sparse
+# custom File class for cleansing the changed rows
+from ..file_reader.read_files import File
+# custom ParsedFileCache class for packing the text columns of a saved state
+from ..file_reader.file_cache import ParsedFileCache
+# custom skill vocabulary and incidence matrix classes for encoding the skills of the changed rows
+from ..skill_matching.skill_vocabulary import SkillVocabulary, SkillMatrix
+# custom inverted index classes for finding the rows sharing a skill with the changed rows
+from ..skill_matching.inverted_index import SkillInvertedIndex, InvertedIndexMatchingBackend
+# custom RecommendationEngine class for selecting the best matches of each job seeker
+from ..recommendation_engine.recommendation import RecommendationEngine
+# custom RecommendationResult class for the columnar matches
+from ..recommendation_result.recommendation_result import RecommendationResult
+
+
+class IncrementalRecommendations:
+    """
+    A class for keeping the recommendations of a previous run up to date with job and job seeker deltas.
+
+    It stores the jobs and job seekers of the run with their skill incidence matrices, and every matching pair as
+    columns like RecommendationResult: a job seeker position, a job position, a matching skill count and a matching
+    skill percentage. Changed rows are appended to the tables and the old versions of modified and removed rows are
+    only marked as inactive, so their pairs are skipped without touching the pair columns. The rows sharing a skill
+    with the changed rows are found with a SkillInvertedIndex and the changed rows are rescored in bulk with
+    JobMatchRecommendationEngine.match_jobseeker_chunk, so the cost of an update follows the delta instead of the
+    whole jobs × job seekers cross product. Once a table holds more inactive than active rows, the inactive rows and
+    their pairs are dropped in one pass.
+
+    Rows are identified by their IDs. The recommendations are always identical to a full run over the patched
+    tables, in which modified rows keep their position and added rows, i.e. rows whose ID was not part of the
+    previous run, come last.
+
+    Attributes:
+    - top_k(int): Maximum number of recommendations kept per job seeker, or None for all of them.
+    - vocabulary(SkillVocabulary): Vocabulary of the skills of both tables.
+    - rows(Dict[str, pd.DataFrame]): IDs and labels of the stored rows of each table, including inactive ones.
+    - matrices(Dict[str, SkillMatrix]): Skill incidence matrix of the stored rows of each table.
+    - sequences(Dict[str, np.ndarray]): Position of every stored row in the patched table, for ordering the output.
+    - active(Dict[str, np.ndarray]): Whether every stored row is the current version of its row.
+    - row_positions(Dict[str, Dict]): Stored position of the current version of each ID of each table.
+    - seeker_positions(np.ndarray): Job seeker position of every stored pair (int32).
+    - job_positions(np.ndarray): Job position of every stored pair (int32).
+    - matching_skill_counts(np.ndarray): Matching skill count of every stored pair (int16).
+    - matching_skill_percents(np.ndarray): Matching skill percentage of every stored pair (float32).
+    - file_offsets(Dict): Byte offset up to which the rows of each append-only file have been applied.
+    """
+    tables = {'jobs': ('title', 'required_skills'), 'jobseekers': ('name', 'skills')}
+
+
+    def __init__(self, jobs_df: pd.DataFrame, jobseekers_df: pd.DataFrame, vocabulary: SkillVocabulary, job_matrix: SkillMatrix,
+                 seeker_matrix: SkillMatrix, result: RecommendationResult, top_k=None):
+        """
+        Constructor for class IncrementalRecommendations.
+
+        Parameters:
+        - jobs_df(pd.DataFrame): Cleansed jobs data of the previous run.
+        - jobseekers_df(pd.DataFrame): Cleansed job seeker data of the previous run.
+        - vocabulary(SkillVocabulary): Vocabulary holding the skills of both tables.
+        - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+        - seeker_matrix(SkillMatrix): Skill incidence matrix of the job seekers.
+        - result(RecommendationResult): All matching pairs of the previous run, without top_k.
+        - top_k(int): Maximum number of recommendations kept per job seeker, or None for all of them. Set to None by default.
+        """
+        # Identifying the rows by their IDs, which therefore have to be unique
+        if not (jobs_df['id'].is_unique and jobseekers_df['id'].is_unique):
+            raise ValueError("Job and job seeker IDs should be unique for incremental updates.")
+
+        self.top_k = top_k
+        self.vocabulary = vocabulary
+        self.rows = {'jobs': jobs_df[['id', 'title']].reset_index(drop=True), 'jobseekers': jobseekers_df[['id', 'name']].reset_index(drop=True)}
+        self.matrices = {'jobs': job_matrix, 'jobseekers': seeker_matrix}
+        self.sequences = {table: np.arange(len(table_df), dtype=np.int64) for table, table_df in self.rows.items()}
+        self.active = {table: np.ones(len(table_df), dtype=bool) for table, table_df in self.rows.items()}
+        self.row_positions = {table: dict(zip(table_df['id'].tolist(), range(len(table_df)))) for table, table_df in self.rows.items()}
+        self.next_sequences = {table: len(table_df) for table, table_df in self.rows.items()}
+        self.seeker_positions, self.job_positions = result.seeker_positions, result.job_positions
+        self.matching_skill_counts, self.matching_skill_percents = result.matching_skill_counts, result.matching_skill_percents
+        self.pending_pairs: List[Tuple] = []
+        self.file_offsets: Dict[str, int] = {}
+        # Matching backend over the jobs and inverted indexes over both tables, built when first needed
+        self.job_backend = None
+        self.indexes: Dict[str, SkillInvertedIndex] = {}
+
+
+
+    def __len__(self) -> int:
+        """
+        Function for getting the number of stored matching pairs.
+
+        Returns:
+        - int: Number of job seeker and job pairs with at least one matching skill.
+        """
+        return len(self.live_pairs())
+
+
+
+    def jobs_backend(self) -> InvertedIndexMatchingBackend:
+        """
+        Function for getting the matching backend over the stored jobs, rebuilding it after the jobs or the vocabulary changed.
+
+        Returns:
+        - InvertedIndexMatchingBackend: Backend over the jobs, covering the whole vocabulary.
+        """
+        if self.job_backend is None or self.job_backend.postings.shape[0] < len(self.vocabulary):
+            self.job_backend = InvertedIndexMatchingBackend(self.matrices['jobs'].with_vocabulary_size(len(self.vocabulary)))
+            self.indexes['jobs'] = SkillInvertedIndex(self.vocabulary, self.job_backend.postings, np.arange(len(self.rows['jobs'])))
+        return self.job_backend
+
+
+
+    def inverted_index(self, table: str) -> SkillInvertedIndex:
+        """
+        Function for getting the inverted index over the stored rows of a table, rebuilding it after the rows or the vocabulary changed.
+
+        Parameters:
+        - table(str): Table to index, either 'jobs' or 'jobseekers'.
+
+        Returns:
+        - SkillInvertedIndex: Inverted index from skills to stored positions.
+        """
+        if table == 'jobs':
+            # Sharing the posting lists of the matching backend
+            self.jobs_backend()
+        elif table not in self.indexes or self.indexes[table].postings.shape[0] < len(self.vocabulary):
+            postings = self.matrices[table].with_vocabulary_size(len(self.vocabulary)).matrix.T.tocsr()
+            self.indexes[table] = SkillInvertedIndex(self.vocabulary, postings, np.arange(len(self.rows[table])))
+        return self.indexes[table]
+
+
+
+    def count_matching_pairs(self, table: str, positions: np.ndarray) -> int:
+        """
+        Function for counting the active pairs of stored rows, i.e. the active rows of the other table sharing a skill with them.
+
+        Parameters:
+        - table(str): Table of the rows, either 'jobs' or 'jobseekers'.
+        - positions(np.ndarray): Stored positions of the rows.
+
+        Returns:
+        - int: Number of active job seeker and job pairs of the rows.
+        """
+        other_table = 'jobseekers' if table == 'jobs' else 'jobs'
+        inverted_index, other_active = self.inverted_index(other_table), self.active[other_table]
+        indptr, indices = self.matrices[table].matrix.indptr, self.matrices[table].matrix.indices
+        return sum(int(other_active[inverted_index.candidate_positions(np.sort(indices[indptr[position]:indptr[position + 1]]))].sum())
+                   for position in positions.tolist())
+
+
+
+    def patch_rows(self, table: str, changed_df: pd.DataFrame = None, removed_ids: Iterable = ()) -> Tuple[int, np.ndarray]:
+        """
+        Function for removing, modifying and adding rows of a table.
+
+        The removed rows are dropped first, so a row removed and added again in the same delta comes last. The new
+        versions of the changed rows are appended to the stored rows, the modified ones at the position of their old
+        version in the patched table and the added ones after all others, in the order of the delta.
+
+        Parameters:
+        - table(str): Table the rows belong to, either 'jobs' or 'jobseekers'.
+        - changed_df(pd.DataFrame): Added or modified rows with the id, label and skills columns. Set to None by default.
+        - removed_ids(Iterable): IDs of the removed rows. Set to no IDs by default.
+
+        Returns:
+        - Tuple[int, np.ndarray]: Number of pairs of the removed and modified rows, and stored positions of the changed rows.
+        """
+        label_column, skills_column = self.tables[table]
+        if changed_df is None:
+            changed_df = pd.DataFrame(columns=['id', label_column, skills_column])
+        # Keeping the last version of every changed row at the position of its first one
+        changed_df = File.cleanse_dataset(changed_df).groupby('id', sort=False, as_index=False).last()
+
+        # Deactivating the removed rows and the old versions of the modified rows
+        row_positions = self.row_positions[table]
+        removed_positions = [row_positions.pop(row_id) for row_id in removed_ids if row_id in row_positions]
+        old_positions = np.array([row_positions.get(row_id, -1) for row_id in changed_df['id'].tolist()], dtype=np.int64)
+        replaced_positions = np.array(removed_positions + old_positions[old_positions >= 0].tolist(), dtype=np.int64)
+        dropped_pairs = self.count_matching_pairs(table, replaced_positions)
+        self.active[table][replaced_positions] = False
+
+        # Appending the changed rows, the modified ones with the sequence of their old version
+        added = old_positions < 0
+        sequences = self.sequences[table][np.maximum(old_positions, 0)]
+        sequences[added] = self.next_sequences[table] + np.arange(int(added.sum()))
+        self.next_sequences[table] += int(added.sum())
+        changed_positions = len(self.rows[table]) + np.arange(len(changed_df))
+        changed_matrix = SkillMatrix.from_skills(changed_df[skills_column], self.vocabulary)
+        stored_matrix = self.matrices[table].with_vocabulary_size(len(self.vocabulary))
+        self.matrices[table] = SkillMatrix(sparse.vstack([stored_matrix.matrix, changed_matrix.matrix], format='csr'),
+                                           np.concatenate([stored_matrix.skill_counts, changed_matrix.skill_counts]))
+        self.rows[table] = pd.concat([self.rows[table], changed_df[['id', label_column]]], ignore_index=True)
+        self.sequences[table] = np.concatenate([self.sequences[table], sequences])
+        self.active[table] = np.concatenate([self.active[table], np.ones(len(changed_df), dtype=bool)])
+        row_positions.update(zip(changed_df['id'].tolist(), changed_positions.tolist()))
+
+        # Dropping the indexes over the changed table
+        self.indexes.pop(table, None)
+        if table == 'jobs':
+            self.job_backend = None
+        return dropped_pairs, changed_positions
+
+
+
+    def add_pairs(self, seeker_positions: np.ndarray, job_positions: np.ndarray, result: RecommendationResult) -> int:
+        """
+        Function for storing the active pairs of a block of rescored rows.
+
+        Parameters:
+        - seeker_positions(np.ndarray): Stored position of every job seeker of the block.
+        - job_positions(np.ndarray): Stored position of every job of the block.
+        - result(RecommendationResult): Matches of the block, with positions within it.
+
+        Returns:
+        - int: Number of stored pairs.
+        """
+        seeker_positions, job_positions = seeker_positions[result.seeker_positions], job_positions[result.job_positions]
+        kept = self.active['jobseekers'][seeker_positions] & self.active['jobs'][job_positions]
+        self.pending_pairs.append((seeker_positions[kept], job_positions[kept], result.matching_skill_counts[kept], result.matching_skill_percents[kept]))
+        return int(kept.sum())
+
+
+
+    def merge_pending_pairs(self) -> None:
+        """
+        Function for appending the pairs stored since the last merge to the pair columns in one pass.
+        """
+        if self.pending_pairs:
+            columns = list(zip((self.seeker_positions, self.job_positions, self.matching_skill_counts, self.matching_skill_percents), *self.pending_pairs))
+            self.seeker_positions, self.job_positions = np.concatenate(columns[0]).astype(np.int32), np.concatenate(columns[1]).astype(np.int32)
+            self.matching_skill_counts, self.matching_skill_percents = np.concatenate(columns[2]), np.concatenate(columns[3])
+            self.pending_pairs = []
+
+
+
+    def live_pairs(self) -> np.ndarray:
+        """
+        Function for finding the stored pairs whose job seeker and job are both active.
+
+        Returns:
+        - np.ndarray: Indices of the active pairs.
+        """
+        self.merge_pending_pairs()
+        return np.flatnonzero(self.active['jobseekers'][self.seeker_positions] & self.active['jobs'][self.job_positions])
+
+
+
+    def compact(self) -> None:
+        """
+        Function for dropping the inactive rows and their pairs, and storing the active rows in the order of the patched tables.
+        """
+        pair_indices = self.live_pairs()
+        position_maps = {}
+        for table in self.tables:
+            order = np.flatnonzero(self.active[table])
+            order = order[np.argsort(self.sequences[table][order], kind='stable')]
+            position_maps[table] = np.full(len(self.rows[table]), -1, dtype=np.int64)
+            position_maps[table][order] = np.arange(len(order))
+
+            self.rows[table] = self.rows[table].iloc[order].reset_index(drop=True)
+            self.matrices[table] = SkillMatrix(self.matrices[table].matrix[order], self.matrices[table].skill_counts[order])
+            self.sequences[table] = np.arange(len(order), dtype=np.int64)
+            self.active[table] = np.ones(len(order), dtype=bool)
+            self.row_positions[table] = dict(zip(self.rows[table]['id'].tolist(), range(len(order))))
+            self.next_sequences[table] = len(order)
+
+        self.seeker_positions = position_maps['jobseekers'][self.seeker_positions[pair_indices]].astype(np.int32)
+        self.job_positions = position_maps['jobs'][self.job_positions[pair_indices]].astype(np.int32)
+        self.matching_skill_counts, self.matching_skill_percents = self.matching_skill_counts[pair_indices], self.matching_skill_percents[pair_indices]
+        self.job_backend, self.indexes = None, {}
+
+
+
+    def compact_if_sparse(self, table: str) -> None:
+        """
+        Function for compacting once a table holds more inactive than active rows, so the stored rows and pairs stay within twice the active ones.
+
+        Parameters:
+        - table(str): Changed table, either 'jobs' or 'jobseekers'.
+        """
+        active_rows = int(self.active[table].sum())
+        if len(self.active[table]) - active_rows > active_rows:
+            self.compact()
+
+
+
+    def match_rows(self, jobseekers_df: pd.DataFrame, seeker_matrix: SkillMatrix, jobs_df: pd.DataFrame, backend: InvertedIndexMatchingBackend) -> RecommendationResult:
+        """
+        Function for scoring a block of job seekers against a block of jobs with the batch matching code.
+
+        Parameters:
+        - jobseekers_df(pd.DataFrame): IDs and names of the job seekers.
+        - seeker_matrix(SkillMatrix): Skill incidence matrix of the job seekers.
+        - jobs_df(pd.DataFrame): IDs and titles of the jobs.
+        - backend(InvertedIndexMatchingBackend): Matching backend over the jobs.
+
+        Returns:
+        - RecommendationResult: All matches of the block, with positions within the given rows.
+        """
+        # Importing the engine here, since the engine module imports this one
+        from ..jobseeker_recommendation_engine.job_match_recommendation import JobMatchRecommendationEngine
+        return JobMatchRecommendationEngine.match_jobseeker_chunk(jobseekers_df, jobs_df, self.vocabulary, backend, seeker_matrix=seeker_matrix)
+
+
+
+    def update_jobs(self, changed_jobs_df: pd.DataFrame = None, removed_job_ids: Iterable = ()) -> int:
+        """
+        Function for applying a jobs delta and rescoring only the affected pairs.
+
+        Parameters:
+        - changed_jobs_df(pd.DataFrame): Added or modified jobs with the columns id, title and required_skills.
+                                         Set to None by default.
+        - removed_job_ids(Iterable): IDs of the removed jobs. Set to no IDs by default.
+
+        Returns:
+        - int: Number of job seeker and job pairs rescored or dropped.
+        """
+        rescored_pairs, changed_positions = self.patch_rows('jobs', changed_jobs_df, removed_job_ids)
+        if len(changed_positions):
+            # Finding the active job seekers sharing at least one skill with the changed jobs
+            changed_matrix = self.matrices['jobs'].row_block(changed_positions[0], changed_positions[-1] + 1)
+            candidates = self.inverted_index('jobseekers').candidate_positions(np.unique(changed_matrix.matrix.indices))
+            candidates = candidates[self.active['jobseekers'][candidates]]
+
+            # Scoring the candidates against the changed jobs in one block
+            seeker_matrix = SkillMatrix(self.matrices['jobseekers'].matrix[candidates], self.matrices['jobseekers'].skill_counts[candidates])
+            result = self.match_rows(self.rows['jobseekers'].iloc[candidates], seeker_matrix, self.rows['jobs'].iloc[changed_positions],
+                                     InvertedIndexMatchingBackend(changed_matrix.with_vocabulary_size(len(self.vocabulary))))
+            rescored_pairs += self.add_pairs(candidates, changed_positions, result)
+
+        self.compact_if_sparse('jobs')
+        return rescored_pairs
+
+
+
+    def update_jobseekers(self, changed_jobseekers_df: pd.DataFrame = None, removed_jobseeker_ids: Iterable = ()) -> int:
+        """
+        Function for applying a job seekers delta and rescoring only the affected pairs.
+
+        Parameters:
+        - changed_jobseekers_df(pd.DataFrame): Added or modified job seekers with the columns id, name and skills.
+                                               Set to None by default.
+        - removed_jobseeker_ids(Iterable): IDs of the removed job seekers. Set to no IDs by default.
+
+        Returns:
+        - int: Number of job seeker and job pairs rescored or dropped.
+        """
+        rescored_pairs, changed_positions = self.patch_rows('jobseekers', changed_jobseekers_df, removed_jobseeker_ids)
+        if len(changed_positions):
+            # Scoring the changed job seekers against all stored jobs in one block
+            seeker_matrix = self.matrices['jobseekers'].row_block(changed_positions[0], changed_positions[-1] + 1)
+            result = self.match_rows(self.rows['jobseekers'].iloc[changed_positions], seeker_matrix, self.rows['jobs'], self.jobs_backend())
+            rescored_pairs += self.add_pairs(changed_positions, np.arange(len(self.rows['jobs'])), result)
+
+        self.compact_if_sparse('jobseekers')
+        return rescored_pairs
+
+
+
+    def apply_delta(self, delta_df: pd.DataFrame, table: str) -> int:
+        """
+        Function for applying a delta given as rows with an operation column.
+
+        The operation of each row is either 'upsert' for an added or modified row, or 'remove' for a removed row,
+        in which case only its id is used.
+
+        Parameters:
+        - delta_df(pd.DataFrame): Delta rows with the columns of the table and an operation column.
+        - table(str): Table the delta belongs to, either 'jobs' or 'jobseekers'.
+
+        Returns:
+        - int: Number of job seeker and job pairs rescored or dropped.
+        """
+        if table not in self.tables:
+            raise ValueError(f"Table should be one of: {', '.join(self.tables)}.")
+
+        operations = delta_df['operation'].astype(str).str.strip().str.lower()
+        if not operations.isin(['upsert', 'remove']).all():
+            raise ValueError("Operation should be either 'upsert' or 'remove'.")
+
+        # Removing first so that a row removed and added again in the same delta ends up at the end
+        removed_ids = delta_df.loc[operations == 'remove', 'id'].tolist()
+        changed_df = delta_df.loc[operations == 'upsert', ['id', *self.tables[table]]]
+        if table == 'jobs':
+            return self.update_jobs(changed_df, removed_ids)
+        return self.update_jobseekers(changed_df, removed_ids)
+
+
+
+    def apply_delta_file(self, path_file: str, table: str) -> int:
+        """
+        Function for applying a delta CSV file with an operation column.
+
+        Parameters:
+        - path_file(str): Path to the delta CSV file.
+        - table(str): Table the delta belongs to, either 'jobs' or 'jobseekers'.
+
+        Returns:
+        - int: Number of job seeker and job pairs rescored or dropped.
+        """
+        try:
+            delta_df = pd.read_csv(path_file)
+
+        except FileNotFoundError as er:
+            # Handling FileNotFoundError
+            raise ValueError(F"Error: {er.strerror}. Please ensure the CSV file exists.")
+
+        return self.apply_delta(delta_df, table)
+
+
+
+    def track_file(self, path_file: str, offset: int = None) -> None:
+        """
+        Function for tracking an append-only file, so that only rows appended later are applied.
+
+        Parameters:
+        - path_file(str): Path to the append-only CSV file.
+        - offset(int): Byte offset up to which the rows are already applied, or None for the current file size.
+                       Set to None by default.
+        """
+        self.file_offsets[os.path.abspath(path_file)] = os.path.getsize(path_file) if offset is None else offset
+
+
+
+    def apply_appended_rows(self, path_file: str, table: str) -> int:
+        """
+        Function for applying the rows appended to an append-only CSV file since the tracked offset.
+
+        The appended rows are treated as added or modified rows. An untracked file is applied from its first row,
+        and a last line which is still being written, i.e. without a line break, is left for the next call.
+
+        Parameters:
+        - path_file(str): Path to the append-only CSV file with a header line.
+        - table(str): Table the rows belong to, either 'jobs' or 'jobseekers'.
+
+        Returns:
+        - int: Number of job seeker and job pairs rescored or dropped.
+        """
+        with open(path_file, 'rb') as file:
+            header = file.readline()
+            offset = max(self.file_offsets.get(os.path.abspath(path_file), 0), len(header))
+            file.seek(offset)
+            appended = file.read()
+
+        # Parsing only the complete lines appended since the offset
+        appended = appended[:appended.rfind(b'\n') + 1]
+        self.file_offsets[os.path.abspath(path_file)] = offset + len(appended)
+        if not appended.strip():
+            return 0
+
+        delta_df = pd.read_csv(io.BytesIO(header + appended))
+        return self.apply_delta(delta_df.assign(operation='upsert'), table)
+
+
+
+    def to_result(self, pair_indices: np.ndarray = None) -> RecommendationResult:
+        """
+        Function for getting the recommendations as columns, ordered like the batch output.
+
+        Parameters:
+        - pair_indices(np.ndarray): Indices of the active pairs to return, or None for all of them. Set to None by default.
+
+        Returns:
+        - RecommendationResult: Recommendations ordered by job seeker and then by job, or by matching skill percentage
+                                in descending order and then by job ID when top_k is set, like a full run over the
+                                patched tables.
+        """
+        if pair_indices is None:
+            pair_indices = self.live_pairs()
+        seeker_sequences = self.sequences['jobseekers'][self.seeker_positions[pair_indices]]
+        job_positions = self.job_positions[pair_indices]
+        if self.top_k is None:
+            pair_indices = pair_indices[np.lexsort((self.sequences['jobs'][job_positions], seeker_sequences))]
+        else:
+            # Breaking the ties by job ID like the batch output
+            pair_indices = pair_indices[RecommendationEngine.select_top_k(seeker_sequences, self.matching_skill_counts[pair_indices], job_positions, self.top_k,
+                                                                          RecommendationResult.id_codes(self.rows['jobs']))]
+        return RecommendationResult(self.rows['jobseekers'], self.rows['jobs'], self.seeker_positions[pair_indices], self.job_positions[pair_indices],
+                                    self.matching_skill_counts[pair_indices], self.matching_skill_percents[pair_indices])
+
+
+
+    def jobseeker_recommendations(self, jobseeker_id) -> List[Dict]:
+        """
+        Function for getting the recommendations of one job seeker.
+
+        Parameters:
+        - jobseeker_id: ID of the job seeker.
+
+        Returns:
+        - List[Dict]: Recommendations of the job seeker ordered by job, or by matching skill percentage in
+                      descending order and then by job ID when top_k is set.
+        """
+        position = self.row_positions['jobseekers'][jobseeker_id]
+        pair_indices = self.live_pairs()
+        return self.to_result(pair_indices[self.seeker_positions[pair_indices] == position]).to_records()
+
+
+
+    def to_records(self) -> List[Dict]:
+        """
+        Function for getting the recommendations of all job seekers.
+
+        Returns:
+        - List[Dict]: Recommendations in the same order and with the same keys as a full run over the patched tables.
+        """
+        return self.to_result().to_records()
+
+
+
+    @staticmethod
+    def encode_column(arrays: Dict, name: str, values: pd.Series) -> str:
+        """
+        Static method for adding a column to the arrays of a saved state, packing text columns with ParsedFileCache.
+
+        Parameters:
+        - arrays(Dict): Arrays of the saved state.
+        - name(str): Name of the column in the arrays.
+        - values(pd.Series): Values of the column.
+
+        Returns:
+        - str: Kind of the stored column, 'text' or 'numeric'.
+        """
+        if pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values):
+            values = values.tolist()
+            if not all(isinstance(value, str) for value in values):
+                raise ValueError(f"Column {name} mixes strings with other values.")
+            arrays[name], arrays[f'{name}_offsets'] = ParsedFileCache.encode_text(values)
+            return 'text'
+        arrays[name] = values.to_numpy()
+        return 'numeric'
+
+
+
+    @staticmethod
+    def decode_column(stored, name: str, kind: str) -> list:
+        """
+        Static method for reading a column stored with encode_column.
+
+        Parameters:
+        - stored: Arrays of the saved state.
+        - name(str): Name of the column in the arrays.
+        - kind(str): Kind of the stored column, 'text' or 'numeric'.
+
+        Returns:
+        - list: Values of the column.
+        """
+        if kind == 'text':
+            return ParsedFileCache.decode_text(stored[name], stored[f'{name}_offsets'])
+        return stored[name]
+
+
+
+    def save(self, path_file: str) -> None:
+        """
+        Function for saving the state to disk, so that a later process can keep applying deltas without a full run.
+
+        The tables, skill matrices, matching pairs, top_k and tracked files are stored in an uncompressed .npz file,
+        with the text columns packed like in the parsed file cache.
+
+        Parameters:
+        - path_file(str): Path of the .npz file to write.
+        """
+        try:
+            # Storing the active rows and pairs only
+            self.compact()
+            arrays = {'skills': np.array(sorted(self.vocabulary.skill_ids, key=self.vocabulary.skill_ids.get), dtype=str),
+                      'seeker_positions': self.seeker_positions, 'job_positions': self.job_positions,
+                      'matching_skill_counts': self.matching_skill_counts, 'matching_skill_percents': self.matching_skill_percents}
+            layout = {'top_k': self.top_k, 'file_offsets': self.file_offsets, 'columns': {}}
+            for table, table_df in self.rows.items():
+                for column in table_df.columns:
+                    layout['columns'][f'{table}_{column}'] = self.encode_column(arrays, f'{table}_{column}', table_df[column])
+                matrix = self.matrices[table]
+                arrays[f'{table}_indptr'], arrays[f'{table}_indices'], arrays[f'{table}_skill_counts'] = matrix.matrix.indptr, matrix.matrix.indices, matrix.skill_counts
+            arrays['layout'] = np.array(json.dumps(layout))
+            with open(path_file, 'wb') as file:
+                np.savez(file, **arrays)
+
+        except Exception as ex:
+            # Handling unexpected errors
+            raise ValueError(f"An unexpected error occurred while saving the incremental recommendations: {str(ex)}")
+
+
+
+    @classmethod
+    def load(cls, path_file: str) -> "IncrementalRecommendations":
+        """
+        Class method for loading a state saved with save.
+
+        Parameters:
+        - path_file(str): Path of the .npz file to read.
+
+        Returns:
+        - IncrementalRecommendations: Loaded state.
+        """
+        try:
+            with np.load(path_file, allow_pickle=False) as stored:
+                layout = json.loads(str(stored['layout']))
+
+                # Rebuilding the vocabulary from the skill tokens ordered by id
+                vocabulary = SkillVocabulary()
+                vocabulary.skill_ids = {skill: skill_id for skill_id, skill in enumerate(stored['skills'].tolist())}
+
+                # Rebuilding the tables and their skill matrices
+                tables, matrices = {}, {}
+                for table, label_column in (('jobs', 'title'), ('jobseekers', 'name')):
+                    tables[table] = pd.DataFrame({column: cls.decode_column(stored, f'{table}_{column}', layout['columns'][f'{table}_{column}'])
+                                                  for column in ('id', label_column)})
+                    indices = stored[f'{table}_indices']
+                    matrix = sparse.csr_matrix((np.ones(len(indices), dtype=np.int32), indices, stored[f'{table}_indptr']), shape=(len(tables[table]), len(vocabulary)))
+                    matrices[table] = SkillMatrix(matrix, stored[f'{table}_skill_counts'])
+
+                result = RecommendationResult(tables['jobseekers'], tables['jobs'], stored['seeker_positions'], stored['job_positions'],
+                                              stored['matching_skill_counts'], stored['matching_skill_percents'])
+                incremental_recommendations = cls(tables['jobs'], tables['jobseekers'], vocabulary, matrices['jobs'], matrices['jobseekers'], result, layout['top_k'])
+                incremental_recommendations.file_offsets = layout['file_offsets']
+                return incremental_recommendations
+
+        except FileNotFoundError as er:
+            # Handling FileNotFoundError
+            raise ValueError(f"Error: {er.strerror}. Please ensure the incremental recommendations file exists.")
+
+        except Exception as ex:
+            # Handling other unexpected errors
+            raise ValueError(f"An unexpected error occurred while loading the incremental recommendations: {str(ex)}")
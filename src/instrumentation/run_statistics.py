@@ -0,0 +1,295 @@
+# typing module for type hints
+from typing import Callable, Dict
+# contextlib module for the stage context managers
+import contextlib
+# functools module for wrapping the instrumented functions
+import functools
+# inspect module for recognizing generator functions
+import inspect
+# json module for the machine-readable dump
+import json
+# time module for measuring the wall and CPU time
+import time
+# psutil library for measuring the memory of the process
+import psutil
+
+
+class RunStatistics:
+    """
+    A class for collecting the per-stage timings and counters of a recommendation run.
+
+    Every stage, e.g. reading the jobs or matching a chunk, adds its wall and CPU time to the totals of its name,
+    so stages run once per chunk are summed up. The counters are plain totals, with the same meaning in every
+    processing path:
+    - pairs_evaluated: Job seeker and job pairs of the cleansed inputs, i.e. job seekers times jobs, which every
+      path answers for whatever it actually compares.
+    - profile_pairs_scored: Distinct job seeker skill profile and job pairs standing for those pairs, equal to
+      pairs_evaluated without profile deduplication.
+    - candidate_pairs: Pairs whose skills were compared after candidate generation, counted only by the paths and
+      matching backends which generate candidates, e.g. the inverted index of sequential processing.
+    - matches_emitted: Recommendations of the run.
+    The resident memory of the process is sampled at the end of every stage, and the busy time reported
+    by the worker processes gives their utilization during the dispatch stage.
+
+    Attributes:
+    - callback(Callable): Function called with the stage name and the statistics at the end of every stage and
+                          with 'run' at the end of the run, or None.
+    - stages(Dict): Wall seconds, CPU seconds and calls of every stage.
+    - counters(Dict): Total of every counter.
+    - worker_seconds(float): Busy seconds reported by the worker processes.
+    - peak_rss(int): Largest resident memory in bytes sampled so far.
+    - wall_seconds(float): Wall time of the run once finished.
+    - running(bool): Whether the run is in progress.
+    """
+    enabled = True
+
+
+    def __init__(self, callback: Callable = None):
+        """
+        Constructor for class RunStatistics.
+
+        Parameters:
+        - callback(Callable): Function called as callback(stage, statistics). Set to None by default.
+        """
+        self.callback = callback
+        self.stages: Dict[str, Dict] = {}
+        self.counters: Dict[str, int] = {}
+        self.worker_seconds = 0.0
+        self.peak_rss = 0
+        self.wall_seconds = 0.0
+        self.running = False
+        self.started_at = None
+        self.process = psutil.Process()
+
+
+
+    def start(self) -> None:
+        """
+        Function for starting the run.
+        """
+        self.running = True
+        self.started_at = time.perf_counter()
+
+
+
+    def finish(self) -> None:
+        """
+        Function for finishing the run and calling the callback with 'run'.
+        """
+        self.wall_seconds = time.perf_counter() - self.started_at
+        self.running = False
+        self.sample_memory()
+        if self.callback is not None:
+            self.callback('run', self)
+
+
+
+    def sample_memory(self) -> None:
+        """
+        Function for updating the peak resident memory with the current one.
+        """
+        self.peak_rss = max(self.peak_rss, self.process.memory_info().rss)
+
+
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """
+        Function for timing a stage of the run, used as a context manager.
+
+        Parameters:
+        - name(str): Name of the stage.
+        """
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield self
+        finally:
+            stage = self.stages.setdefault(name, {'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'calls': 0})
+            stage['wall_seconds'] += time.perf_counter() - wall_start
+            stage['cpu_seconds'] += time.process_time() - cpu_start
+            stage['calls'] += 1
+            self.sample_memory()
+            if self.callback is not None:
+                self.callback(name, self)
+
+
+
+    def count(self, name: str, value: int = 1) -> None:
+        """
+        Function for adding a value to a counter.
+
+        Parameters:
+        - name(str): Name of the counter.
+        - value(int): Value added to the counter. Set to 1 by default.
+        """
+        self.counters[name] = self.counters.get(name, 0) + int(value)
+
+
+
+    def add_worker_seconds(self, seconds: float) -> None:
+        """
+        Function for adding the busy time reported by a worker process for one task.
+
+        Parameters:
+        - seconds(float): Wall seconds the worker spent on the task.
+        """
+        self.worker_seconds += seconds
+
+
+
+    def worker_utilization(self, workers: int) -> float:
+        """
+        Function for calculating the share of the dispatch stage the worker processes were busy.
+
+        Parameters:
+        - workers(int): Number of worker processes.
+
+        Returns:
+        - float: Busy time of the workers divided by the capacity of the pool, or None without a dispatch stage.
+        """
+        dispatch = self.stages.get('dispatch')
+        if dispatch is None or dispatch['wall_seconds'] == 0:
+            return None
+        return self.worker_seconds / (workers * dispatch['wall_seconds'])
+
+
+
+    def deduplication_ratio(self) -> float:
+        """
+        Function for calculating how many pairs were evaluated per skill profile pair they stand for.
+
+        Returns:
+        - float: Pairs evaluated divided by profile pairs scored, or None if no profile pair was scored.
+        """
+        profile_pairs_scored = self.counters.get('profile_pairs_scored')
+        if not profile_pairs_scored:
+            return None
+        return self.counters.get('pairs_evaluated', 0) / profile_pairs_scored
+
+
+
+    def to_dict(self) -> Dict:
+        """
+        Function for converting the statistics into a dictionary.
+
+        Returns:
+        - Dict: Wall time, stages, counters, worker utilization, deduplication ratio and peak memory of the run.
+        """
+        workers = self.counters.get('workers')
+        return {'wall_seconds': self.wall_seconds, 'stages': self.stages, 'counters': self.counters,
+                'worker_seconds': self.worker_seconds, 'worker_utilization': self.worker_utilization(workers) if workers else None,
+                'deduplication_ratio': self.deduplication_ratio(), 'peak_rss_bytes': self.peak_rss}
+
+
+
+    def to_json(self) -> str:
+        """
+        Function for dumping the statistics as JSON.
+
+        Returns:
+        - str: JSON document of to_dict.
+        """
+        return json.dumps(self.to_dict(), indent=2)
+
+
+
+    def save(self, path_file: str) -> None:
+        """
+        Function for saving the statistics as a JSON file.
+
+        Parameters:
+        - path_file(str): Path of the JSON file to write.
+        """
+        try:
+            with open(path_file, 'w') as file:
+                file.write(self.to_json())
+
+        except OSError as ex:
+            # Handling errors while writing the file
+            raise ValueError(f"An error occurred while saving the run statistics: {ex}")
+
+
+
+class DisabledRunStatistics(RunStatistics):
+    """
+    A class standing in for RunStatistics when the instrumentation is disabled.
+
+    All of its functions do nothing, so the instrumented code runs unchanged at the cost of a function call
+    per stage or chunk, and never per pair.
+    """
+    enabled = False
+    null_stage = contextlib.nullcontext()
+
+
+    def __init__(self):
+        """
+        Constructor for class DisabledRunStatistics.
+        """
+        self.running = False
+
+
+
+    def start(self) -> None:
+        """
+        Function for starting the run, which does nothing.
+        """
+        pass
+
+
+
+    def finish(self) -> None:
+        """
+        Function for finishing the run, which does nothing.
+        """
+        pass
+
+
+
+    def stage(self, name: str):
+        """
+        Function for returning a context manager which does nothing.
+        """
+        return self.null_stage
+
+
+
+    def count(self, name: str, value: int = 1) -> None:
+        """
+        Function for adding a value to a counter, which does nothing.
+        """
+        pass
+
+
+
+    def add_worker_seconds(self, seconds: float) -> None:
+        """
+        Function for adding the busy time of a worker process, which does nothing.
+        """
+        pass
+
+
+
+def instrumented(function: Callable) -> Callable:
+    """
+    Decorator for running a function of an engine inside the engine's instrumented_run context manager.
+
+    Generator functions are wrapped by a generator, so that the run lasts until the generator is exhausted or closed.
+
+    Parameters:
+    - function(Callable): Function taking the engine as first argument.
+
+    Returns:
+    - Callable: Wrapped function.
+    """
+    if inspect.isgeneratorfunction(function):
+        @functools.wraps(function)
+        def generator_wrapper(self, *args, **kwargs):
+            with self.instrumented_run():
+                yield from function(self, *args, **kwargs)
+        return generator_wrapper
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        with self.instrumented_run():
+            return function(self, *args, **kwargs)
+    return wrapper
@@ -1,23 +1,127 @@
 # typing module for type hints
-from typing import List, Dict
+from typing import List, Dict, Iterator, Tuple, Union
+# functools module for binding the settings of the approximate backend
+import functools
+# numpy library for numerical arrays
+import numpy as np
 # pandas library for data manipulation and analysis
 import pandas as pd
 # multiprocessing module for parallel processing
 import multiprocessing as mp
+# copy module for running a plan without changing the configured settings
+import copy
+# warnings module for announcing deprecated parameters
+import warnings
+# contextlib module for starting and finishing instrumented runs
+import contextlib
+# time module for measuring the busy time of the worker processes
+import time
+# os module for operating system functionalities
+import os
 # custom File class for reading files
 from ..file_reader.read_files import File
+# custom IngestOptions class for the columns parsed in fast ingest mode
+from ..file_reader.ingest_options import IngestOptions
 # custom RecommendationEngine class for inheritance 
 from ..recommendation_engine.recommendation import RecommendationEngine
+# custom skill vocabulary and incidence matrix classes for vectorized matching
+from ..skill_matching.skill_vocabulary import SkillVocabulary, SkillMatrix
+# custom matching backends for calculating matching skills in bulk
+from ..skill_matching.matching_backend import MatchingBackend, SparseMatchingBackend
+# custom inverted index classes for candidate generation
+from ..skill_matching.inverted_index import SkillInvertedIndex, InvertedIndexMatchingBackend
+# custom bitset backend for calculating matching skills with popcount
+from ..skill_matching.bitset_matching import BitsetMatchingBackend
+# custom DeduplicatedMatchingBackend class for scoring distinct skill profiles only
+from ..skill_matching.profile_deduplication import DeduplicatedMatchingBackend
+# custom scoring kernel classes for scoring the matches of a block in bulk
+from ..skill_matching.scoring_kernels import ScoringKernel, OverlapPercentKernel
+# custom PrefixFilterMatchingBackend class for generating only the pairs which can reach the minimum match
+from ..skill_matching.prefix_filter import PrefixFilterMatchingBackend
+# custom MinHashLshMatchingBackend class for approximately matching very large catalogs
+from ..skill_matching.minhash_lsh import MinHashLshMatchingBackend
+# custom ResultSink classes for writing recommendations incrementally
+from ..result_sink.result_sinks import ResultSink, CsvResultSink
+# custom RecommendationResult class for compact columnar recommendations
+from ..recommendation_result.recommendation_result import RecommendationResult
+# custom IncrementalRecommendations class for updating recommendations with deltas
+from ..incremental_update.incremental_recommendations import IncrementalRecommendations
+# custom RecommendationIndex class for answering single job seeker queries
+from ..recommendation_index.recommendation_index import RecommendationIndex
+# custom execution planner classes for choosing how to process the input files
+from ..execution_planner.execution_planner import ExecutionPlanner, ExecutionPlan
+# custom run statistics classes and decorator for instrumenting the runs
+from ..instrumentation.run_statistics import RunStatistics, DisabledRunStatistics, instrumented
+# custom ShardSpec class for processing one shard of the job seekers
+from ..sharding.shards import ShardSpec
+# custom ExternalRecommendationSorter class for sorting more recommendations than fit into memory
+from ..external_sort.external_sort import ExternalRecommendationSorter
+# custom WorkerPool class for keeping the worker processes warm across parallel runs
+from ..worker_pool.worker_pool import WorkerPool
+# custom CheckpointLog class for committing the finished job seeker chunks to disk
+from ..checkpoint.checkpoint_log import CheckpointLog
+# custom ParsedFileCache class for the fingerprints of the input files
+from ..file_reader.file_cache import ParsedFileCache
 
 
 class JobMatchRecommendationEngine(RecommendationEngine):
     """
-    A class for performing job matching recommendation to job seekers using sequential or parallel processing.
+    A class for performing job matching recommendation to job seekers using sequential, vectorized or parallel processing.
 
     Attributes:
     - path_file_jobs(str): Path to the file containing jobs data.
     - path_file_jobseeker(str): Path to the file containing jobseekers data.
+    - matching_backend(str): Backend used by vectorized processing, either 'auto', 'sparse', 'inverted_index', 'bitset' 
+                             or the approximate 'minhash_lsh', which may miss matches. Default is 'auto', which uses the bitset backend for 
+                             vocabularies of at most bitset_vocabulary_limit skills and the sparse backend otherwise.
+    - lsh_bands(int): Number of bands of the MinHash signatures of the 'minhash_lsh' backend. Default is 16.
+    - lsh_rows_per_band(int): Number of signature values per band of the 'minhash_lsh' backend. Default is 2.
+    - lsh_seed(int): Seed of the hash functions of the 'minhash_lsh' backend. Default is 0.
+    - bitset_vocabulary_limit(int): Largest vocabulary size for which 'auto' chooses the bitset backend. Default is 64.
+    - checkpoint_directory(str): Directory of the work log the streamed runs commit every finished job seeker chunk to,
+                                 or None to not checkpoint. Default is None.
+    - cache_directory(str): Directory of the parsed file cache used when reading the input files, or None to always 
+                            parse the CSV files. Default is None.
+    - pool_size(int): Number of worker processes of parallel processing, or None to derive it from the CPU cores. 
+                      Default is None.
+    - worker_chunksize(int): Number of job seeker chunks sent to a worker process at a time by parallel processing.
+                             Default is 1.
+    - worker_pool(WorkerPool): Pool of worker processes kept warm across parallel runs by open_worker_pool, or None
+                               to start a pool for every parallel run. Default is None.
+    - deduplicate_profiles(bool): Whether job seekers and jobs with identical skill sets are scored once per skill set
+                                  by the matching backends. Default is True.
+    - memory_limit(int): Largest number of bytes of the row hashes kept per input file for removing duplicates
+                         across chunks, or None for no limit. Default is None.
+    - fast_ingest(bool): Whether only the needed columns are parsed with declared data types. Default is False.
+    - ingest_parser(str): Parser of fast ingest mode, 'auto', 'pyarrow' or 'c'. Default is 'auto'.
+    - string_storage(str): Storage of the text columns in fast ingest mode, 'auto', 'pyarrow' or 'category'. Default is 'auto'.
+    - shard(ShardSpec): Shard of the job seekers read in chunks, or None for all job seekers. Set by write_shard. Default is None.
+    - instrumentation(bool): Whether the runs collect per-stage timings and counters. Default is False.
+    - statistics_callback(Callable): Function called with the stage name and the RunStatistics at the end of every 
+                                     stage and of the run, or None. Default is None.
+    - run_statistics(RunStatistics): Statistics of the current or latest run.
     """
+    matching_backend = "auto"
+    matching_backends = {"sparse": SparseMatchingBackend, "inverted_index": InvertedIndexMatchingBackend, "bitset": BitsetMatchingBackend}
+    approximate_matching_backends = {"minhash_lsh": MinHashLshMatchingBackend}
+    bitset_vocabulary_limit = 64
+    lsh_bands = 16
+    lsh_rows_per_band = 2
+    lsh_seed = 0
+    cache_directory = None
+    checkpoint_directory = None
+    pool_size = None
+    worker_chunksize = 1
+    worker_pool = None
+    deduplicate_profiles = True
+    memory_limit = None
+    fast_ingest = False
+    ingest_parser = "auto"
+    string_storage = "auto"
+    shard = None
+    instrumentation = False
+    statistics_callback = None
+    run_statistics = DisabledRunStatistics()
 
     def __init__(self, path_file_jobs: str, path_file_jobseeker: str):
         """
@@ -32,6 +136,420 @@ class JobMatchRecommendationEngine(RecommendationEngine):
 
     
 
+    def set_matching_backend(self, matching_backend: str) -> None:
+        """
+        Function for setting the backend used by vectorized processing.
+
+        Parameters:
+        - matching_backend(str): Name of the backend, 'auto' or one of the keys of matching_backends or of 
+                                 approximate_matching_backends.
+        """
+        if not isinstance(matching_backend, str):
+            raise TypeError("Matching backend must be a string")
+
+        backend_names = ["auto", *self.matching_backends, *self.approximate_matching_backends]
+        if matching_backend in backend_names:
+            self.matching_backend = matching_backend
+        else:
+            raise ValueError(f"Matching backend should be one of: {', '.join(backend_names)}.")
+
+
+
+    def set_lsh_parameters(self, bands: int, rows_per_band: int, seed: int = 0) -> None:
+        """
+        Function for setting the MinHash and LSH parameters of the approximate 'minhash_lsh' matching backend.
+
+        A pair of skill sets with a Jaccard similarity J becomes a candidate with a probability of 
+        1 - (1 - J^rows_per_band)^bands, so more bands raise the recall and more rows per band raise the speed.
+
+        Parameters:
+        - bands(int): Number of bands of the signatures.
+        - rows_per_band(int): Number of signature values per band.
+        - seed(int): Seed of the hash functions. Set to 0 by default.
+        """
+        if not all(isinstance(value, int) and not isinstance(value, bool) for value in (bands, rows_per_band, seed)):
+            raise TypeError("LSH bands, rows per band and seed must be integers")
+
+        if bands >= 1 and rows_per_band >= 1:
+            self.lsh_bands = bands
+            self.lsh_rows_per_band = rows_per_band
+            self.lsh_seed = seed
+        else:
+            raise ValueError("LSH bands and rows per band should be at least 1.")
+
+
+
+    def set_cache_directory(self, cache_directory: str) -> None:
+        """
+        Function for setting the directory of the parsed file cache.
+
+        With a cache directory set, the cleansed and tokenized input files are stored in a binary format and
+        loaded from it on later runs as long as the files are unchanged, which skips CSV parsing and cleansing.
+
+        Parameters:
+        - cache_directory(str): Directory of the cache, or None to disable caching.
+        """
+        if cache_directory is not None and not isinstance(cache_directory, str):
+            raise TypeError("Cache directory must be a string or None")
+        self.cache_directory = cache_directory
+
+
+
+    def set_checkpoint_directory(self, checkpoint_directory: str) -> None:
+        """
+        Function for setting the directory of the work log of checkpointed runs.
+
+        With a checkpoint directory set, the runs streaming through iter_recommendations, e.g. parallel_processing, 
+        write_recommendations and columnar_processing, commit the recommendations of every finished job seeker chunk
+        to the work log. A rerun with the same input files and settings skips the chunks in the work log, so a 
+        killed run resumes where it stopped and gives the same output as an uninterrupted run.
+
+        Parameters:
+        - checkpoint_directory(str): Directory of the work log, or None to disable checkpointing.
+        """
+        if checkpoint_directory is not None and not isinstance(checkpoint_directory, str):
+            raise TypeError("Checkpoint directory must be a string or None")
+        self.checkpoint_directory = checkpoint_directory
+
+
+
+    def checkpoint_manifest(self, jobseeker_chunk_size: int) -> Dict:
+        """
+        Function for describing the inputs and settings the chunks of a checkpointed run depend on.
+
+        Parameters:
+        - jobseeker_chunk_size(int): Size of each chunk of job seeker data.
+
+        Returns:
+        - Dict: Fingerprints of the input files and the settings changing the recommendations or the chunks.
+        """
+        settings = {'jobseeker_chunk_size': jobseeker_chunk_size, 'matching_backend': self.matching_backend, 'lsh_bands': self.lsh_bands,
+                    'lsh_rows_per_band': self.lsh_rows_per_band, 'lsh_seed': self.lsh_seed, 'top_k': self.top_k,
+                    'scoring_kernel': self.scoring_kernel.name, 'min_match_count': self.min_match_count, 'min_match_percent': self.min_match_percent,
+                    'memory_limit': self.memory_limit, 'fast_ingest': self.fast_ingest, 'ingest_parser': self.ingest_parser,
+                    'string_storage': self.string_storage, 'shard': str(self.shard) if self.shard is not None else None}
+        return {'jobs': ParsedFileCache.fingerprint(self.path_file_jobs), 'jobseekers': ParsedFileCache.fingerprint(self.path_file_jobseeker),
+                'settings': settings}
+
+
+
+    def open_checkpoint_log(self, jobseeker_chunk_size: int) -> CheckpointLog:
+        """
+        Function for opening the work log of a checkpointed run.
+
+        Parameters:
+        - jobseeker_chunk_size(int): Size of each chunk of job seeker data.
+
+        Returns:
+        - CheckpointLog: Work log of the inputs and settings of the engine, or None without a checkpoint directory.
+        """
+        if self.checkpoint_directory is None:
+            return None
+        with self.run_statistics.stage('open_checkpoint'):
+            return CheckpointLog(self.checkpoint_directory, self.checkpoint_manifest(jobseeker_chunk_size))
+
+
+
+    def count_checkpoint(self, checkpoint_log: CheckpointLog) -> None:
+        """
+        Function for adding the chunks committed to and resumed from the work log to the run statistics.
+
+        Parameters:
+        - checkpoint_log(CheckpointLog): Work log of the run, or None.
+        """
+        if checkpoint_log is not None:
+            self.run_statistics.count('chunks_committed', checkpoint_log.chunks_committed)
+            self.run_statistics.count('chunks_resumed', checkpoint_log.chunks_resumed)
+
+
+
+    def set_pool_size(self, pool_size) -> None:
+        """
+        Function for setting the number of worker processes of parallel processing.
+
+        Parameters:
+        - pool_size(int): Number of worker processes, or None to derive it from the CPU cores.
+        """
+        if pool_size is None:
+            self.pool_size = None
+            return
+
+        if not isinstance(pool_size, int) or isinstance(pool_size, bool):
+            raise TypeError("Pool size must be an integer or None")
+
+        if pool_size >= 1:
+            self.pool_size = pool_size
+        else:
+            raise ValueError("Pool size should be at least 1.")
+
+
+
+    def set_worker_chunksize(self, worker_chunksize: int) -> None:
+        """
+        Function for setting the number of job seeker chunks sent to a worker process at a time by parallel processing.
+
+        Larger values send fewer messages to the workers, smaller values spread uneven chunks better over them.
+
+        Parameters:
+        - worker_chunksize(int): Number of job seeker chunks per task of the pool.
+        """
+        if not isinstance(worker_chunksize, int) or isinstance(worker_chunksize, bool):
+            raise TypeError("Worker chunksize must be an integer")
+
+        if worker_chunksize >= 1:
+            self.worker_chunksize = worker_chunksize
+        else:
+            raise ValueError("Worker chunksize should be at least 1.")
+
+
+
+    @contextlib.contextmanager
+    def open_worker_pool(self):
+        """
+        Function for keeping a pool of worker processes warm across the parallel runs of the engine, used as a context manager.
+
+        Inside the context, every parallel run, e.g. of parallel_processing, write_recommendations or a parallel plan 
+        of generate_recommendations, reuses the same worker processes and the jobs they loaded in their initializer, 
+        as long as the jobs file and the settings of the engine are unchanged. Otherwise, or after a failed run, the 
+        pool is restarted. The workers are stopped and reaped when leaving the context.
+
+        Returns:
+        - WorkerPool: Pool of worker processes of the engine.
+        """
+        worker_pool = WorkerPool()
+        self.worker_pool = worker_pool
+        try:
+            with worker_pool:
+                yield worker_pool
+        finally:
+            self.worker_pool = None
+
+
+
+    def worker_pool_key(self, pool_size: int) -> Tuple:
+        """
+        Function for describing the jobs and settings the worker processes of a parallel run are loaded with.
+
+        Parameters:
+        - pool_size(int): Number of worker processes.
+
+        Returns:
+        - Tuple: Path, modification time and size of the jobs file and the settings changing the loaded jobs.
+        """
+        jobs_file_stat = os.stat(self.path_file_jobs)
+        return (os.path.abspath(self.path_file_jobs), jobs_file_stat.st_mtime_ns, jobs_file_stat.st_size, pool_size, self.matching_backend,
+                self.bitset_vocabulary_limit, self.lsh_bands, self.lsh_rows_per_band, self.lsh_seed, self.deduplicate_profiles, self.top_k, self.scoring_kernel, self.min_match_count, self.min_match_percent,
+                self.memory_limit, self.fast_ingest, self.ingest_parser, self.string_storage)
+
+
+
+    def set_memory_limit(self, memory_limit) -> None:
+        """
+        Function for setting the memory limit of removing duplicate rows across the chunks of the input files.
+
+        Parameters:
+        - memory_limit(int): Largest number of bytes of the row hashes per input file, or None for no limit.
+        """
+        if memory_limit is None:
+            self.memory_limit = None
+            return
+
+        if not isinstance(memory_limit, int) or isinstance(memory_limit, bool):
+            raise TypeError("Memory limit must be an integer or None")
+
+        if memory_limit >= 1:
+            self.memory_limit = memory_limit
+        else:
+            raise ValueError("Memory limit should be at least 1.")
+
+
+
+    def set_fast_ingest(self, fast_ingest: bool, parser: str = "auto", string_storage: str = "auto") -> None:
+        """
+        Function for setting whether the input files are read in fast ingest mode.
+
+        In fast ingest mode, only the columns used by the engine are parsed, the ids as nullable integers and the
+        text columns as Arrow strings or categoricals, optionally with the multithreaded pyarrow parser. Without
+        pyarrow, the C parser of pandas and categoricals are used. The recommendations are the same in both modes.
+
+        Parameters:
+        - fast_ingest(bool): Whether the input files are read in fast ingest mode.
+        - parser(str): Parser of fast ingest mode, 'auto', 'pyarrow' or 'c'. Set to 'auto' by default.
+        - string_storage(str): Storage of the text columns, 'auto', 'pyarrow' or 'category'. Set to 'auto' by default.
+        """
+        if not isinstance(fast_ingest, bool):
+            raise TypeError("Fast ingest must be a boolean")
+
+        # Validating the parser and the string storage before keeping them
+        IngestOptions({}, parser, string_storage)
+        self.fast_ingest, self.ingest_parser, self.string_storage = fast_ingest, parser, string_storage
+
+
+
+    def open_file(self, path_file: str, ingest_columns: Dict[str, str]) -> File:
+        """
+        Function for creating the reader of an input file with the cache directory, memory limit and ingest mode of the engine.
+
+        Parameters:
+        - path_file(str): Path of the CSV file.
+        - ingest_columns(Dict[str, str]): Columns parsed in fast ingest mode, e.g. IngestOptions.job_columns.
+
+        Returns:
+        - File: Reader of the file.
+        """
+        ingest_options = IngestOptions(ingest_columns, self.ingest_parser, self.string_storage) if self.fast_ingest else None
+        return File(path_file, self.cache_directory, self.memory_limit, ingest_options)
+
+
+
+    def open_jobs_file(self) -> File:
+        """
+        Function for creating the reader of the jobs file.
+
+        Returns:
+        - File: Reader of the jobs file.
+        """
+        return self.open_file(self.path_file_jobs, IngestOptions.job_columns)
+
+
+
+    def open_jobseekers_file(self) -> File:
+        """
+        Function for creating the reader of the job seekers file.
+
+        Returns:
+        - File: Reader of the job seekers file.
+        """
+        return self.open_file(self.path_file_jobseeker, IngestOptions.jobseeker_columns)
+
+
+
+    def set_deduplicate_profiles(self, deduplicate_profiles: bool) -> None:
+        """
+        Function for setting whether identical skill profiles are scored once.
+
+        With deduplication, the job seekers and jobs are grouped by their skill set, only the distinct pairs of
+        skill sets are scored and the results are fanned out to all members, which gives the same recommendations.
+
+        Parameters:
+        - deduplicate_profiles(bool): Whether identical skill profiles are scored once.
+        """
+        if not isinstance(deduplicate_profiles, bool):
+            raise TypeError("Deduplicate profiles must be a boolean")
+        self.deduplicate_profiles = deduplicate_profiles
+
+
+
+    def set_instrumentation(self, instrumentation: bool, statistics_callback=None) -> None:
+        """
+        Function for enabling or disabling the per-stage timings and counters of the runs.
+
+        With the instrumentation enabled, every run of generate_recommendations or of a processing function
+        collects the wall and CPU time of its stages, the pairs evaluated, matches emitted, chunks dispatched,
+        bytes read, worker utilization and peak memory into a RunStatistics, available with get_run_statistics.
+        When disabled, the stages and counters cost a function call per stage or chunk.
+
+        Parameters:
+        - instrumentation(bool): Whether the runs are instrumented.
+        - statistics_callback(Callable): Function called as statistics_callback(stage, run_statistics) at the end of
+                                         every stage and with 'run' at the end of the run. Set to None by default.
+        """
+        if not isinstance(instrumentation, bool):
+            raise TypeError("Instrumentation must be a boolean")
+
+        if statistics_callback is not None and not callable(statistics_callback):
+            raise TypeError("Statistics callback must be callable or None")
+        self.instrumentation = instrumentation
+        self.statistics_callback = statistics_callback
+
+
+
+    def get_run_statistics(self) -> RunStatistics:
+        """
+        Function for getting the statistics of the current or latest instrumented run.
+
+        Returns:
+        - RunStatistics: Statistics of the run, or None if the latest run was not instrumented.
+        """
+        return self.run_statistics if self.run_statistics.enabled else None
+
+
+
+    @contextlib.contextmanager
+    def instrumented_run(self):
+        """
+        Function for starting and finishing the statistics of a run, used as a context manager.
+
+        A new RunStatistics is only started when the instrumentation is enabled and no run is in progress, so a 
+        processing function called by generate_recommendations adds its stages to the run of the caller.
+        """
+        if self.run_statistics.running:
+            yield
+            return
+
+        if not self.instrumentation:
+            # Dropping the statistics of an earlier instrumented run, so that they are not added to
+            self.run_statistics = DisabledRunStatistics()
+            yield
+            return
+
+        self.run_statistics = RunStatistics(self.statistics_callback)
+        self.run_statistics.start()
+        try:
+            yield
+        finally:
+            self.run_statistics.finish()
+
+
+
+    def count_bytes_read(self, *paths_files: str) -> None:
+        """
+        Function for adding the size of the read input files to the bytes read of the run.
+
+        Parameters:
+        - paths_files(str): Paths of the read files.
+        """
+        if self.run_statistics.enabled:
+            self.run_statistics.count('bytes_read', sum(os.path.getsize(path_file) for path_file in paths_files))
+
+
+
+    def create_matching_backend(self, job_matrix: SkillMatrix) -> MatchingBackend:
+        """
+        Function for creating the configured matching backend for the jobs.
+
+        With the 'auto' setting, the bitset backend is chosen when the vocabulary is small enough for the
+        packed bitmasks to beat the sparse products, and the sparse backend otherwise. With deduplicate_profiles
+        set, the backend is wrapped so that it only scores distinct skill profiles. With a minimum match count or
+        percentage, the prefix filter backend is used instead, which only generates the pairs able to reach it,
+        unless the approximate 'minhash_lsh' backend is set, which is then used with the minimum applied to its
+        exactly scored candidates.
+
+        Parameters:
+        - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+
+        Returns:
+        - MatchingBackend: Matching backend built over the jobs.
+        """
+        if self.has_minimum_match() and self.matching_backend not in self.approximate_matching_backends:
+            # Pushing the minimum match down into the candidate generation
+            return PrefixFilterMatchingBackend(job_matrix, self.min_match_count, self.min_match_percent, self.scoring_kernel)
+
+        matching_backend = self.matching_backend
+        if matching_backend == "auto":
+            # Choosing the backend based on the vocabulary size
+            matching_backend = "bitset" if job_matrix.matrix.shape[1] <= self.bitset_vocabulary_limit else "sparse"
+        if matching_backend in self.matching_backends:
+            backend_class = self.matching_backends[matching_backend]
+        else:
+            # Binding the MinHash and LSH settings of the approximate backend
+            backend_class = functools.partial(self.approximate_matching_backends[matching_backend], bands=self.lsh_bands,
+                                              rows_per_band=self.lsh_rows_per_band, seed=self.lsh_seed)
+        if self.deduplicate_profiles:
+            return DeduplicatedMatchingBackend(job_matrix, backend_class)
+        return backend_class(job_matrix)
+
+
     def calculate_total_size_files(self) -> float:
         """
         Function for calculating the total size of the job and job seeker files in Giga Byte.
@@ -44,77 +562,449 @@ class JobMatchRecommendationEngine(RecommendationEngine):
             size_first_file = self.calculate_file_size(self.path_file_jobs)
             size_second_file = self.calculate_file_size(self.path_file_jobseeker)
 
-            # Calculating total size of two files
-            total_size_files = size_first_file + size_second_file
+            # Calculating total size of two files
+            total_size_files = size_first_file + size_second_file
+
+            # Converting bytes to Giga Bytes(GB)
+            file_size_gb = total_size_files / (1024 * 1024 * 1024)  
+
+            
+            # Returning file size in GB
+            return file_size_gb
+        
+        except Exception as ex:
+            # Handling unexpected errors
+            raise Exception(f"An unexpected error occurred while calculating total file size: {str(ex)}")
+
+
+
+    @instrumented
+    def sequential_processing(self) -> List[Dict]:
+        """
+        Function for performing sequential processing to match job seekers with available jobs,specifically 
+        used for the smaller size job and jobseeker files.
+
+        It iterates over job seekers and jobs sequentially to find matches based on required skills. 
+        It reads job and jobseeker data from CSV files, builds an inverted index from skills to jobs once, 
+        and processes each job seeker only against the jobs sharing at least one of its skills. The skills strings
+        are tokenized once through the skill token cache, so the matching skills are counted on frozen sets, and each
+        distinct skill set is counted only once, its matches being reused for every job seeker with the same skills. 
+        The matches of each chunk are then scored by the scoring kernel in bulk. With a minimum match count or 
+        percentage, only the postings of the rarest skills which can still reach it are merged. With top_k set, only 
+        the best matches of each job seeker are kept, ordered by score in descending order.
+
+        Returns:
+        - List[Dict]: List of matched job recommendations.
+        Each dictionary contains the following keys:
+        - 'jobseeker_id': ID of the job seeker.
+        - 'jobseeker_name': Name of the job seeker.
+        - 'job_id': ID of the matched job.
+        - 'job_title': Title of the matched job.
+        - 'matching_skill_count': Count of matching skills between the job seeker and job.
+        - 'matching_skill_percent': Percentage of matching skills between the job seeker and job.
+            """
+        
+        # Storing matched jobs as recommendations
+        recommendations = []
+
+        # Reading the jobs as panda data frame
+        with self.run_statistics.stage('read_jobs'):
+            jobs_df = self.open_jobs_file().read_file()
+        self.count_bytes_read(self.path_file_jobs, self.path_file_jobseeker)
+
+        # Building the inverted index from skills to jobs once
+        with self.run_statistics.stage('build_index'):
+            inverted_index = SkillInvertedIndex.from_jobs(jobs_df)
+            # Tokenizing the required skills of every job once instead of once per job seeker
+            skill_token_cache = RecommendationEngine.skill_token_cache
+            cache_statistics = skill_token_cache.statistics()
+            job_skill_tokens = [skill_token_cache.tokenize(skills) for skills in jobs_df['required_skills']]
+            # Encoding the jobs once for the scoring kernel
+            job_matrix = SkillMatrix.from_skills(jobs_df['required_skills'], inverted_index.vocabulary, grow_vocabulary=False)
+            scoring_kernel = self.scoring_kernel.fit(job_matrix)
+            job_codes = RecommendationResult.id_codes(jobs_df)
+
+        # Storing the matched jobs of every distinct skill set, since job seekers with the same skills get the same matches
+        profile_matches = {}
+
+        # Reading the job seekers one chunk at a time, so that only one chunk is held in memory
+        for jobseekers_chunk in self.read_jobseeker_chunks(File.chunk_size):
+            with self.run_statistics.stage('match'):
+                seeker_job_positions, seeker_matching_skill_counts = [], []
+                # Iterating over each job seeker 
+                for skills in jobseekers_chunk['skills'].tolist():
+                    jobseeker_skill_tokens = skill_token_cache.tokenize(skills)
+                    if jobseeker_skill_tokens not in profile_matches:
+                        # Finding the candidate jobs which can share the smallest matching skill count with the current job seeker
+                        minimum_overlap = max(int(scoring_kernel.minimum_overlaps([len(jobseeker_skill_tokens)], self.min_match_percent)[0]), self.min_match_count)
+                        candidate_positions = inverted_index.candidate_jobs(skills, minimum_overlap)
+                        self.run_statistics.count('profile_pairs_scored', len(jobs_df))
+                        self.run_statistics.count('candidate_pairs', len(candidate_positions))
+                        # Counting the matching skills between the job seeker and each candidate job
+                        matching_skill_counts = np.array([len(jobseeker_skill_tokens & job_skill_tokens[job_position]) for job_position in candidate_positions.tolist()],
+                                                         dtype=np.int64)
+                        # Keeping the jobs with at least the smallest matching skill count
+                        matched = matching_skill_counts >= minimum_overlap
+                        profile_matches[jobseeker_skill_tokens] = (candidate_positions[matched], matching_skill_counts[matched])
+
+                    # Adding the matched jobs of the skill set of the job seeker to the matches of the chunk
+                    job_positions, matching_skill_counts = profile_matches[jobseeker_skill_tokens]
+                    seeker_job_positions.append(job_positions)
+                    seeker_matching_skill_counts.append(matching_skill_counts)
+
+                # Counting all pairs of the chunk like the other paths, the candidates being counted separately
+                self.run_statistics.count('pairs_evaluated', len(jobseekers_chunk) * len(jobs_df))
+
+                # Scoring the matches of the chunk in bulk and keeping the best ones when top_k is set
+                seeker_positions = np.repeat(np.arange(len(jobseekers_chunk)), [len(job_positions) for job_positions in seeker_job_positions])
+                seeker_matrix = SkillMatrix.from_skills(jobseekers_chunk['skills'], inverted_index.vocabulary, grow_vocabulary=False)
+                chunk_matches = self.score_matches(seeker_matrix, job_matrix, seeker_positions, np.concatenate(seeker_job_positions).astype(np.int64),
+                                                   np.concatenate(seeker_matching_skill_counts), scoring_kernel, self.top_k, self.min_match_count,
+                                                   self.min_match_percent, job_codes)
+
+            # Adding the matched jobs of the chunk to the recommendations list
+            with self.run_statistics.stage('build_records'):
+                recommendations.extend(RecommendationResult(jobseekers_chunk, jobs_df, *chunk_matches).to_records())
+        self.run_statistics.count('matches_emitted', len(recommendations))
+        self.count_token_cache_lookups(cache_statistics)
+
+        # Returning matched jobs as recommendations
+        return recommendations
+    
+
+
+    @staticmethod
+    def match_jobseeker_chunk(jobseekers_chunk: pd.DataFrame, jobs_df: pd.DataFrame, vocabulary: SkillVocabulary, backend: MatchingBackend, top_k=None,
+                              seeker_matrix: SkillMatrix = None, scoring_kernel: ScoringKernel = None, min_match_count: int = 1,
+                              min_match_percent: float = 0.0, job_codes: np.ndarray = None) -> RecommendationResult:
+        """
+        Static method for matching a chunk of job seekers against all jobs with a matching backend and scoring the matches with a kernel.
+
+        Parameters:
+        - jobseekers_chunk(pd.DataFrame): Cleansed chunk of job seeker data.
+        - jobs_df(pd.DataFrame): Jobs the backend was built from.
+        - vocabulary(SkillVocabulary): Vocabulary the backend's job matrix was encoded with.
+        - backend(MatchingBackend): Matching backend built over the jobs.
+        - top_k(int): Maximum number of recommendations kept per job seeker, or None for all of them. Set to None by default.
+        - seeker_matrix(SkillMatrix): Already encoded skills of the chunk, or None to encode them here. Set to None by default.
+        - scoring_kernel(ScoringKernel): Kernel fitted to the jobs, or None for the overlap_percent kernel. Set to None by default.
+        - min_match_count(int): Smallest matching skill count of a recommendation. Set to 1 by default.
+        - min_match_percent(float): Smallest score of a recommendation. Set to 0 by default.
+        - job_codes(np.ndarray): Codes of the job IDs breaking the ties of top_k, or None to map them here. Set to None by default.
+
+        Returns:
+        - RecommendationResult: Matched job recommendations ordered by job seeker and then by job, or by 
+                                score in descending order and then by job ID when top_k is set.
+        """
+        # Encoding the skills of the job seekers with the vocabulary of the jobs
+        if seeker_matrix is None:
+            seeker_matrix = SkillMatrix.from_skills(jobseekers_chunk['skills'], vocabulary, grow_vocabulary=False)
+        seeker_positions, job_positions, matching_skill_counts = backend.match_block(seeker_matrix)
+        if top_k is not None and job_codes is None:
+            job_codes = RecommendationResult.id_codes(jobs_df)
+
+        # Scoring the matches of the chunk in bulk and keeping the best ones when top_k is set
+        seeker_positions, job_positions, matching_skill_counts, matching_skill_percents = JobMatchRecommendationEngine.score_matches(
+            seeker_matrix, backend.job_matrix, seeker_positions, job_positions, matching_skill_counts, scoring_kernel, top_k, min_match_count, min_match_percent,
+            job_codes)
+
+        # Returning the matched jobs of the chunk as recommendations
+        return RecommendationResult(jobseekers_chunk, jobs_df, seeker_positions, job_positions, matching_skill_counts, matching_skill_percents)
+
+
+
+    @staticmethod
+    def score_matches(seeker_matrix: SkillMatrix, job_matrix: SkillMatrix, seeker_positions: np.ndarray, job_positions: np.ndarray,
+                      matching_skill_counts: np.ndarray, scoring_kernel: ScoringKernel = None, top_k=None, min_match_count: int = 1,
+                      min_match_percent: float = 0.0, job_codes: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Static method for scoring the matches of a block of job seekers with a kernel and keeping the best ones of each job seeker.
+
+        The kernel is called once for the whole block. When its ranking is the same as the one by matching skill
+        count, the best matches are selected first, so that only they are scored. The matches below the minimum 
+        count or score are dropped before the best ones are kept, so the result is the same as filtering all
+        matches and keeping the best ones of the rest.
+
+        Parameters:
+        - seeker_matrix(SkillMatrix): Skill incidence matrix of the block of job seekers.
+        - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+        - seeker_positions(np.ndarray): Job seeker position of each match within the block.
+        - job_positions(np.ndarray): Job position of each match.
+        - matching_skill_counts(np.ndarray): Matching skill count of each match.
+        - scoring_kernel(ScoringKernel): Kernel fitted to the jobs, or None for the overlap_percent kernel. Set to None by default.
+        - top_k(int): Maximum number of matches kept per job seeker, or None for all of them. Set to None by default.
+        - min_match_count(int): Smallest matching skill count of a kept match. Set to 1 by default.
+        - min_match_percent(float): Smallest score of a kept match. Set to 0 by default.
+        - job_codes(np.ndarray): Codes of the job IDs breaking the ties of top_k, or None to break them by job position.
+                                 Set to None by default.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Job seeker positions, job positions, matching skill 
+                                                                 counts and scores of the kept matches.
+        """
+        if scoring_kernel is None:
+            scoring_kernel = OverlapPercentKernel()
+
+        # Dropping the matches below the minimum matching skill count
+        if min_match_count > 1:
+            kept = matching_skill_counts >= min_match_count
+            seeker_positions, job_positions, matching_skill_counts = seeker_positions[kept], job_positions[kept], matching_skill_counts[kept]
+
+        # Keeping only the best matches of each job seeker by count before scoring them, when the ranking allows it
+        if top_k is not None and scoring_kernel.ranks_by_count:
+            selected = RecommendationEngine.select_top_k(seeker_positions, matching_skill_counts, job_positions, top_k, job_codes)
+            seeker_positions, job_positions, matching_skill_counts = seeker_positions[selected], job_positions[selected], matching_skill_counts[selected]
+        scores = scoring_kernel.score_block(seeker_matrix, job_matrix, seeker_positions, job_positions, matching_skill_counts)
+
+        # Dropping the matches below the minimum score, which keeps the best ones selected by count the best ones
+        if min_match_percent > 0:
+            kept = scores >= min_match_percent
+            seeker_positions, job_positions, matching_skill_counts, scores = seeker_positions[kept], job_positions[kept], matching_skill_counts[kept], scores[kept]
+
+        # Keeping only the best matches of each job seeker by score otherwise
+        if top_k is not None and not scoring_kernel.ranks_by_count:
+            selected = RecommendationEngine.select_top_k(seeker_positions, scores, job_positions, top_k, job_codes)
+            seeker_positions, job_positions, matching_skill_counts, scores = seeker_positions[selected], job_positions[selected], matching_skill_counts[selected], scores[selected]
+        return seeker_positions, job_positions, matching_skill_counts, scores
+
+
+
+    def count_token_cache_lookups(self, cache_statistics: Dict) -> None:
+        """
+        Function for adding the hits and misses of the skill token cache since a snapshot to the counters of the run.
+
+        Parameters:
+        - cache_statistics(Dict): Statistics of the skill token cache taken at the start of the run.
+        """
+        if self.run_statistics.enabled:
+            current_statistics = RecommendationEngine.skill_token_cache.statistics()
+            self.run_statistics.count('token_cache_hits', current_statistics['hits'] - cache_statistics['hits'])
+            self.run_statistics.count('token_cache_misses', current_statistics['misses'] - cache_statistics['misses'])
+
+
+
+    def count_chunk(self, pairs_evaluated: int, matches_emitted: int, profile_pairs_scored: int = None, candidate_pairs: int = None) -> None:
+        """
+        Function for adding a matched chunk to the counters of the run.
+
+        Parameters:
+        - pairs_evaluated(int): Number of job seeker and job pairs of the chunk.
+        - matches_emitted(int): Number of recommendations of the chunk.
+        - profile_pairs_scored(int): Number of distinct skill profile pairs scored for the chunk, or None if every
+                                     pair was scored. Set to None by default.
+        - candidate_pairs(int): Number of candidate pairs generated for the chunk, or None if the matching backend
+                                does not generate candidates. Set to None by default.
+        """
+        self.run_statistics.count('chunks_dispatched')
+        self.run_statistics.count('pairs_evaluated', pairs_evaluated)
+        self.run_statistics.count('profile_pairs_scored', pairs_evaluated if profile_pairs_scored is None else profile_pairs_scored)
+        if candidate_pairs is not None:
+            self.run_statistics.count('candidate_pairs', candidate_pairs)
+        self.run_statistics.count('matches_emitted', matches_emitted)
+
+
+
+    @staticmethod
+    def count_profile_pairs(backend: MatchingBackend) -> int:
+        """
+        Static method for getting the number of skill profile pairs scored so far by a matching backend.
+
+        Parameters:
+        - backend(MatchingBackend): Matching backend.
+
+        Returns:
+        - int: Number of profile pairs scored, or None if the backend does not deduplicate profiles.
+        """
+        return backend.profile_pairs_scored if isinstance(backend, DeduplicatedMatchingBackend) else None
+
+
+
+    @staticmethod
+    def count_profile_pairs_since(backend: MatchingBackend, profile_pairs_scored: int) -> int:
+        """
+        Static method for getting the number of skill profile pairs scored by a matching backend since a snapshot.
+
+        Parameters:
+        - backend(MatchingBackend): Matching backend.
+        - profile_pairs_scored(int): Value of count_profile_pairs taken before matching.
+
+        Returns:
+        - int: Number of profile pairs scored since the snapshot, or None if the backend does not deduplicate profiles.
+        """
+        if profile_pairs_scored is None:
+            return None
+        return JobMatchRecommendationEngine.count_profile_pairs(backend) - profile_pairs_scored
+
+
+
+    @staticmethod
+    def count_candidate_pairs(backend: MatchingBackend) -> int:
+        """
+        Static method for getting the number of candidate pairs generated so far by a matching backend.
+
+        Parameters:
+        - backend(MatchingBackend): Matching backend, possibly wrapped for deduplicating profiles.
+
+        Returns:
+        - int: Number of candidate pairs, or None if the backend does not generate candidates.
+        """
+        if isinstance(backend, DeduplicatedMatchingBackend):
+            backend = backend.backend
+        return getattr(backend, 'candidate_pairs', None)
+
+
+
+    @staticmethod
+    def count_candidate_pairs_since(backend: MatchingBackend, candidate_pairs: int) -> int:
+        """
+        Static method for getting the number of candidate pairs generated by a matching backend since a snapshot.
+
+        Parameters:
+        - backend(MatchingBackend): Matching backend, possibly wrapped for deduplicating profiles.
+        - candidate_pairs(int): Value of count_candidate_pairs taken before matching.
+
+        Returns:
+        - int: Number of candidate pairs since the snapshot, or None if the backend does not generate candidates.
+        """
+        if candidate_pairs is None:
+            return None
+        return JobMatchRecommendationEngine.count_candidate_pairs(backend) - candidate_pairs
+
+
+
+    @instrumented
+    def vectorized_processing(self, jobseeker_chunk_size=10000) -> List[Dict]:
+        """
+        Function for performing vectorized processing to match job seekers with available jobs.
+
+        It maps every skill to an integer id once and builds sparse job seeker × skill and job × skill
+        incidence matrices. The matching skill counts of all pairs of a job seeker chunk are then given by a single 
+        sparse matrix product, instead of calling calculate_matching_skills for each pair. The output is identical 
+        to sequential_processing.
+
+        Parameters:
+        - jobseeker_chunk_size(int): Number of job seekers multiplied with the jobs at once. Set to 10000 rows by default.
+
+        Returns:
+        - List[Dict]: List of matched job recommendations with the same keys as sequential_processing.
+        """
+        try:
+            # Storing matched jobs as recommendations
+            recommendations = []
+
+            # Reading files as panda data frames and mapping skills to ids, from the cached tokens when available
+            vocabulary = SkillVocabulary()
+            with self.run_statistics.stage('read_jobs'):
+                jobs_df, job_matrix = self.open_jobs_file().read_skill_matrix('required_skills', vocabulary)
+            with self.run_statistics.stage('read_jobseekers'):
+                jobseekers_df, seekers_matrix = self.open_jobseekers_file().read_skill_matrix('skills', vocabulary, grow_vocabulary=False)
+            self.count_bytes_read(self.path_file_jobs, self.path_file_jobseeker)
+
+            # Building the matching backend over the jobs and fitting the scoring kernel to them
+            with self.run_statistics.stage('build_backend'):
+                backend = self.create_matching_backend(job_matrix)
+                scoring_kernel = self.scoring_kernel.fit(job_matrix)
+                job_codes = RecommendationResult.id_codes(jobs_df)
+
+            # Processing the job seekers chunk by chunk to bound the size of each product
+            for start in range(0, len(jobseekers_df), jobseeker_chunk_size):
+                jobseekers_chunk = jobseekers_df.iloc[start:start + jobseeker_chunk_size]
+                # Adding the matched jobs of the chunk to the recommendations list
+                seeker_matrix = seekers_matrix.row_block(start, start + jobseeker_chunk_size)
+                profile_pairs_scored, candidate_pairs = self.count_profile_pairs(backend), self.count_candidate_pairs(backend)
+                with self.run_statistics.stage('match'):
+                    chunk_result = self.match_jobseeker_chunk(jobseekers_chunk, jobs_df, vocabulary, backend, self.top_k, seeker_matrix, scoring_kernel,
+                                                              self.min_match_count, self.min_match_percent, job_codes)
+                with self.run_statistics.stage('build_records'):
+                    recommendations.extend(chunk_result.to_records())
+                self.count_chunk(len(jobseekers_chunk) * len(jobs_df), len(chunk_result), self.count_profile_pairs_since(backend, profile_pairs_scored),
+                                 self.count_candidate_pairs_since(backend, candidate_pairs))
+
+            # Returning matched jobs as recommendations
+            return recommendations
+
+        except Exception as ex:
+            # Handling unexpected errors
+            raise ValueError(f"An unexpected error occurred during vectorized processing: {ex}")
+
+
+
+    @instrumented
+    def incremental_processing(self, jobseeker_chunk_size=10000) -> IncrementalRecommendations:
+        """
+        Function for generating recommendations which can later be updated with job and job seeker deltas.
+
+        It matches all job seekers against all jobs once, the same way as vectorized_processing, and keeps the
+        tables, their skill matrices and all matching pairs as columns. Added, modified and removed rows can then be applied to the
+        returned state, which only rescores the pairs affected by the delta. Both input files are tracked as append-only
+        files from their current size, so rows appended to them later can be applied with apply_appended_rows.
+
+        Parameters:
+        - jobseeker_chunk_size(int): Number of job seekers multiplied with the jobs at once. Set to 10000 rows by default.
+
+        Returns:
+        - IncrementalRecommendations: Recommendations of all job seekers, updatable with deltas.
+        """
+        try:
+            # Checking the kernel, since the deltas are scored pair by pair with the matching skill percentage
+            if not isinstance(self.scoring_kernel, OverlapPercentKernel):
+                raise ValueError("Incremental processing only supports the overlap_percent scoring kernel.")
+            if self.has_minimum_match():
+                raise ValueError("Incremental processing does not support a minimum match count or percentage.")
+
+            # Recording the file sizes before reading, since applying rows appended meanwhile again is harmless
+            file_sizes = {path_file: os.path.getsize(path_file) for path_file in (self.path_file_jobs, self.path_file_jobseeker)}
+
+            # Reading files as panda data frames and mapping skills to ids, from the cached tokens when available. The skills
+            # of the job seekers are added to the vocabulary as well, since jobs added later may require them
+            vocabulary = SkillVocabulary()
+            jobs_df, job_matrix = self.open_jobs_file().read_skill_matrix('required_skills', vocabulary)
+            jobseekers_df, seekers_matrix = self.open_jobseekers_file().read_skill_matrix('skills', vocabulary)
+            job_matrix = job_matrix.with_vocabulary_size(len(vocabulary))
+            backend = self.create_matching_backend(job_matrix)
 
-            # Converting bytes to Giga Bytes(GB)
-            file_size_gb = total_size_files / (1024 * 1024 * 1024)  
+            # Matching all pairs, regardless of top_k, so that any later delta can be patched in
+            chunk_results = [self.match_jobseeker_chunk(jobseekers_df.iloc[start:start + jobseeker_chunk_size], jobs_df, vocabulary, backend, None,
+                                                        seekers_matrix.row_block(start, start + jobseeker_chunk_size))
+                             for start in range(0, max(len(jobseekers_df), 1), jobseeker_chunk_size)]
+            result = RecommendationResult.concatenate(chunk_results)
+
+            # Keeping the tables and matches of the run and tracking the input files for appended rows
+            incremental_recommendations = IncrementalRecommendations(jobs_df, jobseekers_df, vocabulary, job_matrix, seekers_matrix, result, self.top_k)
+            for path_file, file_size in file_sizes.items():
+                incremental_recommendations.track_file(path_file, file_size)
+            return incremental_recommendations
 
-            
-            # Returning file size in GB
-            return file_size_gb
-        
         except Exception as ex:
             # Handling unexpected errors
-            raise Exception(f"An unexpected error occurred while calculating total file size: {str(ex)}")
+            raise ValueError(f"An unexpected error occurred during incremental processing: {ex}")
 
 
 
-    def sequential_processing(self) -> List[Dict]:
+    def build_recommendation_index(self) -> RecommendationIndex:
         """
-        Function for performing sequential processing to match job seekers with available jobs,specifically 
-        used for the smaller size job and jobseeker files.
+        Function for building a long-lived index over the jobs file for single job seeker queries.
 
-        It iterates over job seekers and jobs sequentially to find matches based on required skills. 
-        It reads job and jobseeker data from CSV files, processes each job seeker against every available jobs, 
-        and calculates matches based on common skills.
+        The jobs file is read with the cache directory, memory limit and ingest mode of the engine. The index scores
+        the queries with the matching skill percentage and takes its minimum per query, so another scoring kernel
+        or a minimum match count or percentage of the engine is rejected instead of being ignored.
 
         Returns:
-        - List[Dict]: List of matched job recommendations.
-        Each dictionary contains the following keys:
-        - 'jobseeker_id': ID of the job seeker.
-        - 'jobseeker_name': Name of the job seeker.
-        - 'job_id': ID of the matched job.
-        - 'job_title': Title of the matched job.
-        - 'matching_skill_count': Count of matching skills between the job seeker and job.
-        - 'matching_skill_percent': Percentage of matching skills between the job seeker and job.
-            """
-        
-        # Storing matched jobs as recommendations
-        recommendations = []
+        - RecommendationIndex: Index answering recommend(skills, top_k, min_percent) queries against the jobs.
+        """
+        try:
+            # Checking the kernel and the minimums, since the queries are scored with the matching skill percentage
+            if not isinstance(self.scoring_kernel, OverlapPercentKernel):
+                raise ValueError("The recommendation index only supports the overlap_percent scoring kernel.")
+            if self.has_minimum_match():
+                raise ValueError("The recommendation index does not support a minimum match count or percentage, use min_percent of its queries instead.")
+
+            return RecommendationIndex.from_jobs_file(self.open_jobs_file())
+
+        except Exception as ex:
+            # Handling unexpected errors
+            raise ValueError(f"An unexpected error occurred while building the recommendation index: {ex}")
 
-        # Initializing file reader objects for job and jobseeker data
-        jobs_obj = File(self.path_file_jobs)
-        jobseekers_obj = File(self.path_file_jobseeker)
-
-        # Reading files as panda data frames
-        jobs_df = jobs_obj.read_file()
-        jobseekers_df = jobseekers_obj.read_file()
-
-        # Iterating over each job seeker 
-        for _, jobseeker_row in jobseekers_df.iterrows():
-            # Iterating over each job for the current job seeker
-            for _,job_row in jobs_df.iterrows():
-                # Calculating matching skills between job seeker and job
-                matching_skill_count, matching_skill_percent = RecommendationEngine.calculate_matching_skills(jobseeker_row['skills'], job_row['required_skills'])
-               
-                # Checking the presence of at least one matching skill
-                if ( matching_skill_count >=1):
-                    # Creating a dictionary representing the matched job
-                    matched_job = {
-                    'jobseeker_id': jobseeker_row['id'],
-                    'jobseeker_name': jobseeker_row['name'],
-                    'job_id': job_row['id'],
-                    'job_title': job_row['title'],
-                    'matching_skill_count': matching_skill_count,
-                    'matching_skill_percent': round(matching_skill_percent,2)
-                    }
-                    # Adding the matched job to the recommendations list
-                    recommendations.append(matched_job)
-        
-        # Returning matched jobs as recommendations
-        return recommendations
-    
 
 
     def get_pool_size(self) -> int:
@@ -122,13 +1012,17 @@ class JobMatchRecommendationEngine(RecommendationEngine):
         Function for determining the optimal number of CPU cores to allocate for multiprocessing.
         
         The main intention is to dynamically create a pool of worker processes for parallel execution
-        of tasks based on the CPU cores.
+        of tasks based on the CPU cores, unless a pool size was set with set_pool_size.
 
         Returns:
         - int: Optimum number of worker processes for multiprocessing.   
 
         """
         try:
+            # Using the configured number of worker processes if there is one
+            if self.pool_size is not None:
+                return self.pool_size
+
             # Getting the number of available CPU cores
             num_cores = mp.cpu_count()
 
@@ -151,6 +1045,8 @@ class JobMatchRecommendationEngine(RecommendationEngine):
         It processes each row in the job chunk for determining whether there are any matching jobs
         for the specified job seeker. For that, it calculates the matching skill count and percentage for each job,
         and adds the job to the list of recommendations if the matched jon is greater than or equal to 1.
+        It is no longer used by parallel_processing, which matches whole job seeker chunks against all jobs, and is
+        kept as a compatibility helper for callers matching one job seeker against a job chunk themselves.
 
         Parameters:
         - job_chunk(pd.DataFrame): One chunk of job data set.
@@ -193,46 +1089,440 @@ class JobMatchRecommendationEngine(RecommendationEngine):
 
 
 
-    def parallel_processing(self, jobseeker_chunk_size=1000, job_chunk_size=1000) -> List[Dict]:
+    @instrumented
+    def iter_recommendations(self, jobseeker_chunk_size=1000, parallel=False, columnar=False) -> Iterator[Union[List[Dict], RecommendationResult]]:
+        """
+        Function for generating recommendations as a stream, one job seeker chunk at a time.
+
+        It reads and cleanses the job data once and builds the matching backend over it. The job seeker data is 
+        then read in chunks, and the recommendations of each chunk are yielded as soon as the chunk is matched, 
+        so that only one chunk of job seekers and recommendations has to be held in memory at a time. With parallel 
+        set, the jobs are loaded into every worker process once through the pool initializer and the chunks are 
+        matched by the pool, so the only data sent per task is a block of job seekers and the only data sent back
+        is the compact columnar result. The chunks are dispatched with imap_unordered, so an idle worker takes the next
+        chunk at once, and inside open_worker_pool the workers are kept warm across runs. The chunks are always yielded 
+        in the order of the job seeker file. With a checkpoint directory set, every matched chunk is committed to the
+        work log and the chunks committed by an earlier run are loaded from it instead of being matched.
+
+        Parameters:
+        - jobseeker_chunk_size(int): Size of each chunk of job seeker data to process. Set to 1000 rows by default.
+        - parallel(bool): Whether the chunks are matched by a pool of worker processes. Set to False by default.
+        - columnar(bool): Whether each chunk is yielded as a RecommendationResult instead of a list of dictionaries. 
+                          Set to False by default.
+
+        Returns:
+        - Iterator[Union[List[Dict], RecommendationResult]]: Recommendations of each job seeker chunk.
+        """
+        checkpoint_log = self.open_checkpoint_log(jobseeker_chunk_size)
+        if parallel:
+            # Reusing the warm worker pool of open_worker_pool, or starting a pool for this run only
+            if self.worker_pool is not None:
+                yield from self.dispatch_jobseeker_chunks(self.worker_pool, jobseeker_chunk_size, columnar, checkpoint_log)
+            else:
+                with WorkerPool() as worker_pool:
+                    yield from self.dispatch_jobseeker_chunks(worker_pool, jobseeker_chunk_size, columnar, checkpoint_log)
+            self.count_checkpoint(checkpoint_log)
+            return
+
+        # Reading the jobs, building the matching backend and fitting the scoring kernel once
+        jobs_df, vocabulary, backend, scoring_kernel = self.load_jobs_catalog()
+        self.count_bytes_read(self.path_file_jobs, self.path_file_jobseeker)
+
+        # Reading the job seeker data in chunks and matching them one after another in the current process
+        jobseeker_chunks = self.read_jobseeker_chunks(jobseeker_chunk_size)
+        if checkpoint_log is not None:
+            jobseeker_chunks = checkpoint_log.unfinished(jobseeker_chunks)
+        chunk_results = self.match_jobseeker_chunks(jobseeker_chunks, jobs_df, vocabulary, backend, scoring_kernel)
+        if checkpoint_log is not None:
+            chunk_results = checkpoint_log.resume(chunk_results, jobs_df)
+        for chunk_result in chunk_results:
+            yield chunk_result if columnar else self.build_records(chunk_result)
+        self.count_checkpoint(checkpoint_log)
+
+
+
+    def match_jobseeker_chunks(self, jobseeker_chunks: Iterator[pd.DataFrame], jobs_df: pd.DataFrame, vocabulary: SkillVocabulary,
+                               backend: MatchingBackend, scoring_kernel: ScoringKernel) -> Iterator[RecommendationResult]:
+        """
+        Function for matching job seeker chunks one after another in the current process.
+
+        Parameters:
+        - jobseeker_chunks(Iterator[pd.DataFrame]): Cleansed chunks of job seeker data.
+        - jobs_df(pd.DataFrame): Cleansed jobs.
+        - vocabulary(SkillVocabulary): Vocabulary the backend's job matrix was encoded with.
+        - backend(MatchingBackend): Matching backend built over the jobs.
+        - scoring_kernel(ScoringKernel): Kernel fitted to the jobs.
+
+        Returns:
+        - Iterator[RecommendationResult]: Recommendations of each chunk.
+        """
+        job_codes = RecommendationResult.id_codes(jobs_df)
+        for jobseekers_chunk in jobseeker_chunks:
+            profile_pairs_scored, candidate_pairs = self.count_profile_pairs(backend), self.count_candidate_pairs(backend)
+            with self.run_statistics.stage('match'):
+                chunk_result = self.match_jobseeker_chunk(jobseekers_chunk, jobs_df, vocabulary, backend, self.top_k, scoring_kernel=scoring_kernel,
+                                                          min_match_count=self.min_match_count, min_match_percent=self.min_match_percent,
+                                                          job_codes=job_codes)
+            self.count_chunk(len(jobseekers_chunk) * len(jobs_df), len(chunk_result), self.count_profile_pairs_since(backend, profile_pairs_scored),
+                             self.count_candidate_pairs_since(backend, candidate_pairs))
+            yield chunk_result
+
+
+
+    def load_jobs_catalog(self) -> Tuple[pd.DataFrame, SkillVocabulary, MatchingBackend, ScoringKernel]:
+        """
+        Function for reading and cleansing the jobs, building the matching backend over them and fitting the scoring kernel to them.
+
+        Returns:
+        - Tuple[pd.DataFrame, SkillVocabulary, MatchingBackend, ScoringKernel]: Cleansed jobs, vocabulary of their skills, 
+                                                                               matching backend built over them and 
+                                                                               fitted scoring kernel.
+        """
+        # Reading and cleansing the jobs once and mapping skills to ids, from the cached tokens when available
+        vocabulary = SkillVocabulary()
+        with self.run_statistics.stage('read_jobs'):
+            jobs_df, job_matrix = self.open_jobs_file().read_skill_matrix('required_skills', vocabulary)
+
+        # Building the matching backend over the jobs once
+        with self.run_statistics.stage('build_backend'):
+            backend = self.create_matching_backend(job_matrix)
+            scoring_kernel = self.scoring_kernel.fit(job_matrix)
+        return jobs_df, vocabulary, backend, scoring_kernel
+
+
+
+    def dispatch_jobseeker_chunks(self, worker_pool: WorkerPool, jobseeker_chunk_size: int, columnar: bool,
+                                  checkpoint_log: CheckpointLog = None) -> Iterator[Union[List[Dict], RecommendationResult]]:
+        """
+        Function for matching the job seeker chunks with a pool of worker processes and yielding them in order.
+
+        The pool is started with the jobs loaded into every worker unless it is already warm for the jobs and 
+        settings of the engine, in which case neither the jobs are read nor the workers started again. With a work
+        log, only the chunks missing from it are sent to the workers.
+
+        Parameters:
+        - worker_pool(WorkerPool): Pool of worker processes.
+        - jobseeker_chunk_size(int): Size of each chunk of job seeker data to process.
+        - columnar(bool): Whether each chunk is yielded as a RecommendationResult instead of a list of dictionaries.
+        - checkpoint_log(CheckpointLog): Work log the matched chunks are committed to, or None. Set to None by default.
+
+        Returns:
+        - Iterator[Union[List[Dict], RecommendationResult]]: Recommendations of each job seeker chunk.
+        """
+        # Getting pool size to create pool of worker processes, each loading the jobs once
+        pool_size = self.get_pool_size()
+        worker_pool_key = self.worker_pool_key(pool_size)
+        if not worker_pool.is_warm(worker_pool_key):
+            jobs_df, vocabulary, backend, scoring_kernel = self.load_jobs_catalog()
+            self.count_bytes_read(self.path_file_jobs)
+            with self.run_statistics.stage('start_workers'):
+                worker_pool.start(worker_pool_key, pool_size, {'jobs_df': jobs_df[['id', 'title']]},
+                                  initialize_worker, (jobs_df[['id', 'title']], vocabulary, backend, self.top_k, scoring_kernel, self.min_match_count,
+                                                      self.min_match_percent))
+            self.run_statistics.count('worker_pools_started')
+        jobs_df = worker_pool.catalog['jobs_df']
+        self.count_bytes_read(self.path_file_jobseeker)
+        self.run_statistics.count('workers', pool_size)
+
+        # Letting the workers report their busy time only when the run is instrumented
+        task = process_jobseeker_chunk_timed if self.run_statistics.enabled else process_jobseeker_chunk
+        jobseeker_chunks = self.read_jobseeker_chunks(jobseeker_chunk_size)
+        if checkpoint_log is not None:
+            jobseeker_chunks = checkpoint_log.unfinished(jobseeker_chunks)
+        with self.run_statistics.stage('dispatch'), \
+             contextlib.closing(worker_pool.imap_ordered(task, jobseeker_chunks, self.worker_chunksize)) as chunk_outputs:
+            # Matching the chunks in parallel and yielding them in order
+            chunk_results = self.collect_chunk_outputs(chunk_outputs, jobs_df)
+            if checkpoint_log is not None:
+                chunk_results = checkpoint_log.resume(chunk_results, jobs_df)
+            for chunk_result in chunk_results:
+                yield chunk_result if columnar else self.build_records(chunk_result)
+
+
+
+    def collect_chunk_outputs(self, chunk_outputs: Iterator, jobs_df: pd.DataFrame) -> Iterator[RecommendationResult]:
+        """
+        Function for attaching the jobs to the results sent back by the worker processes and counting them.
+
+        Parameters:
+        - chunk_outputs(Iterator): Results of the worker processes in order, with their busy time, skill profile
+                                   pairs scored and candidate pairs when the run is instrumented.
+        - jobs_df(pd.DataFrame): Ids and titles of the jobs the workers were loaded with.
+
+        Returns:
+        - Iterator[RecommendationResult]: Recommendations of each chunk.
+        """
+        for chunk_output in chunk_outputs:
+            profile_pairs_scored = candidate_pairs = None
+            if self.run_statistics.enabled:
+                chunk_output, worker_seconds, profile_pairs_scored, candidate_pairs = chunk_output
+                self.run_statistics.add_worker_seconds(worker_seconds)
+            # Attaching the jobs, which the workers do not send back
+            chunk_output.jobs_df = jobs_df
+            self.count_chunk(len(chunk_output.jobseekers_df) * len(jobs_df), len(chunk_output), profile_pairs_scored, candidate_pairs)
+            yield chunk_output
+
+
+
+    def read_jobseeker_chunks(self, jobseeker_chunk_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Function for reading the job seeker data in chunks with File.read_chunks.
+
+        The chunks are cleansed like the whole file, i.e. duplicates are removed across chunks as well. With a shard
+        set, only the job seekers of the shard are kept. Chunks left empty are skipped. Only one chunk is parsed at a time.
+
+        Parameters:
+        - jobseeker_chunk_size(int): Size of each chunk of job seeker data.
+
+        Returns:
+        - Iterator[pd.DataFrame]: Cleansed chunks of job seeker data.
+        """
+        jobseekers_reader = self.open_jobseekers_file().read_chunks(jobseeker_chunk_size)
+        while True:
+            with self.run_statistics.stage('read_jobseekers'):
+                jobseekers_chunk = next(jobseekers_reader, None)
+            if jobseekers_chunk is None:
+                return
+            if self.shard is not None:
+                jobseekers_chunk = self.shard.select(jobseekers_chunk)
+            if len(jobseekers_chunk):
+                yield jobseekers_chunk
+
+
+
+    def build_records(self, chunk_result: RecommendationResult) -> List[Dict]:
+        """
+        Function for converting the columnar recommendations of a chunk into a list of dictionaries.
+
+        Parameters:
+        - chunk_result(RecommendationResult): Recommendations of a chunk.
+
+        Returns:
+        - List[Dict]: Recommendations of the chunk as dictionaries.
+        """
+        with self.run_statistics.stage('build_records'):
+            return chunk_result.to_records()
+
+
+
+    @instrumented
+    def columnar_processing(self, jobseeker_chunk_size=1000, parallel=False) -> RecommendationResult:
+        """
+        Function for generating all recommendations as one compact columnar result.
+
+        The recommendations are kept as NumPy arrays of positions, counts and percentages, so that each one takes
+        a few bytes instead of a dictionary, and the ids, names and titles are only resolved when needed.
+
+        Parameters:
+        - jobseeker_chunk_size(int): Size of each chunk of job seeker data to process. Set to 1000 rows by default.
+        - parallel(bool): Whether the chunks are matched by a pool of worker processes. Set to False by default.
+
+        Returns:
+        - RecommendationResult: Matched job recommendations of all job seekers.
+        """
+        try:
+            return RecommendationResult.concatenate(list(self.iter_recommendations(jobseeker_chunk_size, parallel, columnar=True)))
+
+        except Exception as ex:
+            # Handling unexpected errors
+            raise ValueError(f"An unexpected error occurred during columnar processing: {ex}")
+
+
+
+    @instrumented
+    def write_recommendations(self, sink: ResultSink, jobseeker_chunk_size=1000, parallel=False) -> int:
+        """
+        Function for streaming the recommendations into a result sink.
+
+        The recommendations are written incrementally while matching, so the output can be far bigger than the
+        available memory and can be loaded downstream before matching finishes. The sink is closed at the end.
+
+        Parameters:
+        - sink(ResultSink): Sink writing the recommendations, e.g. CsvResultSink, JsonLinesResultSink or ParquetResultSink.
+        - jobseeker_chunk_size(int): Size of each chunk of job seeker data to process. Set to 1000 rows by default.
+        - parallel(bool): Whether the chunks are matched by a pool of worker processes. Set to False by default.
+
+        Returns:
+        - int: Number of recommendations written.
+        """
+        try:
+            with sink:
+                # Writing the recommendations of each chunk as soon as it is matched
+                for chunk_recommendations in self.iter_recommendations(jobseeker_chunk_size, parallel):
+                    sink.write(chunk_recommendations)
+            return sink.rows_written
+
+        except Exception as ex:
+            # Handling unexpected errors
+            raise ValueError(f"An unexpected error occurred while writing recommendations: {ex}")
+
+
+
+    def write_merged_runs(self, sorter: ExternalRecommendationSorter, sink: ResultSink) -> None:
+        """
+        Function for merging the runs of an external sorter into a result sink and removing the runs afterwards.
+
+        The sorted recommendations are written in blocks, so that the sink writes out full buffers. The merge is
+        timed as the 'sort' stage and the runs are removed even if writing fails.
+
+        Parameters:
+        - sorter(ExternalRecommendationSorter): Sorter holding all recommendations.
+        - sink(ResultSink): Open sink writing the sorted recommendations.
+        """
+        with sorter, self.run_statistics.stage('sort'):
+            self.run_statistics.count('sort_runs_spilled', len(sorter.run_paths))
+            block = []
+            for recommendation in sorter.sorted_records():
+                block.append(recommendation)
+                if len(block) == sorter.rows_per_block:
+                    sink.write(block)
+                    block = []
+            sink.write(block)
+
+
+
+    @instrumented
+    def write_sorted_recommendations(self, sink: ResultSink, jobseeker_chunk_size=1000, parallel=False, memory_budget: int = None) -> int:
+        """
+        Function for streaming the sorted recommendations into a result sink within a memory budget.
+
+        The recommendations of every chunk are added to an ExternalRecommendationSorter as soon as the chunk is 
+        matched, which spills sorted runs to temporary files whenever the memory budget is reached. The runs are
+        then merged into the sink, so neither matching nor sorting holds all recommendations in memory. The sink 
+        is closed and the runs are removed at the end.
+
+        Parameters:
+        - sink(ResultSink): Sink writing the recommendations, e.g. CsvResultSink, JsonLinesResultSink or ParquetResultSink.
+        - jobseeker_chunk_size(int): Size of each chunk of job seeker data to process. Set to 1000 rows by default.
+        - parallel(bool): Whether the chunks are matched by a pool of worker processes. Set to False by default.
+        - memory_budget(int): Largest estimated number of bytes sorted in memory, or None for the default budget of
+                              ExternalRecommendationSorter. Set to None by default.
+
+        Returns:
+        - int: Number of recommendations written.
+        """
+        try:
+            with ExternalRecommendationSorter(memory_budget or ExternalRecommendationSorter.default_memory_budget) as sorter, sink:
+                for chunk_result in self.iter_recommendations(jobseeker_chunk_size, parallel, columnar=True):
+                    sorter.add(chunk_result)
+                self.write_merged_runs(sorter, sink)
+            return sink.rows_written
+
+        except Exception as ex:
+            # Handling unexpected errors
+            raise ValueError(f"An unexpected error occurred while writing sorted recommendations: {ex}")
+
+
+
+    def sort_recommendations_into(self, recommendations: Union[List[Dict], RecommendationResult], sink: ResultSink,
+                                  memory_budget: int = None) -> int:
+        """
+        Function for sorting recommendations out of core into a result sink.
+
+        The recommendations are sorted in the order of sort_recommendations by an ExternalRecommendationSorter,
+        which spills sorted runs to temporary files whenever the memory budget is reached, and the runs are merged
+        into the sink. The sink is closed and the runs are removed at the end, also when sorting fails.
+
+        Parameters:
+        - recommendations(Union[List[Dict], RecommendationResult]): Recommended job matches.
+        - sink(ResultSink): Sink writing the sorted recommendations.
+        - memory_budget(int): Largest estimated number of bytes sorted in memory, or None for the default budget of
+                              ExternalRecommendationSorter. Set to None by default.
+
+        Returns:
+        - int: Number of recommendations written.
+        """
+        try:
+            # Checking if the recommendations list is empty
+            if not recommendations:
+                raise ValueError("Recommendation list is empty!")
+
+            with ExternalRecommendationSorter(memory_budget or ExternalRecommendationSorter.default_memory_budget) as sorter, sink:
+                with self.run_statistics.stage('sort'):
+                    if isinstance(recommendations, RecommendationResult):
+                        sorter.add(recommendations)
+                    else:
+                        for start in range(0, len(recommendations), sorter.rows_per_block):
+                            sorter.add(recommendations[start:start + sorter.rows_per_block])
+                self.write_merged_runs(sorter, sink)
+            return sink.rows_written
+
+        except Exception as ex:
+            # Handling  unexpected errors
+            raise ValueError(f"An unexpected error occurred during sorting: {str(ex)}")
+
+
+
+    @instrumented
+    def write_shard(self, shard: Union[ShardSpec, str], path_output: str, jobseeker_chunk_size=1000, parallel=False, memory_budget: int = None) -> int:
+        """
+        Function for matching the job seekers of one shard and writing their sorted recommendations to a CSV file.
+
+        Every job seeker belongs to one shard by a hash of its id, so N processes, on one machine or on several 
+        sharing a filesystem, can each write one shard with 'i/N' for i from 0 to N - 1. Every process reads and
+        cleanses the whole job seekers file, so the duplicates are removed the same way as in a single run. The 
+        shard files are sorted like sort_recommendations, and ShardMerger.merge combines them into the same file as
+        the sorted recommendations of a single run written with CsvResultSink.
+
+        Parameters:
+        - shard(Union[ShardSpec, str]): Shard to process, e.g. ShardSpec(0, 4) or '0/4'.
+        - path_output(str): Path of the shard CSV file.
+        - jobseeker_chunk_size(int): Size of each chunk of job seeker data to process. Set to 1000 rows by default.
+        - parallel(bool): Whether the chunks are matched by a pool of worker processes. Set to False by default.
+        - memory_budget(int): Largest estimated number of bytes sorted in memory, or None for the default budget of
+                              ExternalRecommendationSorter. Set to None by default.
+
+        Returns:
+        - int: Number of recommendations written.
+        """
+        if isinstance(shard, str):
+            shard = ShardSpec.parse(shard)
+        if not isinstance(shard, ShardSpec):
+            raise TypeError("Shard must be a ShardSpec or a string like 0/4")
+
+        try:
+            # Matching the job seekers of the shard only, on a copy so that the engine itself is not sharded, which shares the running statistics
+            engine = copy.copy(self)
+            engine.shard = shard
+            # Sorting the recommendations of the shard before writing them, so that the shard files can be merged
+            return engine.write_sorted_recommendations(CsvResultSink(path_output), jobseeker_chunk_size, parallel, memory_budget)
+
+        except Exception as ex:
+            # Handling unexpected errors
+            raise ValueError(f"An unexpected error occurred while writing shard {shard}: {ex}")
+
+
+
+    @instrumented
+    def parallel_processing(self, jobseeker_chunk_size=1000, job_chunk_size=None) -> List[Dict]:
         """
         Function for processing job data using multiprocessing to find matching jobs for job seekers.
         
-        It reads job seeker data and divides it into chunks. Then for each job seeker data chunk, 
-        job data in read in chunks as well. Then the process_job_chunk function is applied to 
-        each combination of job chunk and job seeker in parallel.
+        It reads and cleanses the job data once, builds the matching backend over it and loads the jobs 
+        into every worker process once through the pool initializer. The job seeker data is then read in chunks 
+        and each chunk is matched against all jobs by one worker, so the only data sent per task is a 
+        block of job seekers. The output is in the same order as sequential_processing.
 
         Parameters:
         - jobseeker_chunk_size(int): Size of each chunk of job seeker data to process. Set to 1000 rows by default.
-        - job_chunk_size(int): Size of each chunk of job data to process. Set to 1000 rows by defaul.
+        - job_chunk_size(int): Deprecated and ignored, since the jobs are no longer split into chunks. Passing it 
+                               emits a DeprecationWarning. Set to None by default.
 
         Returns:
         - List[Dict]: List of dictionaries containing information about matching jobs between jobseekers and jobs.
 
         """
+        if job_chunk_size is not None:
+            warnings.warn("job_chunk_size is deprecated and ignored, since every worker matches its job seekers against all jobs.",
+                          DeprecationWarning, stacklevel=2)
+
         try:
             # Storing matched jobs as recommendations
             recommendations = []
 
-            # Getting pool size to create pool of worker processes
-            pool_size = self.get_pool_size()
-            pool = mp.Pool(pool_size)
-
-            # Processing each chunk of job seeker data
-            for job_seekers_chunk in pd.read_csv(self.path_file_jobseeker, chunksize=jobseeker_chunk_size):
-                # Cleansing the jobseekers chunk to remove duplicates and null values
-                job_seekers_chunk = File.cleanse_dataset(job_seekers_chunk)
-                # Iterating over each job seeker in the chunk
-                for _, jobseeker_row in job_seekers_chunk.iterrows():
-                    # Reading job data in chunks and process each chunk in parallel for current job seeker              
-                    job_recommendations_per_seeker = pool.starmap(self.process_job_chunk, [(job_chunk, jobseeker_row) for job_chunk in pd.read_csv(self.path_file_jobs, chunksize=job_chunk_size)])     
-                    
-                    # Iterating through each job recommendation for current job seeker and add to recommendations list
-                    for recommend in job_recommendations_per_seeker:
-                        recommendations.extend(recommend)
-
-            # Closing the multiprocessing pool and wait until all processes are finished.
-            pool.close()
-            pool.join()
+            # Adding the matched jobs of each chunk, in order, to the recommendations list
+            for chunk_recommendations in self.iter_recommendations(jobseeker_chunk_size, parallel=True):
+                recommendations.extend(chunk_recommendations)
 
             # Returning matched jobs as recommendations
             return recommendations
@@ -243,32 +1533,75 @@ class JobMatchRecommendationEngine(RecommendationEngine):
 
 
 
+    def plan_execution(self) -> ExecutionPlan:
+        """
+        Function for choosing the strategy, matching backend, worker count and chunk size of generate_recommendations.
+
+        The plan is chosen by an ExecutionPlanner from the estimated row counts, skills per row and overlap rate of 
+        the input files and from the available CPU cores and memory. A matching backend set with set_matching_backend 
+        and a pool size set with set_pool_size are kept as they are.
+
+        Returns:
+        - ExecutionPlan: Chosen plan with the estimates it is based on.
+        """
+        planner = ExecutionPlanner(self.path_file_jobs, self.path_file_jobseeker)
+        return planner.plan(self.matching_backend, self.pool_size, self.top_k, self.bitset_vocabulary_limit)
+
+
+
+    def explain_plan(self) -> str:
+        """
+        Function for describing the plan generate_recommendations would run and the estimates it is based on.
+
+        Returns:
+        - str: Human readable description of the plan.
+        """
+        return self.plan_execution().explain()
+
+
+
+    def execute_plan(self, plan: ExecutionPlan) -> List[Dict]:
+        """
+        Function for generating recommendations with the strategy, matching backend, worker count and chunk size of a plan.
+
+        The plan is run on a copy of the engine, so that the configured settings are left unchanged.
+
+        Parameters:
+        - plan(ExecutionPlan): Plan returned by plan_execution.
+
+        Returns:
+        - List[Dict]: List of dictionaries containing recommended job matches.
+        """
+        engine = copy.copy(self)
+        engine.matching_backend = plan.matching_backend
+        engine.pool_size = plan.workers
+        if plan.strategy == "parallel":
+            return engine.parallel_processing(plan.jobseeker_chunk_size)
+        return engine.vectorized_processing(plan.jobseeker_chunk_size)
+
+
+
+    @instrumented
     def generate_recommendations(self) -> List[Dict]:
         """
-        Function for generating recommendations based on the size of files.
+        Function for generating recommendations with the cheapest plan for the input files.
         
-        It calculates the total size of the job and jobseeker files and determines whether to use sequential or parallel
-        processing as per the set threshold for parallel processing value. The job recommendations for each job seeker
-        is generated accordingly.
+        It chooses between vectorized and parallel processing, the matching backend, the number of worker 
+        processes and the chunk size with plan_execution, which estimates their cost from samples of the input 
+        files instead of comparing the size of the files with the deprecated threshold for parallel processing. The job 
+        recommendations for each job seeker are generated accordingly and are the same for every plan.
 
         Returns:
         - List[Dict]: List of dictionaries containing recommended job matches.
 
         """
         try:
-            # Calculating the total size of the jobs and jobseeker files
-            total_size_files = self.calculate_total_size_files()
-            
-            # Determining the processing method based on file size
-            if (round(total_size_files,2) < self.threshold_parallel_processing):
-                # Activating sequential processing for small-sized files
-                recommendations= self.sequential_processing()
-            else:
-                # Activating parallel processing for large-sized files
-                recommendations= self.parallel_processing()
-            
+            # Choosing the processing method and its settings from the estimated costs
+            with self.run_statistics.stage('plan'):
+                plan = self.plan_execution()
+
             # Returning matched jobs as recommendations
-            return recommendations      
+            return self.execute_plan(plan)
         
         # Handling unexpected errors
         except Exception as ex:
@@ -276,29 +1609,40 @@ class JobMatchRecommendationEngine(RecommendationEngine):
 
 
           
-    def sort_recommendations(self, recommendations: List[Dict]) -> pd.DataFrame:
+    def sort_recommendations(self, recommendations: Union[List[Dict], RecommendationResult], as_dataframe=False) -> Union[pd.DataFrame, RecommendationResult]:
         """
         Function for sorting recommendations based on jobseeker ID and matching skill percentage.
         
-        It takes a list of recommendation dictionaries and sorts them based on jobseeker ID
-        in ascending order and matching skill percentage in descending order.
+        It takes a list of recommendation dictionaries or a columnar RecommendationResult and sorts them based on 
+        jobseeker ID in ascending order, matching skill percentage in descending order and job ID in ascending order.
+        A RecommendationResult is sorted with np.lexsort on its arrays, and a DataFrame is only built from it when asked.
+        Recommendations which do not fit into memory are sorted with sort_recommendations_into instead.
 
         Parameters:
-        - recommendations(List[Dict]): List of dictionaries containing recommended job matches.
+        - recommendations(Union[List[Dict], RecommendationResult]): Recommended job matches.
+        - as_dataframe(bool): Whether a sorted RecommendationResult is converted to a DataFrame. Set to False by default.
 
         Returns:
-        - pd.DataFrame: Pandas DataFrame containing sorted recommendations.
+        - Union[pd.DataFrame, RecommendationResult]: Pandas DataFrame containing sorted recommendations, or the sorted
+                                                     RecommendationResult if one was given and as_dataframe is False.
         """  
         try:
             # Checking if the recommendations list is empty
             if not recommendations:
                 raise ValueError("Recommendation list is empty!")
+
+            # Sorting columnar recommendations without building a DataFrame
+            if isinstance(recommendations, RecommendationResult):
+                with self.run_statistics.stage('sort'):
+                    sorted_result = recommendations.sort()
+                return sorted_result.to_dataframe() if as_dataframe else sorted_result
             
-            # Converting recommendations to a pandas DataFrame
-            recommendations_df = pd.DataFrame(recommendations)   
-            
-            # Sorting recommendations by jobseeker ID and matching skill percentage
-            sorted_recommendations = recommendations_df.sort_values(by=['jobseeker_id', 'matching_skill_percent'], ascending=[True, False])
+            with self.run_statistics.stage('sort'):
+                # Converting recommendations to a pandas DataFrame
+                recommendations_df = pd.DataFrame(recommendations)   
+                
+                # Sorting recommendations by jobseeker ID, matching skill percentage and job ID
+                sorted_recommendations = recommendations_df.sort_values(by=['jobseeker_id', 'matching_skill_percent', 'job_id'], ascending=[True, False, True], kind='stable')
             
             # Returning sorterd recommendations
             return sorted_recommendations
@@ -306,4 +1650,78 @@ class JobMatchRecommendationEngine(RecommendationEngine):
         except Exception as ex:
             # Handling  unexpected errors
             raise ValueError(f"An unexpected error occurred during sorting: {str(ex)}")
-            
\ No newline at end of file
+
+
+
+# Jobs data and matching backend loaded once into each worker process of parallel processing
+worker_jobs_catalog = {}
+
+
+def initialize_worker(jobs_df: pd.DataFrame, vocabulary: SkillVocabulary, backend: MatchingBackend, top_k=None, scoring_kernel: ScoringKernel = None,
+                      min_match_count: int = 1, min_match_percent: float = 0.0) -> None:
+    """
+    Function for loading the jobs into a worker process of parallel processing.
+
+    It is called once per worker process by the pool initializer, so that the jobs are not sent with every task.
+
+    Parameters:
+    - jobs_df(pd.DataFrame): Ids and titles of the cleansed jobs.
+    - vocabulary(SkillVocabulary): Vocabulary the backend's job matrix was encoded with.
+    - backend(MatchingBackend): Matching backend built over the jobs.
+    - top_k(int): Maximum number of recommendations kept per job seeker, or None for all of them. Set to None by default.
+    - scoring_kernel(ScoringKernel): Kernel fitted to the jobs, or None for the overlap_percent kernel. Set to None by default.
+    - min_match_count(int): Smallest matching skill count of a recommendation. Set to 1 by default.
+    - min_match_percent(float): Smallest score of a recommendation. Set to 0 by default.
+    """
+    worker_jobs_catalog.update(jobs_df=jobs_df, vocabulary=vocabulary, backend=backend, top_k=top_k, scoring_kernel=scoring_kernel,
+                               min_match_count=min_match_count, min_match_percent=min_match_percent, job_codes=RecommendationResult.id_codes(jobs_df))
+
+
+
+def process_jobseeker_chunk(jobseekers_chunk: pd.DataFrame) -> RecommendationResult:
+    """
+    Function for matching a chunk of job seekers against the jobs loaded into the worker process.
+
+    The jobs table is left out of the returned result, so that it is not sent back with every chunk.
+
+    Parameters:
+    - jobseekers_chunk(pd.DataFrame): Cleansed chunk of job seeker data.
+
+    Returns:
+    - RecommendationResult: Matched job recommendations of the chunk, without the jobs table.
+    """
+    try:
+        chunk_result = JobMatchRecommendationEngine.match_jobseeker_chunk(jobseekers_chunk, worker_jobs_catalog['jobs_df'],
+                                                                          worker_jobs_catalog['vocabulary'], worker_jobs_catalog['backend'], worker_jobs_catalog['top_k'],
+                                                                          scoring_kernel=worker_jobs_catalog['scoring_kernel'], min_match_count=worker_jobs_catalog['min_match_count'],
+                                                                          min_match_percent=worker_jobs_catalog['min_match_percent'],
+                                                                          job_codes=worker_jobs_catalog['job_codes'])
+        chunk_result.jobs_df = None
+        return chunk_result
+
+    except Exception as ex:
+        # Handling unexpected error
+        raise ValueError(f"An unexpected error occurred while processing job seeker chunk: {ex}")
+
+
+
+def process_jobseeker_chunk_timed(jobseekers_chunk: pd.DataFrame) -> Tuple[RecommendationResult, float, int, int]:
+    """
+    Function for matching a chunk of job seekers like process_jobseeker_chunk and measuring the busy time of the worker.
+
+    Parameters:
+    - jobseekers_chunk(pd.DataFrame): Cleansed chunk of job seeker data.
+
+    Returns:
+    - Tuple[RecommendationResult, float, int, int]: Matched job recommendations of the chunk, without the jobs table,
+                                                    the wall seconds spent on matching them, the number of skill profile
+                                                    pairs scored, or None if the backend does not deduplicate profiles,
+                                                    and the number of candidate pairs, or None if the backend does not
+                                                    generate candidates.
+    """
+    backend = worker_jobs_catalog['backend']
+    profile_pairs_scored, candidate_pairs = JobMatchRecommendationEngine.count_profile_pairs(backend), JobMatchRecommendationEngine.count_candidate_pairs(backend)
+    started = time.perf_counter()
+    chunk_result = process_jobseeker_chunk(jobseekers_chunk)
+    return (chunk_result, time.perf_counter() - started, JobMatchRecommendationEngine.count_profile_pairs_since(backend, profile_pairs_scored),
+            JobMatchRecommendationEngine.count_candidate_pairs_since(backend, candidate_pairs))
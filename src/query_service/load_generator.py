@@ -0,0 +1,134 @@
+# typing module for type hints
+from typing import List, Dict
+# argparse module for the command line interface
+import argparse
+# asyncio module for the concurrent client connections
+import asyncio
+# json module for encoding requests and responses
+import json
+# time module for measuring latencies
+import time
+# numpy library for the latency percentiles
+import numpy as np
+# custom File class for reading the job seekers used as queries
+from ..file_reader.read_files import File
+# custom RecommendationIndex class for starting an in-process server
+from ..recommendation_index.recommendation_index import RecommendationIndex
+# custom query service classes and functions
+from .query_service import RecommendationQueryServer, read_http_message
+
+
+async def send_request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str, payload: Dict = None) -> object:
+    """
+    Function for sending a request over an open keep-alive connection and reading its JSON response.
+
+    Parameters:
+    - reader(asyncio.StreamReader): Stream the response is read from.
+    - writer(asyncio.StreamWriter): Stream the request is written to.
+    - method(str): HTTP method of the request.
+    - path(str): Path of the request.
+    - payload(Dict): JSON body of the request, or None for no body. Set to None by default.
+
+    Returns:
+    - object: Decoded JSON body of the response.
+    """
+    body = json.dumps(payload).encode() if payload is not None else b''
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    _, _, response_body = await read_http_message(reader)
+    return json.loads(response_body)
+
+
+
+async def run_load_test(host: str, port: int, queries: List[Dict], concurrency: int = 32, number_requests: int = 1000) -> Dict:
+    """
+    Function for sending recommendation queries to a running server from many concurrent connections.
+
+    Parameters:
+    - host(str): Host of the server.
+    - port(int): Port of the server.
+    - queries(List[Dict]): Queries sent in turn.
+    - concurrency(int): Number of connections sending requests at the same time. Set to 32 by default.
+    - number_requests(int): Total number of requests. Set to 1000 by default.
+
+    Returns:
+    - Dict: Number of requests, elapsed seconds, client side throughput and p50/p99 latency, and the server counters.
+    """
+    latencies = []
+    next_request = iter(range(number_requests))
+
+    async def client() -> None:
+        # Sending requests over one keep-alive connection until all requests are taken
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for request_number in next_request:
+                started = time.perf_counter()
+                await send_request(reader, writer, 'POST', '/recommend', queries[request_number % len(queries)])
+                latencies.append(time.perf_counter() - started)
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    # Reading the counters of the server
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        server_statistics = await send_request(reader, writer, 'GET', '/stats')
+    finally:
+        writer.close()
+
+    latencies = np.array(latencies) * 1000
+    return {
+        'requests': len(latencies),
+        'seconds': round(elapsed, 3),
+        'throughput_per_second': round(len(latencies) / elapsed, 2),
+        'p50_latency_ms': round(float(np.percentile(latencies, 50)), 3),
+        'p99_latency_ms': round(float(np.percentile(latencies, 99)), 3),
+        'server': server_statistics
+    }
+
+
+
+async def run_local_load_test(path_file_jobs: str, path_file_jobseeker: str, concurrency: int = 32, number_requests: int = 1000,
+                              batch_window: float = 0.002, max_batch_size: int = 256) -> Dict:
+    """
+    Function for load testing an in-process server over a jobs file with the job seekers of a file as queries.
+
+    Parameters:
+    - path_file_jobs(str): Path to the file containing jobs data.
+    - path_file_jobseeker(str): Path to the file containing jobseekers data.
+    - concurrency(int): Number of connections sending requests at the same time. Set to 32 by default.
+    - number_requests(int): Total number of requests. Set to 1000 by default.
+    - batch_window(float): Longest time in seconds a query waits for others to join its batch. Set to 2 ms by default.
+    - max_batch_size(int): Largest number of queries scored together. Set to 256 by default.
+
+    Returns:
+    - Dict: Results of run_load_test.
+    """
+    jobseekers_df = File(path_file_jobseeker).read_file()
+    queries = [{'skills': skills, 'jobseeker_id': jobseeker_id, 'jobseeker_name': name}
+               for jobseeker_id, name, skills in zip(jobseekers_df['id'].tolist(), jobseekers_df['name'].tolist(), jobseekers_df['skills'].tolist())]
+
+    # Serving on a free local port for the duration of the test
+    server = RecommendationQueryServer(RecommendationIndex.from_file(path_file_jobs), '127.0.0.1', 0, batch_window, max_batch_size)
+    await server.start()
+    try:
+        return await run_load_test(server.host, server.port, queries, concurrency, number_requests)
+    finally:
+        await server.close()
+
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Load test the job recommendation query service locally.")
+    parser.add_argument('--jobs', default='csv_files/jobs.csv', help="Path to the jobs CSV file.")
+    parser.add_argument('--jobseekers', default='csv_files/jobseekers.csv', help="Path to the job seekers CSV file used as queries.")
+    parser.add_argument('--concurrency', type=int, default=32, help="Number of concurrent connections.")
+    parser.add_argument('--requests', type=int, default=1000, help="Total number of requests.")
+    parser.add_argument('--batch-window', type=float, default=0.002, help="Longest time in seconds a query waits for others to join its batch.")
+    parser.add_argument('--max-batch-size', type=int, default=256, help="Largest number of queries scored together.")
+    arguments = parser.parse_args()
+    print(json.dumps(asyncio.run(run_local_load_test(arguments.jobs, arguments.jobseekers, arguments.concurrency, arguments.requests,
+                                                     arguments.batch_window, arguments.max_batch_size)), indent=2))
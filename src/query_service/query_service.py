@@ -0,0 +1,442 @@
+# typing module for type hints
+from typing import List, Dict, Optional, Tuple
+# argparse module for the command line interface
+import argparse
+# asyncio module for the event loop, streams and futures
+import asyncio
+# collections module for the bounded window of latencies
+import collections
+# json module for encoding requests and responses
+import json
+# time module for measuring latencies
+import time
+# numpy library for the latency percentiles
+import numpy as np
+# custom RecommendationIndex class for scoring the queries
+from ..recommendation_index.recommendation_index import RecommendationIndex
+
+
+class QueryStatistics:
+    """
+    A class for counting the requests of the query service and measuring their latency.
+
+    Attributes:
+    - started(float): Time the counters were started at, from time.perf_counter.
+    - requests(int): Number of answered recommendation requests.
+    - errors(int): Number of rejected or failed recommendation requests.
+    - batches(int): Number of batched scoring calls.
+    - batched_queries(int): Number of queries scored in batches.
+    - latencies(collections.deque): Latency in seconds of the most recent requests, at most window_size of them.
+    """
+    window_size = 10000
+
+
+    def __init__(self):
+        """
+        Constructor for class QueryStatistics.
+        """
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_queries = 0
+        self.latencies = collections.deque(maxlen=self.window_size)
+
+
+
+    def record_request(self, latency: float, error: bool = False) -> None:
+        """
+        Function for recording an answered request.
+
+        Parameters:
+        - latency(float): Time in seconds from receiving the request to having its response.
+        - error(bool): Whether the request was rejected or failed. Set to False by default.
+        """
+        if error:
+            self.errors += 1
+        else:
+            self.requests += 1
+            self.latencies.append(latency)
+
+
+
+    def record_batch(self, batch_size: int) -> None:
+        """
+        Function for recording a batched scoring call.
+
+        Parameters:
+        - batch_size(int): Number of queries scored together.
+        """
+        self.batches += 1
+        self.batched_queries += batch_size
+
+
+
+    def snapshot(self) -> Dict:
+        """
+        Function for getting the current counters.
+
+        Returns:
+        - Dict: Request and error counts, throughput in requests per second since start, p50 and p99 latency in
+                milliseconds over the most recent requests, and the number and mean size of the batches.
+        """
+        uptime = time.perf_counter() - self.started
+        latencies = np.array(self.latencies) * 1000
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'uptime_seconds': round(uptime, 3),
+            'throughput_per_second': round(self.requests / uptime, 2) if uptime > 0 else 0.0,
+            'p50_latency_ms': round(float(np.percentile(latencies, 50)), 3) if len(latencies) else None,
+            'p99_latency_ms': round(float(np.percentile(latencies, 99)), 3) if len(latencies) else None,
+            'batches': self.batches,
+            'mean_batch_size': round(self.batched_queries / self.batches, 2) if self.batches else None
+        }
+
+
+
+class MicroBatcher:
+    """
+    A class for coalescing concurrent queries into batched scoring calls.
+
+    The first query of a batch waits at most batch_window seconds for further queries, and all queries waiting
+    by then, up to max_batch_size of them, are scored with a single call of RecommendationIndex.recommend_batch.
+    The scoring runs in a worker thread, so new queries keep queueing up for the next batch meanwhile.
+
+    Attributes:
+    - index(RecommendationIndex): Index the queries are scored against.
+    - batch_window(float): Longest time in seconds a query waits for others to join its batch.
+    - max_batch_size(int): Largest number of queries scored together.
+    - statistics(QueryStatistics): Counters the batches are recorded in.
+    """
+
+    def __init__(self, index: RecommendationIndex, batch_window: float = 0.002, max_batch_size: int = 256, statistics: QueryStatistics = None):
+        """
+        Constructor for class MicroBatcher.
+
+        Parameters:
+        - index(RecommendationIndex): Index the queries are scored against.
+        - batch_window(float): Longest time in seconds a query waits for others to join its batch. Set to 2 ms by default.
+        - max_batch_size(int): Largest number of queries scored together. Set to 256 by default.
+        - statistics(QueryStatistics): Counters the batches are recorded in, or None for new counters. Set to None by default.
+        """
+        if batch_window < 0:
+            raise ValueError("Batch window should not be negative.")
+        if not isinstance(max_batch_size, int) or max_batch_size < 1:
+            raise ValueError("Maximum batch size should be a positive integer.")
+        self.index = index
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.statistics = statistics if statistics is not None else QueryStatistics()
+        self.queue = None
+        self.task = None
+
+
+
+    def start(self) -> None:
+        """
+        Function for starting the batching task on the running event loop.
+        """
+        self.queue = asyncio.Queue()
+        self.task = asyncio.get_running_loop().create_task(self.run())
+
+
+
+    async def close(self) -> None:
+        """
+        Function for stopping the batching task.
+        """
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+
+
+    async def submit(self, query: Dict) -> List[Dict]:
+        """
+        Function for scoring a query as part of the next batch.
+
+        Parameters:
+        - query(Dict): Query with the key 'skills' and optionally 'top_k', 'min_percent', 'jobseeker_id' and 'jobseeker_name'.
+
+        Returns:
+        - List[Dict]: Recommendations of the query.
+        """
+        # Rejecting invalid queries before they can fail a whole batch
+        if not isinstance(query.get('skills'), str):
+            raise ValueError("The skills of the query should be a string.")
+        self.index.check_query_settings(query.get('top_k'), query.get('min_percent', 0.0))
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((query, future))
+        return await future
+
+
+
+    async def run(self) -> None:
+        """
+        Function for collecting the queued queries into batches and scoring them, until cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            # Waiting for the first query of the batch and giving others the batch window to join
+            batch = [await self.queue.get()]
+            if self.batch_window > 0 and self.queue.qsize() < self.max_batch_size - 1:
+                await asyncio.sleep(self.batch_window)
+            while len(batch) < self.max_batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            # Scoring the batch in a worker thread and splitting the results back to the queries
+            try:
+                results = await loop.run_in_executor(None, self.index.recommend_batch, [query for query, _ in batch])
+                self.statistics.record_batch(len(batch))
+                for (_, future), recommendations in zip(batch, results):
+                    if not future.done():
+                        future.set_result(recommendations)
+            except Exception as ex:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(ex)
+
+
+
+async def read_http_message(reader: asyncio.StreamReader) -> Optional[Tuple[str, Dict[str, str], bytes]]:
+    """
+    Function for reading an HTTP/1.1 request or response with a Content-Length body.
+
+    Parameters:
+    - reader(asyncio.StreamReader): Stream of the connection.
+
+    Returns:
+    - Optional[Tuple[str, Dict[str, str], bytes]]: Start line, headers with lower case names and body, or None if
+                                                   the connection was closed. Raises ValueError for lines longer
+                                                   than the limit of the reader and invalid Content-Length headers.
+    """
+    start_line = await reader.readline()
+    if not start_line.strip():
+        return None
+
+    headers = {}
+    while True:
+        header_line = await reader.readline()
+        if not header_line.strip():
+            break
+        name, _, value = header_line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    content_length = headers.get('content-length', '0')
+    if not content_length.isdigit():
+        raise ValueError(f"Invalid Content-Length header {content_length!r}.")
+    body = await reader.readexactly(int(content_length))
+    return start_line.decode('latin-1').strip(), headers, body
+
+
+
+class RecommendationQueryServer:
+    """
+    A class for serving recommendation queries over HTTP/JSON with asyncio, without any external service.
+
+    Endpoints:
+    - POST /recommend: Body {"skills": "Python, SQL", "top_k": 5, "min_percent": 50, "jobseeker_id": 1, "jobseeker_name": "..."},
+                       of which only skills is required. Responds with the recommendations in the batch output schema.
+    - GET /stats: Responds with the throughput, p50/p99 latency and batching counters.
+    - GET /health: Responds with the status and the number of indexed jobs.
+
+    Attributes:
+    - index(RecommendationIndex): Index the queries are scored against.
+    - host(str): Host the server listens on.
+    - port(int): Port the server listens on, the actual port once started if 0 was given.
+    - statistics(QueryStatistics): Counters of the served requests.
+    - batcher(MicroBatcher): Batcher coalescing the concurrent queries.
+    """
+    reasons = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+
+    def __init__(self, index: RecommendationIndex, host: str = '127.0.0.1', port: int = 8080, batch_window: float = 0.002, max_batch_size: int = 256):
+        """
+        Constructor for class RecommendationQueryServer.
+
+        Parameters:
+        - index(RecommendationIndex): Index the queries are scored against.
+        - host(str): Host the server listens on. Set to '127.0.0.1' by default.
+        - port(int): Port the server listens on, or 0 for any free port. Set to 8080 by default.
+        - batch_window(float): Longest time in seconds a query waits for others to join its batch. Set to 2 ms by default.
+        - max_batch_size(int): Largest number of queries scored together. Set to 256 by default.
+        """
+        self.index = index
+        self.host = host
+        self.port = port
+        self.statistics = QueryStatistics()
+        self.batcher = MicroBatcher(index, batch_window, max_batch_size, self.statistics)
+        self.server = None
+
+
+
+    async def start(self) -> None:
+        """
+        Function for starting to listen for connections.
+        """
+        self.batcher.start()
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+
+
+    async def serve_forever(self) -> None:
+        """
+        Function for starting the server if needed and serving until cancelled.
+        """
+        if self.server is None:
+            await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.close()
+
+
+
+    async def close(self) -> None:
+        """
+        Function for stopping to listen for connections and stopping the batcher.
+        """
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+        await self.batcher.close()
+
+
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Function for answering the requests of a connection, keeping it open between requests.
+
+        Parameters:
+        - reader(asyncio.StreamReader): Stream the requests are read from.
+        - writer(asyncio.StreamWriter): Stream the responses are written to.
+        """
+        try:
+            while True:
+                message = await read_http_message(reader)
+                if message is None:
+                    break
+                start_line, headers, body = message
+                method, path = (start_line.split(' ') + ['', ''])[:2]
+                status, payload = await self.handle_request(method, path, body)
+
+                # Closing the connection after the response if the client asked for it
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                await self.write_response(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+
+        except ValueError as ex:
+            # Rejecting malformed messages, after which the rest of the stream can not be framed
+            try:
+                await self.write_response(writer, 400, {'error': str(ex)}, keep_alive=False)
+            except ConnectionError:
+                pass
+
+        except (ConnectionError, asyncio.IncompleteReadError):
+            # Ignoring clients which disconnect in the middle of a request
+            pass
+
+        finally:
+            writer.close()
+
+
+
+    async def write_response(self, writer: asyncio.StreamWriter, status: int, payload: object, keep_alive: bool = True) -> None:
+        """
+        Function for writing a JSON response.
+
+        Parameters:
+        - writer(asyncio.StreamWriter): Stream the response is written to.
+        - status(int): HTTP status code of the response.
+        - payload(object): JSON payload of the response.
+        - keep_alive(bool): Whether the connection stays open after the response. Set to True by default.
+        """
+        response_body = json.dumps(payload).encode()
+        writer.write((f"HTTP/1.1 {status} {self.reasons[status]}\r\nContent-Type: application/json\r\n"
+                      f"Content-Length: {len(response_body)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n").encode() + response_body)
+        await writer.drain()
+
+
+
+    async def handle_request(self, method: str, path: str, body: bytes) -> Tuple[int, object]:
+        """
+        Function for answering a single request.
+
+        Parameters:
+        - method(str): HTTP method of the request.
+        - path(str): Path of the request.
+        - body(bytes): Body of the request.
+
+        Returns:
+        - Tuple[int, object]: HTTP status code and JSON payload of the response.
+        """
+        if path == '/health':
+            return (200, {'status': 'ok', 'jobs': len(self.index)}) if method == 'GET' else (405, {'error': 'Use GET.'})
+        if path == '/stats':
+            return (200, self.statistics.snapshot()) if method == 'GET' else (405, {'error': 'Use GET.'})
+        if path != '/recommend':
+            return 404, {'error': f'Unknown path {path}.'}
+        if method != 'POST':
+            return 405, {'error': 'Use POST.'}
+
+        started = time.perf_counter()
+        try:
+            query = json.loads(body)
+            if not isinstance(query, dict):
+                raise ValueError("The query should be a JSON object.")
+            recommendations = await self.batcher.submit(query)
+            self.statistics.record_request(time.perf_counter() - started)
+            return 200, recommendations
+
+        except (ValueError, TypeError) as ex:
+            # Handling invalid queries, including invalid JSON
+            self.statistics.record_request(time.perf_counter() - started, error=True)
+            return 400, {'error': str(ex)}
+
+        except Exception as ex:
+            # Handling unexpected errors
+            self.statistics.record_request(time.perf_counter() - started, error=True)
+            return 500, {'error': f"An unexpected error occurred while recommending: {ex}"}
+
+
+
+def run_server(path_file_jobs: str, host: str = '127.0.0.1', port: int = 8080, batch_window: float = 0.002, max_batch_size: int = 256,
+               cache_directory: str = None) -> None:
+    """
+    Function for building the index over a jobs file and serving queries until interrupted.
+
+    Parameters:
+    - path_file_jobs(str): Path to the file containing jobs data.
+    - host(str): Host the server listens on. Set to '127.0.0.1' by default.
+    - port(int): Port the server listens on. Set to 8080 by default.
+    - batch_window(float): Longest time in seconds a query waits for others to join its batch. Set to 2 ms by default.
+    - max_batch_size(int): Largest number of queries scored together. Set to 256 by default.
+    - cache_directory(str): Directory of the parsed file cache, or None to parse the CSV file. Set to None by default.
+    """
+    server = RecommendationQueryServer(RecommendationIndex.from_file(path_file_jobs, cache_directory), host, port, batch_window, max_batch_size)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Serve job recommendation queries over HTTP/JSON.")
+    parser.add_argument('--jobs', default='csv_files/jobs.csv', help="Path to the jobs CSV file.")
+    parser.add_argument('--host', default='127.0.0.1', help="Host to listen on.")
+    parser.add_argument('--port', type=int, default=8080, help="Port to listen on.")
+    parser.add_argument('--batch-window', type=float, default=0.002, help="Longest time in seconds a query waits for others to join its batch.")
+    parser.add_argument('--max-batch-size', type=int, default=256, help="Largest number of queries scored together.")
+    parser.add_argument('--cache-directory', default=None, help="Directory of the parsed file cache.")
+    arguments = parser.parse_args()
+    run_server(arguments.jobs, arguments.host, arguments.port, arguments.batch_window, arguments.max_batch_size, arguments.cache_directory)
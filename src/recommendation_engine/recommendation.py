@@ -2,6 +2,14 @@
 from abc import ABC, abstractmethod
 # os module for operating system functionalities
 import os
+# warnings module for announcing deprecated settings
+import warnings
+# numpy library for numerical arrays
+import numpy as np
+# custom SkillTokenCache class for splitting every distinct skills string once
+from ..skill_matching.skill_token_cache import SkillTokenCache
+# custom scoring kernel classes for scoring the matches in bulk
+from ..skill_matching.scoring_kernels import ScoringKernel, OverlapPercentKernel, JaccardKernel, IdfOverlapKernel
 
 
 class RecommendationEngine(ABC):
@@ -9,18 +17,33 @@ class RecommendationEngine(ABC):
     An abstract base class for recommendation engines.
     
     Attributes:
-    - threshold_parallel_processing(float): Threshold for parallel processing in MB. Default is 5.00 GB.
-                                             The main intention is to activate multiprocessing if the total size of 
-                                             two CSV files is greater than the threshold. 
+    - threshold_parallel_processing(float): Deprecated threshold for parallel processing in GB. Default is 5.00 GB.
+                                             It used to activate multiprocessing if the total size of two CSV files 
+                                             was greater than the threshold. JobMatchRecommendationEngine chooses its 
+                                             processing with a cost model instead and ignores it.
+    - top_k(int): Maximum number of recommendations kept per job seeker, or None for all of them. Default is None.
+    - skill_token_cache(SkillTokenCache): Bounded cache of the tokenized skills strings shared by all engines, used by 
+                                          calculate_matching_skills. It can be replaced by a SkillTokenCache of another size.
+    - scoring_kernel(ScoringKernel): Kernel scoring the matches of a block in bulk, whose score is reported as the 
+                                     matching skill percentage and ranked by. Default is the overlap_percent kernel.
+    - min_match_count(int): Smallest matching skill count of a recommendation. Default is 1.
+    - min_match_percent(float): Smallest matching skill percentage, i.e. score, of a recommendation. Default is 0.
     """
     threshold_parallel_processing = 5.00  
+    top_k = None
+    skill_token_cache = SkillTokenCache()
+    scoring_kernel = OverlapPercentKernel()
+    scoring_kernels = {"overlap_percent": OverlapPercentKernel, "jaccard": JaccardKernel, "idf_overlap": IdfOverlapKernel}
+    min_match_count = 1
+    min_match_percent = 0.0
     
 
     def set_threshold_parallel_processing(self, threshold_parallel_processing: float) -> None:
         """
         Function for setting the threshold for parallel processing.
 
-        It allows to change the threshold within 5.00 to 10.00 GB.
+        It allows to change the threshold within 5.00 to 10.00 GB. It is deprecated and emits a DeprecationWarning,
+        since the processing is chosen by the execution planner from a cost model and the threshold is ignored.
         
         Parameters:
         - threshold_parallel_processing(float): Threshold for parallel processing in MB.
@@ -31,10 +54,103 @@ class RecommendationEngine(ABC):
             raise TypeError("Threshold must be a float")
         
         if 5.00<= threshold_parallel_processing <= 10.00: 
+            warnings.warn("The threshold for parallel processing is deprecated and ignored, the processing is chosen by the execution planner.",
+                          DeprecationWarning, stacklevel=2)
             self.threshold_parallel_processing = threshold_parallel_processing
         else:
             raise ValueError("Threshold for parallel processing should be between 5MB and 10 MB.")
     
+
+
+    def set_top_k(self, top_k) -> None:
+        """
+        Function for setting the maximum number of recommendations kept per job seeker.
+
+        With a top_k set, only the best matches of each job seeker are kept while scoring, ordered by
+        matching skill percentage in descending order.
+
+        Parameters:
+        - top_k(int): Maximum number of recommendations per job seeker, or None to keep all of them.
+        """
+        if top_k is None:
+            self.top_k = None
+            return
+
+        if not isinstance(top_k, int) or isinstance(top_k, bool):
+            raise TypeError("Top k must be an integer or None")
+
+        if top_k >= 1:
+            self.top_k = top_k
+        else:
+            raise ValueError("Top k should be at least 1.")
+
+
+
+    def set_min_match_count(self, min_match_count: int) -> None:
+        """
+        Function for setting the smallest matching skill count of a recommendation.
+
+        Parameters:
+        - min_match_count(int): Smallest matching skill count, 1 to keep every match.
+        """
+        if not isinstance(min_match_count, int) or isinstance(min_match_count, bool):
+            raise TypeError("Minimum match count must be an integer")
+
+        if min_match_count >= 1:
+            self.min_match_count = min_match_count
+        else:
+            raise ValueError("Minimum match count should be at least 1.")
+
+
+
+    def set_min_match_percent(self, min_match_percent: float) -> None:
+        """
+        Function for setting the smallest matching skill percentage, i.e. score of the scoring kernel, of a recommendation.
+
+        Parameters:
+        - min_match_percent(float): Smallest matching skill percentage, 0 to keep every match.
+        """
+        if isinstance(min_match_percent, bool) or not isinstance(min_match_percent, (int, float)):
+            raise TypeError("Minimum match percentage must be a number")
+
+        if 0 <= min_match_percent <= 100:
+            self.min_match_percent = float(min_match_percent)
+        else:
+            raise ValueError("Minimum match percentage should be between 0 and 100.")
+
+
+
+    def has_minimum_match(self) -> bool:
+        """
+        Function for checking whether a minimum match count or percentage drops some of the matches.
+
+        Returns:
+        - bool: Whether min_match_count is above 1 or min_match_percent above 0.
+        """
+        return self.min_match_count > 1 or self.min_match_percent > 0
+
+
+
+    def set_scoring_kernel(self, scoring_kernel) -> None:
+        """
+        Function for setting the kernel scoring the matches.
+
+        Parameters:
+        - scoring_kernel(Union[str, ScoringKernel]): Name of a built-in kernel, 'overlap_percent', 'jaccard' or
+                                                     'idf_overlap', or a ScoringKernel instance.
+        """
+        if isinstance(scoring_kernel, ScoringKernel):
+            self.scoring_kernel = scoring_kernel
+            return
+
+        if not isinstance(scoring_kernel, str):
+            raise TypeError("Scoring kernel must be a string or a ScoringKernel")
+
+        if scoring_kernel in self.scoring_kernels:
+            self.scoring_kernel = self.scoring_kernels[scoring_kernel]()
+        else:
+            raise ValueError(f"Scoring kernel should be one of: {', '.join(self.scoring_kernels)}.")
+
         
 
     def calculate_file_size(self, path_file: str) -> int:
@@ -67,6 +183,9 @@ class RecommendationEngine(ABC):
         """
         Static method for calculating the total matching skills and percentage between the 
         required skills and the skills present.
+
+        The skills strings are tokenized through skill_token_cache, so that a string scored many times
+        is split only once, and the tokens are scored with calculate_matching_tokens.
         
         Parameters:
         - skills_required(str): Required skills.
@@ -76,30 +195,102 @@ class RecommendationEngine(ABC):
         - tuple: Tuple containing the matching skill count and the matching skills percentage.
         """
         try:
-            # Converting the skills string into a set of unique skills to perform set operation 
-            set_skills_required = set(skills_required.split(", "))
-            set_skills_present = set(set_skills_present.split(", "))
-            
-            
-            # Calculating matching skills using intersection
-            matching_skills = set_skills_required.intersection(set_skills_present)
-            # Calculating matching skill count
-            matching_skill_count = len(matching_skills)
-
-            # Calculating matching skills percentage
-            if len(set_skills_required) > 0:
-                matched_skills_percentage = (matching_skill_count / len(set_skills_required)) * 100
-            else:
-                matched_skills_percentage = 0
-
-            return matching_skill_count,matched_skills_percentage
+            # Converting the skills strings into sets of unique skills to perform set operation 
+            skill_token_cache = RecommendationEngine.skill_token_cache
+            return RecommendationEngine.calculate_matching_tokens(skill_token_cache.tokenize(skills_required), skill_token_cache.tokenize(set_skills_present))
         
         except Exception as ex:
             # Handling unexpected errors
             raise Exception(f"Error calculating matching skills: {str(ex)}")
 
+
+
+    @staticmethod
+    def calculate_matching_tokens(skills_required: frozenset, skills_present: frozenset) -> tuple:
+        """
+        Static method for calculating the total matching skills and percentage between already tokenized
+        required skills and skills present.
+
+        Parameters:
+        - skills_required(frozenset): Unique required skill tokens.
+        - skills_present(frozenset): Unique skill tokens present.
+
+        Returns:
+        - tuple: Tuple containing the matching skill count and the matching skills percentage.
+        """
+        # Calculating matching skill count using intersection
+        matching_skill_count = len(skills_required & skills_present)
+
+        # Calculating matching skills percentage
+        if len(skills_required) > 0:
+            matched_skills_percentage = (matching_skill_count / len(skills_required)) * 100
+        else:
+            matched_skills_percentage = 0
+
+        return matching_skill_count, matched_skills_percentage
+
     
 
+    @staticmethod
+    def calculate_matching_percentages(matching_skill_counts: np.ndarray, skill_counts: np.ndarray) -> np.ndarray:
+        """
+        Static method for calculating the matching skills percentages of many pairs at once.
+
+        It gives exactly the same values as calculate_matching_skills followed by round(percentage, 2).
+        The percentages are rounded with Python's round on the distinct values only, because numpy's rounding 
+        can differ from Python's in the last digit.
+
+        Parameters:
+        - matching_skill_counts(np.ndarray): Matching skill count of each pair.
+        - skill_counts(np.ndarray): Number of unique skills that the percentage is based on for each pair.
+
+        Returns:
+        - np.ndarray: Matching skills percentage of each pair rounded to 2 decimals.
+        """
+        try:
+            # Calculating and rounding the percentages like the scoring kernels
+            return ScoringKernel.calculate_percentages(matching_skill_counts, skill_counts)
+
+        except Exception as ex:
+            # Handling unexpected errors
+            raise Exception(f"Error calculating matching skills percentages: {str(ex)}")
+
+
+
+    @staticmethod
+    def select_top_k(seeker_positions: np.ndarray, matching_skill_counts: np.ndarray, job_positions: np.ndarray, top_k: int,
+                     job_codes: np.ndarray = None) -> np.ndarray:
+        """
+        Static method for selecting the best matches of each job seeker.
+
+        The matches are ranked per job seeker by matching skill count in descending order, which is the same as
+        the matching skill percentage since it shares the denominator, with ties broken by job ID like
+        RecommendationResult.sort, so that the selection equals sorting all matches and keeping the first top_k.
+        The scores of a scoring kernel can be given instead of the counts to rank by them.
+
+        Parameters:
+        - seeker_positions(np.ndarray): Job seeker position of each match.
+        - matching_skill_counts(np.ndarray): Matching skill count, or score, of each match.
+        - job_positions(np.ndarray): Job position of each match.
+        - top_k(int): Maximum number of matches kept per job seeker.
+        - job_codes(np.ndarray): Code of the ID of every job, as given by RecommendationResult.id_codes, or None to
+                                 break ties by job position. Set to None by default.
+
+        Returns:
+        - np.ndarray: Indices of the selected matches, ordered by job seeker position and then by rank.
+        """
+        # Ordering the matches by job seeker, matching skill count in descending order and job ID
+        tie_breaks = job_positions if job_codes is None else np.asarray(job_codes)[job_positions]
+        order = np.lexsort((tie_breaks, -np.asarray(matching_skill_counts, dtype=np.float64), seeker_positions))
+        ordered_seekers = np.asarray(seeker_positions)[order]
+
+        # Calculating the rank of every match within its job seeker and keeping the first top_k
+        group_starts = np.flatnonzero(np.r_[True, ordered_seekers[1:] != ordered_seekers[:-1]]) if len(order) else np.array([], dtype=np.int64)
+        ranks = np.arange(len(order)) - np.repeat(group_starts, np.diff(np.r_[group_starts, len(order)]))
+        return order[ranks < top_k]
+
+
+
     @abstractmethod
     def generate_recommendations():
         """
@@ -0,0 +1,288 @@
+# typing module for type hints
+from typing import Iterable, List, Dict, Union
+# time module for enforcing the latency budget of a query
+import time
+# numpy library for numerical arrays
+import numpy as np
+# pandas library for data manipulation and analysis
+import pandas as pd
+# custom File class for reading the jobs file
+from ..file_reader.read_files import File
+# custom RecommendationEngine class for the shared percentage and top k calculations
+from ..recommendation_engine.recommendation import RecommendationEngine
+# custom RecommendationResult class for the codes of the job ids breaking the ties of top k
+from ..recommendation_result.recommendation_result import RecommendationResult
+# custom skill vocabulary and incidence matrix classes for mapping skills to ids
+from ..skill_matching.skill_vocabulary import SkillVocabulary, SkillMatrix
+# custom SkillInvertedIndex class for the posting lists of the skills
+from ..skill_matching.inverted_index import SkillInvertedIndex
+# custom SparseMatchingBackend class for scoring batches of queries at once
+from ..skill_matching.matching_backend import SparseMatchingBackend
+
+
+class QueryRecommendations(list):
+    """
+    A list of the recommendations of a single query, flagged when the query exceeded its latency budget.
+
+    Attributes:
+    - truncated(bool): Whether the posting lists of some skills were skipped, so that the recommendations may miss
+                       jobs and understate matching skill counts.
+    """
+
+    def __init__(self, recommendations: Iterable[Dict] = (), truncated: bool = False):
+        """
+        Constructor for class QueryRecommendations.
+
+        Parameters:
+        - recommendations(Iterable[Dict]): Recommendations of the query. Set to no recommendations by default.
+        - truncated(bool): Whether the query exceeded its latency budget. Set to False by default.
+        """
+        super().__init__(recommendations)
+        self.truncated = truncated
+
+
+
+class RecommendationIndex:
+    """
+    A class for answering single job seeker queries against a jobs catalog held in memory.
+
+    It is built once from the jobs file and keeps the skill vocabulary and the inverted index from skills to jobs,
+    so a query only merges the posting lists of its own skills instead of scanning the catalog. The posting lists
+    are merged from the shortest to the longest, and when a query exceeds its latency budget the remaining (most
+    common) skills are skipped, giving the matches found so far flagged as truncated instead of exceeding the
+    budget. Many queries can
+    also be scored together with recommend_batch, which uses a single sparse matrix product for all of them.
+
+    Attributes:
+    - jobs_df(pd.DataFrame): Ids and titles of the cleansed jobs.
+    - inverted_index(SkillInvertedIndex): Inverted index from skills to job positions.
+    - truncated_queries(int): Number of queries which exceeded their latency budget so far.
+    """
+
+    def __init__(self, jobs_df: pd.DataFrame, inverted_index: SkillInvertedIndex):
+        """
+        Constructor for class RecommendationIndex.
+
+        Parameters:
+        - jobs_df(pd.DataFrame): Cleansed jobs data the inverted index was built from.
+        - inverted_index(SkillInvertedIndex): Inverted index from skills to job positions.
+        """
+        self.jobs_df = jobs_df[['id', 'title']]
+        self.inverted_index = inverted_index
+        self.truncated_queries = 0
+        # Creating the backend for batched queries on first use
+        self.backend = None
+        # Resolving the ids and titles by position without going through pandas at query time
+        self.job_ids = self.jobs_df['id'].to_numpy(dtype=object)
+        self.job_titles = self.jobs_df['title'].to_numpy(dtype=object)
+        # Mapping the ids to codes breaking the ties of top_k like the batch output
+        self.job_codes = RecommendationResult.id_codes(self.jobs_df)
+
+
+
+    def __len__(self) -> int:
+        """
+        Function for getting the number of indexed jobs.
+
+        Returns:
+        - int: Number of jobs.
+        """
+        return len(self.inverted_index)
+
+
+
+    @classmethod
+    def from_file(cls, path_file_jobs: str, cache_directory: str = None) -> "RecommendationIndex":
+        """
+        Class method for building the index from a jobs file.
+
+        Parameters:
+        - path_file_jobs(str): Path to the file containing jobs data.
+        - cache_directory(str): Directory of the parsed file cache, or None to parse the CSV file. Set to None by default.
+
+        Returns:
+        - RecommendationIndex: Index over the jobs of the file.
+        """
+        return cls.from_jobs_file(File(path_file_jobs, cache_directory))
+
+
+
+    @classmethod
+    def from_jobs_file(cls, jobs_file: File) -> "RecommendationIndex":
+        """
+        Class method for building the index from a reader of the jobs file, with its cache, memory limit and ingest mode.
+
+        Parameters:
+        - jobs_file(File): Reader of the file containing jobs data.
+
+        Returns:
+        - RecommendationIndex: Index over the jobs of the file.
+        """
+        vocabulary = SkillVocabulary()
+        jobs_df, job_matrix = jobs_file.read_skill_matrix('required_skills', vocabulary)
+        return cls(jobs_df, SkillInvertedIndex(vocabulary, job_matrix.matrix.T.tocsr(), jobs_df.index.to_numpy()))
+
+
+
+    def recommend(self, skills: Union[str, Iterable[str]], top_k: int = None, min_percent: float = 0.0, jobseeker_id=None,
+                  jobseeker_name: str = None, latency_budget: float = None) -> QueryRecommendations:
+        """
+        Function for recommending jobs for a single skills string.
+
+        Without top_k and min_percent, the recommendations are identical to those of a job seeker with the same
+        skills in the batch output. The budget is checked before merging every posting list, so a query whose
+        budget is used up before the first one gets no recommendations. A query exceeding its budget is flagged
+        as truncated, since its recommendations may then miss jobs and understate the matching skill counts.
+
+        Parameters:
+        - skills(Union[str, Iterable[str]]): Comma separated skills of the job seeker, or the skills themselves.
+        - top_k(int): Maximum number of recommendations, or None for all of them. Set to None by default.
+        - min_percent(float): Smallest matching skill percentage recommended. Set to 0 by default.
+        - jobseeker_id: ID reported in the recommendations. Set to None by default.
+        - jobseeker_name(str): Name reported in the recommendations. Set to None by default.
+        - latency_budget(float): Time budget of the query in seconds, or None for no budget. Set to None by default.
+
+        Returns:
+        - QueryRecommendations: Recommendations with the same keys as the batch output, ordered by job, or by
+                                matching skill percentage in descending order when top_k is set, and whether the
+                                query was truncated.
+        """
+        skills = self.join_skills(skills)
+        self.check_query_settings(top_k, min_percent)
+        if latency_budget is not None and latency_budget < 0:
+            raise ValueError("Latency budget should not be negative.")
+        deadline = None if latency_budget is None else time.perf_counter() + latency_budget
+
+        # Looking up the posting lists of the known skills, the shortest first
+        postings = self.inverted_index.postings
+        skill_ids = self.inverted_index.vocabulary.lookup_skills(skills)
+        skill_ids = skill_ids[np.argsort(postings.indptr[skill_ids + 1] - postings.indptr[skill_ids], kind='stable')]
+
+        # Collecting the posting lists until the latency budget is used up
+        posting_lists, truncated = [], False
+        for skill_id in skill_ids.tolist():
+            if deadline is not None and time.perf_counter() >= deadline:
+                self.truncated_queries += 1
+                truncated = True
+                break
+            posting_lists.append(postings.indices[postings.indptr[skill_id]:postings.indptr[skill_id + 1]])
+        if not posting_lists:
+            return QueryRecommendations(truncated=truncated)
+
+        # Counting the occurrences of every job, which is its matching skill count
+        job_positions, matching_skill_counts = np.unique(np.concatenate(posting_lists), return_counts=True)
+        return QueryRecommendations(self.select_recommendations(job_positions, matching_skill_counts, len(SkillVocabulary.tokenize(skills)), top_k,
+                                                                min_percent, jobseeker_id, jobseeker_name), truncated)
+
+
+
+    def recommend_batch(self, queries: List[Dict]) -> List[List[Dict]]:
+        """
+        Function for recommending jobs for many queries with a single sparse matrix product.
+
+        Parameters:
+        - queries(List[Dict]): Queries with the key 'skills' and optionally the keys 'top_k', 'min_percent',
+                               'jobseeker_id' and 'jobseeker_name' with the same meaning as in recommend.
+
+        Returns:
+        - List[List[Dict]]: Recommendations of each query, identical to calling recommend without a latency budget.
+        """
+        for query in queries:
+            self.check_query_settings(query.get('top_k'), query.get('min_percent', 0.0))
+        queries = [dict(query, skills=self.join_skills(query['skills'])) for query in queries]
+        if self.backend is None:
+            job_matrix = self.inverted_index.postings.T.tocsr()
+            self.backend = SparseMatchingBackend(SkillMatrix(job_matrix, np.diff(job_matrix.indptr)))
+
+        # Scoring all queries at once, with the pairs ordered by query and job
+        seeker_matrix = SkillMatrix.from_skills([query['skills'] for query in queries], self.inverted_index.vocabulary, grow_vocabulary=False)
+        seeker_positions, job_positions, matching_skill_counts = self.backend.match_block(seeker_matrix)
+        boundaries = np.searchsorted(seeker_positions, np.arange(len(queries) + 1)).tolist()
+
+        # Splitting the pairs back into the recommendations of each query
+        return [self.select_recommendations(job_positions[boundaries[position]:boundaries[position + 1]],
+                                            matching_skill_counts[boundaries[position]:boundaries[position + 1]],
+                                            seeker_matrix.skill_counts[position], query.get('top_k'), query.get('min_percent', 0.0),
+                                            query.get('jobseeker_id'), query.get('jobseeker_name'))
+                for position, query in enumerate(queries)]
+
+
+
+    @staticmethod
+    def join_skills(skills: Union[str, Iterable[str]]) -> str:
+        """
+        Static method for turning the skills of a query into a skills string.
+
+        Parameters:
+        - skills(Union[str, Iterable[str]]): Comma separated skills, or the skills themselves.
+
+        Returns:
+        - str: Comma separated skills.
+        """
+        if isinstance(skills, str):
+            return skills
+        try:
+            skills = list(skills)
+        except TypeError:
+            raise TypeError("Skills must be a string or an iterable of strings")
+        if not all(isinstance(skill, str) for skill in skills):
+            raise TypeError("Skills must be a string or an iterable of strings")
+        return SkillVocabulary.skill_separator.join(skills)
+
+
+
+    @staticmethod
+    def check_query_settings(top_k: int, min_percent: float) -> None:
+        """
+        Static method for validating the settings of a query.
+
+        Parameters:
+        - top_k(int): Maximum number of recommendations, or None for all of them.
+        - min_percent(float): Smallest matching skill percentage recommended.
+        """
+        if top_k is not None and (not isinstance(top_k, int) or isinstance(top_k, bool)):
+            raise TypeError("Top k must be an integer or None")
+        if top_k is not None and top_k < 1:
+            raise ValueError("Top k should be at least 1.")
+        if isinstance(min_percent, bool) or not isinstance(min_percent, (int, float)):
+            raise TypeError("Minimum percentage must be a number")
+        if not 0 <= min_percent <= 100:
+            raise ValueError("Minimum percentage should be between 0 and 100.")
+
+
+
+    def select_recommendations(self, job_positions: np.ndarray, matching_skill_counts: np.ndarray, skill_count: int, top_k: int,
+                               min_percent: float, jobseeker_id, jobseeker_name: str) -> List[Dict]:
+        """
+        Function for turning the matched jobs of a query into recommendations.
+
+        Parameters:
+        - job_positions(np.ndarray): Sorted positions of the matched jobs.
+        - matching_skill_counts(np.ndarray): Matching skill count of each matched job.
+        - skill_count(int): Number of unique skills of the query.
+        - top_k(int): Maximum number of recommendations, or None for all of them.
+        - min_percent(float): Smallest matching skill percentage recommended.
+        - jobseeker_id: ID reported in the recommendations.
+        - jobseeker_name(str): Name reported in the recommendations.
+
+        Returns:
+        - List[Dict]: Recommendations with the same keys as the batch output.
+        """
+        matching_skill_percents = RecommendationEngine.calculate_matching_percentages(matching_skill_counts, skill_count)
+
+        # Dropping the matches below the minimum percentage and keeping the best ones when top_k is set
+        selected = np.flatnonzero(matching_skill_percents >= min_percent)
+        if top_k is not None:
+            selected = selected[RecommendationEngine.select_top_k(np.zeros(len(selected), dtype=np.int64), matching_skill_counts[selected],
+                                                                  job_positions[selected], top_k, self.job_codes)]
+
+        return [{
+            'jobseeker_id': jobseeker_id,
+            'jobseeker_name': jobseeker_name,
+            'job_id': job_id,
+            'job_title': job_title,
+            'matching_skill_count': matching_skill_count,
+            'matching_skill_percent': matching_skill_percent
+        } for job_id, job_title, matching_skill_count, matching_skill_percent in zip(
+            self.job_ids[job_positions[selected]].tolist(), self.job_titles[job_positions[selected]].tolist(),
+            matching_skill_counts[selected].tolist(), matching_skill_percents[selected].tolist())]
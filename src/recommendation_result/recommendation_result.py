@@ -0,0 +1,173 @@
+# typing module for type hints
+from typing import List, Dict
+# numpy library for numerical arrays
+import numpy as np
+# pandas library for data manipulation and analysis
+import pandas as pd
+
+
+class RecommendationResult:
+    """
+    A class representing recommendations as compact columns (struct of arrays) instead of a list of dictionaries.
+
+    Each recommendation is stored as a job seeker position, a job position, a matching skill count and a matching
+    skill percentage in NumPy arrays. The ids, names and titles are only resolved from the input tables when the
+    recommendations are converted to dictionaries or to a DataFrame.
+
+    Attributes:
+    - jobseekers_df(pd.DataFrame): Ids and names of the job seekers the seeker positions refer to.
+    - jobs_df(pd.DataFrame): Ids and titles of the jobs the job positions refer to.
+    - seeker_positions(np.ndarray): Row position of the job seeker of each recommendation (int32).
+    - job_positions(np.ndarray): Row position of the job of each recommendation (int32).
+    - matching_skill_counts(np.ndarray): Matching skill count of each recommendation (int16).
+    - matching_skill_percents(np.ndarray): Matching skill percentage of each recommendation (float32).
+    """
+    columns = ['jobseeker_id', 'jobseeker_name', 'job_id', 'job_title', 'matching_skill_count', 'matching_skill_percent']
+
+
+    def __init__(self, jobseekers_df: pd.DataFrame, jobs_df: pd.DataFrame, seeker_positions: np.ndarray, job_positions: np.ndarray,
+                 matching_skill_counts: np.ndarray, matching_skill_percents: np.ndarray):
+        """
+        Constructor for class RecommendationResult.
+
+        Parameters:
+        - jobseekers_df(pd.DataFrame): Job seekers the seeker positions refer to. Only the id and name columns are kept.
+        - jobs_df(pd.DataFrame): Jobs the job positions refer to. Only the id and title columns are kept.
+        - seeker_positions(np.ndarray): Row position of the job seeker of each recommendation.
+        - job_positions(np.ndarray): Row position of the job of each recommendation.
+        - matching_skill_counts(np.ndarray): Matching skill count of each recommendation.
+        - matching_skill_percents(np.ndarray): Rounded matching skill percentage of each recommendation.
+        """
+        self.jobseekers_df = jobseekers_df[['id', 'name']]
+        self.jobs_df = jobs_df[['id', 'title']] if jobs_df is not None else None
+        self.seeker_positions = np.asarray(seeker_positions, dtype=np.int32)
+        self.job_positions = np.asarray(job_positions, dtype=np.int32)
+        self.matching_skill_counts = np.asarray(matching_skill_counts, dtype=np.int16)
+        self.matching_skill_percents = np.asarray(matching_skill_percents, dtype=np.float32)
+
+
+
+    def __len__(self) -> int:
+        """
+        Function for getting the number of recommendations.
+
+        Returns:
+        - int: Number of recommendations.
+        """
+        return len(self.seeker_positions)
+
+
+
+    @classmethod
+    def concatenate(cls, results: List["RecommendationResult"]) -> "RecommendationResult":
+        """
+        Class method for concatenating the results of several job seeker chunks matched against the same jobs.
+
+        Parameters:
+        - results(List[RecommendationResult]): Results to concatenate, in order.
+
+        Returns:
+        - RecommendationResult: Concatenated result.
+        """
+        if not results:
+            raise ValueError("There are no results to concatenate.")
+
+        # Shifting the seeker positions of every chunk by the number of job seekers before it
+        seeker_offsets = np.cumsum([0] + [len(result.jobseekers_df) for result in results[:-1]])
+        return cls(pd.concat([result.jobseekers_df for result in results], ignore_index=True), results[0].jobs_df,
+                   np.concatenate([result.seeker_positions + offset for result, offset in zip(results, seeker_offsets)]),
+                   np.concatenate([result.job_positions for result in results]),
+                   np.concatenate([result.matching_skill_counts for result in results]),
+                   np.concatenate([result.matching_skill_percents for result in results]))
+
+
+
+    def take(self, indices: np.ndarray) -> "RecommendationResult":
+        """
+        Function for selecting recommendations by index, e.g. to reorder them.
+
+        Parameters:
+        - indices(np.ndarray): Indices of the recommendations to select, in the new order.
+
+        Returns:
+        - RecommendationResult: Result with the selected recommendations, sharing the input tables.
+        """
+        return RecommendationResult(self.jobseekers_df, self.jobs_df, self.seeker_positions[indices], self.job_positions[indices],
+                                    self.matching_skill_counts[indices], self.matching_skill_percents[indices])
+
+
+
+    @staticmethod
+    def id_codes(data_set: pd.DataFrame) -> np.ndarray:
+        """
+        Static method for mapping the ids of a table to integer codes in the same order as the ids.
+
+        Parameters:
+        - data_set(pd.DataFrame): Job or job seeker table.
+
+        Returns:
+        - np.ndarray: Code of the id of every row, equal codes for equal ids.
+        """
+        return np.unique(data_set['id'].to_numpy(), return_inverse=True)[1].reshape(-1)
+
+
+
+    def sort(self) -> "RecommendationResult":
+        """
+        Function for sorting the recommendations without building a DataFrame.
+
+        It uses np.lexsort to sort by jobseeker ID in ascending order, matching skill percentage in descending
+        order and job ID in ascending order.
+
+        Returns:
+        - RecommendationResult: Sorted result.
+        """
+        # Mapping the ids to sortable integer codes once per table
+        jobseeker_codes = self.id_codes(self.jobseekers_df)
+        job_codes = self.id_codes(self.jobs_df)
+
+        # Sorting with the last key as the primary key
+        order = np.lexsort((job_codes[self.job_positions], -self.matching_skill_percents, jobseeker_codes[self.seeker_positions]))
+        return self.take(order)
+
+
+
+    def column_values(self) -> Dict[str, list]:
+        """
+        Function for resolving the columns of the recommendations into Python values.
+
+        Returns:
+        - Dict[str, list]: Values of each output column.
+        """
+        return {
+            'jobseeker_id': self.jobseekers_df['id'].to_numpy(dtype=object)[self.seeker_positions].tolist(),
+            'jobseeker_name': self.jobseekers_df['name'].to_numpy(dtype=object)[self.seeker_positions].tolist(),
+            'job_id': self.jobs_df['id'].to_numpy(dtype=object)[self.job_positions].tolist(),
+            'job_title': self.jobs_df['title'].to_numpy(dtype=object)[self.job_positions].tolist(),
+            'matching_skill_count': self.matching_skill_counts.tolist(),
+            # Rounding again to recover the exact 2 decimals percentage from its float32 storage
+            'matching_skill_percent': np.round(self.matching_skill_percents.astype(np.float64), 2).tolist()
+        }
+
+
+
+    def to_records(self) -> List[Dict]:
+        """
+        Function for converting the recommendations into a list of dictionaries.
+
+        Returns:
+        - List[Dict]: Recommendations with the same keys as the sequential processing.
+        """
+        values = self.column_values()
+        return [dict(zip(self.columns, row)) for row in zip(*(values[column] for column in self.columns))]
+
+
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Function for converting the recommendations into a DataFrame.
+
+        Returns:
+        - pd.DataFrame: Recommendations with one column per recommendation key.
+        """
+        return pd.DataFrame(self.column_values(), columns=self.columns)
@@ -0,0 +1,266 @@
+# ABC (Abstract Base Class) and abstractmethod from the abc module
+from abc import ABC, abstractmethod
+# typing module for type hints
+from typing import List, Dict
+# csv module for writing CSV files
+import csv
+# json module for writing JSON Lines files
+import json
+# pyarrow library for writing Parquet files, which is optional
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+class ResultSink(ABC):
+    """
+    An abstract base class for writing recommendations to a file incrementally.
+
+    The recommendations are buffered and written out whenever the buffer holds buffer_size rows, so that
+    the memory used for output stays bounded no matter how many recommendations are generated.
+
+    Attributes:
+    - path_file(str): Path of the output file.
+    - buffer_size(int): Maximum number of recommendations buffered before writing. Default is 10000.
+    - rows_written(int): Number of recommendations written to the file so far.
+    """
+    columns = ['jobseeker_id', 'jobseeker_name', 'job_id', 'job_title', 'matching_skill_count', 'matching_skill_percent']
+
+
+    def __init__(self, path_file: str, buffer_size: int = 10000):
+        """
+        Constructor for class ResultSink.
+
+        Parameters:
+        - path_file(str): Path of the output file.
+        - buffer_size(int): Maximum number of recommendations buffered before writing. Set to 10000 by default.
+        """
+        if not isinstance(buffer_size, int) or buffer_size < 1:
+            raise ValueError("Buffer size should be a positive integer.")
+        self.path_file = path_file
+        self.buffer_size = buffer_size
+        self.rows_written = 0
+        self.buffer = []
+
+
+
+    def __enter__(self) -> "ResultSink":
+        """
+        Function for entering the context of the sink.
+
+        Returns:
+        - ResultSink: The sink itself.
+        """
+        return self
+
+
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Function for closing the sink when leaving its context.
+        """
+        self.close()
+
+
+
+    def write(self, recommendations: List[Dict]) -> None:
+        """
+        Function for adding recommendations to the sink.
+
+        Parameters:
+        - recommendations(List[Dict]): Recommendations to write.
+        """
+        self.buffer.extend(recommendations)
+        # Writing out full buffers only and keeping the remainder buffered
+        rows_full_buffers = len(self.buffer) - len(self.buffer) % self.buffer_size
+        for start in range(0, rows_full_buffers, self.buffer_size):
+            self.write_rows(self.buffer[start:start + self.buffer_size])
+        self.rows_written += rows_full_buffers
+        self.buffer = self.buffer[rows_full_buffers:]
+
+
+
+    def flush(self) -> None:
+        """
+        Function for writing out all buffered recommendations.
+        """
+        if self.buffer:
+            self.write_rows(self.buffer)
+            self.rows_written += len(self.buffer)
+            self.buffer = []
+
+
+
+    def close(self) -> None:
+        """
+        Function for writing out the buffered recommendations and closing the output file.
+        """
+        self.flush()
+        self.close_file()
+
+
+
+    @abstractmethod
+    def write_rows(self, rows: List[Dict]) -> None:
+        """
+        Abstract method for writing a batch of recommendations to the output file.
+
+        Parameters:
+        - rows(List[Dict]): Recommendations to write.
+        """
+        pass
+
+
+
+    @abstractmethod
+    def close_file(self) -> None:
+        """
+        Abstract method for closing the output file.
+        """
+        pass
+
+
+
+class CsvResultSink(ResultSink):
+    """
+    A class for writing recommendations to a CSV file incrementally.
+
+    Attributes:
+    - path_file(str): Path of the output CSV file.
+    - buffer_size(int): Maximum number of recommendations buffered before writing.
+    - rows_written(int): Number of recommendations written to the file so far.
+    """
+
+    def __init__(self, path_file: str, buffer_size: int = 10000):
+        """
+        Constructor for class CsvResultSink.
+
+        It creates the CSV file and writes the header.
+
+        Parameters:
+        - path_file(str): Path of the output CSV file.
+        - buffer_size(int): Maximum number of recommendations buffered before writing. Set to 10000 by default.
+        """
+        super().__init__(path_file, buffer_size)
+        self.file = open(path_file, 'w', newline='')
+        self.writer = csv.DictWriter(self.file, fieldnames=self.columns)
+        self.writer.writeheader()
+
+
+
+    def write_rows(self, rows: List[Dict]) -> None:
+        """
+        Function for writing a batch of recommendations as CSV rows.
+
+        Parameters:
+        - rows(List[Dict]): Recommendations to write.
+        """
+        self.writer.writerows(rows)
+
+
+
+    def close_file(self) -> None:
+        """
+        Function for closing the CSV file.
+        """
+        self.file.close()
+
+
+
+class JsonLinesResultSink(ResultSink):
+    """
+    A class for writing recommendations to a JSON Lines file incrementally, one JSON object per line.
+
+    Attributes:
+    - path_file(str): Path of the output JSON Lines file.
+    - buffer_size(int): Maximum number of recommendations buffered before writing.
+    - rows_written(int): Number of recommendations written to the file so far.
+    """
+
+    def __init__(self, path_file: str, buffer_size: int = 10000):
+        """
+        Constructor for class JsonLinesResultSink.
+
+        Parameters:
+        - path_file(str): Path of the output JSON Lines file.
+        - buffer_size(int): Maximum number of recommendations buffered before writing. Set to 10000 by default.
+        """
+        super().__init__(path_file, buffer_size)
+        self.file = open(path_file, 'w')
+
+
+
+    def write_rows(self, rows: List[Dict]) -> None:
+        """
+        Function for writing a batch of recommendations as JSON lines.
+
+        Parameters:
+        - rows(List[Dict]): Recommendations to write.
+        """
+        self.file.writelines(json.dumps({column: row[column] for column in self.columns}) + "\n" for row in rows)
+
+
+
+    def close_file(self) -> None:
+        """
+        Function for closing the JSON Lines file.
+        """
+        self.file.close()
+
+
+
+class ParquetResultSink(ResultSink):
+    """
+    A class for writing recommendations to a Parquet file incrementally, one row group per buffer.
+
+    It requires the optional pyarrow library.
+
+    Attributes:
+    - path_file(str): Path of the output Parquet file.
+    - buffer_size(int): Maximum number of recommendations buffered before writing.
+    - rows_written(int): Number of recommendations written to the file so far.
+    """
+
+    def __init__(self, path_file: str, buffer_size: int = 10000):
+        """
+        Constructor for class ParquetResultSink.
+
+        Parameters:
+        - path_file(str): Path of the output Parquet file.
+        - buffer_size(int): Maximum number of recommendations buffered before writing. Set to 10000 by default.
+        """
+        if pa is None:
+            raise ImportError("The pyarrow library is required for writing Parquet files. Please install it with 'pip install pyarrow'.")
+        super().__init__(path_file, buffer_size)
+        # Creating the writer lazily, since the schema is inferred from the first batch
+        self.writer = None
+
+
+
+    def write_rows(self, rows: List[Dict]) -> None:
+        """
+        Function for writing a batch of recommendations as a Parquet row group.
+
+        Parameters:
+        - rows(List[Dict]): Recommendations to write.
+        """
+        table = pa.Table.from_pylist(rows).select(self.columns)
+        if self.writer is None:
+            self.writer = pq.ParquetWriter(self.path_file, table.schema)
+        self.writer.write_table(table.cast(self.writer.schema))
+
+
+
+    def close_file(self) -> None:
+        """
+        Function for closing the Parquet file.
+
+        A file without rows is still written when no recommendations were generated.
+        """
+        if self.writer is None:
+            pq.write_table(pa.table({column: pa.array([]) for column in self.columns}), self.path_file)
+        else:
+            self.writer.close()
@@ -0,0 +1,55 @@
+# argparse module for the command line interface
+import argparse
+# custom JobMatchRecommendationEngine class for matching the job seekers of a shard
+from ..jobseeker_recommendation_engine.job_match_recommendation import JobMatchRecommendationEngine
+# custom shard classes for parsing the shard and merging the shard files
+from .shards import ShardSpec, ShardMerger
+
+
+def run_shard(path_file_jobs: str, path_file_jobseeker: str, shard: str, path_output: str, jobseeker_chunk_size: int = 1000,
+              parallel: bool = False, cache_directory: str = None) -> int:
+    """
+    Function for writing the sorted recommendations of one shard, e.g. from its own process or machine.
+
+    Parameters:
+    - path_file_jobs(str): Path to the jobs CSV file.
+    - path_file_jobseeker(str): Path to the job seekers CSV file.
+    - shard(str): Shard to process as 'i/N'.
+    - path_output(str): Path of the shard CSV file.
+    - jobseeker_chunk_size(int): Size of each chunk of job seeker data to process. Set to 1000 rows by default.
+    - parallel(bool): Whether the chunks are matched by a pool of worker processes. Set to False by default.
+    - cache_directory(str): Directory of the parsed file cache, or None to parse the CSV files. Set to None by default.
+
+    Returns:
+    - int: Number of recommendations written.
+    """
+    engine = JobMatchRecommendationEngine(path_file_jobs, path_file_jobseeker)
+    engine.set_cache_directory(cache_directory)
+    return engine.write_shard(ShardSpec.parse(shard), path_output, jobseeker_chunk_size, parallel)
+
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run one shard of the job recommendations or merge the shard files.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="Write the sorted recommendations of the job seekers of one shard.")
+    run_parser.add_argument('--shard', required=True, help="Shard to process as i/N, with i from 0 to N - 1.")
+    run_parser.add_argument('--jobs', default='csv_files/jobs.csv', help="Path to the jobs CSV file.")
+    run_parser.add_argument('--jobseekers', default='csv_files/jobseekers.csv', help="Path to the job seekers CSV file.")
+    run_parser.add_argument('--output', required=True, help="Path of the shard CSV file.")
+    run_parser.add_argument('--chunk-size', type=int, default=1000, help="Number of job seekers matched at once.")
+    run_parser.add_argument('--parallel', action='store_true', help="Match the chunks with a pool of worker processes.")
+    run_parser.add_argument('--cache-directory', default=None, help="Directory of the parsed file cache.")
+
+    merge_parser = subparsers.add_parser('merge', help="Merge sorted shard files into the final order.")
+    merge_parser.add_argument('shard_files', nargs='+', help="Paths of the shard CSV files.")
+    merge_parser.add_argument('--output', required=True, help="Path of the merged CSV file.")
+    arguments = parser.parse_args()
+
+    if arguments.command == 'run':
+        rows_written = run_shard(arguments.jobs, arguments.jobseekers, arguments.shard, arguments.output, arguments.chunk_size,
+                                 arguments.parallel, arguments.cache_directory)
+    else:
+        rows_written = ShardMerger().merge(arguments.shard_files, arguments.output)
+    print(f"{rows_written} recommendations written to {arguments.output}")
@@ -0,0 +1,193 @@
+# typing module for type hints
+from typing import Iterator, List, Tuple
+# csv module for reading and writing the shard files
+import csv
+# heapq module for the k-way merge of the sorted shard files
+import heapq
+# numpy library for numerical arrays
+import numpy as np
+# pandas library for hashing the job seeker ids
+import pandas as pd
+
+
+class ShardSpec:
+    """
+    A class describing one shard of a sharded run.
+
+    Every job seeker id is assigned to a shard by a hash of its text, which is the same in every process and on
+    every machine, unlike the randomized hash of Python strings. All rows with the same job seeker id, and so all of
+    its recommendations, belong to the same shard.
+
+    Attributes:
+    - index(int): Position of the shard, from 0 to count - 1.
+    - count(int): Number of shards of the run.
+    """
+
+    def __init__(self, index: int, count: int):
+        """
+        Constructor for class ShardSpec.
+
+        Parameters:
+        - index(int): Position of the shard, from 0 to count - 1.
+        - count(int): Number of shards of the run.
+        """
+        if not all(isinstance(value, int) and not isinstance(value, bool) for value in (index, count)):
+            raise TypeError("Shard index and count must be integers")
+
+        if count < 1 or not 0 <= index < count:
+            raise ValueError("Shard index should be between 0 and the shard count - 1.")
+        self.index = index
+        self.count = count
+
+
+
+    def __repr__(self) -> str:
+        """
+        Function for representing the shard as in the command line, e.g. 0/4.
+
+        Returns:
+        - str: Index and count of the shard.
+        """
+        return f"{self.index}/{self.count}"
+
+
+
+    @classmethod
+    def parse(cls, text: str) -> "ShardSpec":
+        """
+        Class method for parsing a shard given as 'i/N'.
+
+        Parameters:
+        - text(str): Index and count of the shard separated by a slash.
+
+        Returns:
+        - ShardSpec: Parsed shard.
+        """
+        try:
+            index, count = (int(value) for value in text.split("/"))
+        except ValueError:
+            raise ValueError(f"Shard should be given as i/N, e.g. 0/4, not {text!r}.")
+        return cls(index, count)
+
+
+
+    @staticmethod
+    def shards_of(jobseeker_ids: pd.Series, count: int) -> np.ndarray:
+        """
+        Static method for assigning job seeker ids to shards.
+
+        Parameters:
+        - jobseeker_ids(pd.Series): Job seeker ids.
+        - count(int): Number of shards.
+
+        Returns:
+        - np.ndarray: Shard of every id.
+        """
+        return (pd.util.hash_array(jobseeker_ids.astype(str).to_numpy(dtype=object)) % np.uint64(count)).astype(np.int64)
+
+
+
+    def select(self, jobseekers_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Function for keeping the job seekers of the shard.
+
+        Parameters:
+        - jobseekers_df(pd.DataFrame): Job seekers.
+
+        Returns:
+        - pd.DataFrame: Job seekers whose id belongs to the shard, in their original order.
+        """
+        return jobseekers_df[self.shards_of(jobseekers_df['id'], self.count) == self.index]
+
+
+
+class ShardMerger:
+    """
+    A class for merging sorted shard files into one file in the final order of the recommendations.
+
+    Every shard file is sorted by jobseeker ID in ascending order, matching skill percentage in descending order
+    and job ID in ascending order, like sort_recommendations. The files are read row by row and merged with a
+    heap, so only one row per file is held in memory. The rows are copied as they are, so the merged file is the
+    same as the sorted recommendations of a single run written with CsvResultSink.
+    """
+
+    @staticmethod
+    def sort_value(value: str):
+        """
+        Static method for converting an id of a shard file into a value sorting like the parsed id.
+
+        Parameters:
+        - value(str): Id as written in the file.
+
+        Returns:
+        - Union[int, float, str]: Integer or decimal id, or the text itself if it is not a number.
+        """
+        for number_type in (int, float):
+            try:
+                return number_type(value)
+            except ValueError:
+                pass
+        return value
+
+
+
+    @classmethod
+    def sort_key(cls, row: List[str]) -> Tuple:
+        """
+        Class method for getting the sort key of a row of a shard file.
+
+        Parameters:
+        - row(List[str]): Jobseeker id, jobseeker name, job id, job title, matching skill count and percentage.
+
+        Returns:
+        - Tuple: Jobseeker id, negated matching skill percentage and job id.
+        """
+        return cls.sort_value(row[0]), -float(row[5]), cls.sort_value(row[2])
+
+
+
+    @staticmethod
+    def read_rows(path_file: str) -> Iterator[List[str]]:
+        """
+        Static method for reading the rows of a shard file after its header.
+
+        Parameters:
+        - path_file(str): Path of the shard file.
+
+        Returns:
+        - Iterator[List[str]]: Rows of the file.
+        """
+        with open(path_file, newline='') as file:
+            reader = csv.reader(file)
+            next(reader, None)
+            yield from reader
+
+
+
+    def merge(self, paths_shard_files: List[str], path_output: str) -> int:
+        """
+        Function for merging sorted shard files into one sorted CSV file.
+
+        Parameters:
+        - paths_shard_files(List[str]): Paths of the shard files, e.g. written by write_shard.
+        - path_output(str): Path of the merged CSV file.
+
+        Returns:
+        - int: Number of rows written.
+        """
+        try:
+            with open(path_output, 'w', newline='') as file:
+                writer = csv.writer(file)
+                # Taking the header of the first shard file, which all of them share
+                with open(paths_shard_files[0], newline='') as shard_file:
+                    writer.writerow(next(csv.reader(shard_file)))
+
+                rows_written = 0
+                for row in heapq.merge(*(self.read_rows(path_file) for path_file in paths_shard_files), key=self.sort_key):
+                    writer.writerow(row)
+                    rows_written += 1
+            return rows_written
+
+        except (OSError, IndexError, StopIteration) as ex:
+            # Handling missing or empty shard files
+            raise ValueError(f"An error occurred while merging the shard files: {ex}")
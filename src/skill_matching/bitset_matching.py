@@ -0,0 +1,155 @@
+# typing module for type hints
+from typing import Tuple
+# numpy library for numerical arrays
+import numpy as np
+# custom SkillMatrix class for the skill incidence matrices
+from .skill_vocabulary import SkillMatrix
+# custom MatchingBackend class for inheritance
+from .matching_backend import MatchingBackend
+
+
+class BitsetMatchingBackend(MatchingBackend):
+    """
+    A class for calculating matching skill counts with packed skill bitmasks.
+
+    The skills of every job seeker and job are encoded as a fixed-width bitmask over the skill vocabulary,
+    stored as packed uint64 words. The matching skill count of a pair is the popcount of the AND of their
+    bitmasks, which is calculated for cache-sized blocks of job seekers and jobs at once. Its cost grows with the
+    vocabulary size instead of the number of matches, so it is the fastest and most memory efficient backend when 
+    the vocabulary is small and the matches are dense, e.g. up to one 64-bit word per bitmask.
+
+    Attributes:
+    - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+    - number_words(int): Number of uint64 words of each bitmask.
+    - job_bitsets(np.ndarray): Packed bitmasks of the jobs of shape (number of jobs, number_words).
+    """
+    word_bits = 64
+    job_block_size = 1024
+    max_block_words = 1 << 16
+    max_slab_counts = 1 << 22
+
+
+    def __init__(self, job_matrix: SkillMatrix):
+        """
+        Constructor for class BitsetMatchingBackend.
+
+        Parameters:
+        - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+        """
+        super().__init__(job_matrix)
+        self.number_words = max(1, -(-job_matrix.matrix.shape[1] // self.word_bits))
+        self.job_bitsets = self.encode_bitsets(job_matrix)
+
+
+
+    def encode_bitsets(self, skill_matrix: SkillMatrix) -> np.ndarray:
+        """
+        Function for packing the rows of a skill incidence matrix into uint64 bitmasks.
+
+        Skills outside the vocabulary of the jobs are left out, since they cannot match any job.
+
+        Parameters:
+        - skill_matrix(SkillMatrix): Skill incidence matrix to encode.
+
+        Returns:
+        - np.ndarray: Packed bitmasks of shape (number of rows, number_words).
+        """
+        matrix = skill_matrix.matrix
+        # Expanding the row of every non-zero entry and keeping the skills known to the jobs
+        rows = np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr))
+        skill_ids = matrix.indices.astype(np.int64)
+        known = skill_ids < self.job_matrix.matrix.shape[1]
+        rows, skill_ids = rows[known], skill_ids[known]
+
+        # Setting the bit of every skill in the word it belongs to
+        bitsets = np.zeros((matrix.shape[0], self.number_words), dtype=np.uint64)
+        bits = np.left_shift(np.uint64(1), (skill_ids % self.word_bits).astype(np.uint64))
+        np.bitwise_or.at(bitsets, (rows, skill_ids // self.word_bits), bits)
+        return bitsets
+
+
+
+    @staticmethod
+    def popcount(words: np.ndarray, buffer: np.ndarray) -> np.ndarray:
+        """
+        Static method for counting the set bits of packed bitmasks along the last axis.
+
+        The words are overwritten. The native popcount is used when numpy provides it, and a
+        branch-free SWAR popcount computed in place otherwise.
+
+        Parameters:
+        - words(np.ndarray): Packed uint64 bitmasks.
+        - buffer(np.ndarray): Scratch array of the same shape as words.
+
+        Returns:
+        - np.ndarray: Number of set bits of each bitmask.
+        """
+        if hasattr(np, "bitwise_count"):
+            # Using the native popcount
+            words = np.bitwise_count(words)
+        else:
+            # Summing the bits pairwise, then per 4 bits and per byte, and adding up the bytes with a multiplication
+            np.right_shift(words, np.uint64(1), out=buffer)
+            buffer &= np.uint64(0x5555555555555555)
+            words -= buffer
+            np.right_shift(words, np.uint64(2), out=buffer)
+            buffer &= np.uint64(0x3333333333333333)
+            words &= np.uint64(0x3333333333333333)
+            words += buffer
+            np.right_shift(words, np.uint64(4), out=buffer)
+            words += buffer
+            words &= np.uint64(0x0f0f0f0f0f0f0f0f)
+            words *= np.uint64(0x0101010101010101)
+            words >>= np.uint64(56)
+
+        # Adding up the counts of the words of each bitmask
+        if words.shape[-1] == 1:
+            return words[..., 0]
+        return words.sum(axis=-1, dtype=np.uint16)
+
+
+
+    def match_block(self, seeker_matrix: SkillMatrix) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Function for finding all job seeker and job pairs with at least one matching skill.
+
+        Parameters:
+        - seeker_matrix(SkillMatrix): Skill incidence matrix of a block of job seekers.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray, np.ndarray]: Job seeker positions, job positions and matching skill counts.
+        """
+        seeker_bitsets = self.encode_bitsets(seeker_matrix)
+        number_seekers, number_jobs = len(seeker_bitsets), len(self.job_bitsets)
+
+        # Bounding the size of the AND of a job seeker block with a job block so that it stays in the CPU cache
+        seeker_block_size = max(1, self.max_block_words // (self.job_block_size * self.number_words))
+        words_buffer = np.empty((seeker_block_size, self.job_block_size, self.number_words), dtype=np.uint64)
+        scratch_buffer = np.empty_like(words_buffer)
+        # Bounding the dense count matrix of a slab of job seekers against all jobs
+        slab_size = max(seeker_block_size, self.max_slab_counts // max(1, number_jobs))
+
+        seeker_positions, job_positions, matching_skill_counts = [], [], []
+        for slab_start in range(0, number_seekers, slab_size):
+            slab = seeker_bitsets[slab_start:slab_start + slab_size]
+            slab_counts = np.zeros((len(slab), number_jobs), dtype=np.uint16)
+
+            # Calculating the popcount of the AND of every job seeker and job of the blocks
+            for seeker_start in range(0, len(slab), seeker_block_size):
+                seeker_block = slab[seeker_start:seeker_start + seeker_block_size]
+                for job_start in range(0, number_jobs, self.job_block_size):
+                    job_block = self.job_bitsets[job_start:job_start + self.job_block_size]
+                    block_words = words_buffer[:len(seeker_block), :len(job_block)]
+                    np.bitwise_and(seeker_block[:, None, :], job_block[None, :, :], out=block_words)
+                    slab_counts[seeker_start:seeker_start + len(seeker_block), job_start:job_start + len(job_block)] = \
+                        self.popcount(block_words, scratch_buffer[:len(seeker_block), :len(job_block)])
+
+            # Keeping the pairs with at least one matching skill, ordered by job seeker and job
+            slab_seekers, slab_jobs = np.nonzero(slab_counts)
+            seeker_positions.append(slab_seekers + slab_start)
+            job_positions.append(slab_jobs)
+            matching_skill_counts.append(slab_counts[slab_seekers, slab_jobs].astype(np.int32))
+
+        if not seeker_positions:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64), np.array([], dtype=np.int32)
+        return np.concatenate(seeker_positions), np.concatenate(job_positions), np.concatenate(matching_skill_counts)
@@ -0,0 +1,213 @@
+# typing module for type hints
+from typing import Tuple
+# numpy library for numerical arrays
+import numpy as np
+# pandas library for data manipulation and analysis
+import pandas as pd
+# sparse module from scipy for sparse matrices
+from scipy import sparse
+# custom skill vocabulary and incidence matrix classes
+from .skill_vocabulary import SkillVocabulary, SkillMatrix
+# custom MatchingBackend class for inheritance
+from .matching_backend import MatchingBackend
+
+
+class SkillInvertedIndex:
+    """
+    A class representing an inverted index from skill tokens to the jobs requiring them.
+
+    The index is built once from the jobs data and can be saved to and loaded from disk, so that
+    candidate generation does not need to scan the whole jobs catalog for every job seeker.
+
+    Attributes:
+    - vocabulary(SkillVocabulary): Vocabulary mapping skill tokens to the ids used by the postings.
+    - postings(sparse.csr_matrix): Skill × job matrix whose row i holds the sorted positions of the jobs requiring skill i.
+    - job_labels(np.ndarray): Index label of each job position in the data frame the index was built from.
+    """
+
+    def __init__(self, vocabulary: SkillVocabulary, postings: sparse.csr_matrix, job_labels: np.ndarray):
+        """
+        Constructor for class SkillInvertedIndex.
+
+        Parameters:
+        - vocabulary(SkillVocabulary): Vocabulary mapping skill tokens to the ids used by the postings.
+        - postings(sparse.csr_matrix): Skill × job posting lists.
+        - job_labels(np.ndarray): Index label of each job position.
+        """
+        self.vocabulary = vocabulary
+        self.postings = postings
+        self.job_labels = job_labels
+
+
+
+    def __len__(self) -> int:
+        """
+        Function for getting the number of indexed jobs.
+
+        Returns:
+        - int: Number of jobs.
+        """
+        return self.postings.shape[1]
+
+
+
+    @classmethod
+    def from_jobs(cls, jobs_df: pd.DataFrame, skills_column: str = 'required_skills') -> "SkillInvertedIndex":
+        """
+        Class method for building the inverted index from a jobs data frame.
+
+        Parameters:
+        - jobs_df(pd.DataFrame): Cleansed jobs data.
+        - skills_column(str): Column containing the required skills. Set to 'required_skills' by default.
+
+        Returns:
+        - SkillInvertedIndex: Inverted index of the jobs.
+        """
+        vocabulary = SkillVocabulary()
+        job_matrix = SkillMatrix.from_skills(jobs_df[skills_column], vocabulary)
+        return cls(vocabulary, job_matrix.matrix.T.tocsr(), jobs_df.index.to_numpy())
+
+
+
+    def candidate_jobs(self, skills: str, minimum_overlap: int = 1) -> np.ndarray:
+        """
+        Function for finding the jobs sharing at least one skill with a skills string.
+
+        With a minimum overlap t above 1, only the postings of the k - t + 1 rarest of the k known skills are merged,
+        since a job sharing none of them cannot share t skills (prefix filter).
+
+        Parameters:
+        - skills(str): Comma separated skills of a job seeker.
+        - minimum_overlap(int): Smallest number of shared skills of a job to be a candidate. Set to 1 by default.
+
+        Returns:
+        - np.ndarray: Sorted positions of the candidate jobs, i.e. the union of the postings of the skills.
+        """
+        return self.candidate_positions(self.vocabulary.lookup_skills(skills), minimum_overlap)
+
+
+
+    def candidate_positions(self, skill_ids: np.ndarray, minimum_overlap: int = 1) -> np.ndarray:
+        """
+        Function for finding the jobs sharing at least one skill with already encoded skills.
+
+        Parameters:
+        - skill_ids(np.ndarray): Sorted ids of the unique skills, all known to the vocabulary of the index.
+        - minimum_overlap(int): Smallest number of shared skills of a job to be a candidate. Set to 1 by default.
+
+        Returns:
+        - np.ndarray: Sorted positions of the candidate jobs, i.e. the union of the postings of the skills.
+        """
+        prefix_length = len(skill_ids) - minimum_overlap + 1
+        if len(skill_ids) == 0 or prefix_length <= 0:
+            return np.array([], dtype=np.int32)
+        if prefix_length < len(skill_ids):
+            # Keeping the skills with the shortest postings, ties broken by skill id
+            posting_lengths = self.postings.indptr[skill_ids + 1] - self.postings.indptr[skill_ids]
+            skill_ids = skill_ids[np.lexsort((skill_ids, posting_lengths))[:prefix_length]]
+        return np.unique(np.concatenate([self.postings.indices[self.postings.indptr[skill_id]:self.postings.indptr[skill_id + 1]] for skill_id in skill_ids]))
+
+
+
+    def save(self, path_file: str) -> None:
+        """
+        Function for saving the inverted index to disk.
+
+        Parameters:
+        - path_file(str): Path of the .npz file to write.
+        """
+        try:
+            # Storing the skill tokens in the order of their ids
+            skills = np.array(sorted(self.vocabulary.skill_ids, key=self.vocabulary.skill_ids.get), dtype=str)
+            np.savez(path_file, skills=skills, indptr=self.postings.indptr, indices=self.postings.indices,
+                     shape=np.array(self.postings.shape), job_labels=self.job_labels)
+
+        except Exception as ex:
+            # Handling unexpected errors
+            raise ValueError(f"An unexpected error occurred while saving the inverted index: {str(ex)}")
+
+
+
+    @classmethod
+    def load(cls, path_file: str) -> "SkillInvertedIndex":
+        """
+        Class method for loading an inverted index saved with save.
+
+        Parameters:
+        - path_file(str): Path of the .npz file to read.
+
+        Returns:
+        - SkillInvertedIndex: Loaded inverted index.
+        """
+        try:
+            with np.load(path_file, allow_pickle=False) as stored_index:
+                # Rebuilding the vocabulary from the skill tokens ordered by id
+                vocabulary = SkillVocabulary()
+                vocabulary.skill_ids = {skill: skill_id for skill_id, skill in enumerate(stored_index['skills'].tolist())}
+                postings = sparse.csr_matrix((np.ones(len(stored_index['indices']), dtype=np.int32), stored_index['indices'], stored_index['indptr']),
+                                             shape=tuple(stored_index['shape']))
+                return cls(vocabulary, postings, stored_index['job_labels'])
+
+        except FileNotFoundError as er:
+            # Handling FileNotFoundError
+            raise ValueError(f"Error: {er.strerror}. Please ensure the inverted index file exists.")
+
+        except Exception as ex:
+            # Handling other unexpected errors
+            raise ValueError(f"An unexpected error occurred while loading the inverted index: {str(ex)}")
+
+
+
+class InvertedIndexMatchingBackend(MatchingBackend):
+    """
+    A class for calculating matching skill counts by merging the posting lists of the job seekers' skills.
+
+    Every job in the posting list of a skill of a job seeker shares that skill, so counting how often each job
+    occurs in the concatenated posting lists gives the matching skill count. Jobs without any shared skill
+    are never touched.
+
+    Attributes:
+    - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+    - postings(sparse.csr_matrix): Skill × job posting lists.
+    """
+
+    def __init__(self, job_matrix: SkillMatrix):
+        """
+        Constructor for class InvertedIndexMatchingBackend.
+
+        Parameters:
+        - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+        """
+        super().__init__(job_matrix)
+        self.postings = job_matrix.matrix.T.tocsr()
+
+
+
+    def match_block(self, seeker_matrix: SkillMatrix) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Function for finding all job seeker and job pairs with at least one matching skill.
+
+        Parameters:
+        - seeker_matrix(SkillMatrix): Skill incidence matrix of a block of job seekers.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray, np.ndarray]: Job seeker positions, job positions and matching skill counts.
+        """
+        # Aligning the vocabulary size of the job seekers with the jobs
+        seeker_matrix = seeker_matrix.with_vocabulary_size(self.postings.shape[0]).matrix
+        number_jobs = self.postings.shape[1]
+
+        # Locating the posting list of every (job seeker, skill) entry
+        posting_starts = self.postings.indptr[seeker_matrix.indices]
+        posting_lengths = self.postings.indptr[seeker_matrix.indices + 1] - posting_starts
+        total_postings = int(posting_lengths.sum())
+
+        # Concatenating the posting lists together with the job seeker they belong to
+        entry_seekers = np.repeat(np.arange(seeker_matrix.shape[0], dtype=np.int64), np.diff(seeker_matrix.indptr))
+        posting_seekers = np.repeat(entry_seekers, posting_lengths)
+        posting_offsets = np.arange(total_postings, dtype=np.int64) - np.repeat(np.cumsum(posting_lengths) - posting_lengths, posting_lengths)
+        posting_jobs = self.postings.indices[np.repeat(posting_starts, posting_lengths) + posting_offsets]
+
+        # Counting the occurrences of every (job seeker, job) pair, which come out sorted by job seeker and job
+        pair_keys, matching_skill_counts = np.unique(posting_seekers * number_jobs + posting_jobs, return_counts=True)
+        return pair_keys // number_jobs, pair_keys % number_jobs, matching_skill_counts.astype(np.int32)
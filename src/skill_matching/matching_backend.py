@@ -0,0 +1,93 @@
+# ABC (Abstract Base Class) and abstractmethod from the abc module
+from abc import ABC, abstractmethod
+# typing module for type hints
+from typing import Tuple
+# numpy library for numerical arrays
+import numpy as np
+# custom SkillMatrix class for the skill incidence matrices
+from .skill_vocabulary import SkillMatrix
+
+
+class MatchingBackend(ABC):
+    """
+    An abstract base class for matching backends that calculate the matching skill counts
+    between job seekers and jobs in bulk.
+
+    Attributes:
+    - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+    """
+
+    def __init__(self, job_matrix: SkillMatrix):
+        """
+        Constructor for class MatchingBackend.
+
+        Parameters:
+        - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+        """
+        self.job_matrix = job_matrix
+
+
+
+    @abstractmethod
+    def match_block(self, seeker_matrix: SkillMatrix) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Abstract method for finding all job seeker and job pairs with at least one matching skill.
+
+        Parameters:
+        - seeker_matrix(SkillMatrix): Skill incidence matrix of a block of job seekers.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray, np.ndarray]: Job seeker positions, job positions and matching skill
+                                                     counts of the matched pairs, ordered by job seeker position
+                                                     and then by job position.
+        """
+        pass
+
+
+
+class SparseMatchingBackend(MatchingBackend):
+    """
+    A class for calculating matching skill counts with a single sparse matrix product.
+
+    The product of the job seeker × skill and skill × job incidence matrices gives the size of the
+    skill intersection of every pair, and only the non-zero entries are ever materialized.
+
+    Attributes:
+    - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+    - skill_job_matrix(sparse.csr_matrix): Transposed job incidence matrix (skill × job).
+    """
+
+    def __init__(self, job_matrix: SkillMatrix):
+        """
+        Constructor for class SparseMatchingBackend.
+
+        Parameters:
+        - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+        """
+        super().__init__(job_matrix)
+        # Transposing once so that every block product reuses the same skill × job matrix
+        self.skill_job_matrix = job_matrix.matrix.T.tocsr()
+
+
+
+    def match_block(self, seeker_matrix: SkillMatrix) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Function for finding all job seeker and job pairs with at least one matching skill.
+
+        Parameters:
+        - seeker_matrix(SkillMatrix): Skill incidence matrix of a block of job seekers.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray, np.ndarray]: Job seeker positions, job positions and matching skill counts.
+        """
+        # Aligning the vocabulary size of the job seekers with the jobs
+        seeker_matrix = seeker_matrix.with_vocabulary_size(self.skill_job_matrix.shape[0])
+
+        # Calculating all intersection counts of the block with one sparse product
+        product = (seeker_matrix.matrix @ self.skill_job_matrix).tocsr()
+        product.eliminate_zeros()
+        product.sort_indices()
+
+        # Expanding the row pointer into the job seeker position of every matched pair
+        seeker_positions = np.repeat(np.arange(product.shape[0]), np.diff(product.indptr))
+        return seeker_positions, product.indices.copy(), product.data.copy()
@@ -0,0 +1,152 @@
+# typing module for type hints
+from typing import Tuple
+# numpy library for numerical arrays
+import numpy as np
+# scipy library for sparse matrices
+from scipy import sparse
+# custom SkillMatrix class for the skill incidence matrices
+from .skill_vocabulary import SkillMatrix
+# custom MatchingBackend class for inheritance
+from .matching_backend import MatchingBackend
+
+
+class MinHashLshMatchingBackend(MatchingBackend):
+    """
+    A class for finding approximately the job seeker and job pairs with a high skill overlap, with MinHash and locality sensitive hashing.
+
+    Every skill set is summarized by a MinHash signature of bands × rows_per_band values, the smallest hash of its
+    skill ids under each of as many random hash functions. Two skill sets agree on a value with a probability equal
+    to their Jaccard similarity J. The signature is cut into bands, and a job is a candidate of a job seeker when
+    they agree on all values of at least one band, which happens with a probability of 1 - (1 - J^rows_per_band)^bands.
+    More bands find more of the pairs with a low similarity at the cost of more candidates, more rows per band find
+    fewer of them. The candidates are then scored exactly, so the matching skill counts of the returned pairs are
+    the same as the ones of the exact backends, but pairs which never share a band are missed.
+
+    Attributes:
+    - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+    - bands(int): Number of bands of the signatures.
+    - rows_per_band(int): Number of signature values per band.
+    - seed(int): Seed of the random hash functions.
+    - band_keys(np.ndarray): Sorted hash of every band of every job with at least one skill, one row per band.
+    - band_jobs(np.ndarray): Job position of every sorted band hash, one row per band.
+    - candidate_pairs(int): Number of candidate pairs scored so far.
+    """
+    prime = np.int64(2**31 - 1)
+    rows_per_signature_block = 10000
+
+
+    def __init__(self, job_matrix: SkillMatrix, bands: int = 16, rows_per_band: int = 2, seed: int = 0):
+        """
+        Constructor for class MinHashLshMatchingBackend.
+
+        Parameters:
+        - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+        - bands(int): Number of bands of the signatures. Set to 16 by default.
+        - rows_per_band(int): Number of signature values per band. Set to 2 by default.
+        - seed(int): Seed of the random hash functions. Set to 0 by default.
+        """
+        super().__init__(job_matrix)
+        if bands < 1 or rows_per_band < 1:
+            raise ValueError("Bands and rows per band should be at least 1.")
+        self.bands = bands
+        self.rows_per_band = rows_per_band
+        self.seed = seed
+        self.candidate_pairs = 0
+
+        # Drawing the hash functions (a * skill + b) mod p with a prime p above every skill id
+        random_generator = np.random.default_rng(seed)
+        self.hash_factors = random_generator.integers(1, self.prime, size=bands * rows_per_band, dtype=np.int64)
+        self.hash_offsets = random_generator.integers(0, self.prime, size=bands * rows_per_band, dtype=np.int64)
+
+        # Sorting the band hashes of the jobs, so that the jobs sharing a band with a job seeker are found by binary search
+        job_positions, job_keys = self.band_hashes(job_matrix.matrix)
+        band_order = np.argsort(job_keys, axis=1, kind='stable')
+        self.band_keys = np.take_along_axis(job_keys, band_order, axis=1)
+        self.band_jobs = job_positions.astype(np.int32 if len(job_matrix) < 2**31 else np.int64)[band_order]
+
+
+
+    def signatures(self, matrix: sparse.csr_matrix) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Function for calculating the MinHash signatures of the rows with at least one skill.
+
+        Parameters:
+        - matrix(sparse.csr_matrix): Skill incidence matrix.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: Positions of the rows with at least one skill and their signatures,
+                                         one row of bands × rows_per_band values per position.
+        """
+        positions = np.flatnonzero(np.diff(matrix.indptr))
+        signatures = np.empty((len(positions), len(self.hash_factors)), dtype=np.int64)
+
+        # Hashing the skills of a block of rows at a time, keeping the smallest hash of every row
+        for start in range(0, len(positions), self.rows_per_signature_block):
+            block_positions = positions[start:start + self.rows_per_signature_block]
+            entry_starts, entry_stops = matrix.indptr[block_positions], matrix.indptr[block_positions[-1] + 1]
+            skills = matrix.indices[entry_starts[0]:entry_stops].astype(np.int64)
+            hashes = (skills[:, None] * self.hash_factors + self.hash_offsets) % self.prime
+            signatures[start:start + len(block_positions)] = np.minimum.reduceat(hashes, entry_starts - entry_starts[0], axis=0)
+        return positions, signatures
+
+
+
+    def band_hashes(self, matrix: sparse.csr_matrix) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Function for hashing every band of the signatures of the rows into a single value.
+
+        Two rows agreeing on all values of a band get the same hash. Distinct bands may rarely share a hash too,
+        which only adds candidates.
+
+        Parameters:
+        - matrix(sparse.csr_matrix): Skill incidence matrix.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: Positions of the rows with at least one skill and the hashes of their
+                                         bands, one row per band and one column per position.
+        """
+        positions, signatures = self.signatures(matrix)
+        band_values = signatures.astype(np.uint64).T.reshape(self.bands, self.rows_per_band, len(positions))
+        band_keys = np.zeros((self.bands, len(positions)), dtype=np.uint64)
+        # Combining the values of every band with a multiplicative hash, wrapping around at 64 bits
+        for row in range(self.rows_per_band):
+            band_keys = band_keys * np.uint64(0x9E3779B97F4A7C15) + band_values[:, row]
+        return positions, band_keys
+
+
+
+    def match_block(self, seeker_matrix: SkillMatrix) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Function for finding the job seeker and job pairs sharing at least one band, with their exact matching skill counts.
+
+        Parameters:
+        - seeker_matrix(SkillMatrix): Skill incidence matrix of a block of job seekers.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray, np.ndarray]: Job seeker positions, job positions and matching skill
+                                                     counts of the candidate pairs with at least one matching
+                                                     skill, ordered by job seeker position and then by job position.
+        """
+        seeker_matrix = seeker_matrix.with_vocabulary_size(self.job_matrix.matrix.shape[1]).matrix
+        number_jobs = np.int64(len(self.job_matrix))
+        seeker_positions, seeker_keys = self.band_hashes(seeker_matrix)
+
+        # Looking up the range of jobs with the same hash in every band
+        pair_keys = []
+        for band in range(self.bands):
+            range_starts = np.searchsorted(self.band_keys[band], seeker_keys[band], side='left')
+            range_lengths = np.searchsorted(self.band_keys[band], seeker_keys[band], side='right') - range_starts
+            total_jobs = int(range_lengths.sum())
+            range_offsets = np.arange(total_jobs, dtype=np.int64) - np.repeat(np.cumsum(range_lengths) - range_lengths, range_lengths)
+            band_jobs = self.band_jobs[band][np.repeat(range_starts, range_lengths) + range_offsets]
+            pair_keys.append(np.repeat(seeker_positions, range_lengths) * number_jobs + band_jobs)
+
+        # Merging the candidates of all bands into distinct pairs
+        pair_keys = np.unique(np.concatenate(pair_keys)) if pair_keys else np.empty(0, dtype=np.int64)
+        seeker_positions, job_positions = pair_keys // number_jobs, pair_keys % number_jobs
+        self.candidate_pairs += len(seeker_positions)
+
+        # Scoring the candidates exactly, dropping the rare ones which only shared a colliding band hash
+        matching_skill_counts = np.asarray(seeker_matrix[seeker_positions].multiply(self.job_matrix.matrix[job_positions]).sum(axis=1)).reshape(-1).astype(np.int32)
+        matched = matching_skill_counts > 0
+        return seeker_positions[matched], job_positions[matched], matching_skill_counts[matched]
@@ -0,0 +1,120 @@
+# typing module for type hints
+from typing import Tuple
+# numpy library for numerical arrays
+import numpy as np
+# custom SkillMatrix class for the skill incidence matrices
+from .skill_vocabulary import SkillMatrix
+# custom MatchingBackend class for inheritance
+from .matching_backend import MatchingBackend
+# custom scoring kernel classes for the smallest matching skill count of a minimum score
+from .scoring_kernels import ScoringKernel, OverlapPercentKernel
+
+
+class PrefixFilterMatchingBackend(MatchingBackend):
+    """
+    A class for finding only the job seeker and job pairs which can reach a minimum match, with prefix and length filtering.
+
+    The skills are ordered by their number of jobs, from the rarest to the most common. A job seeker needing at
+    least t matching skills out of its k known skills can only reach t with a job sharing one of its k - t + 1
+    rarest skills, since the other t - 1 skills alone are not enough (prefix filter), and only with a job requiring
+    at least t skills (length filter). The candidates are therefore generated from the short posting lists of the
+    rare skills of the prefix only, and their matching skill counts are verified on all skills afterwards, keeping
+    the pairs with at least t. The result holds every pair reaching the minimum, so filtering the scored pairs gives
+    the same recommendations as filtering the scored pairs of any other backend, in the style of AllPairs and PPJoin.
+
+    Attributes:
+    - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+    - postings(sparse.csr_matrix): Skill × job posting lists.
+    - skill_ranks(np.ndarray): Position of every skill ordered from the rarest to the most common.
+    - min_match_count(int): Smallest matching skill count of a pair.
+    - min_match_percent(float): Smallest score of a pair.
+    - scoring_kernel(ScoringKernel): Kernel whose score is bounded by min_match_percent.
+    - candidate_pairs(int): Number of candidate pairs verified so far.
+    """
+
+    def __init__(self, job_matrix: SkillMatrix, min_match_count: int = 1, min_match_percent: float = 0.0, scoring_kernel: ScoringKernel = None):
+        """
+        Constructor for class PrefixFilterMatchingBackend.
+
+        Parameters:
+        - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+        - min_match_count(int): Smallest matching skill count of a pair. Set to 1 by default.
+        - min_match_percent(float): Smallest score of a pair. Set to 0 by default.
+        - scoring_kernel(ScoringKernel): Kernel whose score is bounded by min_match_percent, or None for the 
+                                         overlap_percent kernel. Set to None by default.
+        """
+        super().__init__(job_matrix)
+        self.postings = job_matrix.matrix.T.tocsr()
+        self.postings.sort_indices()
+        self.min_match_count = min_match_count
+        self.min_match_percent = min_match_percent
+        self.scoring_kernel = scoring_kernel if scoring_kernel is not None else OverlapPercentKernel()
+        self.candidate_pairs = 0
+
+        # Ordering the skills by their number of jobs, with ties broken by skill id
+        skill_order = np.lexsort((np.arange(self.postings.shape[0]), np.diff(self.postings.indptr)))
+        self.skill_ranks = np.empty(len(skill_order), dtype=np.int64)
+        self.skill_ranks[skill_order] = np.arange(len(skill_order))
+
+
+
+    def minimum_overlaps(self, skill_counts: np.ndarray) -> np.ndarray:
+        """
+        Function for calculating the smallest matching skill count every job seeker needs for the minimum match.
+
+        Parameters:
+        - skill_counts(np.ndarray): Number of unique skills of each job seeker.
+
+        Returns:
+        - np.ndarray: Smallest matching skill count of each job seeker.
+        """
+        return np.maximum(self.scoring_kernel.minimum_overlaps(skill_counts, self.min_match_percent), self.min_match_count)
+
+
+
+    def match_block(self, seeker_matrix: SkillMatrix) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Function for finding the job seeker and job pairs which can reach the minimum match.
+
+        Parameters:
+        - seeker_matrix(SkillMatrix): Skill incidence matrix of a block of job seekers.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray, np.ndarray]: Job seeker positions, job positions and matching skill
+                                                     counts of the pairs with at least the smallest matching skill
+                                                     count of their job seeker, ordered by job seeker position
+                                                     and then by job position.
+        """
+        minimum_overlaps = self.minimum_overlaps(seeker_matrix.skill_counts)
+        seeker_matrix = seeker_matrix.with_vocabulary_size(self.postings.shape[0]).matrix
+        number_jobs = np.int64(self.postings.shape[1])
+
+        # Ordering the skills of every job seeker from the rarest to the most common
+        known_skill_counts = np.diff(seeker_matrix.indptr)
+        entry_seekers = np.repeat(np.arange(seeker_matrix.shape[0], dtype=np.int64), known_skill_counts)
+        entry_order = np.lexsort((self.skill_ranks[seeker_matrix.indices], entry_seekers))
+
+        # Keeping the k - t + 1 rarest skills of every job seeker, none if it has fewer than t known skills
+        prefix_lengths = np.maximum(known_skill_counts - minimum_overlaps + 1, 0)
+        entry_ranks = np.arange(len(entry_order)) - np.repeat(seeker_matrix.indptr[:-1], known_skill_counts)
+        in_prefix = entry_ranks < np.repeat(prefix_lengths, known_skill_counts)
+        prefix_seekers, prefix_skills = entry_seekers[entry_order][in_prefix], seeker_matrix.indices[entry_order][in_prefix]
+
+        # Concatenating the posting lists of the prefix skills into the distinct candidate pairs
+        posting_starts = self.postings.indptr[prefix_skills]
+        posting_lengths = self.postings.indptr[prefix_skills + 1] - posting_starts
+        total_postings = int(posting_lengths.sum())
+        posting_offsets = np.arange(total_postings, dtype=np.int64) - np.repeat(np.cumsum(posting_lengths) - posting_lengths, posting_lengths)
+        posting_jobs = self.postings.indices[np.repeat(posting_starts, posting_lengths) + posting_offsets]
+        pair_keys = np.unique(np.repeat(prefix_seekers, posting_lengths) * number_jobs + posting_jobs)
+        seeker_positions, job_positions = pair_keys // number_jobs, pair_keys % number_jobs
+
+        # Dropping the jobs with fewer skills than the job seeker needs to match
+        long_enough = self.job_matrix.skill_counts[job_positions] >= minimum_overlaps[seeker_positions]
+        seeker_positions, job_positions = seeker_positions[long_enough], job_positions[long_enough]
+        self.candidate_pairs += len(seeker_positions)
+
+        # Verifying the matching skill counts of the candidates on all skills
+        matching_skill_counts = np.asarray(seeker_matrix[seeker_positions].multiply(self.job_matrix.matrix[job_positions]).sum(axis=1)).reshape(-1).astype(np.int32)
+        reached = matching_skill_counts >= minimum_overlaps[seeker_positions]
+        return seeker_positions[reached], job_positions[reached], matching_skill_counts[reached]
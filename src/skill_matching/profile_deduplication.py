@@ -0,0 +1,182 @@
+# typing module for type hints
+from typing import Tuple
+# numpy library for numerical arrays
+import numpy as np
+# custom SkillMatrix class for the skill incidence matrices
+from .skill_vocabulary import SkillMatrix
+# custom MatchingBackend class for inheritance
+from .matching_backend import MatchingBackend
+
+
+class SkillProfiles:
+    """
+    A class grouping the rows of a skill incidence matrix by their canonical skill set.
+
+    Two rows belong to the same profile when they hold exactly the same skill ids, so they match every other
+    row with the same matching skill count and only one of them has to be scored.
+
+    Attributes:
+    - skill_matrix(SkillMatrix): Incidence matrix of the grouped rows.
+    - profile_matrix(SkillMatrix): Incidence matrix with one row per profile, in order of first appearance.
+    - row_profiles(np.ndarray): Profile of every row.
+    - member_indptr(np.ndarray): Pointer into member_rows for every profile.
+    - member_rows(np.ndarray): Row positions of the members of every profile, in ascending order per profile.
+    """
+
+    def __init__(self, skill_matrix: SkillMatrix, profile_matrix: SkillMatrix, row_profiles: np.ndarray):
+        """
+        Constructor for class SkillProfiles.
+
+        Parameters:
+        - skill_matrix(SkillMatrix): Incidence matrix of the grouped rows.
+        - profile_matrix(SkillMatrix): Incidence matrix with one row per profile.
+        - row_profiles(np.ndarray): Profile of every row.
+        """
+        self.skill_matrix = skill_matrix
+        self.profile_matrix = profile_matrix
+        self.row_profiles = row_profiles
+        # Listing the members of every profile, keeping the row order within each profile
+        self.member_rows = np.argsort(row_profiles, kind='stable')
+        self.member_indptr = np.zeros(len(profile_matrix) + 1, dtype=np.int64)
+        self.member_indptr[1:] = np.cumsum(np.bincount(row_profiles, minlength=len(profile_matrix)))
+
+
+
+    def __len__(self) -> int:
+        """
+        Function for getting the number of profiles.
+
+        Returns:
+        - int: Number of distinct skill sets.
+        """
+        return len(self.profile_matrix)
+
+
+
+    @property
+    def deduplication_ratio(self) -> float:
+        """
+        Function for getting the number of rows per profile.
+
+        Returns:
+        - float: Number of rows divided by the number of profiles, 1 if every row is unique.
+        """
+        return len(self.skill_matrix) / len(self) if len(self) else 1.0
+
+
+
+    @classmethod
+    def from_matrix(cls, skill_matrix: SkillMatrix) -> "SkillProfiles":
+        """
+        Class method for grouping the rows of an incidence matrix by their skill ids.
+
+        Parameters:
+        - skill_matrix(SkillMatrix): Incidence matrix with sorted skill ids in every row.
+
+        Returns:
+        - SkillProfiles: Profiles of the rows.
+        """
+        matrix = skill_matrix.matrix
+        if not matrix.has_sorted_indices:
+            matrix = matrix.sorted_indices()
+        indptr, indices = matrix.indptr, matrix.indices
+
+        # Assigning the next profile to every unseen skill set
+        profile_ids, row_profiles, first_rows = {}, np.empty(len(skill_matrix), dtype=np.int64), []
+        for row in range(len(skill_matrix)):
+            key = indices[indptr[row]:indptr[row + 1]].tobytes()
+            profile = profile_ids.setdefault(key, len(profile_ids))
+            if profile == len(first_rows):
+                first_rows.append(row)
+            row_profiles[row] = profile
+
+        first_rows = np.array(first_rows, dtype=np.int64)
+        profile_matrix = SkillMatrix(matrix[first_rows] if len(first_rows) else matrix[:0], skill_matrix.skill_counts[first_rows])
+        return cls(skill_matrix, profile_matrix, row_profiles)
+
+
+
+    def members(self, profiles: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Function for listing the member rows of a sequence of profiles.
+
+        Parameters:
+        - profiles(np.ndarray): Profile positions.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: Number of members of every given profile and position of the first member
+                                         of every given profile within member_rows.
+        """
+        return self.member_indptr[profiles + 1] - self.member_indptr[profiles], self.member_indptr[profiles]
+
+
+
+class DeduplicatedMatchingBackend(MatchingBackend):
+    """
+    A class for calculating matching skill counts on distinct skill profiles only.
+
+    The jobs are grouped by their skill set once and the wrapped backend is built over one job per profile.
+    Each block of job seekers is grouped the same way, only the distinct job seeker and job profile pairs are
+    scored by the wrapped backend, and the counts are then fanned out to all member rows. The result is the same
+    as the wrapped backend on all rows. When neither side has duplicates, there is nothing to fan out.
+
+    Attributes:
+    - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+    - job_profiles(SkillProfiles): Profiles of the jobs.
+    - backend(MatchingBackend): Wrapped backend built over the job profiles.
+    - seeker_rows(int): Number of job seeker rows matched so far.
+    - seeker_profiles(int): Number of job seeker profiles scored so far.
+    - profile_pairs_scored(int): Number of job seeker and job profile pairs scored so far.
+    """
+
+    def __init__(self, job_matrix: SkillMatrix, backend_class: type):
+        """
+        Constructor for class DeduplicatedMatchingBackend.
+
+        Parameters:
+        - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+        - backend_class(type): MatchingBackend subclass scoring the profiles.
+        """
+        super().__init__(job_matrix)
+        self.job_profiles = SkillProfiles.from_matrix(job_matrix)
+        self.backend = backend_class(self.job_profiles.profile_matrix)
+        self.seeker_rows = 0
+        self.seeker_profiles = 0
+        self.profile_pairs_scored = 0
+
+
+
+    def match_block(self, seeker_matrix: SkillMatrix) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Function for finding all job seeker and job pairs with at least one matching skill through their profiles.
+
+        Parameters:
+        - seeker_matrix(SkillMatrix): Skill incidence matrix of a block of job seekers.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray, np.ndarray]: Job seeker positions, job positions and matching skill
+                                                     counts of the matched pairs, ordered by job seeker position
+                                                     and then by job position.
+        """
+        seeker_profiles = SkillProfiles.from_matrix(seeker_matrix)
+        self.seeker_rows += len(seeker_matrix)
+        self.seeker_profiles += len(seeker_profiles)
+        self.profile_pairs_scored += len(seeker_profiles) * len(self.job_profiles)
+        profile_seekers, profile_jobs, matching_skill_counts = self.backend.match_block(seeker_profiles.profile_matrix)
+
+        # Returning the matches as they are when every row is its own profile, since the profiles keep the row order
+        if len(seeker_profiles) == len(seeker_matrix) and len(self.job_profiles) == len(self.job_matrix):
+            return profile_seekers, profile_jobs, matching_skill_counts
+
+        # Repeating every profile pair once per combination of its job seeker and job members
+        seeker_sizes, seeker_starts = seeker_profiles.members(profile_seekers)
+        job_sizes, job_starts = self.job_profiles.members(profile_jobs)
+        pair_sizes = seeker_sizes * job_sizes
+        pairs = np.repeat(np.arange(len(pair_sizes)), pair_sizes)
+        offsets = np.arange(len(pairs)) - np.repeat(np.cumsum(pair_sizes) - pair_sizes, pair_sizes)
+        seeker_positions = seeker_profiles.member_rows[seeker_starts[pairs] + offsets // job_sizes[pairs]]
+        job_positions = self.job_profiles.member_rows[job_starts[pairs] + offsets % job_sizes[pairs]]
+
+        # Restoring the order by job seeker position and then by job position
+        order = np.lexsort((job_positions, seeker_positions))
+        return seeker_positions[order], job_positions[order], matching_skill_counts[pairs][order]
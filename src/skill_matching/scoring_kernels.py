@@ -0,0 +1,256 @@
+# ABC (Abstract Base Class) and abstractmethod from the abc module
+from abc import ABC, abstractmethod
+# numpy library for numerical arrays
+import numpy as np
+# custom SkillMatrix class for the skill incidence matrices
+from .skill_vocabulary import SkillMatrix
+
+
+class ScoringKernel(ABC):
+    """
+    An abstract base class for scoring kernels that score the matched job seeker and job pairs of a block in bulk.
+
+    A matching backend finds the pairs with at least one matching skill and their matching skill counts, and the
+    kernel turns all pairs of a block into scores at once with array operations. The scores are percentages
+    rounded to 2 decimals, which the engines report as the matching skill percentage and rank by, e.g. for top_k
+    and sort_recommendations. A kernel needing statistics of the jobs computes them once per catalog in fit.
+    Kernels used by parallel processing are sent to the worker processes, so they must be picklable.
+
+    Attributes:
+    - name(str): Name of the kernel for set_scoring_kernel.
+    - ranks_by_count(bool): Whether ranking the matches of a job seeker by score is the same as ranking them by
+                            matching skill count, so that top_k can be selected before scoring.
+    - bounded_by_overlap_percent(bool): Whether a score is never larger than the share of the job seeker's skills 
+                                        matched, so that a minimum score requires a minimum matching skill count.
+    """
+    name = None
+    ranks_by_count = False
+    bounded_by_overlap_percent = False
+
+
+    def fit(self, job_matrix: SkillMatrix) -> "ScoringKernel":
+        """
+        Function for computing the statistics of a jobs catalog the kernel needs for scoring.
+
+        Parameters:
+        - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+
+        Returns:
+        - ScoringKernel: Kernel ready to score matches against the jobs, the kernel itself if it needs no statistics.
+        """
+        return self
+
+
+
+    def minimum_overlaps(self, skill_counts: np.ndarray, min_match_percent: float) -> np.ndarray:
+        """
+        Function for calculating the smallest matching skill count with which a job seeker can reach a minimum score.
+
+        The bound is conservative, i.e. a pair below it can never reach the minimum score after rounding, so that
+        candidate generation can skip such pairs without changing the results.
+
+        Parameters:
+        - skill_counts(np.ndarray): Number of unique skills of each job seeker.
+        - min_match_percent(float): Smallest score recommended.
+
+        Returns:
+        - np.ndarray: Smallest matching skill count of each job seeker, at least 1.
+        """
+        skill_counts = np.asarray(skill_counts, dtype=np.int64)
+        if not self.bounded_by_overlap_percent or min_match_percent <= 0:
+            return np.ones(len(skill_counts), dtype=np.int64)
+
+        # Allowing for the rounding to 2 decimals, which may lift a score by up to 0.005
+        minimum_overlaps = np.ceil(skill_counts * (min_match_percent - 0.005) / 100 - 1e-9)
+        return np.maximum(minimum_overlaps, 1).astype(np.int64)
+
+
+
+    @abstractmethod
+    def score_block(self, seeker_matrix: SkillMatrix, job_matrix: SkillMatrix, seeker_positions: np.ndarray, job_positions: np.ndarray,
+                    matching_skill_counts: np.ndarray) -> np.ndarray:
+        """
+        Abstract method for scoring the matched pairs of a block of job seekers.
+
+        Parameters:
+        - seeker_matrix(SkillMatrix): Skill incidence matrix of the block of job seekers.
+        - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+        - seeker_positions(np.ndarray): Job seeker position of each matched pair within the block.
+        - job_positions(np.ndarray): Job position of each matched pair.
+        - matching_skill_counts(np.ndarray): Matching skill count of each matched pair.
+
+        Returns:
+        - np.ndarray: Score of each matched pair as a percentage rounded to 2 decimals.
+        """
+        pass
+
+
+
+    @staticmethod
+    def calculate_percentages(numerators: np.ndarray, denominators: np.ndarray) -> np.ndarray:
+        """
+        Static method for calculating percentages rounded to 2 decimals the same way as Python's round.
+
+        The percentages are rounded with Python's round on the distinct values only, because numpy's rounding
+        can differ from Python's in the last digit.
+
+        Parameters:
+        - numerators(np.ndarray): Numerator of each percentage.
+        - denominators(np.ndarray): Denominator of each percentage.
+
+        Returns:
+        - np.ndarray: Percentages rounded to 2 decimals.
+        """
+        # Calculating the raw percentages the same way as the scalar version
+        percentages = (np.asarray(numerators) / np.asarray(denominators)) * 100
+        if len(percentages) == 0:
+            return percentages.astype(np.float64)
+
+        # Rounding each distinct percentage once and mapping it back to the pairs
+        distinct_percentages, positions = np.unique(percentages, return_inverse=True)
+        rounded_percentages = np.array([round(percentage, 2) for percentage in distinct_percentages.tolist()])
+        return rounded_percentages[positions]
+
+
+
+class OverlapPercentKernel(ScoringKernel):
+    """
+    A class scoring a match by the share of the job seeker's skills required by the job, i.e. the matching skill
+    percentage of calculate_matching_skills. It is the default kernel of the engines.
+    """
+    name = "overlap_percent"
+    ranks_by_count = True
+    bounded_by_overlap_percent = True
+
+
+    def score_block(self, seeker_matrix: SkillMatrix, job_matrix: SkillMatrix, seeker_positions: np.ndarray, job_positions: np.ndarray,
+                    matching_skill_counts: np.ndarray) -> np.ndarray:
+        """
+        Function for scoring the matched pairs by matching skill count divided by the skills of the job seeker.
+
+        Parameters:
+        - seeker_matrix(SkillMatrix): Skill incidence matrix of the block of job seekers.
+        - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+        - seeker_positions(np.ndarray): Job seeker position of each matched pair within the block.
+        - job_positions(np.ndarray): Job position of each matched pair.
+        - matching_skill_counts(np.ndarray): Matching skill count of each matched pair.
+
+        Returns:
+        - np.ndarray: Matching skill percentage of each matched pair.
+        """
+        return self.calculate_percentages(matching_skill_counts, seeker_matrix.skill_counts[seeker_positions])
+
+
+
+class JaccardKernel(ScoringKernel):
+    """
+    A class scoring a match by the Jaccard similarity of the skill sets, i.e. the matching skills divided by the
+    skills of the job seeker or the job, so that jobs requiring many other skills score lower.
+    """
+    name = "jaccard"
+    bounded_by_overlap_percent = True
+
+
+    def score_block(self, seeker_matrix: SkillMatrix, job_matrix: SkillMatrix, seeker_positions: np.ndarray, job_positions: np.ndarray,
+                    matching_skill_counts: np.ndarray) -> np.ndarray:
+        """
+        Function for scoring the matched pairs by matching skill count divided by the size of the union of the skill sets.
+
+        Parameters:
+        - seeker_matrix(SkillMatrix): Skill incidence matrix of the block of job seekers.
+        - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+        - seeker_positions(np.ndarray): Job seeker position of each matched pair within the block.
+        - job_positions(np.ndarray): Job position of each matched pair.
+        - matching_skill_counts(np.ndarray): Matching skill count of each matched pair.
+
+        Returns:
+        - np.ndarray: Jaccard similarity of each matched pair as a percentage.
+        """
+        matching_skill_counts = np.asarray(matching_skill_counts, dtype=np.int64)
+        union_sizes = seeker_matrix.skill_counts[seeker_positions].astype(np.int64) + job_matrix.skill_counts[job_positions] - matching_skill_counts
+        return self.calculate_percentages(matching_skill_counts, union_sizes)
+
+
+
+class IdfOverlapKernel(ScoringKernel):
+    """
+    A class scoring a match by the share of the job seeker's skills required by the job, each skill weighted by
+    its inverse document frequency in the jobs catalog, so that matching on a rare skill counts more than matching
+    on a skill most jobs require.
+
+    The weight of a skill is log((1 + jobs) / (1 + jobs requiring it)) + 1, computed once per catalog by fit.
+    Skills of a job seeker which no job requires get the largest weight.
+
+    Attributes:
+    - skill_idf(np.ndarray): Weight of every skill of the vocabulary, or None before fit.
+    - unknown_skill_idf(float): Weight of the skills which no job requires.
+    """
+    name = "idf_overlap"
+
+
+    def __init__(self, skill_idf: np.ndarray = None, unknown_skill_idf: float = None):
+        """
+        Constructor for class IdfOverlapKernel.
+
+        Parameters:
+        - skill_idf(np.ndarray): Weight of every skill of the vocabulary. Set to None by default, i.e. computed by fit.
+        - unknown_skill_idf(float): Weight of the skills which no job requires. Set to None by default.
+        """
+        self.skill_idf = skill_idf
+        self.unknown_skill_idf = unknown_skill_idf
+
+
+
+    def fit(self, job_matrix: SkillMatrix) -> "IdfOverlapKernel":
+        """
+        Function for computing the inverse document frequency of every skill of a jobs catalog.
+
+        Parameters:
+        - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+
+        Returns:
+        - IdfOverlapKernel: New kernel with the weights of the catalog.
+        """
+        job_count = len(job_matrix)
+        document_frequencies = np.bincount(job_matrix.matrix.indices, minlength=job_matrix.matrix.shape[1])
+        return IdfOverlapKernel(np.log((1 + job_count) / (1 + document_frequencies)) + 1, float(np.log(1 + job_count) + 1))
+
+
+
+    def score_block(self, seeker_matrix: SkillMatrix, job_matrix: SkillMatrix, seeker_positions: np.ndarray, job_positions: np.ndarray,
+                    matching_skill_counts: np.ndarray) -> np.ndarray:
+        """
+        Function for scoring the matched pairs by the weight of the matching skills divided by the weight of the skills of the job seeker.
+
+        The weights of the matching skills of all pairs are given by a single sparse product of the weighted job
+        seeker matrix with the job matrix, from which the matched pairs are picked.
+
+        Parameters:
+        - seeker_matrix(SkillMatrix): Skill incidence matrix of the block of job seekers.
+        - job_matrix(SkillMatrix): Skill incidence matrix of the jobs.
+        - seeker_positions(np.ndarray): Job seeker position of each matched pair within the block.
+        - job_positions(np.ndarray): Job position of each matched pair.
+        - matching_skill_counts(np.ndarray): Matching skill count of each matched pair.
+
+        Returns:
+        - np.ndarray: Weighted matching skill percentage of each matched pair.
+        """
+        if self.skill_idf is None:
+            raise ValueError("The IDF weights of the jobs should be computed with fit before scoring.")
+        if len(seeker_positions) == 0:
+            return np.array([], dtype=np.float64)
+
+        # Weighting the skills of the job seekers, the skills unknown to the vocabulary included
+        weighted_seekers = seeker_matrix.matrix.multiply(self.skill_idf[np.newaxis, :seeker_matrix.matrix.shape[1]]).tocsr()
+        unknown_skill_counts = seeker_matrix.skill_counts - np.diff(seeker_matrix.matrix.indptr)
+        seeker_weights = np.asarray(weighted_seekers.sum(axis=1)).reshape(-1) + unknown_skill_counts * self.unknown_skill_idf
+
+        # Picking the weight of the matching skills of every pair from the product, whose entries are sorted by row and column
+        matched_weights = (weighted_seekers @ job_matrix.matrix.T.tocsr()).tocsr()
+        matched_weights.sort_indices()
+        job_count = np.int64(job_matrix.matrix.shape[0])
+        product_keys = np.repeat(np.arange(matched_weights.shape[0], dtype=np.int64), np.diff(matched_weights.indptr)) * job_count + matched_weights.indices
+        pair_keys = np.asarray(seeker_positions, dtype=np.int64) * job_count + np.asarray(job_positions, dtype=np.int64)
+        pair_weights = matched_weights.data[np.searchsorted(product_keys, pair_keys)]
+
+        return self.calculate_percentages(pair_weights, seeker_weights[seeker_positions])
@@ -0,0 +1,85 @@
+# typing module for type hints
+from typing import Dict
+# functools module for the bounded least recently used cache
+import functools
+# custom SkillVocabulary class for splitting the skills strings
+from .skill_vocabulary import SkillVocabulary
+
+
+class SkillTokenCache:
+    """
+    A class for interning skills strings into frozen sets of skill tokens.
+
+    Every distinct skills string is split once and kept in a bounded least recently used cache, so that the
+    required skills of a job are not split again for every job seeker it is scored against. The strings are split
+    with SkillVocabulary.tokenize, so the cached tokens always match the skill ids of the vocabulary.
+
+    Attributes:
+    - max_size(int): Largest number of distinct skills strings kept in the cache.
+    """
+
+    def __init__(self, max_size: int = 65536):
+        """
+        Constructor for class SkillTokenCache.
+
+        Parameters:
+        - max_size(int): Largest number of distinct skills strings kept in the cache. Set to 65536 by default.
+        """
+        if not isinstance(max_size, int) or isinstance(max_size, bool):
+            raise TypeError("Maximum size must be an integer")
+
+        if max_size < 1:
+            raise ValueError("Maximum size should be at least 1.")
+        self.max_size = max_size
+        self.cached_split = functools.lru_cache(maxsize=max_size)(self.split_skills)
+
+
+
+    @classmethod
+    def split_skills(cls, skills: str) -> frozenset:
+        """
+        Class method for converting a skills string into a frozen set of unique skill tokens without caching.
+
+        Parameters:
+        - skills(str): Comma separated skills.
+
+        Returns:
+        - frozenset: Unique skill tokens.
+        """
+        return frozenset(SkillVocabulary.tokenize(skills))
+
+
+
+    def tokenize(self, skills: str) -> frozenset:
+        """
+        Function for converting a skills string into a frozen set of unique skill tokens through the cache.
+
+        Parameters:
+        - skills(str): Comma separated skills.
+
+        Returns:
+        - frozenset: Unique skill tokens, shared by all calls with the same string.
+        """
+        return self.cached_split(skills)
+
+
+
+    def statistics(self) -> Dict:
+        """
+        Function for getting the hit and miss counts of the cache.
+
+        Returns:
+        - Dict: Hits, misses, hit rate, current size and maximum size of the cache.
+        """
+        cache_info = self.cached_split.cache_info()
+        lookups = cache_info.hits + cache_info.misses
+        return {'hits': cache_info.hits, 'misses': cache_info.misses, 'hit_rate': cache_info.hits / lookups if lookups else 0.0,
+                'size': cache_info.currsize, 'max_size': self.max_size}
+
+
+
+    def clear(self) -> None:
+        """
+        Function for removing all skills strings and resetting the hit and miss counts.
+        """
+        self.cached_split.cache_clear()
@@ -0,0 +1,223 @@
+# typing module for type hints
+from typing import Dict, Iterable
+# numpy library for numerical arrays
+import numpy as np
+# sparse module from scipy for sparse matrices
+from scipy import sparse
+
+
+class SkillVocabulary:
+    """
+    A class for mapping skill tokens to consecutive integer ids.
+
+    The skills strings are split exactly the same way as in RecommendationEngine.calculate_matching_skills,
+    so that the integer based matching gives the same results as the string based matching.
+
+    Attributes:
+    - skill_ids(Dict[str, int]): Mapping from a skill token to its integer id.
+    """
+    skill_separator = ", "
+
+
+    def __init__(self):
+        """
+        Constructor for class SkillVocabulary.
+        """
+        self.skill_ids: Dict[str, int] = {}
+
+
+
+    def __len__(self) -> int:
+        """
+        Function for getting the number of skills in the vocabulary.
+
+        Returns:
+        - int: Number of distinct skill tokens.
+        """
+        return len(self.skill_ids)
+
+
+
+    @classmethod
+    def tokenize(cls, skills: str) -> set:
+        """
+        Class method for converting a skills string into a set of unique skill tokens.
+
+        Parameters:
+        - skills(str): Comma separated skills.
+
+        Returns:
+        - set: Set of unique skill tokens.
+        """
+        return set(str(skills).split(cls.skill_separator))
+
+
+
+    def add_skills(self, skills: str) -> np.ndarray:
+        """
+        Function for encoding a skills string, adding unseen skill tokens to the vocabulary.
+
+        Parameters:
+        - skills(str): Comma separated skills.
+
+        Returns:
+        - np.ndarray: Sorted integer ids of the unique skill tokens.
+        """
+        # Assigning the next free id to every unseen skill token
+        skill_ids = [self.skill_ids.setdefault(skill, len(self.skill_ids)) for skill in self.tokenize(skills)]
+        return np.sort(np.array(skill_ids, dtype=np.int32))
+
+
+
+    def lookup_skills(self, skills: str) -> np.ndarray:
+        """
+        Function for encoding a skills string without changing the vocabulary.
+
+        Skill tokens unknown to the vocabulary are left out, since they cannot match anything.
+
+        Parameters:
+        - skills(str): Comma separated skills.
+
+        Returns:
+        - np.ndarray: Sorted integer ids of the known unique skill tokens.
+        """
+        skill_ids = [self.skill_ids[skill] for skill in self.tokenize(skills) if skill in self.skill_ids]
+        return np.sort(np.array(skill_ids, dtype=np.int32))
+
+
+
+class SkillMatrix:
+    """
+    A class representing a binary row × skill incidence matrix in sparse (CSR) format.
+
+    Attributes:
+    - matrix(sparse.csr_matrix): Incidence matrix of shape (number of rows, vocabulary size).
+    - skill_counts(np.ndarray): Number of unique skills of each row, including the skills
+                                unknown to the vocabulary.
+    """
+
+    def __init__(self, matrix: sparse.csr_matrix, skill_counts: np.ndarray):
+        """
+        Constructor for class SkillMatrix.
+
+        Parameters:
+        - matrix(sparse.csr_matrix): Incidence matrix of shape (number of rows, vocabulary size).
+        - skill_counts(np.ndarray): Number of unique skills of each row.
+        """
+        self.matrix = matrix
+        self.skill_counts = skill_counts
+
+
+
+    def __len__(self) -> int:
+        """
+        Function for getting the number of rows in the matrix.
+
+        Returns:
+        - int: Number of rows.
+        """
+        return self.matrix.shape[0]
+
+
+
+    @classmethod
+    def from_skills(cls, skills_column: Iterable[str], vocabulary: SkillVocabulary, grow_vocabulary: bool = True) -> "SkillMatrix":
+        """
+        Class method for building the incidence matrix from a column of skills strings.
+
+        Parameters:
+        - skills_column(Iterable[str]): Skills string of each row.
+        - vocabulary(SkillVocabulary): Vocabulary for mapping skills to ids.
+        - grow_vocabulary(bool): Whether unseen skills are added to the vocabulary. Set to True by default.
+
+        Returns:
+        - SkillMatrix: Incidence matrix of the given rows.
+        """
+        # Storing the skill ids and the number of unique skills of each row
+        row_skill_ids = []
+        skill_counts = []
+        for skills in skills_column:
+            if grow_vocabulary:
+                skill_ids = vocabulary.add_skills(skills)
+                skill_counts.append(len(skill_ids))
+            else:
+                skill_ids = vocabulary.lookup_skills(skills)
+                # Counting unknown skills as well since they are part of the percentage denominator
+                skill_counts.append(len(vocabulary.tokenize(skills)))
+            row_skill_ids.append(skill_ids)
+
+        # Building the CSR structure from the per-row skill ids
+        indptr = np.zeros(len(row_skill_ids) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(skill_ids) for skill_ids in row_skill_ids])
+        indices = np.concatenate(row_skill_ids) if row_skill_ids else np.array([], dtype=np.int32)
+        data = np.ones(len(indices), dtype=np.int32)
+        matrix = sparse.csr_matrix((data, indices, indptr), shape=(len(row_skill_ids), len(vocabulary)))
+
+        return cls(matrix, np.array(skill_counts, dtype=np.int32))
+
+
+
+    @classmethod
+    def from_tokenized(cls, skill_tokens: list, indptr: np.ndarray, indices: np.ndarray, vocabulary: SkillVocabulary, grow_vocabulary: bool = True) -> "SkillMatrix":
+        """
+        Class method for building the incidence matrix from already tokenized skills.
+
+        The rows are given in CSR form over a local list of skill tokens, e.g. as stored by the parsed file cache,
+        so only the distinct tokens have to be mapped to the vocabulary instead of splitting every skills string.
+
+        Parameters:
+        - skill_tokens(list): Distinct skill tokens the indices refer to.
+        - indptr(np.ndarray): CSR row pointer of the rows.
+        - indices(np.ndarray): Local token id of every unique skill of every row.
+        - vocabulary(SkillVocabulary): Vocabulary for mapping skills to ids.
+        - grow_vocabulary(bool): Whether unseen skills are added to the vocabulary. Set to True by default.
+
+        Returns:
+        - SkillMatrix: Incidence matrix of the given rows.
+        """
+        # Mapping every local token to its vocabulary id, or -1 if it is unknown and may not be added
+        if grow_vocabulary:
+            token_ids = [vocabulary.skill_ids.setdefault(skill, len(vocabulary.skill_ids)) for skill in skill_tokens]
+        else:
+            token_ids = [vocabulary.skill_ids.get(skill, -1) for skill in skill_tokens]
+        skill_ids = np.array(token_ids, dtype=np.int32)[indices] if len(indices) else np.array([], dtype=np.int32)
+
+        # Counting all unique skills of each row and dropping the unknown ones from the matrix
+        skill_counts = np.diff(indptr).astype(np.int32)
+        rows = np.repeat(np.arange(len(skill_counts)), skill_counts)
+        known = skill_ids >= 0
+        matrix = sparse.csr_matrix((np.ones(int(known.sum()), dtype=np.int32), (rows[known], skill_ids[known])), shape=(len(skill_counts), len(vocabulary)))
+        matrix.sort_indices()
+        return cls(matrix, skill_counts)
+
+
+
+    def row_block(self, start: int, stop: int) -> "SkillMatrix":
+        """
+        Function for slicing a contiguous block of rows.
+
+        Parameters:
+        - start(int): Position of the first row.
+        - stop(int): Position after the last row.
+
+        Returns:
+        - SkillMatrix: Incidence matrix of the selected rows.
+        """
+        return SkillMatrix(self.matrix[start:stop], self.skill_counts[start:stop])
+
+
+
+    def with_vocabulary_size(self, vocabulary_size: int) -> "SkillMatrix":
+        """
+        Function for widening the matrix to a (grown) vocabulary size.
+
+        Parameters:
+        - vocabulary_size(int): Number of columns of the widened matrix.
+
+        Returns:
+        - SkillMatrix: Incidence matrix with the given number of columns.
+        """
+        if self.matrix.shape[1] == vocabulary_size:
+            return self
+        matrix = sparse.csr_matrix((self.matrix.data, self.matrix.indices, self.matrix.indptr), shape=(self.matrix.shape[0], vocabulary_size))
+        return SkillMatrix(matrix, self.skill_counts)
@@ -0,0 +1,166 @@
+# typing module for type hints
+from typing import Callable, Dict, Iterable, Iterator, Tuple
+# multiprocessing module for the pool of worker processes
+import multiprocessing as mp
+
+
+class WorkerPool:
+    """
+    A class owning a pool of worker processes which is kept warm across parallel runs.
+
+    The workers load the jobs once through the pool initializer when the pool is started, and the pool is reused
+    by every later run with the same key, i.e. the same jobs and engine settings, so neither the jobs nor the
+    matching backend are read, built or sent to the workers again. The tasks are dispatched with imap_unordered,
+    so a worker takes the next task as soon as it is done, and the results are put back into the order of the
+    tasks before they are yielded. When a run fails or is abandoned, the workers are terminated and reaped, so
+    that no task of the run is left in the pool, and the next run starts a new pool.
+
+    Attributes:
+    - key(Tuple): Jobs and settings the workers were loaded with, or None if no pool is running.
+    - pool_size(int): Number of worker processes of the running pool.
+    - catalog(Dict): Data of the jobs the workers were loaded with, kept for the process using the pool.
+    - pools_started(int): Number of pools started so far.
+    """
+
+    def __init__(self):
+        """
+        Constructor for class WorkerPool.
+        """
+        self.pool = None
+        self.key = None
+        self.pool_size = None
+        self.catalog: Dict = {}
+        self.pools_started = 0
+
+
+
+    def __enter__(self) -> "WorkerPool":
+        """
+        Function for entering the context of the worker pool.
+
+        Returns:
+        - WorkerPool: The worker pool itself.
+        """
+        return self
+
+
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Function for stopping the workers when leaving the context, waiting for them to finish unless there was an error.
+        """
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+
+
+    def is_warm(self, key: Tuple) -> bool:
+        """
+        Function for checking whether the workers are running and were loaded with the given jobs and settings.
+
+        Parameters:
+        - key(Tuple): Jobs and settings of the run.
+
+        Returns:
+        - bool: Whether the running pool can be reused.
+        """
+        return self.pool is not None and self.key == key
+
+
+
+    def start(self, key: Tuple, pool_size: int, catalog: Dict, initializer: Callable, initargs: Tuple) -> None:
+        """
+        Function for starting a pool of worker processes, terminating the running one if there is one.
+
+        Parameters:
+        - key(Tuple): Jobs and settings the workers are loaded with.
+        - pool_size(int): Number of worker processes.
+        - catalog(Dict): Data of the jobs kept for the process using the pool.
+        - initializer(Callable): Function loading the jobs into every worker process.
+        - initargs(Tuple): Arguments of the initializer.
+        """
+        self.terminate()
+        self.pool = mp.Pool(pool_size, initializer=initializer, initargs=initargs)
+        self.key, self.pool_size, self.catalog = key, pool_size, catalog
+        self.pools_started += 1
+
+
+
+    def imap_ordered(self, task: Callable, items: Iterable, chunksize: int = 1) -> Iterator:
+        """
+        Function for running a task on every item with imap_unordered and yielding the results in the order of the items.
+
+        A result finished before the ones of earlier items is held back until they are yielded. If a task fails,
+        or the results are not consumed to the end, the workers are terminated and reaped.
+
+        Parameters:
+        - task(Callable): Function of a module run by the workers on every item.
+        - items(Iterable): Items to run the task on.
+        - chunksize(int): Number of items sent to a worker at a time. Set to 1 by default.
+
+        Returns:
+        - Iterator: Result of the task for every item, in the order of the items.
+        """
+        pending_results = {}
+        next_index = 0
+        try:
+            indexed_items = ((index, task, item) for index, item in enumerate(items))
+            for index, result in self.pool.imap_unordered(run_indexed_task, indexed_items, chunksize):
+                pending_results[index] = result
+                while next_index in pending_results:
+                    yield pending_results.pop(next_index)
+                    next_index += 1
+        except BaseException:
+            # Cancelling the remaining tasks, so that they do not run into the next run
+            self.terminate()
+            raise
+
+
+
+    def close(self) -> None:
+        """
+        Function for stopping the workers once they have finished their tasks and reaping them.
+        """
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+        self.reset()
+
+
+
+    def terminate(self) -> None:
+        """
+        Function for stopping the workers at once, cancelling their tasks, and reaping them.
+        """
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+        self.reset()
+
+
+
+    def reset(self) -> None:
+        """
+        Function for forgetting the stopped pool and the jobs its workers were loaded with.
+        """
+        self.pool = None
+        self.key = None
+        self.pool_size = None
+        self.catalog = {}
+
+
+
+def run_indexed_task(indexed_item: Tuple[int, Callable, object]) -> Tuple[int, object]:
+    """
+    Function for running a task on an item in a worker process and returning the result with the position of the item.
+
+    Parameters:
+    - indexed_item(Tuple[int, Callable, object]): Position of the item, task and item.
+
+    Returns:
+    - Tuple[int, object]: Position of the item and result of the task.
+    """
+    index, task, item = indexed_item
+    return index, task(item)
@@ -0,0 +1,146 @@
+# os module for interacting with the operating system
+import os
+# json module for reading the saved results
+import json
+# shutil and tempfile modules for creating and removing a temporary directory
+import shutil
+import tempfile
+# unittest module for writing and running tests
+import unittest
+# pandas library for working with structured data
+import pandas as pd
+# custom File class for cleansing the generated files
+from src.file_reader.read_files import File
+# custom SyntheticDataGenerator class for testing its functionalities
+from src.benchmark.data_generator import SyntheticDataGenerator
+# custom benchmark classes and functions for testing their functionalities
+from src.benchmark.benchmark_runner import BenchmarkRunner, run_benchmark_case
+
+
+class TestBenchmarkClasses(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of SyntheticDataGenerator and BenchmarkRunner classes.
+
+    This test suite class contains individual test functions for generating input files and for
+    running and saving benchmark cases.
+    """
+
+    def setUp(self):
+        """
+        Function for setting up the test cases.
+
+        It is called before performing each test case so as to set up necessary
+        resources for testing.
+        """
+        self.test_directory = tempfile.mkdtemp()
+        self.jobs_file_path = os.path.join(self.test_directory, 'jobs.csv')
+        self.jobseeker_file_path = os.path.join(self.test_directory, 'jobseekers.csv')
+
+
+
+    def tearDown(self):
+        """
+        Function for cleaning up after performing each test case.
+
+        It is called after each test case for removing any resources created during testing.
+        """
+        shutil.rmtree(self.test_directory)
+
+
+
+    def test_generate_files(self):
+        """
+        Function for testing generating input files.
+
+        It ensures that the files have the expected rows, skills and injected nulls and duplicates, and that
+        the same seed gives the same files.
+        """
+        generator = SyntheticDataGenerator(vocabulary_size=50, skills_per_row=(2, 4), null_rate=0.1, duplicate_rate=0.1, seed=7)
+        generator.write_files(self.jobs_file_path, self.jobseeker_file_path, 300, 200)
+        jobs_df = pd.read_csv(self.jobs_file_path)
+        jobseekers_df = pd.read_csv(self.jobseeker_file_path)
+        self.assertListEqual(list(jobs_df.columns), ['id', 'title', 'required_skills'])
+        self.assertListEqual(list(jobseekers_df.columns), ['id', 'name', 'skills'])
+
+        # Checking the injected nulls and duplicates, which the cleansing removes
+        self.assertGreater(len(jobs_df), 300)
+        self.assertGreater(jobs_df['required_skills'].isna().sum(), 0)
+        cleansed_jobs_df = File(self.jobs_file_path).read_file()
+        self.assertTrue(cleansed_jobs_df['id'].is_unique)
+        self.assertTrue(all(1 <= len(skills.split(", ")) <= 4 for skills in cleansed_jobs_df['required_skills']))
+
+        # Checking that the most popular skill is the most frequent one
+        skill_frequencies = cleansed_jobs_df['required_skills'].str.split(", ").explode().value_counts()
+        self.assertEqual(skill_frequencies.index[0], 'Skill 0')
+
+        # Checking that the files are reproducible
+        other_jobs_file_path = os.path.join(self.test_directory, 'other_jobs.csv')
+        generator.write_files(other_jobs_file_path, self.jobseeker_file_path, 300, 200)
+        with open(self.jobs_file_path) as file, open(other_jobs_file_path) as other_file:
+            self.assertEqual(file.read(), other_file.read())
+
+
+
+    def test_run_benchmark_case(self):
+        """
+        Function for testing running a single benchmark case in the current process, with an exact and an approximate backend.
+        """
+        SyntheticDataGenerator(vocabulary_size=20, seed=1).write_files(self.jobs_file_path, self.jobseeker_file_path, 50, 40)
+        result = run_benchmark_case({'path_file_jobs': self.jobs_file_path, 'path_file_jobseeker': self.jobseeker_file_path,
+                                     'mode': 'vectorized', 'workers': 1, 'matching_backend': 'auto', 'top_k': None})
+        self.assertEqual(result['pairs'], 2000)
+        self.assertGreater(result['recommendations'], 0)
+        self.assertGreater(result['output_bytes'], 0)
+        self.assertGreater(result['peak_rss_mb'], 0)
+        self.assertIsNone(result['recall'])
+
+        # Measuring the recall of the approximate backend against the exact recommendations
+        approximate_result = run_benchmark_case({'path_file_jobs': self.jobs_file_path, 'path_file_jobseeker': self.jobseeker_file_path,
+                                                 'mode': 'vectorized', 'workers': 1, 'matching_backend': 'minhash_lsh', 'top_k': 3,
+                                                 'lsh_bands': 32, 'lsh_rows_per_band': 1})
+        self.assertTrue(0 < approximate_result['recall'] <= 1)
+
+
+
+    def test_run_and_save(self):
+        """
+        Function for testing running the cases in fresh processes and saving the results.
+        """
+        SyntheticDataGenerator(vocabulary_size=20, seed=1).write_files(self.jobs_file_path, self.jobseeker_file_path, 30, 20)
+        benchmark_runner = BenchmarkRunner(self.jobs_file_path, self.jobseeker_file_path, modes=['columnar', 'streaming'], worker_counts=[1, 2])
+        self.assertEqual(len(benchmark_runner.cases()), 3)
+        with self.assertRaises(ValueError):
+            BenchmarkRunner(self.jobs_file_path, self.jobseeker_file_path, modes=['unknown'])
+
+        results = benchmark_runner.run()
+        self.assertEqual(len({result['recommendations'] for result in results}), 1)
+        path_results = os.path.join(self.test_directory, 'results.json')
+        benchmark_runner.save(results, path_results)
+        with open(path_results) as file:
+            saved = json.load(file)
+        self.assertListEqual(saved['results'], results)
+        self.assertIn('cpu_count', saved['environment'])
+
+
+
+    def test_run_crashed_case(self):
+        """
+        Function for testing that a case whose process dies without a result is recorded as failed with its exit code.
+        """
+        class CrashingBenchmarkRunner(BenchmarkRunner):
+            result_poll_interval = 0.1
+
+            def start_case_process(self, context, case, result_queue):
+                process = context.Process(target=os._exit, args=(3,))
+                process.start()
+                return process
+
+        results = CrashingBenchmarkRunner(self.jobs_file_path, self.jobseeker_file_path, modes=['columnar']).run()
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['exit_code'], 3)
+        self.assertIn('error', results[0])
+
+
+
+if __name__ == '__main__':
+    unittest.main()
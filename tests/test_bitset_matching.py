@@ -0,0 +1,64 @@
+# unittest module for writing and running tests
+import unittest
+# numpy library for numerical arrays
+import numpy as np
+# custom skill vocabulary and incidence matrix classes for building test inputs
+from src.skill_matching.skill_vocabulary import SkillVocabulary, SkillMatrix
+# custom SparseMatchingBackend class for comparing the results
+from src.skill_matching.matching_backend import SparseMatchingBackend
+# custom BitsetMatchingBackend class for testing its functionalities
+from src.skill_matching.bitset_matching import BitsetMatchingBackend
+
+
+class TestBitsetMatchingBackendClass(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of BitsetMatchingBackend class.
+
+    This test suite class contains individual test functions for encoding skills as packed bitmasks
+    and calculating matching skill counts with popcount.
+    """
+
+    def test_encode_bitsets(self):
+        """
+        Function for testing packing skills into uint64 bitmasks.
+
+        It ensures that a vocabulary of more than 64 skills uses several words and that skills
+        unknown to the jobs are left out.
+        """
+        vocabulary = SkillVocabulary()
+        job_matrix = SkillMatrix.from_skills([", ".join(f"Skill {number}" for number in range(70))], vocabulary)
+        backend = BitsetMatchingBackend(job_matrix)
+        self.assertEqual(backend.job_bitsets.shape, (1, 2))
+        self.assertEqual(int(backend.popcount(backend.job_bitsets.copy(), np.empty_like(backend.job_bitsets))[0]), 70)
+
+        seeker_matrix = SkillMatrix.from_skills(["Skill 3, Skill 65, Cooking"], vocabulary, grow_vocabulary=False)
+        seeker_bitsets = backend.encode_bitsets(seeker_matrix)
+        self.assertEqual(int(backend.popcount(seeker_bitsets.copy(), np.empty_like(seeker_bitsets))[0]), 2)
+
+
+
+    def test_match_block(self):
+        """
+        Function for testing matching job seekers with bitmasks.
+
+        It ensures that the bitset backend gives the same pairs and counts as the sparse backend, also when
+        the blocks are smaller than the inputs.
+        """
+        random_generator = np.random.default_rng(0)
+        skills = [f"Skill {number}" for number in range(100)]
+        vocabulary = SkillVocabulary()
+        job_matrix = SkillMatrix.from_skills([", ".join(random_generator.choice(skills, size=5)) for _ in range(50)], vocabulary)
+        seeker_matrix = SkillMatrix.from_skills([", ".join(random_generator.choice(skills, size=4)) for _ in range(30)], vocabulary, grow_vocabulary=False)
+
+        backend = BitsetMatchingBackend(job_matrix)
+        backend.job_block_size = 7
+        backend.max_block_words = 20
+        expected = SparseMatchingBackend(job_matrix).match_block(seeker_matrix)
+        actual = backend.match_block(seeker_matrix)
+        for expected_array, actual_array in zip(expected, actual):
+            self.assertEqual(actual_array.tolist(), expected_array.tolist())
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+# os module for interacting with the operating system
+import os
+# shutil and tempfile modules for creating and removing a temporary directory
+import shutil
+import tempfile
+# unittest module for writing and running tests
+import unittest
+# pandas library for building the test tables
+import pandas as pd
+# custom RecommendationResult class for building the chunk results
+from src.recommendation_result.recommendation_result import RecommendationResult
+# custom CheckpointLog class for testing its functionalities
+from src.checkpoint.checkpoint_log import CheckpointLog
+
+
+class TestCheckpointLogClass(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of CheckpointLog class.
+
+    This test suite class contains individual test functions for committing chunks, resuming them and
+    discarding the work log of other inputs or settings.
+    """
+
+    def setUp(self):
+        """
+        Function for setting up the test cases.
+
+        It is called before performing each test case so as to set up necessary
+        resources for testing.
+        """
+        self.checkpoint_directory = tempfile.mkdtemp()
+        self.manifest = {'jobs': {'content_hash': 'a'}, 'jobseekers': {'content_hash': 'b'}, 'settings': {'top_k': None}}
+        self.jobs_df = pd.DataFrame({'id': [1, 2], 'title': ['Software Engineer', 'Data Scientist']})
+        self.chunks = [pd.DataFrame({'id': [number], 'name': [f'Job Seeker {number}']}) for number in range(4)]
+
+
+
+    def tearDown(self):
+        """
+        Function for cleaning up after performing each test case.
+
+        It is called after each test case for removing any resources created during testing.
+        """
+        shutil.rmtree(self.checkpoint_directory)
+
+
+
+    def match(self, jobseeker_chunks):
+        """
+        Function for matching every job seeker of a chunk with the first job.
+        """
+        for jobseekers_chunk in jobseeker_chunks:
+            yield RecommendationResult(jobseekers_chunk, self.jobs_df, [0], [0], [1], [50.0])
+
+
+
+    def run_log(self, checkpoint_log, stop_after=None):
+        """
+        Function for running the chunks through a work log, optionally stopping after some of them.
+        """
+        chunk_results = checkpoint_log.resume(self.match(checkpoint_log.unfinished(iter(self.chunks))), self.jobs_df)
+        return [chunk_result.jobseekers_df['id'].tolist() for _, chunk_result in zip(range(stop_after or len(self.chunks)), chunk_results)]
+
+
+
+    def test_resume(self):
+        """
+        Function for testing resuming a stopped run.
+
+        It ensures that the committed chunks are skipped and loaded with the jobs, in the order of the chunks.
+        """
+        checkpoint_log = CheckpointLog(self.checkpoint_directory, self.manifest)
+        self.assertListEqual(self.run_log(checkpoint_log, stop_after=2), [[0], [1]])
+        self.assertEqual(checkpoint_log.chunks_committed, 2)
+
+        # Resuming with the first two chunks loaded from the work log
+        checkpoint_log = CheckpointLog(self.checkpoint_directory, self.manifest)
+        self.assertSetEqual(checkpoint_log.finished_chunks, {0, 1})
+        self.assertEqual(len(list(checkpoint_log.unfinished(iter(self.chunks)))), 2)
+        self.assertListEqual(self.run_log(checkpoint_log), [[0], [1], [2], [3]])
+        self.assertEqual((checkpoint_log.chunks_resumed, checkpoint_log.chunks_committed), (2, 2))
+        self.assertIs(checkpoint_log.load(0, self.jobs_df).jobs_df, self.jobs_df)
+
+        with self.assertRaises(ValueError):
+            checkpoint_log.load(4, self.jobs_df)
+
+
+
+    def test_changed_manifest(self):
+        """
+        Function for testing that the work log of other inputs or settings is discarded together with partial files.
+        """
+        checkpoint_log = CheckpointLog(self.checkpoint_directory, self.manifest)
+        self.run_log(checkpoint_log)
+        with open(os.path.join(self.checkpoint_directory, 'chunk_00000004.pickle.1.tmp'), 'wb') as file:
+            file.write(b'partial')
+
+        checkpoint_log = CheckpointLog(self.checkpoint_directory, dict(self.manifest, settings={'top_k': 1}))
+        self.assertSetEqual(checkpoint_log.finished_chunks, set())
+        self.assertListEqual(os.listdir(self.checkpoint_directory), [CheckpointLog.manifest_file_name])
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+# os module for interacting with the operating system
+import os
+# shutil and tempfile modules for creating and removing a temporary directory
+import shutil
+import tempfile
+# unittest module for writing and running tests
+import unittest
+# pandas library for writing sorted input files
+import pandas as pd
+# custom SyntheticDataGenerator class for generating the input files
+from src.benchmark.data_generator import SyntheticDataGenerator
+# custom File class for counting the cleansed rows
+from src.file_reader.read_files import File
+# custom ExecutionPlanner class for testing its functionalities
+from src.execution_planner.execution_planner import ExecutionPlanner
+
+
+class TestExecutionPlannerClass(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of ExecutionPlanner and ExecutionPlan classes.
+
+    This test suite class contains individual test functions for estimating the statistics of the input files
+    and for choosing and explaining the plan.
+    """
+
+    def setUp(self):
+        """
+        Function for setting up the test cases.
+
+        It generates a jobs file and a job seekers file with duplicates and nulls in a temporary directory.
+        """
+        self.test_directory = tempfile.mkdtemp()
+        self.jobs_file_path = os.path.join(self.test_directory, 'jobs.csv')
+        self.jobseeker_file_path = os.path.join(self.test_directory, 'jobseekers.csv')
+        SyntheticDataGenerator(vocabulary_size=40, null_rate=0.05, duplicate_rate=0.05, seed=3).write_files(self.jobs_file_path, self.jobseeker_file_path, 4000, 2000)
+
+
+
+    def tearDown(self):
+        """
+        Function for cleaning up after performing each test case.
+        """
+        shutil.rmtree(self.test_directory)
+
+
+
+    def test_collect_statistics(self):
+        """
+        Function for testing the estimated statistics.
+
+        It ensures that the row counts are exact when the sample covers the files and close to the cleansed
+        row counts when they are extrapolated.
+        """
+        job_rows = len(File(self.jobs_file_path).read_file())
+        jobseeker_rows = len(File(self.jobseeker_file_path).read_file())
+
+        statistics = ExecutionPlanner(self.jobs_file_path, self.jobseeker_file_path, sample_rows=10000).collect_statistics()
+        self.assertTrue(statistics['jobs']['exact'])
+        self.assertEqual(statistics['jobs']['rows'], job_rows)
+        self.assertEqual(statistics['jobseekers']['rows'], jobseeker_rows)
+        self.assertEqual(statistics['vocabulary_size'], 40)
+        self.assertTrue(0 < statistics['overlap_rate'] <= 1)
+        self.assertGreaterEqual(statistics['skills_per_match'], 1)
+
+        statistics = ExecutionPlanner(self.jobs_file_path, self.jobseeker_file_path, sample_rows=200).collect_statistics()
+        self.assertFalse(statistics['jobs']['exact'])
+        self.assertLessEqual(statistics['jobs']['sampled_rows'], 200)
+        self.assertAlmostEqual(statistics['jobs']['rows'] / job_rows, 1, delta=0.1)
+        self.assertAlmostEqual(statistics['jobseekers']['rows'] / jobseeker_rows, 1, delta=0.1)
+
+
+
+    def test_collect_statistics_sorted_files(self):
+        """
+        Function for testing that the sample is spread over the whole file instead of taken from its beginning.
+
+        It ensures that the overlap rate of a jobs file sorted by skill is estimated from both of its halves.
+        """
+        pd.DataFrame({'id': range(4000), 'title': 'Developer', 'required_skills': ['Java'] * 2000 + ['Python'] * 2000}).to_csv(self.jobs_file_path, index=False)
+        pd.DataFrame({'id': range(100), 'name': 'Andrew', 'skills': 'Python'}).to_csv(self.jobseeker_file_path, index=False)
+        statistics = ExecutionPlanner(self.jobs_file_path, self.jobseeker_file_path, sample_rows=200).collect_statistics()
+        self.assertEqual(statistics['vocabulary_size'], 2)
+        self.assertAlmostEqual(statistics['overlap_rate'], 0.5, delta=0.15)
+        self.assertAlmostEqual(statistics['jobs']['rows'] / 4000, 1, delta=0.1)
+
+
+
+    def test_plan(self):
+        """
+        Function for testing choosing the plan.
+
+        It ensures that a single CPU core gives vectorized processing, that many cores and top_k, which makes
+        the matching dominate, give parallel processing and that configured settings are kept.
+        """
+        plan = ExecutionPlanner(self.jobs_file_path, self.jobseeker_file_path, cpu_count=1).plan()
+        self.assertEqual(plan.strategy, 'vectorized')
+        self.assertEqual(plan.workers, 1)
+        self.assertIn(plan.matching_backend, ('sparse', 'bitset'))
+
+        planner = ExecutionPlanner(self.jobs_file_path, self.jobseeker_file_path, cpu_count=64)
+        planner.seconds_per_worker_start = 0
+        plan = planner.plan(top_k=1)
+        self.assertEqual(plan.strategy, 'parallel')
+        self.assertEqual(plan.workers, 63)
+        self.assertLess(plan.costs['parallel processing'], plan.costs['vectorized processing'])
+
+        plan = planner.plan(matching_backend='inverted_index', pool_size=2, top_k=1)
+        self.assertEqual(plan.matching_backend, 'inverted_index')
+        self.assertEqual(plan.workers, 2)
+
+        # Checking that a small memory budget bounds the number of workers and the chunk size
+        planner.available_memory = 4000 * ExecutionPlanner.bytes_per_job * 6
+        plan = planner.plan(top_k=1)
+        self.assertEqual(plan.workers, 3)
+        self.assertEqual(plan.jobseeker_chunk_size, ExecutionPlanner.min_chunk_size)
+
+
+
+    def test_explain(self):
+        """
+        Function for testing the explain output of the plan.
+        """
+        plan = ExecutionPlanner(self.jobs_file_path, self.jobseeker_file_path, cpu_count=1).plan()
+        explanation = plan.explain()
+        self.assertTrue(explanation.startswith("Execution plan: vectorized processing"))
+        self.assertIn(f"matching backend: {plan.matching_backend}", explanation)
+        self.assertIn("overlap rate:", explanation)
+        self.assertIn("parallel processing:", explanation)
+        self.assertEqual(plan.to_dict()['jobseeker_chunk_size'], plan.jobseeker_chunk_size)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# os module for interacting with the operating system
+import os
+# unittest module for writing and running tests
+import unittest
+# numpy library for numerical arrays
+import numpy as np
+# pandas library for working with structured data
+import pandas as pd
+# custom RecommendationResult class for building columnar recommendations
+from src.recommendation_result.recommendation_result import RecommendationResult
+# custom ExternalRecommendationSorter class for testing its functionalities
+from src.external_sort.external_sort import ExternalRecommendationSorter
+
+
+class TestExternalRecommendationSorterClass(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of ExternalRecommendationSorter class.
+
+    This test suite class contains individual test functions for spilling sorted runs and merging them
+    in the order of sort_recommendations.
+    """
+
+    def setUp(self):
+        """
+        Function for setting up the test cases.
+
+        It is called before performing each test case so as to set up necessary
+        resources for testing.
+        """
+        random_generator = np.random.default_rng(0)
+        jobseekers_df = pd.DataFrame({'id': random_generator.permutation(40), 'name': [f"Seeker {number}" for number in range(40)]})
+        jobs_df = pd.DataFrame({'id': random_generator.permutation(30) + 100, 'title': [f"Job {number}" for number in range(30)]})
+        seeker_positions = np.repeat(np.arange(40), 30)
+        job_positions = np.tile(np.arange(30), 40)
+        # Drawing few distinct percentages, so that many recommendations tie on the percentage
+        matching_skill_percents = random_generator.choice([25.0, 50.0, 100.0], size=len(seeker_positions))
+        self.result = RecommendationResult(jobseekers_df, jobs_df, seeker_positions, job_positions, np.ones(len(seeker_positions)), matching_skill_percents)
+
+
+
+    def test_sort_dictionaries(self):
+        """
+        Function for testing sorting dictionaries with several spilled runs.
+
+        It ensures that the merged order is the one of sorting a DataFrame, ties broken by job ID, and
+        that the runs are removed when the sorter is closed.
+        """
+        recommendations = self.result.to_records()
+        expected = pd.DataFrame(recommendations).sort_values(by=['jobseeker_id', 'matching_skill_percent', 'job_id'],
+                                                             ascending=[True, False, True], kind='stable').to_dict('records')
+        with ExternalRecommendationSorter(memory_budget=100 * ExternalRecommendationSorter.bytes_per_row) as sorter:
+            for start in range(0, len(recommendations), 70):
+                sorter.add(recommendations[start:start + 70])
+            self.assertGreater(len(sorter.run_paths), 5)
+            self.assertEqual(sorter.rows_added, len(recommendations))
+            self.assertListEqual(list(sorter.sorted_records()), expected)
+            run_directory = sorter.run_directory
+        self.assertFalse(os.path.exists(run_directory))
+
+        with self.assertRaises(ValueError):
+            ExternalRecommendationSorter(0)
+        with self.assertRaises(TypeError):
+            ExternalRecommendationSorter(1.5)
+
+
+
+    def test_sort_results(self):
+        """
+        Function for testing sorting columnar results with several spilled runs.
+
+        It ensures that the merged order is the one of RecommendationResult.sort.
+        """
+        expected = self.result.sort().to_records()
+        with ExternalRecommendationSorter(memory_budget=250 * ExternalRecommendationSorter.bytes_per_result_row) as sorter:
+            for start in range(0, len(self.result), 100):
+                sorter.add(self.result.take(np.arange(start, min(start + 100, len(self.result)))))
+            self.assertGreater(len(sorter.run_paths), 1)
+            self.assertListEqual(list(sorter.sorted_records()), expected)
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+# os module for interacting with the operating system
+import os
+# shutil module for removing the cache directory
+import shutil
+# tempfile module for creating temporary directories
+import tempfile
+# unittest module for writing and running tests
+import unittest
+# pandas library for working with structured data
+import pandas as pd
+# custom ParsedFileCache class for testing its functionalities
+from src.file_reader.file_cache import ParsedFileCache
+# custom File class for reading files through the cache
+from src.file_reader.read_files import File
+# custom IngestOptions class for reading files in fast ingest mode
+from src.file_reader.ingest_options import IngestOptions
+# custom skill vocabulary class for building skill matrices
+from src.skill_matching.skill_vocabulary import SkillVocabulary
+
+
+class TestParsedFileCacheClass(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of ParsedFileCache class.
+
+    This test suite class contains individual test functions for storing, loading and invalidating
+    cached files, and for reading files through the cache.
+    """
+
+    def setUp(self):
+        """
+        Function for setting up the test cases.
+
+        It is called before performing each test case so as to set up necessary
+        resources for testing.
+        """
+        self.test_directory = tempfile.mkdtemp()
+        self.cache_directory = os.path.join(self.test_directory, 'cache')
+        self.path_test_file = os.path.join(self.test_directory, 'jobseekers.csv')
+        pd.DataFrame({
+            'id': [1, 2, 3],
+            'name': ['Andrew', 'Michelle', 'Léa'],
+            'skills': ['Python, SQL', 'Java, Python', 'Rust']
+        }).to_csv(self.path_test_file, index=False)
+
+
+
+    def tearDown(self):
+        """
+        Function for cleaning up after performing each test case.
+
+        It is called after each test case for removing any resources created during testing.
+        """
+        shutil.rmtree(self.test_directory)
+
+
+
+    def test_store_and_load(self):
+        """
+        Function for testing storing and loading a cached dataset.
+
+        It ensures that the loaded dataset and tokenized skills are identical to the stored ones.
+        """
+        data_set = File(self.path_test_file).read_file()
+        tokenized_skills = File.tokenize_skills(data_set)
+        cache = ParsedFileCache(self.cache_directory)
+        fingerprint = cache.fingerprint(self.path_test_file)
+        self.assertTrue(cache.store(fingerprint, data_set, tokenized_skills))
+
+        loaded_data_set, loaded_tokenized_skills = cache.load(fingerprint)
+        pd.testing.assert_frame_equal(loaded_data_set, data_set)
+        skill_tokens, indptr, indices = loaded_tokenized_skills['skills']
+        self.assertEqual(sorted(skill_tokens), ['Java', 'Python', 'Rust', 'SQL'])
+        self.assertEqual(indptr.tolist(), [0, 2, 4, 5])
+        self.assertEqual(sorted(skill_tokens[index] for index in indices[2:4]), ['Java', 'Python'])
+
+
+
+    def test_changed_file_invalidates_entry(self):
+        """
+        Function for testing the invalidation of a cache entry.
+
+        It ensures that an entry is not used once the contents of the source file have changed.
+        """
+        cache = ParsedFileCache(self.cache_directory)
+        fingerprint = cache.fingerprint(self.path_test_file)
+        data_set = File(self.path_test_file).read_file()
+        cache.store(fingerprint, data_set, File.tokenize_skills(data_set))
+
+        pd.DataFrame({'id': [1], 'name': ['Andrew'], 'skills': ['Go']}).to_csv(self.path_test_file, index=False)
+        self.assertIsNone(cache.load(cache.fingerprint(self.path_test_file)))
+        self.assertEqual(File(self.path_test_file, self.cache_directory).read_file()['skills'].tolist(), ['Go'])
+
+
+
+    def test_switching_ingest_modes(self):
+        """
+        Function for testing reading a file in fast ingest mode and in normal mode through one cache directory.
+
+        It ensures that every mode gets its own entry, so that neither mode is served the dataset of the other one,
+        and that the cached dataset of fast ingest mode keeps the declared data types.
+        """
+        pd.DataFrame({'id': [1, 2], 'name': ['Andrew', 'Michelle'], 'skills': ['Python', 'Rust'], 'unused': ['x', 'y']}).to_csv(self.path_test_file, index=False)
+        ingest_options = IngestOptions(IngestOptions.jobseeker_columns)
+        for _ in range(2):
+            self.assertListEqual(list(File(self.path_test_file, self.cache_directory).read_file().columns), ['id', 'name', 'skills', 'unused'])
+            fast_data_set = File(self.path_test_file, self.cache_directory, ingest_options=ingest_options).read_file()
+            self.assertListEqual(list(fast_data_set.columns), ['id', 'name', 'skills'])
+            self.assertEqual(fast_data_set['id'].dtype, 'Int64')
+        self.assertEqual(len(os.listdir(self.cache_directory)), 2)
+        self.assertNotEqual(ParsedFileCache.fingerprint(self.path_test_file), ParsedFileCache.fingerprint(self.path_test_file, ingest_options.describe()))
+
+
+
+    def test_store_non_text_object_column(self):
+        """
+        Function for testing storing a dataset with an object column holding non-string values.
+
+        It ensures that such a dataset is not cached.
+        """
+        cache = ParsedFileCache(self.cache_directory)
+        data_set = pd.DataFrame({'id': [1, 2], 'skills': ['Python', 3]})
+        self.assertFalse(cache.store(cache.fingerprint(self.path_test_file), data_set, {}))
+
+
+
+    def test_read_skill_matrix_from_cache(self):
+        """
+        Function for testing reading a skill matrix through the cache.
+
+        It ensures that the matrix built from the cached tokens equals the one built from the skills strings.
+        """
+        data_set, skill_matrix = File(self.path_test_file).read_skill_matrix('skills', SkillVocabulary())
+        for _ in range(2):
+            cached_data_set, cached_skill_matrix = File(self.path_test_file, self.cache_directory).read_skill_matrix('skills', SkillVocabulary())
+            pd.testing.assert_frame_equal(cached_data_set, data_set)
+            self.assertEqual(cached_skill_matrix.skill_counts.tolist(), skill_matrix.skill_counts.tolist())
+            self.assertEqual((cached_skill_matrix.matrix @ cached_skill_matrix.matrix.T).toarray().tolist(),
+                             (skill_matrix.matrix @ skill_matrix.matrix.T).toarray().tolist())
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+# os module for interacting with the operating system
+import os
+# shutil and tempfile modules for creating and removing a temporary directory
+import shutil
+import tempfile
+# unittest module for writing and running tests
+import unittest
+# pandas library for working with structured data
+import pandas as pd
+# custom JobMatchRecommendationEngine class for creating the incremental recommendations
+from src.jobseeker_recommendation_engine.job_match_recommendation import JobMatchRecommendationEngine
+# custom IncrementalRecommendations class for loading a saved state
+from src.incremental_update.incremental_recommendations import IncrementalRecommendations
+
+
+class TestIncrementalRecommendationsClass(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of IncrementalRecommendations class.
+
+    This test suite class contains individual test functions for applying job and job seeker deltas
+    and comparing the patched recommendations with a full run over the patched files.
+    """
+
+    def setUp(self):
+        """
+        Function for setting up the test cases.
+
+        It is called before performing each test case so as to set up necessary
+        resources for testing.
+        """
+        self.test_directory = tempfile.mkdtemp()
+        self.jobs_file_path = os.path.join(self.test_directory, 'jobs.csv')
+        self.jobseeker_file_path = os.path.join(self.test_directory, 'jobseekers.csv')
+        self.jobs_df = pd.DataFrame({
+            'id': [1, 2, 3],
+            'title': ['Software Engineer', 'Data Scientist', 'Web Developer'],
+            'required_skills': ['Python, Java', 'Python, SQL, R', 'JavaScript, HTML/CSS']
+        })
+        self.jobseekers_df = pd.DataFrame({
+            'id': [1, 2, 3],
+            'name': ['Michelle', 'Andrew', 'Léa'],
+            'skills': ['Python, SQL', 'Java, JavaScript', 'R']
+        })
+        self.write_files()
+
+
+
+    def tearDown(self):
+        """
+        Function for cleaning up after performing each test case.
+
+        It is called after each test case for removing any resources created during testing.
+        """
+        shutil.rmtree(self.test_directory)
+
+
+
+    def write_files(self):
+        """
+        Function for writing the current jobs and job seekers to the input files.
+        """
+        self.jobs_df.to_csv(self.jobs_file_path, index=False)
+        self.jobseekers_df.to_csv(self.jobseeker_file_path, index=False)
+
+
+
+    def assert_matches_full_run(self, engine, incremental_recommendations):
+        """
+        Function for asserting that the patched recommendations equal a full run over the input files.
+        """
+        self.assertListEqual(incremental_recommendations.to_records(), engine.sequential_processing())
+
+
+
+    def test_update_jobs(self):
+        """
+        Function for testing applying added, modified and removed jobs.
+
+        It ensures that only the affected pairs are rescored and that the result equals a full run.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        incremental_recommendations = engine.incremental_processing()
+        self.assert_matches_full_run(engine, incremental_recommendations)
+
+        # Removing the first job, modifying the second one and adding a fourth one
+        changed_jobs_df = pd.DataFrame({'id': [2, 4], 'title': ['Data Analyst', 'Backend Developer'], 'required_skills': ['SQL', 'Java, SQL']})
+        self.jobs_df = pd.concat([self.jobs_df.iloc[1:], changed_jobs_df.iloc[1:]])
+        self.jobs_df.loc[self.jobs_df['id'] == 2, ['title', 'required_skills']] = ['Data Analyst', 'SQL']
+        self.write_files()
+
+        # Checking that only the pairs sharing a skill with the old or new version of the changed jobs are touched
+        rescored_pairs = incremental_recommendations.update_jobs(changed_jobs_df, removed_job_ids=[1])
+        self.assertEqual(rescored_pairs, 7)
+        self.assert_matches_full_run(engine, incremental_recommendations)
+
+
+
+    def test_update_jobseekers_with_top_k(self):
+        """
+        Function for testing applying added, modified and removed job seekers with top_k set.
+
+        It ensures that the best matches of the patched job seekers equal a full run.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        engine.set_top_k(1)
+        incremental_recommendations = engine.incremental_processing()
+
+        # Removing the second job seeker, modifying the third one and adding a fourth one
+        changed_jobseekers_df = pd.DataFrame({'id': [3, 4], 'name': ['Léa', 'Sam'], 'skills': ['R, SQL, Python', 'HTML/CSS']})
+        self.jobseekers_df = pd.concat([self.jobseekers_df.iloc[[0, 2]], changed_jobseekers_df.iloc[1:]])
+        self.jobseekers_df.loc[self.jobseekers_df['id'] == 3, 'skills'] = 'R, SQL, Python'
+        self.write_files()
+
+        incremental_recommendations.update_jobseekers(changed_jobseekers_df, removed_jobseeker_ids=[2])
+        self.assert_matches_full_run(engine, incremental_recommendations)
+        self.assertEqual(incremental_recommendations.jobseeker_recommendations(3)[0]['job_id'], 2)
+
+
+
+    def test_apply_delta_file(self):
+        """
+        Function for testing applying a delta CSV file with an operation column.
+
+        It ensures that upserted and removed rows are applied and that unknown operations are rejected.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        incremental_recommendations = engine.incremental_processing()
+
+        delta_file_path = os.path.join(self.test_directory, 'jobs_delta.csv')
+        pd.DataFrame({'operation': ['remove', 'upsert'], 'id': [3, 5], 'title': [None, 'R Developer'],
+                      'required_skills': [None, 'R']}).to_csv(delta_file_path, index=False)
+        incremental_recommendations.apply_delta_file(delta_file_path, 'jobs')
+        self.jobs_df = pd.concat([self.jobs_df.iloc[:2], pd.DataFrame({'id': [5], 'title': ['R Developer'], 'required_skills': ['R']})])
+        self.write_files()
+        self.assert_matches_full_run(engine, incremental_recommendations)
+
+        with self.assertRaises(ValueError):
+            incremental_recommendations.apply_delta(pd.DataFrame({'operation': ['rename'], 'id': [1]}), 'jobs')
+        with self.assertRaises(ValueError):
+            incremental_recommendations.apply_delta(pd.DataFrame({'operation': ['remove'], 'id': [1]}), 'companies')
+
+
+
+    def test_apply_appended_rows(self):
+        """
+        Function for testing applying rows appended to a tracked input file.
+
+        It ensures that only complete lines appended after the tracked offset are applied.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        incremental_recommendations = engine.incremental_processing()
+        self.assertEqual(incremental_recommendations.apply_appended_rows(self.jobseeker_file_path, 'jobseekers'), 0)
+
+        # Appending one complete job seeker and one which is still being written
+        with open(self.jobseeker_file_path, 'a') as file:
+            file.write('4,Sam,"SQL, HTML/CSS"\n5,Kim,"Ja')
+        incremental_recommendations.apply_appended_rows(self.jobseeker_file_path, 'jobseekers')
+        self.assertListEqual([recommendation['job_id'] for recommendation in incremental_recommendations.jobseeker_recommendations(4)], [2, 3])
+        self.assertNotIn(5, incremental_recommendations.row_positions['jobseekers'])
+
+        # Finishing the last line
+        with open(self.jobseeker_file_path, 'a') as file:
+            file.write('va"\n')
+        incremental_recommendations.apply_appended_rows(self.jobseeker_file_path, 'jobseekers')
+        self.assert_matches_full_run(engine, incremental_recommendations)
+
+
+
+    def test_save_and_load(self):
+        """
+        Function for testing saving the state to disk and applying deltas to the loaded state.
+
+        It ensures that the loaded state gives the same recommendations and tracked files, and that skills first
+        seen in one table are matched by rows added to the other table later.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        engine.set_top_k(2)
+        path_state = os.path.join(self.test_directory, 'state.npz')
+        engine.incremental_processing().save(path_state)
+        incremental_recommendations = IncrementalRecommendations.load(path_state)
+        self.assert_matches_full_run(engine, incremental_recommendations)
+        self.assertEqual(incremental_recommendations.file_offsets[os.path.abspath(self.jobs_file_path)], os.path.getsize(self.jobs_file_path))
+
+        # Adding a job seeker with a skill no job requires yet, and then a job requiring it
+        changed_jobseekers_df = pd.DataFrame({'id': [4], 'name': ['Sam'], 'skills': ['Go, SQL']})
+        changed_jobs_df = pd.DataFrame({'id': [4], 'title': ['Go Developer'], 'required_skills': ['Go']})
+        incremental_recommendations.update_jobseekers(changed_jobseekers_df)
+        self.assertEqual(incremental_recommendations.update_jobs(changed_jobs_df), 1)
+        self.jobseekers_df = pd.concat([self.jobseekers_df, changed_jobseekers_df])
+        self.jobs_df = pd.concat([self.jobs_df, changed_jobs_df])
+        self.write_files()
+        self.assert_matches_full_run(engine, incremental_recommendations)
+
+        with self.assertRaises(ValueError):
+            IncrementalRecommendations.load(os.path.join(self.test_directory, 'missing.npz'))
+
+
+
+    def test_unique_ids(self):
+        """
+        Function for testing incremental processing of files with duplicate IDs.
+
+        It ensures that a ValueError is raised, since the rows are identified by their IDs.
+        """
+        self.jobs_df = pd.concat([self.jobs_df, self.jobs_df.assign(title='Copy')])
+        self.write_files()
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        with self.assertRaises(ValueError):
+            engine.incremental_processing()
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+# unittest module for writing and running tests
+import unittest
+# patch function from unittest.mock module for hiding the optional pyarrow library
+from unittest.mock import patch
+# pandas library for the column data types
+import pandas as pd
+# custom IngestOptions class for testing its functionalities
+from src.file_reader.ingest_options import IngestOptions
+
+
+class TestIngestOptionsClass(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of IngestOptions class.
+
+    This test suite class contains individual test functions for validating the options and resolving the
+    parser and data types, with and without pyarrow.
+    """
+
+    def test_validate_options(self):
+        """
+        Function for testing rejecting unknown parsers, string storages and column kinds.
+        """
+        with self.assertRaises(ValueError):
+            IngestOptions(IngestOptions.job_columns, parser='python')
+        with self.assertRaises(ValueError):
+            IngestOptions(IngestOptions.job_columns, string_storage='object')
+        with self.assertRaises(ValueError):
+            IngestOptions({'id': 'number'})
+        self.assertListEqual(IngestOptions(IngestOptions.jobseeker_columns).usecols, ['id', 'name', 'skills'])
+
+
+
+    def test_resolve_options(self):
+        """
+        Function for testing resolving the parser and data types.
+
+        It ensures that pyarrow is used when installed and requested, and that the C parser and categoricals
+        are used instead when pyarrow is not installed.
+        """
+        ingest_options = IngestOptions(IngestOptions.job_columns, parser='pyarrow')
+        if IngestOptions.pyarrow_available():
+            self.assertEqual(ingest_options.resolve_parser(), 'pyarrow')
+            self.assertEqual(ingest_options.dtypes()['title'], pd.StringDtype('pyarrow'))
+        self.assertEqual(IngestOptions(IngestOptions.job_columns, parser='c').resolve_parser(), 'c')
+        self.assertEqual(IngestOptions(IngestOptions.job_columns, string_storage='category').dtypes()['required_skills'], 'category')
+        self.assertEqual(ingest_options.dtypes()['id'], 'Int64')
+
+        with patch('src.file_reader.ingest_options.pyarrow', None):
+            self.assertFalse(IngestOptions.pyarrow_available())
+            self.assertEqual(ingest_options.resolve_parser(), 'c')
+            self.assertEqual(ingest_options.dtypes()['title'], 'category')
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+# os module for interacting with the operating system
+import os
+# unittest module for writing and running tests
+import unittest
+# pandas library for working with structured data
+import pandas as pd
+# custom skill vocabulary and incidence matrix classes for building test inputs
+from src.skill_matching.skill_vocabulary import SkillVocabulary, SkillMatrix
+# custom SparseMatchingBackend class for comparing the results
+from src.skill_matching.matching_backend import SparseMatchingBackend
+# custom inverted index classes for testing their functionalities
+from src.skill_matching.inverted_index import SkillInvertedIndex, InvertedIndexMatchingBackend
+
+
+class TestSkillInvertedIndexClass(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of SkillInvertedIndex and InvertedIndexMatchingBackend classes.
+
+    This test suite class contains individual test functions for building, querying and persisting the 
+    inverted index and for matching job seekers through the posting lists.
+    """
+
+    def setUp(self):
+        """
+        Function for setting up the test cases.
+
+        It is called before performing each test case so as to set up necessary
+        resources for testing.
+        """
+        self.jobs_df = pd.DataFrame({'id': [1, 2, 3], 'title': ['Software Engineer', 'Data Scientist', 'Web Developer'],
+                                     'required_skills': ['Python, R', 'Python, Java', 'Docker, React']}, index=[10, 11, 12])
+        self.path_index_file = 'inverted_index_sample.npz'
+
+
+
+    def tearDown(self):
+        """
+        Function for cleaning up after performing each test case.
+
+        It is called after each test case for removing any resources created during testing.
+        """
+        if os.path.exists(self.path_index_file):
+            os.remove(self.path_index_file)
+
+
+
+    def test_candidate_jobs(self):
+        """
+        Function for testing finding candidate jobs for a skills string.
+
+        It ensures that the candidates are exactly the jobs sharing at least one skill.
+        """
+        inverted_index = SkillInvertedIndex.from_jobs(self.jobs_df)
+        self.assertEqual(inverted_index.candidate_jobs("Python, SQL").tolist(), [0, 1])
+        self.assertEqual(inverted_index.candidate_jobs("React").tolist(), [2])
+        self.assertEqual(len(inverted_index.candidate_jobs("Cooking")), 0)
+
+        # Merging only the postings of the rarest skill when two shared skills are needed
+        self.assertEqual(inverted_index.candidate_jobs("Python, R", minimum_overlap=2).tolist(), [0])
+        self.assertEqual(len(inverted_index.candidate_jobs("Python, SQL", minimum_overlap=3)), 0)
+        self.assertEqual(inverted_index.job_labels.tolist(), [10, 11, 12])
+
+
+
+    def test_save_and_load(self):
+        """
+        Function for testing persisting the inverted index.
+
+        It ensures that a loaded index gives the same candidates as the saved one.
+        """
+        SkillInvertedIndex.from_jobs(self.jobs_df).save(self.path_index_file)
+        inverted_index = SkillInvertedIndex.load(self.path_index_file)
+        self.assertEqual(len(inverted_index), 3)
+        self.assertEqual(inverted_index.candidate_jobs("Java, Docker").tolist(), [1, 2])
+
+
+
+    def test_load_nonexistent_file(self):
+        """
+        Function for testing loading a non-existent inverted index file.
+
+        It ensures that a ValueError is raised.
+        """
+        with self.assertRaises(ValueError):
+            SkillInvertedIndex.load('non_existent_index.npz')
+
+
+
+    def test_match_block(self):
+        """
+        Function for testing matching job seekers through the posting lists.
+
+        It ensures that the inverted index backend gives the same pairs and counts as the sparse backend.
+        """
+        vocabulary = SkillVocabulary()
+        job_matrix = SkillMatrix.from_skills(self.jobs_df['required_skills'], vocabulary)
+        seeker_matrix = SkillMatrix.from_skills(["Python, SQL", "Java, Python", "Cooking"], vocabulary, grow_vocabulary=False)
+        expected = SparseMatchingBackend(job_matrix).match_block(seeker_matrix)
+        actual = InvertedIndexMatchingBackend(job_matrix).match_block(seeker_matrix)
+        for expected_array, actual_array in zip(expected, actual):
+            self.assertEqual(actual_array.tolist(), expected_array.tolist())
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,12 +6,23 @@ import unittest
 import pandas as pd
 # os module for operating system functionalities
 import os
+# shutil and tempfile modules for creating and removing a temporary cache directory
+import shutil
+import tempfile
 # multiprocessing module for parallel processing
 import multiprocessing as mp
 # patch function from unittest.mock module for mocking objects during testing
 from unittest.mock import patch
 # custom JobMatchRecommendationEngine class for testing its functions
 from src.jobseeker_recommendation_engine.job_match_recommendation import JobMatchRecommendationEngine
+# custom worker functions of parallel processing for testing them in-process
+from src.jobseeker_recommendation_engine.job_match_recommendation import initialize_worker, process_jobseeker_chunk
+# custom File class for reading the sample files
+from src.file_reader.read_files import File
+# custom skill vocabulary and incidence matrix classes for building the worker inputs
+from src.skill_matching.skill_vocabulary import SkillVocabulary, SkillMatrix
+# custom CsvResultSink class for streaming recommendations into a file
+from src.result_sink.result_sinks import CsvResultSink
 
 
 class TestJobMatchRecommendationEngineClass(unittest.TestCase):
@@ -116,6 +127,262 @@ class TestJobMatchRecommendationEngineClass(unittest.TestCase):
 
 
 
+    def test_vectorized_processing(self):
+        """
+        Function for testing the accuracy of vectorized_processing function.
+
+        It ensures that the vectorized processing gives exactly the same recommendations, in the same order, 
+        as the sequential processing.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        recommendations = engine.vectorized_processing(jobseeker_chunk_size=1)
+
+        # Checking that the recommendations are identical to the sequential processing
+        self.assertEqual(len(recommendations), 4)
+        self.assertListEqual(recommendations, engine.sequential_processing())
+
+
+
+    def test_set_matching_backend(self):
+        """
+        Function for testing setting the backend used by vectorized processing.
+
+        It ensures that every backend gives the same recommendations and that an unknown backend
+        raises a ValueError.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        expected_recommendations = engine.sequential_processing()
+        for matching_backend in engine.matching_backends:
+            engine.set_matching_backend(matching_backend)
+            self.assertListEqual(engine.vectorized_processing(), expected_recommendations)
+
+        with self.assertRaises(ValueError):
+            engine.set_matching_backend("unknown")
+
+
+
+    def test_minhash_lsh(self):
+        """
+        Function for testing the approximate 'minhash_lsh' matching backend.
+
+        It ensures that its recommendations are exact recommendations, that a very loose setting finds all of
+        them, and that invalid LSH parameters are rejected.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        expected_recommendations = engine.sequential_processing()
+        engine.set_matching_backend("minhash_lsh")
+        recommendations = engine.vectorized_processing()
+        self.assertTrue(all(recommendation in expected_recommendations for recommendation in recommendations))
+
+        engine.set_lsh_parameters(64, 1)
+        self.assertListEqual(engine.vectorized_processing(), expected_recommendations)
+        self.assertListEqual(engine.parallel_processing(), expected_recommendations)
+
+        with self.assertRaises(TypeError):
+            engine.set_lsh_parameters(16.0, 2)
+        with self.assertRaises(ValueError):
+            engine.set_lsh_parameters(16, 0)
+
+
+
+    def test_top_k(self):
+        """
+        Function for testing keeping only the best recommendations of each job seeker.
+
+        It ensures that the sequential, vectorized and parallel processing keep the same best job per job seeker.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        engine.set_top_k(1)
+        recommendations = engine.sequential_processing()
+
+        # Andrew's best job is the Data Scientist job matching both of his skills
+        self.assertEqual(len(recommendations), 2)
+        self.assertEqual(recommendations[1]['job_id'], 2)
+        self.assertEqual(recommendations[1]['matching_skill_percent'], 100.0)
+        self.assertListEqual(engine.vectorized_processing(), recommendations)
+        self.assertListEqual(engine.parallel_processing(), recommendations)
+
+
+
+    def test_top_k_ties(self):
+        """
+        Function for testing that top_k breaks ties by job ID like sorting all recommendations.
+
+        It ensures that every processing path, the incremental recommendations and the recommendation index keep
+        the jobs with the smallest IDs among equally good jobs listed out of order.
+        """
+        test_directory = tempfile.mkdtemp()
+        try:
+            path_jobs, path_jobseekers = os.path.join(test_directory, 'jobs.csv'), os.path.join(test_directory, 'jobseekers.csv')
+            pd.DataFrame({'id': [3, 1, 2], 'title': ['C', 'A', 'B'], 'required_skills': ['Python'] * 3}).to_csv(path_jobs, index=False)
+            pd.DataFrame({'id': [1], 'name': ['Andrew'], 'skills': ['Python']}).to_csv(path_jobseekers, index=False)
+            engine = JobMatchRecommendationEngine(path_jobs, path_jobseekers)
+            expected_job_ids = engine.sort_recommendations(engine.vectorized_processing(), as_dataframe=True)['job_id'].tolist()[:2]
+            self.assertListEqual(expected_job_ids, [1, 2])
+
+            engine.set_top_k(2)
+            for recommendations in [engine.sequential_processing(), engine.vectorized_processing(), engine.parallel_processing(),
+                                    engine.incremental_processing().jobseeker_recommendations(1),
+                                    engine.build_recommendation_index().recommend('Python', top_k=2)]:
+                self.assertListEqual([recommendation['job_id'] for recommendation in recommendations], expected_job_ids)
+        finally:
+            shutil.rmtree(test_directory)
+
+
+
+    def test_set_scoring_kernel(self):
+        """
+        Function for testing scoring the recommendations with another kernel.
+
+        It ensures that every processing path gives the same scores and best jobs with the Jaccard and IDF kernels,
+        that the Jaccard similarity is at most the matching skill percentage and that invalid kernels are rejected.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        overlap_recommendations = engine.vectorized_processing()
+
+        for scoring_kernel in ["jaccard", "idf_overlap"]:
+            engine.set_scoring_kernel(scoring_kernel)
+            engine.set_top_k(None)
+            recommendations = engine.sequential_processing()
+            self.assertListEqual(engine.vectorized_processing(jobseeker_chunk_size=1), recommendations)
+            self.assertListEqual(engine.parallel_processing(), recommendations)
+            self.assertEqual(len(recommendations), len(overlap_recommendations))
+
+            # Keeping the best job per job seeker by the score of the kernel
+            engine.set_top_k(1)
+            best_recommendations = engine.sequential_processing()
+            self.assertListEqual(engine.vectorized_processing(), best_recommendations)
+            self.assertListEqual(engine.parallel_processing(), best_recommendations)
+            for best_recommendation in best_recommendations:
+                self.assertEqual(best_recommendation['matching_skill_percent'],
+                                 max(recommendation['matching_skill_percent'] for recommendation in recommendations
+                                     if recommendation['jobseeker_id'] == best_recommendation['jobseeker_id']))
+
+        engine.set_scoring_kernel("jaccard")
+        engine.set_top_k(None)
+        for jaccard_recommendation, overlap_recommendation in zip(engine.vectorized_processing(), overlap_recommendations):
+            self.assertLessEqual(jaccard_recommendation['matching_skill_percent'], overlap_recommendation['matching_skill_percent'])
+
+        with self.assertRaises(ValueError):
+            engine.incremental_processing()
+        with self.assertRaises(ValueError):
+            engine.set_scoring_kernel("cosine")
+        with self.assertRaises(TypeError):
+            engine.set_scoring_kernel(1)
+
+
+
+    def test_min_match(self):
+        """
+        Function for testing a minimum matching skill count and percentage.
+
+        It ensures that every processing path gives the same recommendations as filtering all recommendations,
+        also together with top_k, and that invalid minimums are rejected.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        all_recommendations = engine.sequential_processing()
+
+        for min_match_count, min_match_percent in [(2, 0), (1, 100), (1, 50)]:
+            engine.set_min_match_count(min_match_count)
+            engine.set_min_match_percent(min_match_percent)
+            expected = [recommendation for recommendation in all_recommendations
+                        if recommendation['matching_skill_count'] >= min_match_count and recommendation['matching_skill_percent'] >= min_match_percent]
+            self.assertListEqual(engine.sequential_processing(), expected)
+            self.assertListEqual(engine.vectorized_processing(jobseeker_chunk_size=1), expected)
+            self.assertListEqual(engine.parallel_processing(), expected)
+
+        # Keeping the best of the remaining recommendations of every job seeker
+        engine.set_top_k(1)
+        best_recommendations = engine.vectorized_processing()
+        self.assertEqual(len(best_recommendations), len({recommendation['jobseeker_id'] for recommendation in expected}))
+        self.assertListEqual(engine.sequential_processing(), best_recommendations)
+
+        with self.assertRaises(ValueError):
+            engine.incremental_processing()
+        with self.assertRaises(ValueError):
+            engine.set_min_match_count(0)
+        with self.assertRaises(TypeError):
+            engine.set_min_match_percent("50")
+        with self.assertRaises(ValueError):
+            engine.set_min_match_percent(101)
+
+
+
+    def test_iter_recommendations(self):
+        """
+        Function for testing streaming the recommendations one job seeker chunk at a time.
+
+        It ensures that one list is yielded per chunk and that the streamed recommendations are identical to the 
+        sequential processing, with and without the pool of worker processes.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        expected_recommendations = engine.sequential_processing()
+        for parallel in [False, True]:
+            chunks = list(engine.iter_recommendations(jobseeker_chunk_size=1, parallel=parallel))
+            self.assertEqual(len(chunks), 2)
+            self.assertListEqual([recommendation for chunk in chunks for recommendation in chunk], expected_recommendations)
+
+
+
+    def test_write_recommendations(self):
+        """
+        Function for testing streaming the recommendations into a result sink.
+
+        It ensures that all recommendations are written to the sink's file.
+        """
+        path_output_file = 'recommendations_sample.csv'
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        rows_written = engine.write_recommendations(CsvResultSink(path_output_file, buffer_size=3), jobseeker_chunk_size=1)
+        written_recommendations = pd.read_csv(path_output_file).to_dict('records')
+        os.remove(path_output_file)
+
+        self.assertEqual(rows_written, 4)
+        self.assertListEqual(written_recommendations, engine.sequential_processing())
+
+
+
+    def test_columnar_processing(self):
+        """
+        Function for testing generating the recommendations as a columnar result.
+
+        It ensures that the columnar result holds the same recommendations as the sequential processing and that
+        sorting it gives the same DataFrame as sorting the list of dictionaries.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        recommendations = engine.sequential_processing()
+        result = engine.columnar_processing(jobseeker_chunk_size=1)
+        self.assertListEqual(result.to_records(), recommendations)
+
+        # Sorting without and with building a DataFrame
+        self.assertEqual(len(engine.sort_recommendations(result)), 4)
+        sorted_df = engine.sort_recommendations(result, as_dataframe=True)
+        self.assertTrue(sorted_df.equals(engine.sort_recommendations(recommendations).reset_index(drop=True)))
+
+
+
+    def test_cache_directory(self):
+        """
+        Function for testing reading the input files through the parsed file cache.
+
+        It ensures that the cache is filled on the first run and that the recommendations are unchanged on later runs.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        recommendations = engine.sequential_processing()
+        with self.assertRaises(TypeError):
+            engine.set_cache_directory(1)
+
+        cache_directory = tempfile.mkdtemp()
+        try:
+            engine.set_cache_directory(cache_directory)
+            for _ in range(2):
+                self.assertListEqual(engine.vectorized_processing(), recommendations)
+                self.assertListEqual(engine.sequential_processing(), recommendations)
+            self.assertEqual(len(os.listdir(cache_directory)), 2)
+        finally:
+            shutil.rmtree(cache_directory)
+
+
+
     def test_get_pool_size_valid(self):
         """
         Function for testing the pool size calculation with valid CPU count.
@@ -153,6 +420,24 @@ class TestJobMatchRecommendationEngineClass(unittest.TestCase):
 
 
 
+    def test_set_pool_size(self):
+        """
+        Function for testing setting the number of worker processes.
+
+        It ensures that a set pool size overrides the CPU count and that invalid values are rejected.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        engine.set_pool_size(3)
+        self.assertEqual(engine.get_pool_size(), 3)
+        engine.set_pool_size(None)
+        self.assertEqual(engine.get_pool_size(), max(mp.cpu_count() - 1, 1))
+        with self.assertRaises(ValueError):
+            engine.set_pool_size(0)
+        with self.assertRaises(TypeError):
+            engine.set_pool_size(2.0)
+
+
+
     def test_parallel_processing(self):
         """
         Function for testing the parallel processing of job matching.
@@ -179,6 +464,110 @@ class TestJobMatchRecommendationEngineClass(unittest.TestCase):
         for recommendation in recommendations:
             self.assertTrue(all(key in recommendation for key in expected_keys))
 
+        # Asserting that the recommendations are identical to the sequential processing, also with one job seeker per chunk
+        self.assertListEqual(recommendations, engine.sequential_processing())
+        self.assertListEqual(engine.parallel_processing(jobseeker_chunk_size=1), recommendations)
+
+        # Accepting the deprecated job chunk size of earlier versions with a warning
+        with self.assertWarns(DeprecationWarning):
+            self.assertListEqual(engine.parallel_processing(1000, 1000), recommendations)
+
+
+
+    def test_open_worker_pool(self):
+        """
+        Function for testing keeping the worker processes warm across parallel runs.
+
+        It ensures that the runs inside open_worker_pool reuse one pool, that changing a setting restarts it and
+        that the recommendations are the same as without a warm pool.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        expected = engine.parallel_processing()
+        engine.set_pool_size(2)
+        engine.set_worker_chunksize(2)
+
+        with engine.open_worker_pool() as worker_pool:
+            self.assertListEqual(engine.parallel_processing(jobseeker_chunk_size=1), expected)
+            self.assertListEqual(engine.parallel_processing(), expected)
+            self.assertEqual(worker_pool.pools_started, 1)
+
+            # Restarting the pool for another setting of the engine
+            engine.set_top_k(1)
+            self.assertEqual(len(engine.parallel_processing()), len(engine.sequential_processing()))
+            self.assertEqual(worker_pool.pools_started, 2)
+            processes = list(worker_pool.pool._pool)
+
+        self.assertIsNone(engine.worker_pool)
+        self.assertFalse(any(process.is_alive() for process in processes))
+
+        with self.assertRaises(ValueError):
+            engine.set_worker_chunksize(0)
+
+
+
+    def test_checkpoint_directory(self):
+        """
+        Function for testing resuming a checkpointed run.
+
+        It ensures that a run stopped after its first chunk is resumed without matching that chunk again, that
+        the resumed output file is identical to the one of an uninterrupted run and that changed settings
+        discard the work log.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        with self.assertRaises(TypeError):
+            engine.set_checkpoint_directory(1)
+
+        test_directory = tempfile.mkdtemp()
+        try:
+            path_expected, path_resumed = os.path.join(test_directory, 'expected.csv'), os.path.join(test_directory, 'resumed.csv')
+            engine.write_recommendations(CsvResultSink(path_expected), jobseeker_chunk_size=1, parallel=True)
+            engine.set_checkpoint_directory(os.path.join(test_directory, 'checkpoint'))
+
+            # Stopping a run after its first chunk, as if it was killed
+            chunks = engine.iter_recommendations(jobseeker_chunk_size=1, parallel=True)
+            next(chunks)
+            chunks.close()
+
+            engine.set_instrumentation(True)
+            engine.write_recommendations(CsvResultSink(path_resumed), jobseeker_chunk_size=1, parallel=True)
+            self.assertEqual(engine.get_run_statistics().counters['chunks_resumed'], 1)
+            self.assertEqual(engine.get_run_statistics().counters['chunks_dispatched'], 1)
+            with open(path_expected, 'rb') as file, open(path_resumed, 'rb') as other_file:
+                self.assertEqual(file.read(), other_file.read())
+
+            # Matching every chunk again after a setting changed
+            engine.set_top_k(1)
+            self.assertEqual(len(engine.parallel_processing(jobseeker_chunk_size=1)), 2)
+            self.assertEqual(engine.get_run_statistics().counters['chunks_resumed'], 0)
+        finally:
+            shutil.rmtree(test_directory)
+
+
+
+    def test_process_jobseeker_chunk(self):
+        """
+        Function for testing the worker functions of parallel processing.
+
+        It ensures that a worker initialized once with the jobs matches a chunk of job seekers
+        against all jobs.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        jobs_df = File(self.jobs_file_path).read_file()
+        jobseekers_df = File(self.jobseeker_file_path).read_file()
+
+        # Loading the jobs into the current process the same way as the pool initializer
+        vocabulary = SkillVocabulary()
+        backend = engine.create_matching_backend(SkillMatrix.from_skills(jobs_df['required_skills'], vocabulary))
+        initialize_worker(jobs_df[['id', 'title']], vocabulary, backend)
+
+        # Checking that the second job seeker matches the first two jobs
+        chunk_result = process_jobseeker_chunk(jobseekers_df.iloc[1:])
+        self.assertIsNone(chunk_result.jobs_df)
+        chunk_result.jobs_df = jobs_df
+        recommendations = chunk_result.to_records()
+        self.assertListEqual([recommendation['job_id'] for recommendation in recommendations], [1, 2])
+        self.assertListEqual([recommendation['matching_skill_count'] for recommendation in recommendations], [1, 2])
+
 
 
     def test_generate_recommendations(self):
@@ -208,6 +597,213 @@ class TestJobMatchRecommendationEngineClass(unittest.TestCase):
 
 
 
+    def test_plan_execution(self):
+        """
+        Function for testing planning and running the plan of generate_recommendations.
+
+        It ensures that the configured settings are kept in the plan and that every plan gives the same
+        recommendations without changing the configured settings.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        plan = engine.plan_execution()
+        self.assertIn(plan.strategy, ('vectorized', 'parallel'))
+        self.assertIn("Execution plan:", engine.explain_plan())
+
+        engine.set_matching_backend('inverted_index')
+        self.assertEqual(engine.plan_execution().matching_backend, 'inverted_index')
+
+        # Running a parallel plan with two workers and one job seeker per chunk
+        recommendations = engine.sequential_processing()
+        plan.strategy, plan.matching_backend, plan.workers, plan.jobseeker_chunk_size = 'parallel', 'sparse', 2, 1
+        self.assertListEqual(engine.execute_plan(plan), recommendations)
+        self.assertEqual(engine.matching_backend, 'inverted_index')
+        self.assertIsNone(engine.pool_size)
+
+
+
+    def test_instrumentation(self):
+        """
+        Function for testing the per-stage timings and counters of the runs.
+
+        It ensures that an instrumented run records its stages and counters and calls the callback, that a
+        processing function called by generate_recommendations adds to the same run and that disabling the
+        instrumentation drops the statistics.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        self.assertIsNone(engine.get_run_statistics())
+        with self.assertRaises(TypeError):
+            engine.set_instrumentation('yes')
+        with self.assertRaises(TypeError):
+            engine.set_instrumentation(True, 'callback')
+
+        events = []
+        engine.set_instrumentation(True, lambda stage, run_statistics: events.append(stage))
+        recommendations = engine.generate_recommendations()
+        engine.sort_recommendations(recommendations)
+        run_statistics = engine.get_run_statistics()
+        self.assertIn('plan', run_statistics.stages)
+        self.assertIn('read_jobs', run_statistics.stages)
+        self.assertIn('sort', run_statistics.stages)
+        self.assertEqual(run_statistics.counters['matches_emitted'], len(recommendations))
+        self.assertEqual(run_statistics.counters['bytes_read'], os.path.getsize(self.jobs_file_path) + os.path.getsize(self.jobseeker_file_path))
+        self.assertEqual(events.count('run'), 1)
+
+        # Checking the dispatch stage and the worker utilization of parallel processing
+        engine.set_pool_size(2)
+        engine.parallel_processing(jobseeker_chunk_size=1)
+        run_statistics = engine.get_run_statistics().to_dict()
+        self.assertEqual(run_statistics['counters']['chunks_dispatched'], 2)
+        self.assertEqual(run_statistics['counters']['pairs_evaluated'], 6)
+        self.assertIsNotNone(run_statistics['worker_utilization'])
+
+        # Checking the lookups of the skill token cache of sequential processing
+        engine.sequential_processing()
+        run_statistics = engine.get_run_statistics()
+        self.assertEqual(run_statistics.counters['token_cache_hits'] + run_statistics.counters['token_cache_misses'], 5)
+
+        engine.set_instrumentation(False)
+        engine.vectorized_processing()
+        self.assertIsNone(engine.get_run_statistics())
+
+
+
+    def test_duplicates_across_chunks(self):
+        """
+        Function for testing removing duplicate job seekers which are in different chunks.
+
+        It ensures that the streaming, parallel and whole-file paths drop the same duplicates and give the same recommendations.
+        """
+        with open(self.jobseeker_file_path, 'a', newline='') as csvfile:
+            csv.writer(csvfile).writerows([['1', 'Michelle', 'Python, SQL'], ['3', 'Maria', 'R']])
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        engine.set_pool_size(2)
+        expected = engine.sort_recommendations(engine.vectorized_processing())
+        self.assertEqual(len(expected), 5)
+        pd.testing.assert_frame_equal(engine.sort_recommendations(engine.sequential_processing()), expected)
+        pd.testing.assert_frame_equal(engine.sort_recommendations(engine.parallel_processing(jobseeker_chunk_size=1)), expected)
+        streamed = [recommendation for chunk in engine.iter_recommendations(jobseeker_chunk_size=2) for recommendation in chunk]
+        pd.testing.assert_frame_equal(engine.sort_recommendations(streamed), expected)
+
+        with self.assertRaises(TypeError):
+            engine.set_memory_limit(1.5)
+        with self.assertRaises(ValueError):
+            engine.set_memory_limit(0)
+
+
+
+    def test_fast_ingest(self):
+        """
+        Function for testing reading the input files in fast ingest mode.
+
+        It ensures that every parser gives the same recommendations as the default mode and that invalid
+        settings are rejected.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        expected = engine.sort_recommendations(engine.sequential_processing()).astype(object)
+        for parser in ('pyarrow', 'c'):
+            engine.set_fast_ingest(True, parser)
+            self.assertIsNotNone(engine.open_jobs_file().ingest_options)
+            pd.testing.assert_frame_equal(engine.sort_recommendations(engine.sequential_processing()).astype(object), expected)
+            self.assertListEqual(engine.sort_recommendations(engine.columnar_processing(), as_dataframe=True).to_dict('records'), expected.to_dict('records'))
+
+        # Reading job ids which are not integers
+        pd.read_csv(self.jobs_file_path).assign(id=['J1', 'J2', 'J3']).to_csv(self.jobs_file_path, index=False)
+        engine.set_fast_ingest(False)
+        expected = engine.sort_recommendations(engine.generate_recommendations()).astype(object)
+        self.assertListEqual(sorted(expected['job_id'].unique()), ['J1', 'J2'])
+        for parser in ('pyarrow', 'c'):
+            engine.set_fast_ingest(True, parser)
+            pd.testing.assert_frame_equal(engine.sort_recommendations(engine.generate_recommendations()).astype(object), expected)
+
+        with self.assertRaises(TypeError):
+            engine.set_fast_ingest('yes')
+        with self.assertRaises(ValueError):
+            engine.set_fast_ingest(True, 'python')
+
+
+
+    def test_deduplicate_profiles(self):
+        """
+        Function for testing scoring identical skill profiles once.
+
+        It ensures that the recommendations are the same with and without deduplication, and that the run
+        statistics report the deduplication ratio.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        with self.assertRaises(TypeError):
+            engine.set_deduplicate_profiles(1)
+
+        # Adding job seekers with the same skills in another order
+        with open(self.jobseeker_file_path, 'a', newline='') as csvfile:
+            csv.writer(csvfile).writerows([['3', 'Maria', 'SQL, Python'], ['4', 'James', 'Python, Java']])
+        engine.set_instrumentation(True)
+        expected = engine.sort_recommendations(engine.vectorized_processing())
+        run_statistics = engine.get_run_statistics().to_dict()
+        self.assertEqual(run_statistics['counters']['pairs_evaluated'], 12)
+        self.assertEqual(run_statistics['counters']['profile_pairs_scored'], 6)
+        self.assertEqual(run_statistics['deduplication_ratio'], 2.0)
+
+        # Counting the pairs the same way in sequential processing, with its inverted index candidates apart
+        engine.sequential_processing()
+        run_statistics = engine.get_run_statistics().to_dict()
+        self.assertEqual((run_statistics['counters']['pairs_evaluated'], run_statistics['counters']['profile_pairs_scored']), (12, 6))
+        self.assertLess(run_statistics['counters']['candidate_pairs'], 6)
+        engine.parallel_processing()
+        self.assertNotIn('candidate_pairs', engine.get_run_statistics().counters)
+        engine.set_matching_backend('minhash_lsh')
+        engine.parallel_processing()
+        self.assertEqual(engine.get_run_statistics().counters['pairs_evaluated'], 12)
+        self.assertIn('candidate_pairs', engine.get_run_statistics().counters)
+        engine.set_matching_backend('auto')
+
+        engine.set_deduplicate_profiles(False)
+        pd.testing.assert_frame_equal(engine.sort_recommendations(engine.vectorized_processing()), expected)
+        self.assertEqual(engine.get_run_statistics().to_dict()['deduplication_ratio'], 1.0)
+
+
+
+    def test_external_sort(self):
+        """
+        Function for testing sorting the recommendations out of core.
+
+        It ensures that sorting into a sink with a memory budget, and writing the sorted recommendations with
+        spilled runs, give the same file as writing the recommendations sorted in memory, and that the runs are
+        removed when writing fails.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        recommendations = engine.sequential_processing()
+        expected = engine.sort_recommendations(recommendations)
+
+        test_directory = tempfile.mkdtemp()
+        try:
+            path_in_memory, path_external = os.path.join(test_directory, 'in_memory.csv'), os.path.join(test_directory, 'external.csv')
+            with CsvResultSink(path_in_memory) as sink:
+                sink.write(expected.to_dict('records'))
+            with open(path_in_memory) as file:
+                expected_file = file.read()
+
+            for unsorted in (recommendations, engine.columnar_processing()):
+                self.assertEqual(engine.sort_recommendations_into(unsorted, CsvResultSink(path_external), memory_budget=1), len(expected))
+                with open(path_external) as file:
+                    self.assertEqual(file.read(), expected_file)
+
+            engine.set_instrumentation(True)
+            self.assertEqual(engine.write_sorted_recommendations(CsvResultSink(path_external), jobseeker_chunk_size=1, memory_budget=1), len(expected))
+            self.assertEqual(engine.get_run_statistics().counters['sort_runs_spilled'], 2)
+            self.assertIn('sort', engine.get_run_statistics().stages)
+            with open(path_external) as file:
+                self.assertEqual(file.read(), expected_file)
+
+            # Removing the runs when the sink fails
+            with patch.object(CsvResultSink, 'write_rows', side_effect=OSError('disk full')), patch('tempfile.tempdir', test_directory):
+                with self.assertRaises(ValueError):
+                    engine.sort_recommendations_into(recommendations, CsvResultSink(path_external), memory_budget=1)
+            self.assertListEqual(sorted(os.listdir(test_directory)), ['external.csv', 'in_memory.csv'])
+        finally:
+            shutil.rmtree(test_directory)
+
+
+
     def test_sort_recommendations(self):
         """
         Function for testing sorting recommendations.
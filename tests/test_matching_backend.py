@@ -0,0 +1,61 @@
+# unittest module for writing and running tests
+import unittest
+# custom skill vocabulary and incidence matrix classes for building test inputs
+from src.skill_matching.skill_vocabulary import SkillVocabulary, SkillMatrix
+# custom SparseMatchingBackend class for testing its functionalities
+from src.skill_matching.matching_backend import SparseMatchingBackend
+
+
+class TestSparseMatchingBackendClass(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of SparseMatchingBackend class.
+
+    This test suite class contains individual test functions for calculating the matching skill counts
+    of job seeker and job pairs in bulk.
+    """
+
+    def setUp(self):
+        """
+        Function for setting up the test cases.
+
+        It is called before performing each test case so as to set up necessary
+        resources for testing.
+        """
+        self.vocabulary = SkillVocabulary()
+        self.job_matrix = SkillMatrix.from_skills(["Python, R", "Python, Java", "Docker, React"], self.vocabulary)
+        self.seeker_matrix = SkillMatrix.from_skills(["Python, SQL", "Java, Python"], self.vocabulary, grow_vocabulary=False)
+
+
+
+    def test_match_block(self):
+        """
+        Function for testing finding the matched pairs of a block of job seekers.
+
+        It ensures that only pairs with at least one matching skill are returned, ordered by job seeker
+        and then by job, with the correct matching skill counts.
+        """
+        backend = SparseMatchingBackend(self.job_matrix)
+        seeker_positions, job_positions, matching_skill_counts = backend.match_block(self.seeker_matrix)
+        self.assertEqual(seeker_positions.tolist(), [0, 0, 1, 1])
+        self.assertEqual(job_positions.tolist(), [0, 1, 0, 1])
+        self.assertEqual(matching_skill_counts.tolist(), [1, 1, 1, 2])
+
+
+
+    def test_match_block_no_match(self):
+        """
+        Function for testing a block of job seekers without any matching skill.
+
+        It ensures that empty arrays are returned.
+        """
+        backend = SparseMatchingBackend(self.job_matrix)
+        seeker_matrix = SkillMatrix.from_skills(["Cooking"], self.vocabulary, grow_vocabulary=False)
+        seeker_positions, job_positions, matching_skill_counts = backend.match_block(seeker_matrix)
+        self.assertEqual(len(seeker_positions), 0)
+        self.assertEqual(len(job_positions), 0)
+        self.assertEqual(len(matching_skill_counts), 0)
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+# unittest module for writing and running tests
+import unittest
+# numpy library for numerical arrays
+import numpy as np
+# custom skill vocabulary and incidence matrix classes for building test inputs
+from src.skill_matching.skill_vocabulary import SkillVocabulary, SkillMatrix
+# custom SparseMatchingBackend class for comparing the results
+from src.skill_matching.matching_backend import SparseMatchingBackend
+# custom JaccardKernel class for the similarity of the pairs
+from src.skill_matching.scoring_kernels import JaccardKernel
+# custom MinHashLshMatchingBackend class for testing its functionalities
+from src.skill_matching.minhash_lsh import MinHashLshMatchingBackend
+
+
+class TestMinHashLshMatchingBackendClass(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of MinHashLshMatchingBackend class.
+
+    This test suite class contains individual test functions for finding the pairs with a high skill
+    overlap approximately, compared with all pairs.
+    """
+
+    def setUp(self):
+        """
+        Function for setting up the test cases.
+
+        It is called before performing each test case so as to set up necessary
+        resources for testing.
+        """
+        random_generator = np.random.default_rng(0)
+        skills = [f"Skill {number}" for number in range(40)]
+
+        def draw_skills(number_rows):
+            return [", ".join(random_generator.choice(skills, size=random_generator.integers(1, 7), replace=False)) for _ in range(number_rows)]
+
+        self.vocabulary = SkillVocabulary()
+        job_skills = draw_skills(300)
+        self.job_matrix = SkillMatrix.from_skills(job_skills, self.vocabulary)
+        # Adding job seekers with the skills of a job and with no known skill
+        self.seeker_matrix = SkillMatrix.from_skills(draw_skills(60) + job_skills[:10] + ["Cooking"], self.vocabulary, grow_vocabulary=False)
+        self.all_pairs = SparseMatchingBackend(self.job_matrix).match_block(self.seeker_matrix)
+        self.similarities = JaccardKernel().score_block(self.seeker_matrix, self.job_matrix, *self.all_pairs)
+
+
+
+    def recall(self, backend: MinHashLshMatchingBackend, min_similarity: float) -> float:
+        """
+        Function for calculating the share of the pairs with at least a Jaccard similarity percentage which the backend finds.
+        """
+        found_pairs = set(zip(*(positions.tolist() for positions in backend.match_block(self.seeker_matrix)[:2])))
+        similar = self.similarities >= min_similarity
+        similar_pairs = set(zip(self.all_pairs[0][similar].tolist(), self.all_pairs[1][similar].tolist()))
+        return len(similar_pairs & found_pairs) / len(similar_pairs)
+
+
+
+    def test_exact_counts(self):
+        """
+        Function for testing that the candidates are scored exactly.
+
+        It ensures that every returned pair is a match with the same count as with all pairs, in order, that
+        identical skill sets are always found and that job seekers without known skills get no candidates.
+        """
+        backend = MinHashLshMatchingBackend(self.job_matrix)
+        seeker_positions, job_positions, matching_skill_counts = backend.match_block(self.seeker_matrix)
+        all_counts = dict(zip(zip(self.all_pairs[0].tolist(), self.all_pairs[1].tolist()), self.all_pairs[2].tolist()))
+        self.assertTrue(0 < len(seeker_positions) < len(self.all_pairs[0]))
+        self.assertListEqual(matching_skill_counts.tolist(), [all_counts[pair] for pair in zip(seeker_positions.tolist(), job_positions.tolist())])
+        self.assertListEqual(list(zip(seeker_positions.tolist(), job_positions.tolist())), sorted(zip(seeker_positions.tolist(), job_positions.tolist())))
+        self.assertEqual(self.recall(backend, 100.0), 1.0)
+        self.assertNotIn(len(self.seeker_matrix) - 1, seeker_positions.tolist())
+
+        with self.assertRaises(ValueError):
+            MinHashLshMatchingBackend(self.job_matrix, bands=0)
+
+
+
+    def test_tunable_recall(self):
+        """
+        Function for testing that more bands and fewer rows per band find more of the similar pairs.
+        """
+        strict_backend = MinHashLshMatchingBackend(self.job_matrix, bands=4, rows_per_band=4)
+        loose_backend = MinHashLshMatchingBackend(self.job_matrix, bands=64, rows_per_band=1)
+        self.assertGreater(self.recall(loose_backend, 50.0), 0.95)
+        self.assertLess(self.recall(strict_backend, 50.0), self.recall(loose_backend, 50.0))
+        self.assertLess(strict_backend.candidate_pairs, loose_backend.candidate_pairs)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
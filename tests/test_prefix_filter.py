@@ -0,0 +1,87 @@
+# unittest module for writing and running tests
+import unittest
+# numpy library for numerical arrays
+import numpy as np
+# custom skill vocabulary and incidence matrix classes for building test inputs
+from src.skill_matching.skill_vocabulary import SkillVocabulary, SkillMatrix
+# custom SparseMatchingBackend class for comparing the results
+from src.skill_matching.matching_backend import SparseMatchingBackend
+# custom scoring kernel classes for the minimum scores
+from src.skill_matching.scoring_kernels import OverlapPercentKernel, JaccardKernel
+# custom PrefixFilterMatchingBackend class for testing its functionalities
+from src.skill_matching.prefix_filter import PrefixFilterMatchingBackend
+
+
+class TestPrefixFilterMatchingBackendClass(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of PrefixFilterMatchingBackend class.
+
+    This test suite class contains individual test functions for generating only the pairs which can
+    reach a minimum match, compared with filtering all pairs.
+    """
+
+    def setUp(self):
+        """
+        Function for setting up the test cases.
+
+        It is called before performing each test case so as to set up necessary
+        resources for testing.
+        """
+        random_generator = np.random.default_rng(0)
+        skills = [f"Skill {number}" for number in range(30)]
+        # Drawing common skills more often than rare ones
+        weights = 1 / np.arange(1, len(skills) + 1)
+        weights /= weights.sum()
+
+        def draw_skills(number_rows):
+            return [", ".join(random_generator.choice(skills, size=random_generator.integers(1, 7), replace=False, p=weights)) for _ in range(number_rows)]
+
+        self.vocabulary = SkillVocabulary()
+        self.job_matrix = SkillMatrix.from_skills(draw_skills(200), self.vocabulary)
+        self.seeker_matrix = SkillMatrix.from_skills(draw_skills(50) + ["Cooking, Skill 0"], self.vocabulary, grow_vocabulary=False)
+        self.all_pairs = SparseMatchingBackend(self.job_matrix).match_block(self.seeker_matrix)
+
+
+
+    def test_minimum_count(self):
+        """
+        Function for testing a minimum matching skill count.
+
+        It ensures that the pairs are exactly the pairs of all matches with at least the minimum count,
+        in the same order, and that fewer candidates than matches are verified.
+        """
+        for min_match_count in [1, 2, 3]:
+            backend = PrefixFilterMatchingBackend(self.job_matrix, min_match_count=min_match_count)
+            seeker_positions, job_positions, matching_skill_counts = backend.match_block(self.seeker_matrix)
+            kept = self.all_pairs[2] >= min_match_count
+            self.assertListEqual(seeker_positions.tolist(), self.all_pairs[0][kept].tolist())
+            self.assertListEqual(job_positions.tolist(), self.all_pairs[1][kept].tolist())
+            self.assertListEqual(matching_skill_counts.tolist(), self.all_pairs[2][kept].tolist())
+            if min_match_count > 1:
+                self.assertLess(backend.candidate_pairs, len(self.all_pairs[0]))
+
+
+
+    def test_minimum_percent(self):
+        """
+        Function for testing a minimum score.
+
+        It ensures that no pair reaching the minimum score is missed, for the matching skill percentage as well
+        as for the Jaccard similarity, and that unknown skills count towards the percentage.
+        """
+        for scoring_kernel in [OverlapPercentKernel(), JaccardKernel()]:
+            for min_match_percent in [25.0, 33.33, 50.0, 66.67, 100.0]:
+                backend = PrefixFilterMatchingBackend(self.job_matrix, min_match_percent=min_match_percent, scoring_kernel=scoring_kernel)
+                candidates = backend.match_block(self.seeker_matrix)
+                scores = scoring_kernel.score_block(self.seeker_matrix, self.job_matrix, *self.all_pairs)
+                expected_pairs = set(zip(self.all_pairs[0][scores >= min_match_percent].tolist(), self.all_pairs[1][scores >= min_match_percent].tolist()))
+                self.assertTrue(expected_pairs <= set(zip(candidates[0].tolist(), candidates[1].tolist())))
+
+        # The job seeker with an unknown skill needs its only known skill to reach 50 percent, but not 51 percent
+        backend = PrefixFilterMatchingBackend(self.job_matrix, min_match_percent=51.0)
+        self.assertNotIn(len(self.seeker_matrix) - 1, backend.match_block(self.seeker_matrix)[0].tolist())
+
+
+
+if __name__ == "__main__":
+    unittest.main()
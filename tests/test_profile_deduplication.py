@@ -0,0 +1,77 @@
+# unittest module for writing and running tests
+import unittest
+# numpy library for numerical arrays
+import numpy as np
+# custom skill vocabulary and incidence matrix classes for building test inputs
+from src.skill_matching.skill_vocabulary import SkillVocabulary, SkillMatrix
+# custom matching backends for comparing the results
+from src.skill_matching.matching_backend import SparseMatchingBackend
+from src.skill_matching.bitset_matching import BitsetMatchingBackend
+# custom profile deduplication classes for testing their functionalities
+from src.skill_matching.profile_deduplication import SkillProfiles, DeduplicatedMatchingBackend
+
+
+class TestProfileDeduplicationClasses(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of SkillProfiles and DeduplicatedMatchingBackend classes.
+
+    This test suite class contains individual test functions for grouping rows by their skill set and
+    calculating matching skill counts on distinct profiles only.
+    """
+
+    def test_skill_profiles(self):
+        """
+        Function for testing grouping rows by their canonical skill set.
+
+        It ensures that the order of the skills in a string does not matter, that the profiles keep the order
+        of first appearance and that the members of every profile are listed in row order.
+        """
+        vocabulary = SkillVocabulary()
+        skill_matrix = SkillMatrix.from_skills(["Python, SQL", "Java", "SQL, Python", "Java", "Python, SQL"], vocabulary)
+        profiles = SkillProfiles.from_matrix(skill_matrix)
+        self.assertEqual(len(profiles), 2)
+        self.assertListEqual(profiles.row_profiles.tolist(), [0, 1, 0, 1, 0])
+        self.assertAlmostEqual(profiles.deduplication_ratio, 2.5)
+
+        sizes, starts = profiles.members(np.array([1, 0]))
+        self.assertListEqual(sizes.tolist(), [2, 3])
+        self.assertListEqual(profiles.member_rows[starts[1]:starts[1] + sizes[1]].tolist(), [0, 2, 4])
+
+        empty_profiles = SkillProfiles.from_matrix(SkillMatrix.from_skills([], vocabulary, grow_vocabulary=False))
+        self.assertEqual(len(empty_profiles), 0)
+        self.assertEqual(empty_profiles.deduplication_ratio, 1.0)
+
+
+
+    def test_match_block(self):
+        """
+        Function for testing matching job seekers through their profiles.
+
+        It ensures that the deduplicated backend gives the same pairs and counts as the wrapped backend on
+        all rows, with duplicates on both sides, and that it only scores the distinct profile pairs.
+        """
+        random_generator = np.random.default_rng(0)
+        skills = [f"Skill {number}" for number in range(8)]
+        vocabulary = SkillVocabulary()
+        job_matrix = SkillMatrix.from_skills([", ".join(random_generator.choice(skills, size=2, replace=False)) for _ in range(40)], vocabulary)
+        seeker_matrix = SkillMatrix.from_skills([", ".join(random_generator.choice(skills, size=2, replace=False)) for _ in range(60)], vocabulary, grow_vocabulary=False)
+
+        expected = SparseMatchingBackend(job_matrix).match_block(seeker_matrix)
+        for backend_class in (SparseMatchingBackend, BitsetMatchingBackend):
+            backend = DeduplicatedMatchingBackend(job_matrix, backend_class)
+            actual = backend.match_block(seeker_matrix)
+            for expected_array, actual_array in zip(expected, actual):
+                self.assertEqual(actual_array.tolist(), expected_array.tolist())
+            self.assertEqual(backend.seeker_rows, 60)
+            self.assertLessEqual(backend.profile_pairs_scored, 28 * 28)
+
+        # Checking a block without any matching job
+        unknown_matrix = SkillMatrix.from_skills(["Cooking", "Cooking"], vocabulary, grow_vocabulary=False)
+        seeker_positions, job_positions, matching_skill_counts = DeduplicatedMatchingBackend(job_matrix, SparseMatchingBackend).match_block(unknown_matrix)
+        self.assertEqual(len(seeker_positions), 0)
+        self.assertEqual(len(matching_skill_counts), 0)
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+# asyncio module for running concurrent requests
+import asyncio
+# unittest module for writing and running tests
+import unittest
+# custom RecommendationIndex class for building the served index
+from src.recommendation_index.recommendation_index import RecommendationIndex
+# custom query service classes for testing their functionalities
+from src.query_service.query_service import RecommendationQueryServer
+# custom load test functions for sending requests to the server
+from src.query_service.load_generator import send_request, run_load_test
+
+
+class TestRecommendationQueryServerClass(unittest.IsolatedAsyncioTestCase):
+    """
+    Test suite for validating the functionalities of RecommendationQueryServer class.
+
+    This test suite class contains individual test functions for answering concurrent queries with
+    micro-batching, reporting the counters and rejecting invalid requests.
+    """
+
+    async def asyncSetUp(self):
+        """
+        Function for setting up the test cases.
+
+        It starts a server over the sample jobs file on a free local port.
+        """
+        self.index = RecommendationIndex.from_file('csv_files/jobs.csv')
+        self.server = RecommendationQueryServer(self.index, port=0, batch_window=0.01)
+        await self.server.start()
+
+
+
+    async def asyncTearDown(self):
+        """
+        Function for cleaning up after performing each test case.
+
+        It stops the server.
+        """
+        await self.server.close()
+
+
+
+    async def request(self, method, path, payload=None):
+        """
+        Function for sending a single request over a new connection.
+        """
+        reader, writer = await asyncio.open_connection(self.server.host, self.server.port)
+        try:
+            return await send_request(reader, writer, method, path, payload)
+        finally:
+            writer.close()
+
+
+
+    async def test_concurrent_queries_are_batched(self):
+        """
+        Function for testing concurrent queries.
+
+        It ensures that concurrent queries are coalesced into fewer scoring calls and that each response
+        equals the recommendations of the index for the query.
+        """
+        queries = [{'skills': 'Ruby, SQL', 'jobseeker_id': 1}, {'skills': 'JavaScript, HTML/CSS', 'top_k': 2},
+                   {'skills': 'Python, Machine Learning', 'min_percent': 50}, {'skills': 'Unknown'}]
+        responses = await asyncio.gather(*(self.request('POST', '/recommend', query) for query in queries))
+        for query, response in zip(queries, responses):
+            self.assertListEqual(response, self.index.recommend(**query))
+
+        statistics = await self.request('GET', '/stats')
+        self.assertEqual(statistics['requests'], 4)
+        self.assertLess(statistics['batches'], 4)
+        self.assertIsNotNone(statistics['p99_latency_ms'])
+
+
+
+    async def test_invalid_requests(self):
+        """
+        Function for testing invalid requests.
+
+        It ensures that invalid queries are rejected without failing the other queries of their batch.
+        """
+        responses = await asyncio.gather(self.request('POST', '/recommend', {'skills': 'Ruby', 'top_k': 0}),
+                                         self.request('POST', '/recommend', {'top_k': 1}),
+                                         self.request('POST', '/recommend', {'skills': 'Ruby'}))
+        self.assertIn('error', responses[0])
+        self.assertIn('error', responses[1])
+        self.assertListEqual(responses[2], self.index.recommend('Ruby'))
+        self.assertIn('error', await self.request('GET', '/unknown'))
+        self.assertEqual((await self.request('GET', '/stats'))['errors'], 2)
+
+
+
+    async def test_malformed_messages(self):
+        """
+        Function for testing malformed HTTP messages.
+
+        It ensures that an invalid Content-Length header and a header line over the limit of the reader are
+        answered with 400 Bad Request instead of dropping the connection.
+        """
+        for message in (b"POST /recommend HTTP/1.1\r\nContent-Length: abc\r\n\r\n",
+                        b"GET /health HTTP/1.1\r\nX-Padding: " + b"a" * 2 ** 17 + b"\r\n\r\n"):
+            reader, writer = await asyncio.open_connection(self.server.host, self.server.port)
+            try:
+                writer.write(message)
+                await writer.drain()
+                self.assertTrue((await reader.readline()).startswith(b"HTTP/1.1 400 Bad Request"))
+            finally:
+                writer.close()
+        self.assertEqual((await self.request('GET', '/health'))['status'], 'ok')
+
+
+
+    async def test_load_test(self):
+        """
+        Function for testing the load test against the server.
+        """
+        results = await run_load_test(self.server.host, self.server.port, [{'skills': 'Ruby, SQL'}], concurrency=4, number_requests=20)
+        self.assertEqual(results['requests'], 20)
+        self.assertEqual(results['server']['requests'], 20)
+        self.assertEqual((await self.request('GET', '/health'))['jobs'], len(self.index))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,8 @@ import pandas as pd
 import unittest
 # custom File class for reading files
 from src.file_reader.read_files import File
+# custom IngestOptions class for reading files in fast ingest mode
+from src.file_reader.ingest_options import IngestOptions
 
 
 class TestFileClass(unittest.TestCase):
@@ -110,5 +112,105 @@ class TestFileClass(unittest.TestCase):
         self.assertEqual(len(cleansed_df), 3)  
 
 
+
+    def test_read_chunks(self):
+        """
+        Function for testing reading a CSV file in cleansed chunks.
+
+        It ensures that duplicates are removed also when they are in different chunks, so that the chunks
+        together equal the whole file, and that exceeding the memory limit raises a ValueError.
+        """
+        pd.DataFrame({'A': [1, 2, 1, None, 3, 2, 4], 'B': ['x', 'y', 'x', 'z', 'w', 'y', 'v']}).to_csv(self.path_test_file, index=False)
+        expected_df = File.cleanse_dataset(pd.read_csv(self.path_test_file))
+        chunks = list(File(self.path_test_file).read_chunks(chunk_size=2))
+        self.assertEqual(len(chunks), 4)
+        pd.testing.assert_frame_equal(pd.concat(chunks), expected_df)
+        pd.testing.assert_frame_equal(File(self.path_test_file).read_file(), expected_df)
+
+        with self.assertRaises(ValueError):
+            list(File(self.path_test_file, memory_limit=16).read_chunks(chunk_size=2))
+
+        # Parsing the ids of a later chunk with a null id as floats
+        with open(self.path_test_file, 'w') as file:
+            file.write('id,name,skills\n1,A,Python\n2,B,SQL\n1,A,Python\n,C,Java\n')
+        expected_df = File.cleanse_dataset(pd.read_csv(self.path_test_file))
+        chunks = list(File(self.path_test_file).read_chunks(chunk_size=2))
+        self.assertListEqual([row for chunk in chunks for row in chunk.values.tolist()], expected_df.values.tolist())
+
+
+
+    def test_read_file_fast_ingest(self):
+        """
+        Function for testing reading a CSV file in fast ingest mode.
+
+        It ensures that only the listed columns are parsed with their declared data types and that every parser
+        and string storage gives the same cleansed values as reading all columns.
+        """
+        pd.DataFrame({'id': [1, 2, 1, 3, 2], 'name': ['Ann', 'Bob', 'Ann', None, 'Bob'], 'skills': ['R', 'Go', 'R', 'C', 'Go'],
+                      'unused': [0.5, 1.5, 0.5, 2.5, 1.5]}).to_csv(self.path_test_file, index=False)
+        expected_df = File(self.path_test_file).read_file()[['id', 'name', 'skills']]
+        for parser in IngestOptions.parsers:
+            for string_storage in IngestOptions.string_storages:
+                ingest_options = IngestOptions(IngestOptions.jobseeker_columns, parser, string_storage)
+                result = File(self.path_test_file, ingest_options=ingest_options).read_file()
+                self.assertListEqual(list(result.columns), ['id', 'name', 'skills'])
+                self.assertEqual(result['id'].dtype, 'Int64')
+                pd.testing.assert_frame_equal(result.astype(object), expected_df.astype(object))
+
+                chunks = list(File(self.path_test_file, ingest_options=ingest_options).read_chunks(chunk_size=2))
+                self.assertListEqual([len(chunk) for chunk in chunks], [2, 0, 0])
+
+        with self.assertRaises(ValueError):
+            File('non_existent_file.csv', ingest_options=IngestOptions(IngestOptions.jobseeker_columns)).read_file()
+
+
+
+    def test_read_file_fast_ingest_extra_columns(self):
+        """
+        Function for testing that the other columns are cleansed the same way in fast ingest mode as in normal mode.
+
+        It ensures that rows with a null in another column are removed and that rows which only differ in another
+        column are kept, with every parser and string storage and across chunks.
+        """
+        pd.DataFrame({'id': [1, 2, 3, 3], 'name': ['Ann', 'Bob', 'Cid', 'Cid'], 'skills': ['R', 'Go', 'C', 'C'],
+                      'unused': [0.5, None, 1.5, 2.5]}).to_csv(self.path_test_file, index=False)
+        expected_ids = File(self.path_test_file).read_file()['id'].tolist()
+        self.assertListEqual(expected_ids, [1, 3, 3])
+        for parser in IngestOptions.parsers:
+            for string_storage in IngestOptions.string_storages:
+                ingest_options = IngestOptions(IngestOptions.jobseeker_columns, parser, string_storage)
+                result = File(self.path_test_file, ingest_options=ingest_options).read_file()
+                self.assertListEqual(list(result.columns), ['id', 'name', 'skills'])
+                self.assertListEqual(result['id'].tolist(), expected_ids)
+
+                chunks = list(File(self.path_test_file, ingest_options=ingest_options).read_chunks(chunk_size=2))
+                self.assertListEqual([chunk['id'].tolist() for chunk in chunks], [[1], [3, 3]])
+
+
+
+    def test_read_file_fast_ingest_string_ids(self):
+        """
+        Function for testing reading ids which are not integers in fast ingest mode.
+
+        It ensures that such ids are kept as strings with every parser, while the integer ids of other chunks
+        are still converted into integers, like the inferred data types of normal mode.
+        """
+        pd.DataFrame({'id': ['J1', 'J2', 'J1', None], 'name': ['Ann', 'Bob', 'Ann', 'Cid'], 'skills': ['R', 'Go', 'R', 'C']}).to_csv(self.path_test_file, index=False)
+        expected_df = File(self.path_test_file).read_file()
+        for parser in IngestOptions.parsers:
+            ingest_options = IngestOptions(IngestOptions.jobseeker_columns, parser)
+            result = File(self.path_test_file, ingest_options=ingest_options).read_file()
+            pd.testing.assert_frame_equal(result.astype(object), expected_df.astype(object))
+
+        with open(self.path_test_file, 'a') as file:
+            file.write('5,Dan,Go\n6,Eve,SQL\n')
+        for parser in IngestOptions.parsers:
+            ingest_options = IngestOptions(IngestOptions.jobseeker_columns, parser)
+            chunks = list(File(self.path_test_file, ingest_options=ingest_options).read_chunks(chunk_size=2))
+            self.assertListEqual([chunk['id'].tolist() for chunk in chunks], [['J1', 'J2'], [], [5, 6]])
+            self.assertEqual(chunks[2]['id'].dtype, 'Int64')
+
+
+
 if __name__ == '__main__':
     unittest.main()
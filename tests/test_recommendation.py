@@ -2,6 +2,8 @@
 import unittest
 # patch function from unittest.mock module for mocking objects during testing
 from unittest.mock import patch
+# numpy library for numerical arrays
+import numpy as np
 # custom RecommendationEngine class for testing its functionalities
 from src.recommendation_engine.recommendation import RecommendationEngine
 
@@ -31,9 +33,10 @@ class TestRecommendationEngine(unittest.TestCase):
         """
         Function for testing setting a valid threshold for parallel processing.
 
-        It ensures that setting a valid threshold within the specified range is successful.
+        It ensures that setting a valid threshold within the specified range is successful and announced as deprecated.
         """
-        self.engine.set_threshold_parallel_processing(7.5)
+        with self.assertWarns(DeprecationWarning):
+            self.engine.set_threshold_parallel_processing(7.5)
         self.assertEqual(self.engine.threshold_parallel_processing, 7.5)
 
 
@@ -106,6 +109,73 @@ class TestRecommendationEngine(unittest.TestCase):
         self.assertEqual(matching_count, 2)
         self.assertEqual(round(matching_percentage,2), 66.67)
 
+
+
+
+    def test_calculate_matching_tokens(self):
+        """
+        Function for testing calculating matching skills between tokenized skills.
+
+        It ensures that the tokenized version gives the same values as the string version and that
+        repeated strings are served from the skill token cache.
+        """
+        self.assertEqual(self.engine.calculate_matching_tokens(frozenset({"Python", "React", "MySQL"}), frozenset({"Python", "MySQL"})),
+                         self.engine.calculate_matching_skills("Python, React, MySQL", "Python, MySQL"))
+        self.assertEqual(self.engine.calculate_matching_tokens(frozenset(), frozenset({"Python"})), (0, 0))
+
+        hits = RecommendationEngine.skill_token_cache.statistics()['hits']
+        self.engine.calculate_matching_skills("Python, React, MySQL", "Python, MySQL")
+        self.assertEqual(RecommendationEngine.skill_token_cache.statistics()['hits'], hits + 2)
+
+        # Checking that values which are not strings are split like in the skill vocabulary
+        self.assertEqual(self.engine.calculate_matching_skills(42, "Python, 42"), (1, 100.0))
+
+
+
+    def test_calculate_matching_percentages(self):
+        """
+        Function for testing calculating matching skills percentages in bulk.
+        
+        It ensures that the bulk percentages are identical to the rounded percentages of
+        calculate_matching_skills.
+        """
+        matching_counts = np.array([1, 2, 1, 3])
+        skill_counts = np.array([3, 3, 8, 7])
+        percentages = self.engine.calculate_matching_percentages(matching_counts, skill_counts)
+        expected = [round(count / total * 100, 2) for count, total in zip(matching_counts.tolist(), skill_counts.tolist())]
+        self.assertListEqual(percentages.tolist(), expected)
+
+
+
+    def test_set_top_k(self):
+        """
+        Function for testing setting the maximum number of recommendations per job seeker.
+
+        It ensures that valid values are stored and that invalid values raise a TypeError or ValueError.
+        """
+        self.engine.set_top_k(20)
+        self.assertEqual(self.engine.top_k, 20)
+        self.engine.set_top_k(None)
+        self.assertIsNone(self.engine.top_k)
+        with self.assertRaises(ValueError):
+            self.engine.set_top_k(0)
+        with self.assertRaises(TypeError):
+            self.engine.set_top_k(2.5)
+
+
+
+    def test_select_top_k(self):
+        """
+        Function for testing selecting the best matches of each job seeker.
+
+        It ensures that at most top_k matches are kept per job seeker, ordered by matching skill count in
+        descending order and by job position on ties.
+        """
+        seeker_positions = np.array([0, 0, 0, 1, 1, 2])
+        matching_skill_counts = np.array([1, 3, 3, 2, 1, 1])
+        job_positions = np.array([0, 1, 2, 0, 1, 2])
+        selected = self.engine.select_top_k(seeker_positions, matching_skill_counts, job_positions, 2)
+        self.assertListEqual(selected.tolist(), [1, 2, 3, 4, 5])
     
 
 if __name__ == "__main__":
@@ -0,0 +1,140 @@
+# os module for interacting with the operating system
+import os
+# unittest module for writing and running tests
+import unittest
+# pandas library for working with structured data
+import pandas as pd
+# custom JobMatchRecommendationEngine class for comparing with the batch output
+from src.jobseeker_recommendation_engine.job_match_recommendation import JobMatchRecommendationEngine
+# custom RecommendationIndex class for testing its functionalities
+from src.recommendation_index.recommendation_index import RecommendationIndex
+
+
+class TestRecommendationIndexClass(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of RecommendationIndex class.
+
+    This test suite class contains individual test functions for single job seeker queries with
+    top k, minimum percentage and latency budget settings.
+    """
+
+    def setUp(self):
+        """
+        Function for setting up the test cases.
+
+        It is called before performing each test case so as to set up necessary
+        resources for testing.
+        """
+        self.jobs_file_path = 'index_jobs_sample.csv'
+        self.jobseeker_file_path = 'index_jobseekers_sample.csv'
+        pd.DataFrame({
+            'id': [1, 2, 3],
+            'title': ['Software Engineer', 'Data Scientist', 'Web Developer'],
+            'required_skills': ['Python, Java', 'Python, SQL, R', 'JavaScript, HTML/CSS']
+        }).to_csv(self.jobs_file_path, index=False)
+        self.jobseekers_df = pd.DataFrame({
+            'id': [1, 2],
+            'name': ['Michelle', 'Andrew'],
+            'skills': ['Python, SQL, Go', 'Java, JavaScript']
+        })
+        self.jobseekers_df.to_csv(self.jobseeker_file_path, index=False)
+        self.engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        self.index = self.engine.build_recommendation_index()
+
+
+
+    def tearDown(self):
+        """
+        Function for cleaning up after performing each test case.
+
+        It is called after each test case for removing any resources created during testing.
+        """
+        os.remove(self.jobs_file_path)
+        os.remove(self.jobseeker_file_path)
+
+
+
+    def test_recommend_matches_batch_output(self):
+        """
+        Function for testing that the recommendations equal those of the batch output.
+        """
+        self.assertEqual(len(self.index), 3)
+        for top_k in [None, 1]:
+            self.engine.set_top_k(top_k)
+            recommendations = []
+            for jobseeker_id, name, skills in self.jobseekers_df.itertuples(index=False):
+                recommendations.extend(self.index.recommend(skills, top_k, jobseeker_id=jobseeker_id, jobseeker_name=name))
+            self.assertListEqual(recommendations, self.engine.sequential_processing())
+
+
+
+    def test_recommend_min_percent(self):
+        """
+        Function for testing the minimum matching skill percentage of a query.
+        """
+        recommendations = self.index.recommend('Python, SQL, Go', min_percent=50)
+        self.assertListEqual([recommendation['job_id'] for recommendation in recommendations], [2])
+        self.assertEqual(recommendations[0]['matching_skill_percent'], 66.67)
+        self.assertListEqual(self.index.recommend('Go, Rust'), [])
+        with self.assertRaises(ValueError):
+            self.index.recommend('Python', min_percent=101)
+        with self.assertRaises(TypeError):
+            self.index.recommend('Python', top_k=1.5)
+
+
+
+    def test_recommend_latency_budget(self):
+        """
+        Function for testing a query exceeding its latency budget.
+
+        It ensures that a used up budget merges no posting list and that the truncated query is flagged and counted.
+        """
+        recommendations = self.index.recommend('Python, SQL', latency_budget=0)
+        self.assertListEqual(recommendations, [])
+        self.assertTrue(recommendations.truncated)
+        self.assertEqual(self.index.truncated_queries, 1)
+        recommendations = self.index.recommend('Python, SQL', latency_budget=1)
+        self.assertEqual(len(recommendations), 2)
+        self.assertFalse(recommendations.truncated)
+        self.assertEqual(self.index.truncated_queries, 1)
+        with self.assertRaises(ValueError):
+            self.index.recommend('Python', latency_budget=-1)
+
+
+
+    def test_recommend_skills_iterable(self):
+        """
+        Function for testing queries with the skills given as an iterable instead of a string.
+
+        It ensures that they get the same recommendations as the skills string and that other types are rejected.
+        """
+        self.assertListEqual(self.index.recommend(['Python', 'SQL', 'Go']), self.index.recommend('Python, SQL, Go'))
+        self.assertListEqual(self.index.recommend_batch([{'skills': ('Java', 'JavaScript')}]), [self.index.recommend('Java, JavaScript')])
+        for skills in [1, ['Python', 1], None]:
+            with self.assertRaises(TypeError):
+                self.index.recommend(skills)
+
+
+
+    def test_build_with_engine_settings(self):
+        """
+        Function for testing building the index with the settings of the engine.
+
+        It ensures that fast ingest mode gives the same recommendations and that a scoring kernel or minimums which
+        the index cannot apply are rejected instead of ignored.
+        """
+        self.engine.set_fast_ingest(True)
+        self.assertListEqual(self.engine.build_recommendation_index().recommend('Python, SQL, Go'), self.index.recommend('Python, SQL, Go'))
+
+        self.engine.set_scoring_kernel('jaccard')
+        with self.assertRaises(ValueError):
+            self.engine.build_recommendation_index()
+        self.engine.set_scoring_kernel('overlap_percent')
+        self.engine.set_min_match_count(2)
+        with self.assertRaises(ValueError):
+            self.engine.build_recommendation_index()
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+# unittest module for writing and running tests
+import unittest
+# numpy library for numerical arrays
+import numpy as np
+# pandas library for working with structured data
+import pandas as pd
+# custom RecommendationResult class for testing its functionalities
+from src.recommendation_result.recommendation_result import RecommendationResult
+
+
+class TestRecommendationResultClass(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of RecommendationResult class.
+
+    This test suite class contains individual test functions for storing, concatenating, sorting and
+    converting columnar recommendations.
+    """
+
+    def setUp(self):
+        """
+        Function for setting up the test cases.
+
+        It is called before performing each test case so as to set up necessary
+        resources for testing.
+        """
+        self.jobseekers_df = pd.DataFrame({'id': [2, 1], 'name': ['Andrew', 'Michelle'], 'skills': ['Java, Python', 'Python, SQL']})
+        self.jobs_df = pd.DataFrame({'id': [1, 2], 'title': ['Software Engineer', 'Data Scientist'], 'required_skills': ['Python, R', 'Python, Java']})
+        self.result = RecommendationResult(self.jobseekers_df, self.jobs_df, np.array([0, 0, 1, 1]), np.array([0, 1, 0, 1]),
+                                           np.array([1, 2, 1, 1]), np.array([50.0, 100.0, 50.0, 50.0]))
+
+
+
+    def test_compact_columns(self):
+        """
+        Function for testing the compact storage of the recommendations.
+
+        It ensures that the arrays use the compact types and that only the needed input columns are kept.
+        """
+        self.assertEqual(len(self.result), 4)
+        self.assertEqual(self.result.seeker_positions.dtype, np.int32)
+        self.assertEqual(self.result.matching_skill_counts.dtype, np.int16)
+        self.assertEqual(self.result.matching_skill_percents.dtype, np.float32)
+        self.assertListEqual(list(self.result.jobseekers_df.columns), ['id', 'name'])
+
+
+
+    def test_to_records(self):
+        """
+        Function for testing converting the recommendations into dictionaries.
+
+        It ensures that ids, names and titles are resolved and that the percentages keep 2 decimals.
+        """
+        result = RecommendationResult(self.jobseekers_df, self.jobs_df, np.array([1]), np.array([0]), np.array([2]), np.array([66.67]))
+        self.assertListEqual(result.to_records(), [{'jobseeker_id': 1, 'jobseeker_name': 'Michelle', 'job_id': 1, 'job_title': 'Software Engineer',
+                                                    'matching_skill_count': 2, 'matching_skill_percent': 66.67}])
+
+
+
+    def test_sort(self):
+        """
+        Function for testing sorting the recommendations with np.lexsort.
+
+        It ensures the order by jobseeker ID, matching skill percentage in descending order and job ID.
+        """
+        sorted_df = self.result.sort().to_dataframe()
+        self.assertListEqual(list(sorted_df['jobseeker_id']), [1, 1, 2, 2])
+        self.assertListEqual(list(sorted_df['job_id']), [1, 2, 2, 1])
+
+
+
+    def test_concatenate(self):
+        """
+        Function for testing concatenating the results of several job seeker chunks.
+
+        It ensures that the seeker positions of later chunks refer to the right job seekers.
+        """
+        first = RecommendationResult(self.jobseekers_df.iloc[:1], self.jobs_df, np.array([0]), np.array([1]), np.array([2]), np.array([100.0]))
+        second = RecommendationResult(self.jobseekers_df.iloc[1:], self.jobs_df, np.array([0]), np.array([0]), np.array([1]), np.array([50.0]))
+        result = RecommendationResult.concatenate([first, second])
+        self.assertListEqual([record['jobseeker_name'] for record in result.to_records()], ['Andrew', 'Michelle'])
+        with self.assertRaises(ValueError):
+            RecommendationResult.concatenate([])
+
+
+
+if __name__ == "__main__":
+    unittest.main()
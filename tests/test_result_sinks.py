@@ -0,0 +1,114 @@
+# os module for interacting with the operating system
+import os
+# json module for reading JSON Lines files
+import json
+# unittest module for writing and running tests
+import unittest
+# pandas library for working with structured data
+import pandas as pd
+# custom result sink classes for testing their functionalities
+from src.result_sink.result_sinks import CsvResultSink, JsonLinesResultSink, ParquetResultSink, pa
+
+
+class TestResultSinkClasses(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of the result sink classes.
+
+    This test suite class contains individual test functions for writing recommendations incrementally
+    to CSV, JSON Lines and Parquet files.
+    """
+
+    def setUp(self):
+        """
+        Function for setting up the test cases.
+
+        It is called before performing each test case so as to set up necessary
+        resources for testing.
+        """
+        self.path_output_file = 'recommendations_sample.out'
+        self.recommendations = [
+            {'jobseeker_id': 1, 'jobseeker_name': 'Michelle', 'job_id': 1, 'job_title': 'Software Engineer', 'matching_skill_count': 1, 'matching_skill_percent': 50.0},
+            {'jobseeker_id': 1, 'jobseeker_name': 'Michelle', 'job_id': 2, 'job_title': 'Data Scientist', 'matching_skill_count': 1, 'matching_skill_percent': 50.0},
+            {'jobseeker_id': 2, 'jobseeker_name': 'Andrew', 'job_id': 2, 'job_title': 'Data Scientist', 'matching_skill_count': 2, 'matching_skill_percent': 100.0}
+        ]
+
+
+
+    def tearDown(self):
+        """
+        Function for cleaning up after performing each test case.
+
+        It is called after each test case for removing any resources created during testing.
+        """
+        if os.path.exists(self.path_output_file):
+            os.remove(self.path_output_file)
+
+
+
+    def test_buffering(self):
+        """
+        Function for testing the bounded buffering of a sink.
+
+        It ensures that only full buffers are written until the sink is closed.
+        """
+        sink = CsvResultSink(self.path_output_file, buffer_size=2)
+        sink.write(self.recommendations)
+        self.assertEqual(sink.rows_written, 2)
+        self.assertEqual(len(sink.buffer), 1)
+        sink.close()
+        self.assertEqual(sink.rows_written, 3)
+
+
+
+    def test_invalid_buffer_size(self):
+        """
+        Function for testing creating a sink with an invalid buffer size.
+
+        It ensures that a ValueError is raised.
+        """
+        with self.assertRaises(ValueError):
+            JsonLinesResultSink(self.path_output_file, buffer_size=0)
+
+
+
+    def test_csv_sink(self):
+        """
+        Function for testing writing recommendations to a CSV file.
+
+        It ensures that the file has a header and one row per recommendation.
+        """
+        with CsvResultSink(self.path_output_file, buffer_size=2) as sink:
+            sink.write(self.recommendations[:1])
+            sink.write(self.recommendations[1:])
+        self.assertListEqual(pd.read_csv(self.path_output_file).to_dict('records'), self.recommendations)
+
+
+
+    def test_json_lines_sink(self):
+        """
+        Function for testing writing recommendations to a JSON Lines file.
+
+        It ensures that every line holds one recommendation.
+        """
+        with JsonLinesResultSink(self.path_output_file) as sink:
+            sink.write(self.recommendations)
+        with open(self.path_output_file) as file:
+            self.assertListEqual([json.loads(line) for line in file], self.recommendations)
+
+
+
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_parquet_sink(self):
+        """
+        Function for testing writing recommendations to a Parquet file.
+
+        It ensures that the recommendations are written over several row groups and read back unchanged.
+        """
+        with ParquetResultSink(self.path_output_file, buffer_size=2) as sink:
+            sink.write(self.recommendations)
+        self.assertListEqual(pd.read_parquet(self.path_output_file).to_dict('records'), self.recommendations)
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+# unittest module for writing and running tests
+import unittest
+# numpy library for numerical arrays
+import numpy as np
+# pandas library for working with structured data
+import pandas as pd
+# custom RowHashSet class for testing its functionalities
+from src.file_reader.row_hash_set import RowHashSet
+
+
+class TestRowHashSetClass(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of RowHashSet class.
+
+    This test suite class contains individual test functions for finding the rows seen for the first time
+    and merging the sorted runs of hashes.
+    """
+
+    def test_add_new(self):
+        """
+        Function for testing finding the rows which were not seen in this or an earlier chunk.
+
+        It ensures that the first occurrence of every row is kept regardless of the index, that the runs stay
+        sorted and few while they grow, and that the memory limit is enforced.
+        """
+        row_hash_set = RowHashSet()
+        first_chunk = pd.DataFrame({'id': [1, 2, 1], 'skills': ['Python', 'SQL', 'Python']})
+        self.assertListEqual(row_hash_set.add_new(first_chunk).tolist(), [True, True, False])
+        second_chunk = pd.DataFrame({'id': [2, 3], 'skills': ['SQL', 'SQL']}, index=[7, 8])
+        self.assertListEqual(row_hash_set.add_new(second_chunk).tolist(), [False, True])
+        self.assertEqual(len(row_hash_set), 3)
+        self.assertEqual(row_hash_set.nbytes, 24)
+
+        for start in range(0, 1000, 10):
+            row_hash_set.add_new(pd.DataFrame({'id': np.arange(start, start + 10) + 10}))
+        self.assertEqual(len(row_hash_set), 1003)
+        self.assertLessEqual(len(row_hash_set.runs), 10)
+        self.assertTrue(all(np.all(run[1:] > run[:-1]) for run in row_hash_set.runs))
+
+        limited_hash_set = RowHashSet(memory_limit=16)
+        limited_hash_set.add_new(first_chunk)
+        with self.assertRaises(ValueError):
+            limited_hash_set.add_new(second_chunk)
+
+
+
+    def test_add_new_inferred_data_types(self):
+        """
+        Function for testing that the same values are taken for duplicates whatever data type a chunk is parsed with.
+
+        It ensures that whole floats equal integers, including nullable ones, while other floats stay distinct.
+        """
+        row_hash_set = RowHashSet()
+        row_hash_set.add_new(pd.DataFrame({'id': [1, 2], 'skills': ['Python', 'SQL']}))
+        float_chunk = pd.DataFrame({'id': [1.0, 2.5, -0.0], 'skills': ['Python', 'SQL', 'Go']})
+        self.assertListEqual(row_hash_set.add_new(float_chunk).tolist(), [False, True, True])
+        nullable_chunk = pd.DataFrame({'id': pd.array([2, 0], dtype='Int64'), 'skills': ['SQL', 'Go']})
+        self.assertListEqual(row_hash_set.add_new(nullable_chunk).tolist(), [False, False])
+
+
+
+if __name__ == "__main__":
+    unittest.main()
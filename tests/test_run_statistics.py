@@ -0,0 +1,98 @@
+# os module for interacting with the operating system
+import os
+# json module for reading the saved statistics
+import json
+# shutil and tempfile modules for creating and removing a temporary directory
+import shutil
+import tempfile
+# unittest module for writing and running tests
+import unittest
+# custom run statistics classes for testing their functionalities
+from src.instrumentation.run_statistics import RunStatistics, DisabledRunStatistics
+
+
+class TestRunStatisticsClass(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of RunStatistics and DisabledRunStatistics classes.
+
+    This test suite class contains individual test functions for timing stages, counting, calling the
+    callback and dumping the statistics.
+    """
+
+    def test_stages_and_counters(self):
+        """
+        Function for testing timing stages and adding counters.
+
+        It ensures that repeated stages are summed up, that the callback is called at the end of every stage
+        and of the run, and that the worker utilization is derived from the dispatch stage.
+        """
+        events = []
+        run_statistics = RunStatistics(lambda stage, statistics: events.append(stage))
+        run_statistics.start()
+        self.assertTrue(run_statistics.running)
+        for _ in range(3):
+            with run_statistics.stage('match'):
+                run_statistics.count('pairs_evaluated', 10)
+        with run_statistics.stage('dispatch'):
+            run_statistics.count('workers', 2)
+            run_statistics.add_worker_seconds(0.0)
+        run_statistics.finish()
+
+        self.assertFalse(run_statistics.running)
+        self.assertEqual(run_statistics.stages['match']['calls'], 3)
+        self.assertGreaterEqual(run_statistics.stages['match']['wall_seconds'], 0)
+        self.assertEqual(run_statistics.counters['pairs_evaluated'], 30)
+        self.assertListEqual(events, ['match', 'match', 'match', 'dispatch', 'run'])
+        self.assertGreater(run_statistics.peak_rss, 0)
+        self.assertGreaterEqual(run_statistics.to_dict()['worker_utilization'], 0)
+
+        # Checking that a stage failing with an exception is still recorded
+        with self.assertRaises(KeyError):
+            with run_statistics.stage('sort'):
+                raise KeyError('sort')
+        self.assertEqual(run_statistics.stages['sort']['calls'], 1)
+
+
+
+    def test_save(self):
+        """
+        Function for testing saving the statistics as a JSON file.
+        """
+        run_statistics = RunStatistics()
+        run_statistics.start()
+        with run_statistics.stage('read_jobs'):
+            run_statistics.count('bytes_read', 100)
+        run_statistics.finish()
+
+        test_directory = tempfile.mkdtemp()
+        try:
+            path_statistics = os.path.join(test_directory, 'statistics.json')
+            run_statistics.save(path_statistics)
+            with open(path_statistics) as file:
+                saved = json.load(file)
+            self.assertEqual(saved['counters']['bytes_read'], 100)
+            self.assertIn('read_jobs', saved['stages'])
+            self.assertIsNone(saved['worker_utilization'])
+        finally:
+            shutil.rmtree(test_directory)
+
+
+
+    def test_disabled_run_statistics(self):
+        """
+        Function for testing that the disabled statistics record nothing.
+        """
+        run_statistics = DisabledRunStatistics()
+        run_statistics.start()
+        with run_statistics.stage('match'):
+            run_statistics.count('pairs_evaluated', 10)
+            run_statistics.add_worker_seconds(1.0)
+        run_statistics.finish()
+        self.assertFalse(run_statistics.enabled)
+        self.assertFalse(run_statistics.running)
+        self.assertFalse(hasattr(run_statistics, 'counters'))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# math module for the expected IDF weights
+import math
+# unittest module for writing and running tests
+import unittest
+# numpy library for numerical arrays
+import numpy as np
+# custom skill vocabulary and incidence matrix classes for building test inputs
+from src.skill_matching.skill_vocabulary import SkillVocabulary, SkillMatrix
+# custom SparseMatchingBackend class for finding the matched pairs
+from src.skill_matching.matching_backend import SparseMatchingBackend
+# custom scoring kernel classes for testing their functionalities
+from src.skill_matching.scoring_kernels import ScoringKernel, OverlapPercentKernel, JaccardKernel, IdfOverlapKernel
+
+
+class TestScoringKernelClasses(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of the scoring kernel classes.
+
+    This test suite class contains individual test functions for scoring the matched pairs of a block
+    in bulk, compared with scoring every pair on its skill sets.
+    """
+
+    def setUp(self):
+        """
+        Function for setting up the test cases.
+
+        It is called before performing each test case so as to set up necessary
+        resources for testing.
+        """
+        self.job_skills = ["Python, R", "Python, Java, SQL", "Docker, React", "Python"]
+        self.seeker_skills = ["Python, SQL, Cooking", "Java, Python", "React"]
+        self.vocabulary = SkillVocabulary()
+        self.job_matrix = SkillMatrix.from_skills(self.job_skills, self.vocabulary)
+        self.seeker_matrix = SkillMatrix.from_skills(self.seeker_skills, self.vocabulary, grow_vocabulary=False)
+        self.pairs = SparseMatchingBackend(self.job_matrix).match_block(self.seeker_matrix)
+
+
+
+    def score_pairs(self, scoring_kernel: ScoringKernel) -> list:
+        """
+        Function for scoring the matched pairs of the test block with a kernel fitted to the test jobs.
+        """
+        return scoring_kernel.fit(self.job_matrix).score_block(self.seeker_matrix, self.job_matrix, *self.pairs).tolist()
+
+
+
+    def expected_scores(self, score) -> list:
+        """
+        Function for scoring every matched pair of the test block on its skill sets.
+        """
+        return [round(score(SkillVocabulary.tokenize(self.seeker_skills[seeker_position]), SkillVocabulary.tokenize(self.job_skills[job_position])) * 100, 2)
+                for seeker_position, job_position in zip(self.pairs[0].tolist(), self.pairs[1].tolist())]
+
+
+
+    def test_overlap_percent(self):
+        """
+        Function for testing the matching skill percentage kernel.
+
+        It ensures that the scores are the share of the job seeker's skills, unknown skills included.
+        """
+        self.assertListEqual(self.score_pairs(OverlapPercentKernel()), self.expected_scores(lambda seeker, job: len(seeker & job) / len(seeker)))
+
+
+
+    def test_jaccard(self):
+        """
+        Function for testing the Jaccard similarity kernel.
+
+        It ensures that the scores are the matching skills divided by the union of the skill sets.
+        """
+        self.assertListEqual(self.score_pairs(JaccardKernel()), self.expected_scores(lambda seeker, job: len(seeker & job) / len(seeker | job)))
+
+
+
+    def test_idf_overlap(self):
+        """
+        Function for testing the IDF weighted overlap kernel.
+
+        It ensures that the weights are computed once per catalog by fit, that rare matching skills weigh
+        more and that scoring without fit raises an error.
+        """
+        document_frequencies = {skill: sum(skill in SkillVocabulary.tokenize(skills) for skills in self.job_skills)
+                                for skills in self.seeker_skills for skill in SkillVocabulary.tokenize(skills)}
+        idf = {skill: math.log((1 + len(self.job_skills)) / (1 + frequency)) + 1 for skill, frequency in document_frequencies.items()}
+        expected = self.expected_scores(lambda seeker, job: sum(idf[skill] for skill in seeker & job) / sum(idf[skill] for skill in seeker))
+        self.assertEqual(self.score_pairs(IdfOverlapKernel()), expected)
+
+        # Python is required by three jobs and Java by one, so matching on Java weighs more
+        java_seeker = self.seeker_matrix.row_block(1, 2)
+        scores = IdfOverlapKernel().fit(self.job_matrix).score_block(java_seeker, self.job_matrix, np.array([0, 0]), np.array([1, 3]), np.array([2, 1]))
+        self.assertEqual(scores[0], 100.0)
+        self.assertLess(scores[1], 50.0)
+
+        with self.assertRaises(ValueError):
+            IdfOverlapKernel().score_block(self.seeker_matrix, self.job_matrix, *self.pairs)
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# os module for interacting with the operating system
+import os
+# filecmp module for comparing the merged file with a single run
+import filecmp
+# shutil and tempfile modules for creating and removing a temporary directory
+import shutil
+import tempfile
+# unittest module for writing and running tests
+import unittest
+# multiprocessing module for running the shards in separate processes
+import multiprocessing as mp
+# pandas library for working with structured data
+import pandas as pd
+# custom shard classes for testing their functionalities
+from src.sharding.shards import ShardSpec, ShardMerger
+# custom run_shard function for running a shard in a separate process
+from src.sharding.shard_runner import run_shard
+# custom JobMatchRecommendationEngine class for the recommendations of a single run
+from src.jobseeker_recommendation_engine.job_match_recommendation import JobMatchRecommendationEngine
+# custom CsvResultSink class for writing the recommendations of a single run
+from src.result_sink.result_sinks import CsvResultSink
+# custom SyntheticDataGenerator class for generating the input files
+from src.benchmark.data_generator import SyntheticDataGenerator
+
+
+class TestShardClasses(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of ShardSpec and ShardMerger classes.
+
+    This test suite class contains individual test functions for assigning job seekers to shards, running
+    the shards in separate processes and merging the shard files.
+    """
+
+    def setUp(self):
+        """
+        Function for setting up the test cases.
+
+        It is called before performing each test case so as to set up necessary
+        resources for testing.
+        """
+        self.test_directory = tempfile.mkdtemp()
+        self.jobs_file_path = os.path.join(self.test_directory, 'jobs.csv')
+        self.jobseeker_file_path = os.path.join(self.test_directory, 'jobseekers.csv')
+        SyntheticDataGenerator(vocabulary_size=30, duplicate_rate=0.1, null_rate=0.05, seed=5).write_files(self.jobs_file_path, self.jobseeker_file_path, 60, 90)
+
+
+
+    def tearDown(self):
+        """
+        Function for cleaning up after performing each test case.
+
+        It is called after each test case for removing any resources created during testing.
+        """
+        shutil.rmtree(self.test_directory)
+
+
+
+    def test_shard_spec(self):
+        """
+        Function for testing parsing shards and assigning job seekers to them.
+
+        It ensures that every job seeker belongs to exactly one shard, that rows with the same id share their
+        shard and that invalid shards are rejected.
+        """
+        shard = ShardSpec.parse("1/3")
+        self.assertEqual((shard.index, shard.count), (1, 3))
+        self.assertEqual(repr(shard), "1/3")
+        for text in ("3/3", "1-3", "a/3"):
+            with self.assertRaises(ValueError):
+                ShardSpec.parse(text)
+        with self.assertRaises(TypeError):
+            ShardSpec(True, 3)
+
+        jobseekers_df = pd.DataFrame({'id': [1, 2, 3, 4, 5, 1], 'name': ['A', 'B', 'C', 'D', 'E', 'F']})
+        selected = [ShardSpec(index, 3).select(jobseekers_df) for index in range(3)]
+        self.assertEqual(sum(len(shard_df) for shard_df in selected), len(jobseekers_df))
+        self.assertTrue(any(len(shard_df[shard_df['id'] == 1]) == 2 for shard_df in selected))
+        self.assertListEqual(ShardSpec.shards_of(jobseekers_df['id'], 3).tolist(), ShardSpec.shards_of(jobseekers_df['id'].astype(str), 3).tolist())
+
+
+
+    def test_run_and_merge_shards(self):
+        """
+        Function for testing running the shards in separate processes and merging their files.
+
+        It ensures that the merged file is the same as the sorted recommendations of a single run, byte for byte.
+        """
+        engine = JobMatchRecommendationEngine(self.jobs_file_path, self.jobseeker_file_path)
+        path_single_run = os.path.join(self.test_directory, 'single_run.csv')
+        with CsvResultSink(path_single_run) as sink:
+            sink.write(engine.sort_recommendations(engine.columnar_processing()).to_records())
+
+        # Running every shard in its own process, like on separate machines
+        paths_shard_files = [os.path.join(self.test_directory, f'shard_{index}.csv') for index in range(3)]
+        processes = [mp.Process(target=run_shard, args=(self.jobs_file_path, self.jobseeker_file_path, f'{index}/3', path_shard_file, 10))
+                     for index, path_shard_file in enumerate(paths_shard_files)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        self.assertTrue(all(process.exitcode == 0 for process in processes))
+
+        path_merged = os.path.join(self.test_directory, 'merged.csv')
+        rows_written = ShardMerger().merge(paths_shard_files, path_merged)
+        self.assertEqual(rows_written, sink.rows_written)
+        self.assertTrue(filecmp.cmp(path_single_run, path_merged, shallow=False))
+
+        # Checking that a shard without job seekers gives a file with the header only
+        used_shards = set(ShardSpec.shards_of(pd.read_csv(self.jobseeker_file_path)['id'], 1000).tolist())
+        empty_shard = ShardSpec(min(set(range(1000)) - used_shards), 1000)
+        path_empty_shard = os.path.join(self.test_directory, 'empty_shard.csv')
+        engine.set_instrumentation(True)
+        self.assertEqual(engine.write_shard(empty_shard, path_empty_shard), 0)
+        self.assertEqual(len(pd.read_csv(path_empty_shard)), 0)
+        self.assertIn('sort', engine.get_run_statistics().stages)
+        with self.assertRaises(ValueError):
+            ShardMerger().merge([os.path.join(self.test_directory, 'missing.csv')], path_merged)
+
+
+
+if __name__ == "__main__":
+    unittest.main()
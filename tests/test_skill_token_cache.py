@@ -0,0 +1,72 @@
+# unittest module for writing and running tests
+import unittest
+# custom SkillTokenCache class for testing its functionalities
+from src.skill_matching.skill_token_cache import SkillTokenCache
+# custom SkillVocabulary class for comparing with its tokenizer
+from src.skill_matching.skill_vocabulary import SkillVocabulary
+
+
+class TestSkillTokenCacheClass(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of SkillTokenCache class.
+
+    This test suite class contains individual test functions for tokenizing skills strings through the
+    cache, bounding its size and reporting its hits and misses.
+    """
+
+    def test_tokenize(self):
+        """
+        Function for testing tokenizing skills strings.
+
+        It ensures that the tokens are the unique skills of the string and that a repeated string returns the
+        same frozen set from the cache.
+        """
+        skill_token_cache = SkillTokenCache()
+        tokens = skill_token_cache.tokenize("Python, SQL, Python")
+        self.assertEqual(tokens, frozenset({"Python", "SQL"}))
+        self.assertIs(skill_token_cache.tokenize("Python, SQL, Python"), tokens)
+        self.assertEqual(skill_token_cache.tokenize("Python,SQL"), frozenset({"Python,SQL"}))
+
+        # Checking that values which are not strings are split like in the vocabulary
+        self.assertEqual(skill_token_cache.tokenize(42), frozenset(SkillVocabulary.tokenize(42)))
+
+        statistics = skill_token_cache.statistics()
+        self.assertEqual((statistics['hits'], statistics['misses'], statistics['size']), (1, 3, 3))
+        self.assertAlmostEqual(statistics['hit_rate'], 1 / 4)
+
+
+
+    def test_bounded_size(self):
+        """
+        Function for testing that the least recently used strings are evicted beyond the maximum size.
+        """
+        skill_token_cache = SkillTokenCache(max_size=2)
+        skill_token_cache.tokenize("Python")
+        skill_token_cache.tokenize("SQL")
+        skill_token_cache.tokenize("Python")
+        skill_token_cache.tokenize("Java")
+        self.assertEqual(skill_token_cache.statistics()['size'], 2)
+
+        # Checking that the least recently used string, SQL, was evicted and Python was kept
+        skill_token_cache.tokenize("Python")
+        skill_token_cache.tokenize("SQL")
+        self.assertEqual(skill_token_cache.statistics()['hits'], 2)
+
+        skill_token_cache.clear()
+        self.assertEqual(skill_token_cache.statistics(), {'hits': 0, 'misses': 0, 'hit_rate': 0.0, 'size': 0, 'max_size': 2})
+
+
+
+    def test_invalid_max_size(self):
+        """
+        Function for testing that invalid maximum sizes are rejected.
+        """
+        with self.assertRaises(ValueError):
+            SkillTokenCache(max_size=0)
+        with self.assertRaises(TypeError):
+            SkillTokenCache(max_size=1.5)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+# unittest module for writing and running tests
+import unittest
+# numpy library for numerical arrays
+import numpy as np
+# custom SkillVocabulary and SkillMatrix classes for testing their functionalities
+from src.skill_matching.skill_vocabulary import SkillVocabulary, SkillMatrix
+
+
+class TestSkillVocabularyClass(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of SkillVocabulary and SkillMatrix classes.
+
+    This test suite class contains individual test functions for mapping skills to ids and building
+    the skill incidence matrices.
+    """
+
+    def test_add_skills(self):
+        """
+        Function for testing encoding skills while growing the vocabulary.
+
+        It ensures that every distinct skill gets one id and duplicated skills are encoded once.
+        """
+        vocabulary = SkillVocabulary()
+        first_ids = vocabulary.add_skills("Python, SQL, Python")
+        second_ids = vocabulary.add_skills("SQL, Java")
+        self.assertEqual(len(vocabulary), 3)
+        self.assertEqual(len(first_ids), 2)
+        self.assertIn(vocabulary.skill_ids['SQL'], second_ids)
+
+
+
+    def test_lookup_skills_unknown(self):
+        """
+        Function for testing encoding skills without growing the vocabulary.
+
+        It ensures that unknown skills are left out and the vocabulary is unchanged.
+        """
+        vocabulary = SkillVocabulary()
+        vocabulary.add_skills("Python, SQL")
+        skill_ids = vocabulary.lookup_skills("Python, Rust")
+        self.assertEqual(skill_ids.tolist(), [vocabulary.skill_ids['Python']])
+        self.assertEqual(len(vocabulary), 2)
+
+
+
+    def test_from_skills(self):
+        """
+        Function for testing building a skill incidence matrix.
+
+        It ensures that the matrix has one row per skills string, one column per vocabulary skill and
+        that the skill counts include skills unknown to the vocabulary.
+        """
+        vocabulary = SkillVocabulary()
+        job_matrix = SkillMatrix.from_skills(["Python, R", "Docker"], vocabulary)
+        seeker_matrix = SkillMatrix.from_skills(["Python, SQL"], vocabulary, grow_vocabulary=False)
+        self.assertEqual(job_matrix.matrix.shape, (2, 3))
+        self.assertEqual(seeker_matrix.matrix.shape, (1, 3))
+        self.assertEqual(seeker_matrix.matrix.sum(), 1)
+        np.testing.assert_array_equal(seeker_matrix.skill_counts, [2])
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# time module for delaying the tasks
+import time
+# unittest module for writing and running tests
+import unittest
+# custom WorkerPool class for testing its functionalities
+from src.worker_pool.worker_pool import WorkerPool
+
+
+# Offset loaded once into each worker process by the pool initializer
+worker_offset = {}
+
+
+def load_offset(offset: int) -> None:
+    """
+    Function for loading an offset into a worker process, standing in for the jobs.
+    """
+    worker_offset['offset'] = offset
+
+
+
+def add_offset(number: int) -> int:
+    """
+    Function for adding the loaded offset to a number, finishing later items first.
+    """
+    time.sleep(0.002 * (number % 4))
+    if number < 0:
+        raise ValueError("Negative number")
+    return number + worker_offset['offset']
+
+
+
+class TestWorkerPoolClass(unittest.TestCase):
+    """
+    Test suite for validating the functionalities of WorkerPool class.
+
+    This test suite class contains individual test functions for reusing a warm pool across runs, keeping
+    the order of the tasks and stopping the workers on errors.
+    """
+
+    def test_reuse_warm_pool(self):
+        """
+        Function for testing running several times on a warm pool.
+
+        It ensures that the results are in the order of the items, that the pool is only started again for a
+        different key and that the workers are reaped when leaving the context.
+        """
+        with WorkerPool() as worker_pool:
+            worker_pool.start(('jobs', 1), 2, {'offset': 100}, load_offset, (100,))
+            for chunksize in [1, 3]:
+                self.assertTrue(worker_pool.is_warm(('jobs', 1)))
+                self.assertListEqual(list(worker_pool.imap_ordered(add_offset, range(20), chunksize)), list(range(100, 120)))
+            self.assertEqual(worker_pool.pools_started, 1)
+            self.assertFalse(worker_pool.is_warm(('jobs', 2)))
+            processes = list(worker_pool.pool._pool)
+
+        self.assertIsNone(worker_pool.pool)
+        self.assertFalse(any(process.is_alive() for process in processes))
+
+
+
+    def test_terminate_on_error(self):
+        """
+        Function for testing stopping the workers when a task fails or the results are abandoned.
+
+        It ensures that the error is raised, the workers are terminated and reaped and a new pool can be started.
+        """
+        worker_pool = WorkerPool()
+        worker_pool.start(('jobs', 1), 2, {}, load_offset, (0,))
+        processes = list(worker_pool.pool._pool)
+        with self.assertRaises(ValueError):
+            list(worker_pool.imap_ordered(add_offset, [1, 2, -1, 3]))
+        self.assertIsNone(worker_pool.pool)
+        self.assertFalse(worker_pool.is_warm(('jobs', 1)))
+        self.assertFalse(any(process.is_alive() for process in processes))
+
+        # Abandoning the results after the first one
+        worker_pool.start(('jobs', 1), 2, {}, load_offset, (0,))
+        results = worker_pool.imap_ordered(add_offset, range(100))
+        self.assertEqual(next(results), 0)
+        results.close()
+        self.assertIsNone(worker_pool.pool)
+        self.assertEqual(worker_pool.pools_started, 2)
+
+
+
+if __name__ == '__main__':
+    unittest.main()